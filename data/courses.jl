@@ -0,0 +1,5726 @@
+{"code": "ABTS1000", "name": "Indigenous Australian Issues: Past, Present, Future", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS1000"}
+{"code": "ABTS1010", "name": "Torres Strait Islander Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS1010"}
+{"code": "ABTS1020", "name": "Ten Canoes: Exploring Indigenous Art, Film, Music and Literature Through Iconic Works", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS1020"}
+{"code": "ABTS2010", "name": "Indigenous Women and Men: Gendered Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS2010"}
+{"code": "ABTS2020", "name": "Contemporary Indigenous knowledge, thought and philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS2020"}
+{"code": "ABTS2060", "name": "Contemporary Indigenous Social Organisation: Identity, family, community, nation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS2060"}
+{"code": "ABTS2080", "name": "Independent Project in Aboriginal & Torres Strait Islander Studies I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS2080"}
+{"code": "ABTS2090", "name": "Independent Project in Aboriginal & Torres Strait Islander Studies 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS2090"}
+{"code": "ABTS3010", "name": "Work Placement in Indigenous Australian Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS3010"}
+{"code": "ABTS3020", "name": "Working with Indigenous People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS3020"}
+{"code": "ABTS3030", "name": "International Indigenous Perspectives: Approaches from the Global South", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS3030"}
+{"code": "ABTS7000", "name": "Major Themes in Aboriginal & Torres Strait Islander Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ABTS7000"}
+{"code": "ACCT1101", "name": "Accounting for Decision Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT1101"}
+{"code": "ACCT1110", "name": "Financial Reporting and Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT1110"}
+{"code": "ACCT1901D", "name": "Financial Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT1901D"}
+{"code": "ACCT1902D", "name": "Managerial Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT1902D"}
+{"code": "ACCT2101", "name": "Financial Reporting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT2101"}
+{"code": "ACCT2102", "name": "Principles of Management Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT2102"}
+{"code": "ACCT2110", "name": "Intermediate Financial Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT2110"}
+{"code": "ACCT2111", "name": "Principles of Financial Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT2111"}
+{"code": "ACCT2112", "name": "Financial Accounting for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT2112"}
+{"code": "ACCT2113", "name": "Management Accounting Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT2113"}
+{"code": "ACCT2114", "name": "Applied Management Accounting and Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT2114"}
+{"code": "ACCT3101", "name": "Auditing & Public Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT3101"}
+{"code": "ACCT3102", "name": "External Reporting Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT3102"}
+{"code": "ACCT3103", "name": "Advanced Financial Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT3103"}
+{"code": "ACCT3104", "name": "Management Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT3104"}
+{"code": "ACCT3105", "name": "Advanced Management Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT3105"}
+{"code": "ACCT3106", "name": "Analysis of Financial Statements", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT3106"}
+{"code": "ACCT4101", "name": "Advanced Studies in Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT4101"}
+{"code": "ACCT6101", "name": "Financial Information in Capital Markets", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT6101"}
+{"code": "ACCT6102", "name": "Accounting in the Modern Financial Economy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT6102"}
+{"code": "ACCT6103", "name": "Auditing Honours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT6103"}
+{"code": "ACCT6104", "name": "Managerial Accounting Honours A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT6104"}
+{"code": "ACCT7101", "name": "Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7101"}
+{"code": "ACCT7102", "name": "Financial Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7102"}
+{"code": "ACCT7103", "name": "Auditing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7103"}
+{"code": "ACCT7104", "name": "Corporate Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7104"}
+{"code": "ACCT7105", "name": "Advanced Financial Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7105"}
+{"code": "ACCT7106", "name": "Financial Statement Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7106"}
+{"code": "ACCT7107", "name": "Management Accounting and Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7107"}
+{"code": "ACCT7108", "name": "Advanced Management Accounting and Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7108"}
+{"code": "ACCT7109", "name": "Strategic Cost Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7109"}
+{"code": "ACCT7700", "name": "Accounting in a Governance Framework", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7700"}
+{"code": "ACCT7804", "name": "Accounting and Business Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ACCT7804"}
+{"code": "ADVT2506", "name": "Online Advertising", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT2506"}
+{"code": "ADVT2509", "name": "Foundations of Advertising", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT2509"}
+{"code": "ADVT2510", "name": "Advertising Media", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT2510"}
+{"code": "ADVT2511", "name": "Advertising & Consumer Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT2511"}
+{"code": "ADVT3505", "name": "Advertising Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT3505"}
+{"code": "ADVT3506", "name": "Advertising Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT3506"}
+{"code": "ADVT3507", "name": "Creative Advertising and Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT3507"}
+{"code": "ADVT3508", "name": "Contemporary Issues in Advertising", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT3508"}
+{"code": "ADVT3510", "name": "Media and Platforms for Advertising", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT3510"}
+{"code": "ADVT7506", "name": "Strategic Advertising Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT7506"}
+{"code": "ADVT7507", "name": "Digital Advertising Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT7507"}
+{"code": "ADVT7508", "name": "Fundamentals of Advertising", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT7508"}
+{"code": "ADVT7509", "name": "Creative Advertising Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT7509"}
+{"code": "ADVT7510", "name": "Social Media Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT7510"}
+{"code": "ADVT7512", "name": "Media Planning and Buying", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT7512"}
+{"code": "ADVT7513", "name": "Advertising Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ADVT7513"}
+{"code": "AERO1000", "name": "Introduction to Aviation Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO1000"}
+{"code": "AERO3110", "name": "Aero Design & Manufacturing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO3110"}
+{"code": "AERO4100", "name": "Aero Design and Manufacturing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO4100"}
+{"code": "AERO4200", "name": "Flight Mechanics & Avionics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO4200"}
+{"code": "AERO4300", "name": "Aerospace Composites", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO4300"}
+{"code": "AERO4450", "name": "Aerospace Propulsion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO4450"}
+{"code": "AERO4470", "name": "Hypersonics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO4470"}
+{"code": "AERO4800", "name": "Space Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO4800"}
+{"code": "AERO4810", "name": "Aerospace Team Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO4810"}
+{"code": "AERO7300", "name": "Aerospace Composites", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AERO7300"}
+{"code": "AGRC1012", "name": "Food and Fibre Case Studies I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1012"}
+{"code": "AGRC1016", "name": "Food & Fibre in the E-Landscape", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1016"}
+{"code": "AGRC1020", "name": "Applied Biology I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1020"}
+{"code": "AGRC1021", "name": "Biological Concepts and Plant Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1021"}
+{"code": "AGRC1023", "name": "Applied Mathematics and Statistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1023"}
+{"code": "AGRC1024", "name": "Plant Production Principles and Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1024"}
+{"code": "AGRC1031", "name": "Australia's Bio-Physical Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1031"}
+{"code": "AGRC1032", "name": "Elements of Ecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1032"}
+{"code": "AGRC1040", "name": "Food for a Healthy Planet", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1040"}
+{"code": "AGRC1041", "name": "Cell and Tissue Biology for Agriculture and Veterinary Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1041"}
+{"code": "AGRC1120D", "name": "Agriculture & Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1120D"}
+{"code": "AGRC1125D", "name": "Agricultural Mechanisation 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1125D"}
+{"code": "AGRC1130D", "name": "Crop Agronomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1130D"}
+{"code": "AGRC1135D", "name": "Agricultural Mechanisation II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1135D"}
+{"code": "AGRC1140D", "name": "Plant Production Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1140D"}
+{"code": "AGRC1145D", "name": "Experimental Techniques and Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1145D"}
+{"code": "AGRC1150D", "name": "Management Agricultural Production Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1150D"}
+{"code": "AGRC1155D", "name": "Rural Business Management systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1155D"}
+{"code": "AGRC1160D", "name": "Case Study and Work Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1160D"}
+{"code": "AGRC1165D", "name": "Contemporary Issues in Agriculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1165D"}
+{"code": "AGRC1909C", "name": "Plant Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC1909C"}
+{"code": "AGRC2000", "name": "Food and Fibre Case Studies II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2000"}
+{"code": "AGRC2001", "name": "Agricultural Biochemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2001"}
+{"code": "AGRC2013", "name": "Agricultural Microbiology & Gene Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2013"}
+{"code": "AGRC2023", "name": "Agribusiness Planning and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2023"}
+{"code": "AGRC2030", "name": "Agricultural Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2030"}
+{"code": "AGRC2031", "name": "Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2031"}
+{"code": "AGRC2040", "name": "Agronomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2040"}
+{"code": "AGRC2045", "name": "Molecular and quantitative genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC2045"}
+{"code": "AGRC3000", "name": "Food and Fibre Case Studies III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3000"}
+{"code": "AGRC3002", "name": "Agronomy 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3002"}
+{"code": "AGRC3006", "name": "Pasture Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3006"}
+{"code": "AGRC3018", "name": "Sustainable Agricultural and Animal Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3018"}
+{"code": "AGRC3023", "name": "Agrifood Strategy & Competitiveness", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3023"}
+{"code": "AGRC3027", "name": "Agricultural and Resource Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3027"}
+{"code": "AGRC3028", "name": "Agricultural Science Internship Enterprise Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3028"}
+{"code": "AGRC3029", "name": "Agricultural Science Internship Professional Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3029"}
+{"code": "AGRC3030", "name": "Agricultural Science Internship Workplace-Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3030"}
+{"code": "AGRC3035", "name": "Short International Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3035"}
+{"code": "AGRC3036", "name": "Precision Agriculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3036"}
+{"code": "AGRC3037", "name": "Plants for Human Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3037"}
+{"code": "AGRC3040", "name": "Crop Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3040"}
+{"code": "AGRC3041", "name": "Plant Breeding", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3041"}
+{"code": "AGRC3042", "name": "Animal and Plant Biosecurity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3042"}
+{"code": "AGRC3050", "name": "Agricultural Development in Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3050"}
+{"code": "AGRC3054", "name": "Tropical Agriculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3054"}
+{"code": "AGRC3602", "name": "Special Topic II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3602"}
+{"code": "AGRC3702", "name": "Design and Analysis of Experiments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC3702"}
+{"code": "AGRC4050", "name": "Agricultural Development in Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4050"}
+{"code": "AGRC4054", "name": "Tropical Agriculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4054"}
+{"code": "AGRC4100", "name": "Research Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4100"}
+{"code": "AGRC4101", "name": "Entrepreneurship in Agriculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4101"}
+{"code": "AGRC4613", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4613"}
+{"code": "AGRC4614", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4614"}
+{"code": "AGRC4615", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4615"}
+{"code": "AGRC4616", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC4616"}
+{"code": "AGRC6001", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6001"}
+{"code": "AGRC6002", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6002"}
+{"code": "AGRC6005", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6005"}
+{"code": "AGRC6200", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6200"}
+{"code": "AGRC6300", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6300"}
+{"code": "AGRC6631", "name": "Agricultural Research Methodologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6631"}
+{"code": "AGRC6640", "name": "Postgraduate Advanced Topic I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6640"}
+{"code": "AGRC6641", "name": "Postgraduate Advanced Topic II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6641"}
+{"code": "AGRC6642", "name": "Postgraduate Advanced Topic III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6642"}
+{"code": "AGRC6650", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6650"}
+{"code": "AGRC6651", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC6651"}
+{"code": "AGRC7005", "name": "Advanced Agronomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7005"}
+{"code": "AGRC7031", "name": "Property, Catchment and Regional Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7031"}
+{"code": "AGRC7037", "name": "'E' Technologies for the Food & Fibre Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7037"}
+{"code": "AGRC7043", "name": "Agrifood Strategies and Competitiveness", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7043"}
+{"code": "AGRC7045", "name": "Agricultural Research Methodologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7045"}
+{"code": "AGRC7046", "name": "Leadership in Rural Industries and Communities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7046"}
+{"code": "AGRC7047", "name": "Global Challenges in Agriculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7047"}
+{"code": "AGRC7048", "name": "Principles of Plant Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7048"}
+{"code": "AGRC7049", "name": "Extension and Participatory Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7049"}
+{"code": "AGRC7050", "name": "Agribusiness Value Chain Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7050"}
+{"code": "AGRC7051", "name": "Advanced Pasture Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7051"}
+{"code": "AGRC7052", "name": "Animal and Plant Biosecurity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7052"}
+{"code": "AGRC7123", "name": "Agribusiness Planning and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7123"}
+{"code": "AGRC7501", "name": "Design and Analysis of Experiments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7501"}
+{"code": "AGRC7520", "name": "International Agricultural Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7520"}
+{"code": "AGRC7611", "name": "Graduate Research Project I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7611"}
+{"code": "AGRC7617", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7617"}
+{"code": "AGRC7618", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7618"}
+{"code": "AGRC7619", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AGRC7619"}
+{"code": "ANAT1005", "name": "Anatomical Basis of Human Movement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT1005"}
+{"code": "ANAT1012", "name": "Regional Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT1012"}
+{"code": "ANAT1018", "name": "Systematic & Applied Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT1018"}
+{"code": "ANAT1019", "name": "Regional, Neuro & Applied Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT1019"}
+{"code": "ANAT1020", "name": "Systematic Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT1020"}
+{"code": "ANAT1022", "name": "Anatomy of the Head, Neck & Thorax", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT1022"}
+{"code": "ANAT2000", "name": "Functional Musculoskeletal Anatomy - Health Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT2000"}
+{"code": "ANAT2005", "name": "Neuroanatomy (Speech Pathology)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT2005"}
+{"code": "ANAT2012", "name": "Functional Anatomy (Physiotherapy)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT2012"}
+{"code": "ANAT2029", "name": "Functional Musculoskeletal Anatomy - Human Movement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT2029"}
+{"code": "ANAT3022", "name": "Functional Neuroanatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT3022"}
+{"code": "ANAT6001", "name": "Systematic Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT6001"}
+{"code": "ANAT7000", "name": "Anatomical Fundamentals for Speech & Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT7000"}
+{"code": "ANAT7018", "name": "Functional Neuroanatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANAT7018"}
+{"code": "ANCH1240", "name": "The Rise of Ancient Greece: Greek History to the 4th Century BC", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH1240"}
+{"code": "ANCH1250", "name": "The Rise of Ancient Rome: Roman History from Romulus to Augustus", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH1250"}
+{"code": "ANCH2030", "name": "Myth, Magic and Religion in the Ancient World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2030"}
+{"code": "ANCH2040", "name": "The World of Classical Athens: Politics and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2040"}
+{"code": "ANCH2050", "name": "Ancient World Study Tour: Sites and Museums", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2050"}
+{"code": "ANCH2070", "name": "Study Tour: Sites and Museums of Roman Italy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2070"}
+{"code": "ANCH2130", "name": "Alexander the Great and the Hellenistic World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2130"}
+{"code": "ANCH2230", "name": "The Roman Empire: Politics and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2230"}
+{"code": "ANCH2240", "name": "Pharaohs & Empire", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2240"}
+{"code": "ANCH2250", "name": "The Career and Influence of Julius Caesar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2250"}
+{"code": "ANCH2270", "name": "Art & Archaeology of Ancient Rome", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2270"}
+{"code": "ANCH2280", "name": "Roman Society & Civilisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2280"}
+{"code": "ANCH2290", "name": "Art & Archaeology of Ancient Greece", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2290"}
+{"code": "ANCH2310", "name": "Individuals and the State in the Roman Republic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2310"}
+{"code": "ANCH2431", "name": "The World of Late Antiquity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2431"}
+{"code": "ANCH2500", "name": "Ancient History and Modern Cinema", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2500"}
+{"code": "ANCH2900", "name": "R.D. Milns Antiquities Museum International Internship and Field", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH2900"}
+{"code": "ANCH3010", "name": "Sources for the Study of Ancient History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH3010"}
+{"code": "ANCH3020", "name": "Special Topic in Greek History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH3020"}
+{"code": "ANCH3030", "name": "Special Topic in Roman History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH3030"}
+{"code": "ANCH6850", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH6850"}
+{"code": "ANCH6860", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH6860"}
+{"code": "ANCH6900", "name": "Documentary Evidence for Ancient History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH6900"}
+{"code": "ANCH6910", "name": "Studying Ancient History: Research Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH6910"}
+{"code": "ANCH6920", "name": "Ancient Historiography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH6920"}
+{"code": "ANCH7030", "name": "Myth, The Occult & the Divine in the Ancient World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7030"}
+{"code": "ANCH7130", "name": "Alexander the Great and the Hellenistic Monarchy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7130"}
+{"code": "ANCH7160", "name": "Daily Life in Ancient Greece", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7160"}
+{"code": "ANCH7230", "name": "Rise of the Roman Empire", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7230"}
+{"code": "ANCH7270", "name": "The Art of Rome", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7270"}
+{"code": "ANCH7280", "name": "Daily Life in Ancient Rome", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7280"}
+{"code": "ANCH7290", "name": "The Art of Greece", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7290"}
+{"code": "ANCH7300", "name": "City Centres of Greece & Rome", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7300"}
+{"code": "ANCH7910", "name": "Applied Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7910"}
+{"code": "ANCH7920", "name": "Historians of Greece & Rome", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7920"}
+{"code": "ANCH7961", "name": "Problems in the Ancient World A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7961"}
+{"code": "ANCH7971", "name": "Problems in the Ancient World B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7971"}
+{"code": "ANCH7980", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7980"}
+{"code": "ANCH7981", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7981"}
+{"code": "ANCH7982", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANCH7982"}
+{"code": "ANIM1006", "name": "Fundamentals of Equine Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1006"}
+{"code": "ANIM1014", "name": "Animal Behaviour, Handling and Wellbeing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1014"}
+{"code": "ANIM1018", "name": "Livestock Industries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1018"}
+{"code": "ANIM1020", "name": "Applied Animal Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1020"}
+{"code": "ANIM1026", "name": "Australian Terrestrial Vertebrates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1026"}
+{"code": "ANIM1110D", "name": "Animal Husbandry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1110D"}
+{"code": "ANIM1115D", "name": "Animal Production Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1115D"}
+{"code": "ANIM1909C", "name": "Animal Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1909C"}
+{"code": "ANIM1910C", "name": "Applied Animal Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM1910C"}
+{"code": "ANIM2020", "name": "Dogs, cats and other pets", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2020"}
+{"code": "ANIM2021", "name": "Animal Environmental Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2021"}
+{"code": "ANIM2024", "name": "Equine Behaviour & Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2024"}
+{"code": "ANIM2039", "name": "Equine Breeding and Stud Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2039"}
+{"code": "ANIM2043", "name": "Biology of Australian Marsupials and Monotremes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2043"}
+{"code": "ANIM2044", "name": "Monogastric Production Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2044"}
+{"code": "ANIM2051", "name": "Animal Anatomy & Physiology 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2051"}
+{"code": "ANIM2052", "name": "Animal Anatomy & Physiology 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2052"}
+{"code": "ANIM2053", "name": "Animal Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2053"}
+{"code": "ANIM2054", "name": "Ruminant Production Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2054"}
+{"code": "ANIM2055", "name": "The Management and Husbandry of Zoo Animals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2055"}
+{"code": "ANIM2057", "name": "Applied Animal Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2057"}
+{"code": "ANIM2501", "name": "Applied Animal Nutrition & Grazing Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2501"}
+{"code": "ANIM2503", "name": "Animal Breeding & Molecular Genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM2503"}
+{"code": "ANIM3006", "name": "Animal Health and Epidemiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3006"}
+{"code": "ANIM3016", "name": "Zoo Husbandry and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3016"}
+{"code": "ANIM3018", "name": "Wildlife Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3018"}
+{"code": "ANIM3019", "name": "Animal Reproduction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3019"}
+{"code": "ANIM3023", "name": "Practice Skills I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3023"}
+{"code": "ANIM3030", "name": "Equine Nutrition & Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3030"}
+{"code": "ANIM3039", "name": "Equine Exercise and Rehabilitation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3039"}
+{"code": "ANIM3043", "name": "The Behaviour and Management of Animals in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3043"}
+{"code": "ANIM3045", "name": "Sustainable Animal Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3045"}
+{"code": "ANIM3046", "name": "Animal Breeding & Genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3046"}
+{"code": "ANIM3049", "name": "Biology of Australian Marsupials and Monotremes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3049"}
+{"code": "ANIM3060", "name": "Animals in a Changing Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3060"}
+{"code": "ANIM3061", "name": "Animal Nutrigenomics and Metabolism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3061"}
+{"code": "ANIM3062", "name": "Emerging Issues in Animal Bioscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3062"}
+{"code": "ANIM3063", "name": "Animal Welfare & Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM3063"}
+{"code": "ANIM7001", "name": "Animal Science & Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7001"}
+{"code": "ANIM7016", "name": "Wildlife Husbandry and Utilisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7016"}
+{"code": "ANIM7019", "name": "Monogastric Production Systems in the Tropics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7019"}
+{"code": "ANIM7023", "name": "Human - Wildlife Conflict Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7023"}
+{"code": "ANIM7043", "name": "Australian Marsupials and Monotremes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7043"}
+{"code": "ANIM7115", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7115"}
+{"code": "ANIM7117", "name": "Equine Digestive Physiology and Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7117"}
+{"code": "ANIM7118", "name": "Equine Exercise Physiology and Rehabilitation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7118"}
+{"code": "ANIM7119", "name": "Equine Health and Welfare", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7119"}
+{"code": "ANIM7120", "name": "Equine Reproduction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7120"}
+{"code": "ANIM7214", "name": "Animals in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7214"}
+{"code": "ANIM7219", "name": "Animal Reproductive Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7219"}
+{"code": "ANIM7240", "name": "Animal Nutrition and Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7240"}
+{"code": "ANIM7241", "name": "Animal Nutrition and Nutrigenomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7241"}
+{"code": "ANIM7620", "name": "Concepts in Animal Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7620"}
+{"code": "ANIM7621", "name": "Animal Breeding Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANIM7621"}
+{"code": "ANTH1008", "name": "Being Human: Cultural Diversity and Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH1008"}
+{"code": "ANTH1030", "name": "Anthropology of Current World Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH1030"}
+{"code": "ANTH1101X", "name": "Anthropology of Current World Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH1101X"}
+{"code": "ANTH2010", "name": "Critical Anthropology & Indigenous Australians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH2010"}
+{"code": "ANTH2018", "name": "Consumption & Material Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH2018"}
+{"code": "ANTH2020", "name": "Theory and Society in the Pacific", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH2020"}
+{"code": "ANTH2060", "name": "Ecology, Culture, and Field Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH2060"}
+{"code": "ANTH2250", "name": "Medical Anthropology: Local and Global Perspectives", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH2250"}
+{"code": "ANTH2260", "name": "Applied Anthropology and Indigenous Territories", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH2260"}
+{"code": "ANTH2270", "name": "Migration, Culture and Identity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH2270"}
+{"code": "ANTH3019", "name": "Development Practice & Social Impact", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH3019"}
+{"code": "ANTH3050", "name": "Ritual, Religion and Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH3050"}
+{"code": "ANTH3090", "name": "Ethnographic Fieldwork", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH3090"}
+{"code": "ANTH3140", "name": "Anthropological Futures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH3140"}
+{"code": "ANTH3208", "name": "Anthropology Museum Lab", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH3208"}
+{"code": "ANTH6008", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH6008"}
+{"code": "ANTH6009", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH6009"}
+{"code": "ANTH7250", "name": "Cross-Cultural Perspectives on Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH7250"}
+{"code": "ANTH7260", "name": "Applied Anthropology and Indigenous Territories", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ANTH7260"}
+{"code": "ARCA1000", "name": "Discovering Archaeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA1000"}
+{"code": "ARCA2020", "name": "Australasian Archaeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA2020"}
+{"code": "ARCA2150", "name": "Ancient Civilisations: Archaeology of Mesopotamia, Turkey and The Levant before Alexander the Great", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA2150"}
+{"code": "ARCA3000", "name": "Predicting the Past", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA3000"}
+{"code": "ARCA6008", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA6008"}
+{"code": "ARCA6009", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA6009"}
+{"code": "ARCA6030", "name": "Archaeology Honours Research Seminar 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA6030"}
+{"code": "ARCA6040", "name": "Archaeology Honours Research Seminar 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA6040"}
+{"code": "ARCA7000", "name": "World Heritage", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA7000"}
+{"code": "ARCA7002", "name": "Managing Cultural Heritage Places", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA7002"}
+{"code": "ARCA7007", "name": "Applied Research in Heritage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA7007"}
+{"code": "ARCA7008", "name": "Dissertation Heritage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA7008"}
+{"code": "ARCA7010", "name": "Advanced Heritage Field School", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA7010"}
+{"code": "ARCA7018", "name": "Dissertation Heritage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA7018"}
+{"code": "ARCA7028", "name": "Dissertation Heritage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCA7028"}
+{"code": "ARCH1100", "name": "Architectural Design : Form and Space", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH1100"}
+{"code": "ARCH1140", "name": "Buildings in History & Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH1140"}
+{"code": "ARCH1160", "name": "Architectural Communication 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH1160"}
+{"code": "ARCH1201", "name": "Architectural Design : Plan and Section", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH1201"}
+{"code": "ARCH1240", "name": "Architecture in the Western Tradition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH1240"}
+{"code": "ARCH2100", "name": "Architectural Design : Site and Surface", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH2100"}
+{"code": "ARCH2140", "name": "Architecture in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH2140"}
+{"code": "ARCH2200", "name": "Architectural Design : Memory and History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH2200"}
+{"code": "ARCH2240", "name": "Modern Architecture & the Metropolis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH2240"}
+{"code": "ARCH3100", "name": "Architectural Design : Clients and Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3100"}
+{"code": "ARCH3141", "name": "Architecture in Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3141"}
+{"code": "ARCH3142", "name": "Architecture in Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3142"}
+{"code": "ARCH3200", "name": "Architectural Design : Tectonics and Precision", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3200"}
+{"code": "ARCH3241", "name": "Aboriginal Architecture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3241"}
+{"code": "ARCH3242", "name": "Theories in Architecture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3242"}
+{"code": "ARCH3341", "name": "Architecture Field Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3341"}
+{"code": "ARCH3342", "name": "Special Topics in Architecture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH3342"}
+{"code": "ARCH7001", "name": "Advanced Architectural Design: Architecture and Commerce", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7001"}
+{"code": "ARCH7002", "name": "Advanced Architectural Design: Institutions and Ideology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7002"}
+{"code": "ARCH7003", "name": "Advanced Architectural Design: Adaptive Capacities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7003"}
+{"code": "ARCH7004", "name": "Advanced Architectural Design: Dwelling and Density", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7004"}
+{"code": "ARCH7005", "name": "Advanced Architectural Design: Landscapes and Architecture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7005"}
+{"code": "ARCH7006", "name": "Advanced Architectural Design: Utopian Urbanism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7006"}
+{"code": "ARCH7007", "name": "Advanced Architectural Design: Masterclass", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7007"}
+{"code": "ARCH7008", "name": "Advanced Architectural Design: Material Experiments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7008"}
+{"code": "ARCH7012", "name": "Architectural Research 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7012"}
+{"code": "ARCH7014", "name": "Contemporary Architecture Theory & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7014"}
+{"code": "ARCH7015", "name": "Advanced Architectural Design: Generative Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7015"}
+{"code": "ARCH7016", "name": "Advanced Architectural Design: Responsive Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7016"}
+{"code": "ARCH7017", "name": "Advanced Architectural Design: Architecture and Urban Infrastructure", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7017"}
+{"code": "ARCH7022", "name": "Architectural Research 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7022"}
+{"code": "ARCH7031", "name": "Architectural Practice: Business Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7031"}
+{"code": "ARCH7032", "name": "Architectural Research 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7032"}
+{"code": "ARCH7041", "name": "Architectural Practice: Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7041"}
+{"code": "ARCH7042", "name": "Architectural Research 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7042"}
+{"code": "ARCH7052", "name": "Architectural Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7052"}
+{"code": "ARCH7060", "name": "Architectural Research: Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7060"}
+{"code": "ARCH7061", "name": "Architectural Research: Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7061"}
+{"code": "ARCH7062", "name": "Architectural Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7062"}
+{"code": "ARCH7071", "name": "Architectural Research: Environment and Sustainability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7071"}
+{"code": "ARCH7072", "name": "Architectural Research: Materials and Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7072"}
+{"code": "ARCH7073", "name": "Architectural Research: Design Processes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7073"}
+{"code": "ARCH7081", "name": "Architectural Research: History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7081"}
+{"code": "ARCH7082", "name": "Architectural Research: Heritage", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7082"}
+{"code": "ARCH7083", "name": "Architectural Research: Theory and Criticism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7083"}
+{"code": "ARCH7091", "name": "Architectural Research: Urbanism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7091"}
+{"code": "ARCH7092", "name": "Architectural Research: Cross-Cultural Architecture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7092"}
+{"code": "ARCH7093", "name": "Architectural Research: Community and Advocacy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCH7093"}
+{"code": "ARCS1001", "name": "Doing Archaeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS1001"}
+{"code": "ARCS2000", "name": "Science in Archaeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2000"}
+{"code": "ARCS2003", "name": "Forensics: The Archaeology of Death & Crime Scenes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2003"}
+{"code": "ARCS2010", "name": "Ancient Technologies: Experimental and Analytical Approaches to Understanding Past Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2010"}
+{"code": "ARCS2011", "name": "Lithic Analysis: Current and Future Directions for Research and Heritage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2011"}
+{"code": "ARCS2025", "name": "Archaeology of the Pacific Islands", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2025"}
+{"code": "ARCS2050", "name": "Historical Archaeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2050"}
+{"code": "ARCS2060", "name": "Archaeology Field School", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2060"}
+{"code": "ARCS2070", "name": "Bioarchaeology: Human remains and ancient disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2070"}
+{"code": "ARCS2080", "name": "Plants and Archaeology: Food, fuel, foraging and farming in the human past", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2080"}
+{"code": "ARCS2090", "name": "Animals and Archaeology: Analytical approaches to understanding past human-animal relationships", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS2090"}
+{"code": "ARCS3001", "name": "Advanced Research in Archaeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS3001"}
+{"code": "ARCS3010", "name": "Field Archaeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS3010"}
+{"code": "ARCS3118", "name": "Managing Cultural Heritage: Ethics, History and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS3118"}
+{"code": "ARCS3168", "name": "Human Evolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARCS3168"}
+{"code": "ARTT1105", "name": "Art in the Modern World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT1105"}
+{"code": "ARTT1106", "name": "Looking at Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT1106"}
+{"code": "ARTT2102", "name": "Renaissance Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT2102"}
+{"code": "ARTT2103", "name": "Australia Pacific Indigenous Arts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT2103"}
+{"code": "ARTT2105", "name": "Baroque and Beyond, 1600-1900", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT2105"}
+{"code": "ARTT2107", "name": "Asian Contemporary Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT2107"}
+{"code": "ARTT2116", "name": "Art and Architecture in Venice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT2116"}
+{"code": "ARTT2127", "name": "Australian Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT2127"}
+{"code": "ARTT2200", "name": "Indigenous Art and Culture Field School", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT2200"}
+{"code": "ARTT3100", "name": "Readings in Art History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT3100"}
+{"code": "ARTT3101", "name": "Topics in Contemporary Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT3101"}
+{"code": "ARTT3117", "name": "Visual Arts Curating and Writing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT3117"}
+{"code": "ARTT3200", "name": "Art Internships & Independent Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT3200"}
+{"code": "ARTT6050", "name": "Honours Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT6050"}
+{"code": "ARTT6103", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT6103"}
+{"code": "ARTT6104", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT6104"}
+{"code": "ARTT6500", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ARTT6500"}
+{"code": "AUDL7800", "name": "Acoustics & Psychoacoustics in Audiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7800"}
+{"code": "AUDL7803", "name": "Advanced Audiological Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7803"}
+{"code": "AUDL7806", "name": "Clinical Practice in Audiology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7806"}
+{"code": "AUDL7807", "name": "Advanced Audiological Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7807"}
+{"code": "AUDL7808", "name": "Paediatric & Educational Audiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7808"}
+{"code": "AUDL7812", "name": "Clinical Practice in Audiology IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7812"}
+{"code": "AUDL7814", "name": "Rehabilitative Audiology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7814"}
+{"code": "AUDL7821", "name": "Audiological Assessment & Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7821"}
+{"code": "AUDL7822", "name": "Function & Disorders of the Auditory System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7822"}
+{"code": "AUDL7823", "name": "Rehabilitative Audiology I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7823"}
+{"code": "AUDL7824", "name": "Clinical Practice III & Professional Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7824"}
+{"code": "AUDL7825", "name": "Hearing and Communication Across the Lifespan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUDL7825"}
+{"code": "AUST1000", "name": "Contemporary Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUST1000"}
+{"code": "AUST1010", "name": "Contemporary Australian Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUST1010"}
+{"code": "AUST2000", "name": "Australian Popular Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUST2000"}
+{"code": "AUST2002", "name": "Uneasy Neighbours: Australia & Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=AUST2002"}
+{"code": "BESC1003E", "name": "Pre-University Behavioural Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BESC1003E"}
+{"code": "BESC1023E", "name": "Pre-University Behavioural Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BESC1023E"}
+{"code": "BESC1033E", "name": "Pre-University Behavioural Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BESC1033E"}
+{"code": "BINF6000", "name": "Concepts in Bioinformatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BINF6000"}
+{"code": "BINF6001", "name": "Introduction to Proteins and Nucleic Acids", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BINF6001"}
+{"code": "BINF7000", "name": "Advanced Bioinformatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BINF7000"}
+{"code": "BINF7001", "name": "Advanced Genome Informatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BINF7001"}
+{"code": "BIOC1011", "name": "Molecular Basis of Life", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC1011"}
+{"code": "BIOC2000", "name": "Biochemistry & Molecular Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC2000"}
+{"code": "BIOC3000", "name": "Advanced Biochemistry and Molecular Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC3000"}
+{"code": "BIOC3003", "name": "Human Molecular Genetics & Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC3003"}
+{"code": "BIOC3005", "name": "Molecular Systems Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC3005"}
+{"code": "BIOC3006", "name": "Biochemistry of Metabolism in Health and Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC3006"}
+{"code": "BIOC6006", "name": "Directed Studies in Molecular Genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC6006"}
+{"code": "BIOC6007", "name": "Directed Studies in Biomolecular Structure & Function", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC6007"}
+{"code": "BIOC6014", "name": "Literature Review in Molecular Biology A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC6014"}
+{"code": "BIOC6017", "name": "Introduction to the Molecular Biology Laboratory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC6017"}
+{"code": "BIOC6511", "name": "Honours Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC6511"}
+{"code": "BIOC6512", "name": "Honours Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC6512"}
+{"code": "BIOC6513", "name": "Honours Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC6513"}
+{"code": "BIOC7000", "name": "Major Research Project & Seminars", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7000"}
+{"code": "BIOC7001", "name": "Advanced Molecular Biology Laboratory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7001"}
+{"code": "BIOC7002", "name": "Major Research Project & Seminars", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7002"}
+{"code": "BIOC7003", "name": "Major Research Project & Seminars", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7003"}
+{"code": "BIOC7004", "name": "Advanced Protein Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7004"}
+{"code": "BIOC7009", "name": "Research Proposal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7009"}
+{"code": "BIOC7010", "name": "Research Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7010"}
+{"code": "BIOC7011", "name": "Research Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7011"}
+{"code": "BIOC7014", "name": "Literature Review in Molecular Biology B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7014"}
+{"code": "BIOC7017", "name": "Major Research Project & Seminars", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7017"}
+{"code": "BIOC7018", "name": "Major Research Project & Seminars", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7018"}
+{"code": "BIOC7021", "name": "Major Research Project & Seminars B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7021"}
+{"code": "BIOC7022", "name": "Advanced Research Project & Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7022"}
+{"code": "BIOC7023", "name": "Advanced Research Project & Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7023"}
+{"code": "BIOC7024", "name": "Advanced Research Project & Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7024"}
+{"code": "BIOC7025", "name": "Advanced Research Project & Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC7025"}
+{"code": "BIOC8000", "name": "Advanced Genomics & Bioinformatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOC8000"}
+{"code": "BIOL1001E", "name": "Pre-University Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1001E"}
+{"code": "BIOL1007", "name": "Molecular & Cellular Biology for Physiotherapists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1007"}
+{"code": "BIOL1020", "name": "Genes, Cells & Evolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1020"}
+{"code": "BIOL1021E", "name": "Pre-University Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1021E"}
+{"code": "BIOL1030", "name": "Global Challenges in Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1030"}
+{"code": "BIOL1031E", "name": "Pre-University Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1031E"}
+{"code": "BIOL1040", "name": "Cells to Organisms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1040"}
+{"code": "BIOL1100", "name": "Evolutionary Perspectives on Modern Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1100"}
+{"code": "BIOL1630", "name": "Biomechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1630"}
+{"code": "BIOL1900", "name": "Biophysical Development, Measurement and Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL1900"}
+{"code": "BIOL2001", "name": "Australia's Terrestrial Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2001"}
+{"code": "BIOL2006", "name": "Biostatistics & Experimental Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2006"}
+{"code": "BIOL2010", "name": "Ecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2010"}
+{"code": "BIOL2015", "name": "Ecology Field Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2015"}
+{"code": "BIOL2106", "name": "Advanced Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2106"}
+{"code": "BIOL2200", "name": "Cell Structure & Function", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2200"}
+{"code": "BIOL2201", "name": "Evolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2201"}
+{"code": "BIOL2202", "name": "Genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2202"}
+{"code": "BIOL2203", "name": "Plant Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2203"}
+{"code": "BIOL2204", "name": "Zoology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2204"}
+{"code": "BIOL2205", "name": "Insect Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2205"}
+{"code": "BIOL2630", "name": "Biomechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2630"}
+{"code": "BIOL2902", "name": "Advanced Genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL2902"}
+{"code": "BIOL3000", "name": "Conservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3000"}
+{"code": "BIOL3003", "name": "Advanced Immunology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3003"}
+{"code": "BIOL3004", "name": "Genomics & Bioinformatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3004"}
+{"code": "BIOL3006", "name": "Molecular Cell Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3006"}
+{"code": "BIOL3009", "name": "Arthropods & Human Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3009"}
+{"code": "BIOL3011", "name": "Plant Microbe & Insect Interactions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3011"}
+{"code": "BIOL3014", "name": "Advanced Bioinformatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3014"}
+{"code": "BIOL3016", "name": "Outback Ecology Field Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3016"}
+{"code": "BIOL3023", "name": "Tropical Marine Ecosystems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3023"}
+{"code": "BIOL3200", "name": "Current Topics in Plant Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3200"}
+{"code": "BIOL3201", "name": "Plant Diseases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3201"}
+{"code": "BIOL3202", "name": "Plant Biology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3202"}
+{"code": "BIOL3203", "name": "Plant Molecular Biology & Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3203"}
+{"code": "BIOL3204", "name": "Plant Adaptation and Global Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3204"}
+{"code": "BIOL3205", "name": "Physiological and Integrative Zoology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3205"}
+{"code": "BIOL3207", "name": "Animal Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3207"}
+{"code": "BIOL3209", "name": "Biodiversity Analysis, Discovery and Systematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3209"}
+{"code": "BIOL3210", "name": "Fungal Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3210"}
+{"code": "BIOL3211", "name": "Marine Invertebrates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3211"}
+{"code": "BIOL3215", "name": "Marine Ecology and Conservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3215"}
+{"code": "BIOL3222", "name": "Model Organism Genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3222"}
+{"code": "BIOL3227", "name": "Plant Identification and Vegetation Classification", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3227"}
+{"code": "BIOL3232", "name": "Insect Identification and Taxonomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3232"}
+{"code": "BIOL3236", "name": "Climate Change Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3236"}
+{"code": "BIOL3238", "name": "Insect Structure, Function & Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3238"}
+{"code": "BIOL3239", "name": "Brain to Behaviour: Invertebrate Neuroethology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3239"}
+{"code": "BIOL3310", "name": "Macroecology and Biogeography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3310"}
+{"code": "BIOL3320", "name": "Vertebrate Diversity and Evolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3320"}
+{"code": "BIOL3340", "name": "Fish, Fisheries and Aquaculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3340"}
+{"code": "BIOL3350", "name": "Genetics and Evolution of Complex Traits: From Humans to Non-Model Organisms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3350"}
+{"code": "BIOL3360", "name": "Analysis and Communication of Biological Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3360"}
+{"code": "BIOL3370", "name": "Animal-Plant Interactions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3370"}
+{"code": "BIOL3380", "name": "Laboratory Skills in Genetic Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL3380"}
+{"code": "BIOL6402", "name": "Critical Thinking and Communication in Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL6402"}
+{"code": "BIOL6403", "name": "Critical Thinking and Communication in Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL6403"}
+{"code": "BIOL6501", "name": "BSc(Hons) Research in Biological Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL6501"}
+{"code": "BIOL6502", "name": "BSc(Hons) Research in Biological Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL6502"}
+{"code": "BIOL6503", "name": "BSc(Hons) Research in Biological Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL6503"}
+{"code": "BIOL7005", "name": "Research & Development Proposal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL7005"}
+{"code": "BIOL7011", "name": "Molecular Diagnostics in Plant Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL7011"}
+{"code": "BIOL7012", "name": "Plant-Microbe & Insect Interactions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL7012"}
+{"code": "BIOL7013", "name": "Biosecurity Plant Pests: Invertebrates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL7013"}
+{"code": "BIOL7017", "name": "Plant Pathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL7017"}
+{"code": "BIOL7386", "name": "Anatomy and Biomechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL7386"}
+{"code": "BIOL7630", "name": "Biomechanical Basis of Human Movement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL7630"}
+{"code": "BIOL8001", "name": "Preparation for Professional Doctoral Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOL8001"}
+{"code": "BIOM1050", "name": "Biology for Health Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM1050"}
+{"code": "BIOM1051", "name": "Introductory Cellular Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM1051"}
+{"code": "BIOM1052", "name": "Integrated Anatomy and Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM1052"}
+{"code": "BIOM1060", "name": "Anatomy and Physiology for Nursing and Midwifery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM1060"}
+{"code": "BIOM1061", "name": "Pharmacology and Therapeutics for Nursing and Midwifery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM1061"}
+{"code": "BIOM1070", "name": "Biology for Health Sciences Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM1070"}
+{"code": "BIOM1071", "name": "Biology for Health Sciences Part B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM1071"}
+{"code": "BIOM2009", "name": "Human Physiology & Pharmacology A I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2009"}
+{"code": "BIOM2010", "name": "Human Physiology & Pharmacology A II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2010"}
+{"code": "BIOM2011", "name": "Integrative Cell & Tissue Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2011"}
+{"code": "BIOM2012", "name": "Systems Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2012"}
+{"code": "BIOM2013", "name": "Advanced Integrative Cell & Tissue Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2013"}
+{"code": "BIOM2015", "name": "Physiology and Pharmacology of Human Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2015"}
+{"code": "BIOM2019", "name": "Human Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2019"}
+{"code": "BIOM2020", "name": "Human Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2020"}
+{"code": "BIOM2052", "name": "Integrated Physiology & Pharmacology for Dentistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2052"}
+{"code": "BIOM2070", "name": "Integrated Biomedical Sciences for Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2070"}
+{"code": "BIOM2071", "name": "Integrated Biomedical Sciences for Midwifery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2071"}
+{"code": "BIOM2208", "name": "Differentiation & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2208"}
+{"code": "BIOM2222", "name": "Advanced Techniques in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2222"}
+{"code": "BIOM2402", "name": "Principles of Pharmacology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM2402"}
+{"code": "BIOM3002", "name": "Human Biomedical Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3002"}
+{"code": "BIOM3003", "name": "Functional Musculoskeletal Anatomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3003"}
+{"code": "BIOM3010", "name": "Human Physiology & Pharmacology B1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3010"}
+{"code": "BIOM3011", "name": "Human Physiology & Pharmacology B2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3011"}
+{"code": "BIOM3014", "name": "Molecular & Cellular Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3014"}
+{"code": "BIOM3015", "name": "Integrative Physiology & Pathophysiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3015"}
+{"code": "BIOM3020", "name": "Integrated Endocrinology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3020"}
+{"code": "BIOM3200", "name": "Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3200"}
+{"code": "BIOM3333", "name": "Principles of Biomedical Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3333"}
+{"code": "BIOM3401", "name": "Systems Pharmacology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3401"}
+{"code": "BIOM3402", "name": "Experimental Pharmacology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM3402"}
+{"code": "BIOM6101", "name": "Research Project in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6101"}
+{"code": "BIOM6102", "name": "Research Project in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6102"}
+{"code": "BIOM6103", "name": "Research Project in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6103"}
+{"code": "BIOM6104", "name": "Research Project in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6104"}
+{"code": "BIOM6105", "name": "Research Project in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6105"}
+{"code": "BIOM6191", "name": "Research Project in Biomedical Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6191"}
+{"code": "BIOM6192", "name": "Research Project in Biomedical Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6192"}
+{"code": "BIOM6193", "name": "Research Project in Biomedical Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6193"}
+{"code": "BIOM6301", "name": "Research Proposal in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6301"}
+{"code": "BIOM6401", "name": "Special Topics in Biomedical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6401"}
+{"code": "BIOM6501", "name": "Research Project in Biomedical Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6501"}
+{"code": "BIOM6502", "name": "Research Project in Biomedical Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6502"}
+{"code": "BIOM6503", "name": "Research Project in Biomedical Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6503"}
+{"code": "BIOM6504", "name": "Biomedical Research Background", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6504"}
+{"code": "BIOM6505", "name": "Biomedical Research Background", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6505"}
+{"code": "BIOM6506", "name": "Biomedical Research Background", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6506"}
+{"code": "BIOM6520", "name": "Biomedical Science Perspectives A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6520"}
+{"code": "BIOM6521", "name": "Biomedical Science Perspectives B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM6521"}
+{"code": "BIOM7121", "name": "Fundamental Biomedical Sciences for Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOM7121"}
+{"code": "BIOT2002", "name": "Introduction to Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT2002"}
+{"code": "BIOT3002", "name": "Drug Design & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT3002"}
+{"code": "BIOT3004", "name": "Commercialisation of Biotechnology Products", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT3004"}
+{"code": "BIOT3007", "name": "Biotechnology Industry Placements/ Internship Program", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT3007"}
+{"code": "BIOT3009", "name": "Quality Management Systems in Biotechnology: GMP, GLP, GCP", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT3009"}
+{"code": "BIOT4000", "name": "Product Development in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT4000"}
+{"code": "BIOT4001", "name": "Drug Development Laboratory Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT4001"}
+{"code": "BIOT4002", "name": "Literature Review", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT4002"}
+{"code": "BIOT4020", "name": "Biotechnology Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT4020"}
+{"code": "BIOT4039", "name": "Biotechnology Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT4039"}
+{"code": "BIOT4070", "name": "Biotechnology Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT4070"}
+{"code": "BIOT6010", "name": "Research Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6010"}
+{"code": "BIOT6011", "name": "Research Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6011"}
+{"code": "BIOT6012", "name": "Research Project C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6012"}
+{"code": "BIOT6014", "name": "Literature Review B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6014"}
+{"code": "BIOT6015", "name": "Literature Review C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6015"}
+{"code": "BIOT6121", "name": "Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6121"}
+{"code": "BIOT6122", "name": "Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6122"}
+{"code": "BIOT6123", "name": "Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6123"}
+{"code": "BIOT6124", "name": "Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6124"}
+{"code": "BIOT6125", "name": "Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT6125"}
+{"code": "BIOT7000", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7000"}
+{"code": "BIOT7001", "name": "Minor Research Project & Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7001"}
+{"code": "BIOT7002", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7002"}
+{"code": "BIOT7003", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7003"}
+{"code": "BIOT7004", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7004"}
+{"code": "BIOT7005", "name": "Business Planning in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7005"}
+{"code": "BIOT7010", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7010"}
+{"code": "BIOT7011", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7011"}
+{"code": "BIOT7012", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7012"}
+{"code": "BIOT7014", "name": "Literature Review B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7014"}
+{"code": "BIOT7015", "name": "Literature Review C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7015"}
+{"code": "BIOT7018", "name": "Biologics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7018"}
+{"code": "BIOT7019", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7019"}
+{"code": "BIOT7020", "name": "Advanced Masters Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7020"}
+{"code": "BIOT7021", "name": "Advanced Masters Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7021"}
+{"code": "BIOT7022", "name": "Advanced Masters Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7022"}
+{"code": "BIOT7024", "name": "Advanced Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7024"}
+{"code": "BIOT7025", "name": "Advanced Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7025"}
+{"code": "BIOT7026", "name": "Advanced Research Project in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7026"}
+{"code": "BIOT7030", "name": "Drug Discovery & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7030"}
+{"code": "BIOT7031", "name": "Quality Management Systems in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7031"}
+{"code": "BIOT7033", "name": "Issues in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7033"}
+{"code": "BIOT7034", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7034"}
+{"code": "BIOT7035", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7035"}
+{"code": "BIOT7037", "name": "Current Innovations in Agricultural Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7037"}
+{"code": "BIOT7038", "name": "Biotechnology Applied to Livestock Industries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7038"}
+{"code": "BIOT7040", "name": "Biotechnology Intellectual Property Case Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT7040"}
+{"code": "BIOT8000", "name": "Advanced Biotechnologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8000"}
+{"code": "BIOT8001", "name": "Advanced Study of the Legal, Ethical & Social Aspects of Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8001"}
+{"code": "BIOT8002", "name": "Extended Research Proposal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8002"}
+{"code": "BIOT8003", "name": "Biotechnology Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8003"}
+{"code": "BIOT8004", "name": "Biotechnology Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8004"}
+{"code": "BIOT8005", "name": "Biotechnology Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8005"}
+{"code": "BIOT8007", "name": "Biotechnology Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8007"}
+{"code": "BIOT8008", "name": "Biotechnology Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8008"}
+{"code": "BIOT8010", "name": "Professional Practice in Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIOT8010"}
+{"code": "BIPH2000", "name": "Foundations of Biophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIPH2000"}
+{"code": "BIPH3001", "name": "Frontiers in Biophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BIPH3001"}
+{"code": "BISM1201", "name": "Transforming Business with Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM1201"}
+{"code": "BISM2201", "name": "Principles of Business Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2201"}
+{"code": "BISM2202", "name": "Data Analytics and Information Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2202"}
+{"code": "BISM2203", "name": "Business Process Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2203"}
+{"code": "BISM2204", "name": "Methods of Business Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2204"}
+{"code": "BISM2205", "name": "Predictive Analytics for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2205"}
+{"code": "BISM2206", "name": "Accounting Information and Software Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2206"}
+{"code": "BISM2207", "name": "Managing Business Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2207"}
+{"code": "BISM2233", "name": "eBusiness Systems and Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM2233"}
+{"code": "BISM3201", "name": "Accounting Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3201"}
+{"code": "BISM3202", "name": "Machine Learning in R", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3202"}
+{"code": "BISM3203", "name": "Managing Business Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3203"}
+{"code": "BISM3204", "name": "Data Visualisation for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3204"}
+{"code": "BISM3205", "name": "Business Information Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3205"}
+{"code": "BISM3206", "name": "Advanced Data Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3206"}
+{"code": "BISM3207", "name": "Managing Work in Virtual Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3207"}
+{"code": "BISM3208", "name": "Information Systems Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3208"}
+{"code": "BISM3209", "name": "Prescriptive Analytics for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3209"}
+{"code": "BISM3210", "name": "Technology of Business Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3210"}
+{"code": "BISM3222", "name": "Information Analysis and System Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM3222"}
+{"code": "BISM4201", "name": "Business Analytics: Cases and Strategies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM4201"}
+{"code": "BISM4202", "name": "Text Analysis in R", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM4202"}
+{"code": "BISM4203", "name": "Advanced Studies in Business Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM4203"}
+{"code": "BISM6211", "name": "Information Systems Honours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM6211"}
+{"code": "BISM6222", "name": "Research in Electronic Commerce", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM6222"}
+{"code": "BISM7202", "name": "Information Systems for Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7202"}
+{"code": "BISM7206", "name": "Information Retrieval and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7206"}
+{"code": "BISM7208", "name": "Information Systems Strategy and Sourcing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7208"}
+{"code": "BISM7209", "name": "Accounting Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7209"}
+{"code": "BISM7210", "name": "Foundations of eBusiness", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7210"}
+{"code": "BISM7213", "name": "Securing Business Information", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7213"}
+{"code": "BISM7215", "name": "Managing Virtual Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7215"}
+{"code": "BISM7216", "name": "Business Process Improvement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7216"}
+{"code": "BISM7217", "name": "Advanced Business Data Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7217"}
+{"code": "BISM7221", "name": "Information Systems Control, Governance and Audit", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7221"}
+{"code": "BISM7233", "name": "Data Analytics for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7233"}
+{"code": "BISM7255", "name": "Business Information Systems Analysis and Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7255"}
+{"code": "BISM7620", "name": "Cyber Security Risk Management and Controls", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7620"}
+{"code": "BISM7807", "name": "Operations Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7807"}
+{"code": "BISM7808", "name": "Information Technology for Business Value", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BISM7808"}
+{"code": "BLDG1220", "name": "Building Materials: Properties, Principles and Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLDG1220"}
+{"code": "BLDG2120", "name": "Building Science: Performance and Sustainability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLDG2120"}
+{"code": "BLDG2220", "name": "Building Construction and Documentation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLDG2220"}
+{"code": "BLDG3120", "name": "Building Structures and Envelopes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLDG3120"}
+{"code": "BLDG3220", "name": "Building Systems: Integration and Detailing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLDG3220"}
+{"code": "BLDG7021", "name": "Building Futures: Advanced Structures and Software", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLDG7021"}
+{"code": "BLSI7004", "name": "Customer Experience Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7004"}
+{"code": "BLSI7005", "name": "Value Creation in Service", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7005"}
+{"code": "BLSI7006", "name": "Principles of Innovation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7006"}
+{"code": "BLSI7007", "name": "Service Design Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7007"}
+{"code": "BLSI7008", "name": "Crafting a Service Innovation Organisational Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7008"}
+{"code": "BLSI7009", "name": "Data and Analytics for Service", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7009"}
+{"code": "BLSI7010", "name": "Service Interactions in a Digital Age", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7010"}
+{"code": "BLSI7011", "name": "Service Innovation Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=BLSI7011"}
+{"code": "CHEE1001", "name": "Principles of Biological Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE1001"}
+{"code": "CHEE2001", "name": "Process Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE2001"}
+{"code": "CHEE2003", "name": "Fluid & Particle Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE2003"}
+{"code": "CHEE2005", "name": "Chemical Product Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE2005"}
+{"code": "CHEE2007", "name": "Modelling of Physiological Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE2007"}
+{"code": "CHEE2010", "name": "Engineering Investigation & Statistical Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE2010"}
+{"code": "CHEE2501", "name": "Environmental Systems Engineering I: Processes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE2501"}
+{"code": "CHEE3002", "name": "Heat & Mass Transfer", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3002"}
+{"code": "CHEE3003", "name": "Chemical Thermodynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3003"}
+{"code": "CHEE3004", "name": "Unit Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3004"}
+{"code": "CHEE3005", "name": "Reaction Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3005"}
+{"code": "CHEE3007", "name": "Process Modelling & Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3007"}
+{"code": "CHEE3008", "name": "Special Topics C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3008"}
+{"code": "CHEE3020", "name": "Process Systems Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3020"}
+{"code": "CHEE3205", "name": "Metallurgical Process Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3205"}
+{"code": "CHEE3301", "name": "Polymer Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE3301"}
+{"code": "CHEE4001", "name": "Process Engineering Design Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4001"}
+{"code": "CHEE4002", "name": "Risk in Process Industries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4002"}
+{"code": "CHEE4003", "name": "Special Topics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4003"}
+{"code": "CHEE4006", "name": "Individual Inquiry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4006"}
+{"code": "CHEE4007", "name": "Individual Inquiry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4007"}
+{"code": "CHEE4009", "name": "Transport Phenomena", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4009"}
+{"code": "CHEE4012", "name": "Industrial Wastewater & Solid Waste Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4012"}
+{"code": "CHEE4015", "name": "Special Topics VII", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4015"}
+{"code": "CHEE4020", "name": "Biomolecular Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4020"}
+{"code": "CHEE4021", "name": "Particle Design & Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4021"}
+{"code": "CHEE4022", "name": "Principles of Adsorption", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4022"}
+{"code": "CHEE4024", "name": "Energy Systems in Sustainable Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4024"}
+{"code": "CHEE4026", "name": "Thesis Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4026"}
+{"code": "CHEE4027", "name": "Thesis Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4027"}
+{"code": "CHEE4028", "name": "Metabolic Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4028"}
+{"code": "CHEE4034", "name": "Cell & Tissue Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4034"}
+{"code": "CHEE4060", "name": "Process & Control System Synthesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4060"}
+{"code": "CHEE4301", "name": "Nanomaterials", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4301"}
+{"code": "CHEE4302", "name": "Electrochemistry & Corrosion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4302"}
+{"code": "CHEE4303", "name": "Interface and Colloid Science and Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4303"}
+{"code": "CHEE4305", "name": "Biomaterials: Materials in Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE4305"}
+{"code": "CHEE7102", "name": "Chemical Engineering Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7102"}
+{"code": "CHEE7103", "name": "Chemical Engineering ME Design Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7103"}
+{"code": "CHEE7104", "name": "Chemical Engineering Placement A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7104"}
+{"code": "CHEE7105", "name": "Chemical Engineering Placement B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7105"}
+{"code": "CHEE7106", "name": "Chemical Engineering Placement C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7106"}
+{"code": "CHEE7107", "name": "Chemical Engineering Placement D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7107"}
+{"code": "CHEE7108", "name": "Chemical Engineering Placement E", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7108"}
+{"code": "CHEE7109", "name": "Chemical Engineering Placement F", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7109"}
+{"code": "CHEE7111", "name": "Advanced Process and System Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7111"}
+{"code": "CHEE7112", "name": "Integrated Safety Design and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7112"}
+{"code": "CHEE7113", "name": "Whole of Process Optimisation and Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7113"}
+{"code": "CHEE7325", "name": "Biomaterials: Materials in Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7325"}
+{"code": "CHEE7331", "name": "Polymer Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7331"}
+{"code": "CHEE7408", "name": "Cell and Tissue Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7408"}
+{"code": "CHEE7409", "name": "Metabolic Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7409"}
+{"code": "CHEE7501", "name": "Advanced Water Technology and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7501"}
+{"code": "CHEE7502", "name": "Sustainable Bioresource Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7502"}
+{"code": "CHEE7600", "name": "Special Topics in Chemical Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7600"}
+{"code": "CHEE7601", "name": "Nanomaterials", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEE7601"}
+{"code": "CHEM1004", "name": "Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1004"}
+{"code": "CHEM1090", "name": "Introductory Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1090"}
+{"code": "CHEM1100", "name": "Chemistry 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1100"}
+{"code": "CHEM1200", "name": "Chemistry 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1200"}
+{"code": "CHEM1221", "name": "General, Organic & Biological Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1221"}
+{"code": "CHEM1222", "name": "Chemistry for Pharmacy & Dentistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1222"}
+{"code": "CHEM1500E", "name": "Pre-University Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1500E"}
+{"code": "CHEM1501E", "name": "Pre-University Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1501E"}
+{"code": "CHEM1502E", "name": "Pre-University Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM1502E"}
+{"code": "CHEM2002", "name": "Physical Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2002"}
+{"code": "CHEM2003", "name": "Food Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2003"}
+{"code": "CHEM2050", "name": "Intermediate Chemistry 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2050"}
+{"code": "CHEM2052", "name": "Chemical Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2052"}
+{"code": "CHEM2054", "name": "Experimental Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2054"}
+{"code": "CHEM2056", "name": "Physical Chemistry for Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2056"}
+{"code": "CHEM2058", "name": "Translational Chemistry and Data Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2058"}
+{"code": "CHEM2060", "name": "Intermediate Chemistry 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2060"}
+{"code": "CHEM2901", "name": "Advanced Chemistry 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2901"}
+{"code": "CHEM2902", "name": "Advanced Chemistry 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM2902"}
+{"code": "CHEM3001", "name": "Advanced Organic Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3001"}
+{"code": "CHEM3004", "name": "Determination of Molecular Structure", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3004"}
+{"code": "CHEM3008", "name": "Medicinal & Biological Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3008"}
+{"code": "CHEM3010", "name": "Advanced Inorganic Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3010"}
+{"code": "CHEM3011", "name": "Advanced Physical Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3011"}
+{"code": "CHEM3013", "name": "Nanoscience: Self-assembly", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3013"}
+{"code": "CHEM3014", "name": "Nanoscience: Synthesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3014"}
+{"code": "CHEM3016", "name": "Advanced Experimental Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3016"}
+{"code": "CHEM3020", "name": "Medicinal Chemistry and Chemical Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3020"}
+{"code": "CHEM3030", "name": "Nanomaterials and Self-Assembled Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM3030"}
+{"code": "CHEM6511", "name": "Honours in Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM6511"}
+{"code": "CHEM6512", "name": "Honours in Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM6512"}
+{"code": "CHEM6513", "name": "Honours in Chemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHEM6513"}
+{"code": "CHIN1100", "name": "Spoken Chinese IA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN1100"}
+{"code": "CHIN1200", "name": "Written Chinese IA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN1200"}
+{"code": "CHIN2100", "name": "Spoken Chinese IB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN2100"}
+{"code": "CHIN2110", "name": "Spoken Chinese IIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN2110"}
+{"code": "CHIN2200", "name": "Written Chinese IB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN2200"}
+{"code": "CHIN2555", "name": "English and Chinese Interpreting 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN2555"}
+{"code": "CHIN2600", "name": "Chinese for Native Speakers: Essentials of Chinese Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN2600"}
+{"code": "CHIN2700", "name": "Chinese > English Translation: An Introductory Course", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN2700"}
+{"code": "CHIN2750", "name": "Fundamentals in English > Chinese Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN2750"}
+{"code": "CHIN3001", "name": "Written Chinese IIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3001"}
+{"code": "CHIN3010", "name": "Spoken Chinese IIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3010"}
+{"code": "CHIN3020", "name": "Written Chinese IIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3020"}
+{"code": "CHIN3100", "name": "Spoken Chinese IIIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3100"}
+{"code": "CHIN3110", "name": "Spoken Chinese IIIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3110"}
+{"code": "CHIN3200", "name": "Written Chinese IIIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3200"}
+{"code": "CHIN3210", "name": "Written Chinese IIIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3210"}
+{"code": "CHIN3300", "name": "Chinese>English Translation for Non - Native Speakers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3300"}
+{"code": "CHIN3555", "name": "English and Chinese Interpreting 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3555"}
+{"code": "CHIN3760", "name": "Techniques in English > Chinese Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3760"}
+{"code": "CHIN3770", "name": "Advanced Chinese>English Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3770"}
+{"code": "CHIN3810", "name": "Chinese Cinema and Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3810"}
+{"code": "CHIN3900", "name": "Techniques in Teaching Chinese as a Second Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN3900"}
+{"code": "CHIN6000", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN6000"}
+{"code": "CHIN6100", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN6100"}
+{"code": "CHIN6101", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN6101"}
+{"code": "CHIN6340", "name": "Advanced Chinese Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN6340"}
+{"code": "CHIN6350", "name": "Special Topics in Chinese Language Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN6350"}
+{"code": "CHIN6364", "name": "Special Topics in Chinese Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN6364"}
+{"code": "CHIN7101", "name": "Translation Skills and Practice (English to Chinese)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7101"}
+{"code": "CHIN7102", "name": "Translation Skills and Practice (Chinese to English)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7102"}
+{"code": "CHIN7110", "name": "Interpreting Skills & Practice (English and Mandarin)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7110"}
+{"code": "CHIN7120", "name": "Language Consolidation for Translation & Interpreting Purposes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7120"}
+{"code": "CHIN7130", "name": "Theoretical & Professional Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7130"}
+{"code": "CHIN7140", "name": "Professional Translation (English and Chinese)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7140"}
+{"code": "CHIN7141", "name": "Professional Translation (English to Chinese)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7141"}
+{"code": "CHIN7142", "name": "Professional Translation (Chinese to English)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7142"}
+{"code": "CHIN7150", "name": "Professional Interpreting (English and Mandarin)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7150"}
+{"code": "CHIN7160", "name": "Contextual Studies for Translators & Interpreters", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7160"}
+{"code": "CHIN7170", "name": "Translation & Interpreting Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7170"}
+{"code": "CHIN7180", "name": "Thesis in Translation & Interpreting Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7180"}
+{"code": "CHIN7182", "name": "Thesis in Translation and Interpreting Studies (Advanced)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7182"}
+{"code": "CHIN7190", "name": "Simultaneous Interpreting (English and Mandarin)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7190"}
+{"code": "CHIN7191", "name": "Supervised Translation Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7191"}
+{"code": "CHIN7444", "name": "Legal Interpreting and Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7444"}
+{"code": "CHIN7555", "name": "Literary Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7555"}
+{"code": "CHIN7666", "name": "Translation and Interpreting for Science, Engineering and Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CHIN7666"}
+{"code": "CIVL2131", "name": "Environmental Fluid Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2131"}
+{"code": "CIVL2135", "name": "Environmental Issues and Sustainability in Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2135"}
+{"code": "CIVL2140", "name": "Catchment Hydrology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2140"}
+{"code": "CIVL2210", "name": "Soil Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2210"}
+{"code": "CIVL2330", "name": "Structural Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2330"}
+{"code": "CIVL2340", "name": "Design of Steel Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2340"}
+{"code": "CIVL2360", "name": "Design of Concrete Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2360"}
+{"code": "CIVL2410", "name": "Sustainable Transport Engineering - Traffic Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2410"}
+{"code": "CIVL2530", "name": "Probability and Statistics in Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL2530"}
+{"code": "CIVL3130", "name": "Fluid Mechanics for Civil Engineers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3130"}
+{"code": "CIVL3140", "name": "Hydraulics of Engineered and Natural Waterways", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3140"}
+{"code": "CIVL3141", "name": "Hydrology and Hydrological Risk", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3141"}
+{"code": "CIVL3150", "name": "Modelling of Environmental Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3150"}
+{"code": "CIVL3210", "name": "Geotechnical Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3210"}
+{"code": "CIVL3340", "name": "Structural Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3340"}
+{"code": "CIVL3350", "name": "Integrated Structural Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3350"}
+{"code": "CIVL3420", "name": "Sustainable Transport Engineering - Planning and Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3420"}
+{"code": "CIVL3510", "name": "Project Management with Building Information Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL3510"}
+{"code": "CIVL4110", "name": "Coastal & Estuarine Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4110"}
+{"code": "CIVL4120", "name": "Advanced Hydraulic Engineering and Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4120"}
+{"code": "CIVL4140", "name": "Contaminant Transport Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4140"}
+{"code": "CIVL4160", "name": "Advanced Fluid Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4160"}
+{"code": "CIVL4170", "name": "Environmental Risk Assessment and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4170"}
+{"code": "CIVL4180", "name": "Sustainable Built Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4180"}
+{"code": "CIVL4230", "name": "Advanced Soil Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4230"}
+{"code": "CIVL4250", "name": "Engineering Problem Solving with Numerical Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4250"}
+{"code": "CIVL4270", "name": "Geotechnical Investigation & Testing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4270"}
+{"code": "CIVL4280", "name": "Advanced Rock Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4280"}
+{"code": "CIVL4320", "name": "Engineering of Small Buildings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4320"}
+{"code": "CIVL4330", "name": "Advanced Structural Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4330"}
+{"code": "CIVL4331", "name": "Advanced Structural Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4331"}
+{"code": "CIVL4332", "name": "Advanced Structural Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4332"}
+{"code": "CIVL4333", "name": "Advanced Concrete Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4333"}
+{"code": "CIVL4334", "name": "Design of Timber Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4334"}
+{"code": "CIVL4340", "name": "Wind Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4340"}
+{"code": "CIVL4411", "name": "Advanced Transport Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4411"}
+{"code": "CIVL4412", "name": "Travel Behaviour and Transport Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4412"}
+{"code": "CIVL4450", "name": "Traffic Flow Theory and Emerging Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4450"}
+{"code": "CIVL4460", "name": "Highway Geometric Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4460"}
+{"code": "CIVL4511", "name": "Civil Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4511"}
+{"code": "CIVL4512", "name": "Civil Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4512"}
+{"code": "CIVL4513", "name": "Special studies - Civil Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4513"}
+{"code": "CIVL4514", "name": "Integrated Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4514"}
+{"code": "CIVL4515", "name": "Civil Design II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4515"}
+{"code": "CIVL4516", "name": "Integrated Design for Environmental Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4516"}
+{"code": "CIVL4520", "name": "Civil Engineering Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4520"}
+{"code": "CIVL4522", "name": "Analytical Methods for the Design of Construction Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4522"}
+{"code": "CIVL4560", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4560"}
+{"code": "CIVL4580", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4580"}
+{"code": "CIVL4582", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL4582"}
+{"code": "CIVL7131", "name": "Urban Hydrology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7131"}
+{"code": "CIVL7135", "name": "Advanced Environmental Monitoring Techniques for Civil Engineers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7135"}
+{"code": "CIVL7155", "name": "Environmental Fluid Mechanics - Modelling Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7155"}
+{"code": "CIVL7170", "name": "Pollution Control in Cities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7170"}
+{"code": "CIVL7215", "name": "Ground Improvement & Remediation Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7215"}
+{"code": "CIVL7225", "name": "Dam and Embankment Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7225"}
+{"code": "CIVL7235", "name": "Underground Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7235"}
+{"code": "CIVL7315", "name": "Advanced Concrete Structures and Concrete Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7315"}
+{"code": "CIVL7350", "name": "Design of Composite Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7350"}
+{"code": "CIVL7360", "name": "Computational Design and Digital Workflows", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7360"}
+{"code": "CIVL7415", "name": "Spatial and Quantitative Methods for Transport Data Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7415"}
+{"code": "CIVL7425", "name": "Strategic Transport Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7425"}
+{"code": "CIVL7435", "name": "Traffic Simulation: Methods and Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7435"}
+{"code": "CIVL7500", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7500"}
+{"code": "CIVL7501", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7501"}
+{"code": "CIVL7505", "name": "Research Methods for Civil Engineers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7505"}
+{"code": "CIVL7511", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7511"}
+{"code": "CIVL7512", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7512"}
+{"code": "CIVL7603", "name": "Special Topics in Civil Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CIVL7603"}
+{"code": "COGS3010", "name": "Human Reasoning: Choice, Risk & Decision", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COGS3010"}
+{"code": "COGS4100", "name": "Graduate Certificate Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COGS4100"}
+{"code": "COMP1024", "name": "Conceptual Foundations of Computer Programming", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP1024"}
+{"code": "COMP1900", "name": "Information Access and Internet Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP1900"}
+{"code": "COMP2000", "name": "Special Topics in Computer Science 2A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP2000"}
+{"code": "COMP2001", "name": "Special Topics in Computer Science 2B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP2001"}
+{"code": "COMP2048", "name": "Theory of Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP2048"}
+{"code": "COMP2303", "name": "Network & Operating Systems Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP2303"}
+{"code": "COMP2506", "name": "Human-Computer Interaction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP2506"}
+{"code": "COMP3000", "name": "Special Topics in Computer Science 3A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3000"}
+{"code": "COMP3001", "name": "Special Topics in Computer Science 3B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3001"}
+{"code": "COMP3301", "name": "Operating Systems Architecture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3301"}
+{"code": "COMP3320", "name": "Vulnerability Assessment and Penetration Test", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3320"}
+{"code": "COMP3400", "name": "Functional & Logic Programming", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3400"}
+{"code": "COMP3401", "name": "Compilers and Interpreters", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3401"}
+{"code": "COMP3505", "name": "Social and Mobile Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3505"}
+{"code": "COMP3506", "name": "Algorithms & Data Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3506"}
+{"code": "COMP3702", "name": "Artificial Intelligence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3702"}
+{"code": "COMP3710", "name": "Pattern Recognition and Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3710"}
+{"code": "COMP3880", "name": "International Software Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP3880"}
+{"code": "COMP4000", "name": "Special Topics in Computer Science 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4000"}
+{"code": "COMP4001", "name": "Special Topics in Computer Science 4B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4001"}
+{"code": "COMP4002", "name": "Special Topics in Computer Science 4C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4002"}
+{"code": "COMP4003", "name": "Special Topics Computer Science 4D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4003"}
+{"code": "COMP4004", "name": "Special Topics in Computer Science 4E", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4004"}
+{"code": "COMP4005", "name": "Special Topics in Computer Science 4F", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4005"}
+{"code": "COMP4403", "name": "Compilers and Interpreters", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4403"}
+{"code": "COMP4500", "name": "Advanced Algorithms & Data Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4500"}
+{"code": "COMP4501", "name": "Advanced Human-Computer Interaction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4501"}
+{"code": "COMP4702", "name": "Machine Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP4702"}
+{"code": "COMP6801", "name": "Computer Science Honours Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP6801"}
+{"code": "COMP6802", "name": "Computer Science Honours Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP6802"}
+{"code": "COMP6803", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP6803"}
+{"code": "COMP6804", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP6804"}
+{"code": "COMP7000", "name": "Special Topics in Computer Science 7A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7000"}
+{"code": "COMP7001", "name": "Special Topics in Computer Science 7B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7001"}
+{"code": "COMP7007", "name": "Special Topics in Computer Science 7C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7007"}
+{"code": "COMP7008", "name": "Special Topics in Computer Science 7D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7008"}
+{"code": "COMP7009", "name": "Special Topics in Computer Science 7E", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7009"}
+{"code": "COMP7010", "name": "Special Topics in Computer Science 7F", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7010"}
+{"code": "COMP7024", "name": "Conceptual Foundation of Computer Programming", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7024"}
+{"code": "COMP7306", "name": "Network & Operating Systems Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7306"}
+{"code": "COMP7308", "name": "Operating Systems Architecture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7308"}
+{"code": "COMP7402", "name": "Compilers and Interpreters", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7402"}
+{"code": "COMP7500", "name": "Advanced Algorithms & Data Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7500"}
+{"code": "COMP7505", "name": "Algorithms & Data Structures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7505"}
+{"code": "COMP7510", "name": "Programming Language Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7510"}
+{"code": "COMP7702", "name": "Artificial Intelligence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7702"}
+{"code": "COMP7703", "name": "Machine Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7703"}
+{"code": "COMP7710", "name": "Artificial Intelligence for Cyber Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7710"}
+{"code": "COMP7711", "name": "Cyber Incident Response", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7711"}
+{"code": "COMP7801", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7801"}
+{"code": "COMP7802", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7802"}
+{"code": "COMP7840", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7840"}
+{"code": "COMP7860", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7860"}
+{"code": "COMP7861", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7861"}
+{"code": "COMP7862", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7862"}
+{"code": "COMP7880", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7880"}
+{"code": "COMP7881", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7881"}
+{"code": "COMP7882", "name": "Computer Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMP7882"}
+{"code": "COMS3000", "name": "Information Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS3000"}
+{"code": "COMS3200", "name": "Computer Networks I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS3200"}
+{"code": "COMS4103", "name": "Photonics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS4103"}
+{"code": "COMS4104", "name": "Microwave Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS4104"}
+{"code": "COMS4105", "name": "Communication Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS4105"}
+{"code": "COMS4200", "name": "Computer Networks II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS4200"}
+{"code": "COMS4507", "name": "Advanced Topics in Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS4507"}
+{"code": "COMS7000", "name": "Advanced Topics in Communications I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7000"}
+{"code": "COMS7003", "name": "Information Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7003"}
+{"code": "COMS7200", "name": "Computer Networks II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7200"}
+{"code": "COMS7201", "name": "Computer Networks I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7201"}
+{"code": "COMS7305", "name": "Advanced Microwave Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7305"}
+{"code": "COMS7306", "name": "Electromagnetic Design and Measurements in Microwaves and Photonics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7306"}
+{"code": "COMS7307", "name": "Advanced Photonics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7307"}
+{"code": "COMS7308", "name": "Antenna Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7308"}
+{"code": "COMS7309", "name": "Computational Techniques in Electromagnetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7309"}
+{"code": "COMS7310", "name": "Radar and Electronic Warfare Fundamentals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7310"}
+{"code": "COMS7311", "name": "Microwave Remote Sensing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7311"}
+{"code": "COMS7400", "name": "Photonics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7400"}
+{"code": "COMS7501", "name": "Broadband Communication Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7501"}
+{"code": "COMS7507", "name": "Advanced topics in Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMS7507"}
+{"code": "COMU1002", "name": "Communicating Across Cultures: Theory and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1002"}
+{"code": "COMU1030", "name": "Communication Skills: Spoken Language & Interpersonal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1030"}
+{"code": "COMU1050", "name": "Understanding the News", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1050"}
+{"code": "COMU1052", "name": "Introduction to Public Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1052"}
+{"code": "COMU1120", "name": "Media and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1120"}
+{"code": "COMU1130", "name": "Connectivity and Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1130"}
+{"code": "COMU1140", "name": "Multimedia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1140"}
+{"code": "COMU1152", "name": "Public Relations Writing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1152"}
+{"code": "COMU1903C", "name": "Rural Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU1903C"}
+{"code": "COMU2020", "name": "Professional Practice & Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2020"}
+{"code": "COMU2030", "name": "Communication Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2030"}
+{"code": "COMU2040", "name": "Language Awareness & Cross-Cultural Competence for the Global Workplace", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2040"}
+{"code": "COMU2120", "name": "Media Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2120"}
+{"code": "COMU2140", "name": "Digital Media Industries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2140"}
+{"code": "COMU2150", "name": "Media and Identity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2150"}
+{"code": "COMU2160", "name": "Communication Law and Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2160"}
+{"code": "COMU2170", "name": "Intercultural Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2170"}
+{"code": "COMU2180", "name": "Media Strategies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2180"}
+{"code": "COMU2311", "name": "Communication for Social Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU2311"}
+{"code": "COMU3005", "name": "Media Cultures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3005"}
+{"code": "COMU3010", "name": "Language and Globalisation: Advanced Intercultural Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3010"}
+{"code": "COMU3015", "name": "Public Interest Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3015"}
+{"code": "COMU3060", "name": "Learning from the International Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3060"}
+{"code": "COMU3065", "name": "Learning from the International Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3065"}
+{"code": "COMU3100", "name": "Digital Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3100"}
+{"code": "COMU3110", "name": "Media Platforms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3110"}
+{"code": "COMU3120", "name": "Digital Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3120"}
+{"code": "COMU3130", "name": "Public Relations Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3130"}
+{"code": "COMU3140", "name": "Issues and Stakeholder Engagement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3140"}
+{"code": "COMU3222", "name": "Political Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3222"}
+{"code": "COMU3801", "name": "Communication Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU3801"}
+{"code": "COMU6005", "name": "Communication & Cultural Studies Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU6005"}
+{"code": "COMU6006", "name": "Communication & Cultural Studies Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU6006"}
+{"code": "COMU6008", "name": "Topics in Journalism and Communication Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU6008"}
+{"code": "COMU6050", "name": "Honours Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU6050"}
+{"code": "COMU6500", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU6500"}
+{"code": "COMU7000", "name": "Communication for Social Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7000"}
+{"code": "COMU7002", "name": "Communication Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7002"}
+{"code": "COMU7007", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7007"}
+{"code": "COMU7008", "name": "Thesis Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7008"}
+{"code": "COMU7009", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7009"}
+{"code": "COMU7012", "name": "Communication and Social Movements", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7012"}
+{"code": "COMU7013", "name": "Participatory Development Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7013"}
+{"code": "COMU7014", "name": "Community Informatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7014"}
+{"code": "COMU7015", "name": "Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7015"}
+{"code": "COMU7016", "name": "Participatory Media Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7016"}
+{"code": "COMU7102", "name": "Communication for Social Change: Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7102"}
+{"code": "COMU7103", "name": "PR and Professional Practice: Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7103"}
+{"code": "COMU7111", "name": "Risk Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7111"}
+{"code": "COMU7201", "name": "Communication Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7201"}
+{"code": "COMU7292", "name": "Communication Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7292"}
+{"code": "COMU7301", "name": "Communication Practice and Campaigns", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7301"}
+{"code": "COMU7302", "name": "Issues and Crisis Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7302"}
+{"code": "COMU7304", "name": "Digital Media Theory and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7304"}
+{"code": "COMU7311", "name": "Intercultural Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7311"}
+{"code": "COMU7500", "name": "Ethics and Law for Communicators", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7500"}
+{"code": "COMU7777", "name": "Media, Communication and the Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COMU7777"}
+{"code": "CONS3017", "name": "Landscape Ecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS3017"}
+{"code": "CONS6009", "name": "Conservation & Wildlife Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS6009"}
+{"code": "CONS6017", "name": "Landscape Ecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS6017"}
+{"code": "CONS7004", "name": "Major Research Project & Seminars", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7004"}
+{"code": "CONS7008", "name": "Sampling Design and Analysis in Conservation Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7008"}
+{"code": "CONS7021", "name": "Conservation Decision-Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7021"}
+{"code": "CONS7022", "name": "Space invaders. Invasive species, field skills and GIS mapping", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7022"}
+{"code": "CONS7023", "name": "Applied Fauna Conservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7023"}
+{"code": "CONS7024", "name": "Marine Conservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7024"}
+{"code": "CONS7025", "name": "Rainforest Conservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7025"}
+{"code": "CONS7027", "name": "Conservation Concerns: An industry perspective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7027"}
+{"code": "CONS7029", "name": "Conservation in Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7029"}
+{"code": "CONS7030", "name": "Conservation and Agriculture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CONS7030"}
+{"code": "COSC2500", "name": "Numerical Methods in Computational Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COSC2500"}
+{"code": "COSC3000", "name": "Visualization, Computer Graphics & Data Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COSC3000"}
+{"code": "COSC3500", "name": "High-Performance Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COSC3500"}
+{"code": "COSC7500", "name": "Numerical Methods in Computational Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COSC7500"}
+{"code": "COSC7502", "name": "High-Performance Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COSC7502"}
+{"code": "COUN7001", "name": "Interpersonal Skills in Counselling 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7001"}
+{"code": "COUN7002", "name": "Theories of Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7002"}
+{"code": "COUN7003", "name": "Crisis Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7003"}
+{"code": "COUN7004", "name": "Relationship Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7004"}
+{"code": "COUN7005", "name": "Counselling and Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7005"}
+{"code": "COUN7006", "name": "Advanced Interpersonal Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7006"}
+{"code": "COUN7008", "name": "Traumatology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7008"}
+{"code": "COUN7012", "name": "Counselling Children and Young People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7012"}
+{"code": "COUN7014", "name": "Understanding and Caring for Those Affected by Loss", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7014"}
+{"code": "COUN7015", "name": "Counselling for Health and Capacity Challenges", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7015"}
+{"code": "COUN7016", "name": "Ethics and Professional Practice Issues in Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7016"}
+{"code": "COUN7019", "name": "Counselling for Crisis and Violence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7019"}
+{"code": "COUN7020", "name": "Counselling Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7020"}
+{"code": "COUN7901", "name": "Children, Young People and Families", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7901"}
+{"code": "COUN7902", "name": "Theories and Modalities of Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7902"}
+{"code": "COUN7903", "name": "The Process and Interpersonal Skills of Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7903"}
+{"code": "COUN7904", "name": "Loss, Trauma, Disaster and Violence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=COUN7904"}
+{"code": "CRIM1000", "name": "Introduction to Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM1000"}
+{"code": "CRIM1019", "name": "Introduction to Criminal Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM1019"}
+{"code": "CRIM1101X", "name": "The Psychology of Criminal Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM1101X"}
+{"code": "CRIM1111", "name": "Introduction to Professional Practice in Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM1111"}
+{"code": "CRIM2000", "name": "Youth and Deviance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2000"}
+{"code": "CRIM2001", "name": "Crime, Justice & Punishment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2001"}
+{"code": "CRIM2030", "name": "Criminal Minds", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2030"}
+{"code": "CRIM2080", "name": "Global Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2080"}
+{"code": "CRIM2099", "name": "Crime, Race and Gender", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2099"}
+{"code": "CRIM2100", "name": "Punishment and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2100"}
+{"code": "CRIM2120", "name": "Australian Crime Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2120"}
+{"code": "CRIM2200", "name": "Policing and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2200"}
+{"code": "CRIM2300", "name": "Comparative Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM2300"}
+{"code": "CRIM3002", "name": "Victimology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM3002"}
+{"code": "CRIM3039", "name": "Advanced Criminological Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM3039"}
+{"code": "CRIM3100", "name": "Correctional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM3100"}
+{"code": "CRIM3111", "name": "Advanced Professional Practice in Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM3111"}
+{"code": "CRIM3120", "name": "Crime Prevention Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM3120"}
+{"code": "CRIM4101", "name": "Industry Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM4101"}
+{"code": "CRIM4102", "name": "Criminal Justice Case Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM4102"}
+{"code": "CRIM4103", "name": "Criminology and Criminal Justice Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM4103"}
+{"code": "CRIM4104", "name": "Criminal Justice Case Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM4104"}
+{"code": "CRIM4111", "name": "Advanced Research A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM4111"}
+{"code": "CRIM4112", "name": "Advanced Research B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM4112"}
+{"code": "CRIM6008", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM6008"}
+{"code": "CRIM6009", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM6009"}
+{"code": "CRIM7000", "name": "Introduction to Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7000"}
+{"code": "CRIM7010", "name": "Cyber Crime Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7010"}
+{"code": "CRIM7030", "name": "Criminal Minds", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7030"}
+{"code": "CRIM7060", "name": "Cyber Crime Offending", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7060"}
+{"code": "CRIM7080", "name": "Cyber Warfare, Global Security and Regulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7080"}
+{"code": "CRIM7090", "name": "Regulation, Investigation and Responses", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7090"}
+{"code": "CRIM7119", "name": "Introduction to Criminal Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7119"}
+{"code": "CRIM7120", "name": "Australian Crime Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7120"}
+{"code": "CRIM7121", "name": "Crime Prevention, Policy & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7121"}
+{"code": "CRIM7139", "name": "Advanced Criminological Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7139"}
+{"code": "CRIM7200", "name": "Policing and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7200"}
+{"code": "CRIM7300", "name": "Comparative Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRIM7300"}
+{"code": "CRMD7000", "name": "Mediation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CRMD7000"}
+{"code": "CSSE1000", "name": "Introduction to Computer Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE1000"}
+{"code": "CSSE1001", "name": "Introduction to Software Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE1001"}
+{"code": "CSSE2002", "name": "Programming in the Large", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE2002"}
+{"code": "CSSE2010", "name": "Introduction to Computer Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE2010"}
+{"code": "CSSE2310", "name": "Computer Systems Principles and Programming", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE2310"}
+{"code": "CSSE3002", "name": "The Software Process", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3002"}
+{"code": "CSSE3006", "name": "Special Projects in Computer Systems and Software Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3006"}
+{"code": "CSSE3010", "name": "Embedded Systems Design & Interfacing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3010"}
+{"code": "CSSE3080", "name": "Special Topics in Computer Systems 3A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3080"}
+{"code": "CSSE3081", "name": "Special Topics in Computer Systems 3B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3081"}
+{"code": "CSSE3090", "name": "Special Topics in Software Engineering 3A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3090"}
+{"code": "CSSE3091", "name": "Special Topics in Software Engineering 3B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3091"}
+{"code": "CSSE3100", "name": "Reasoning About Programs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE3100"}
+{"code": "CSSE4004", "name": "Distributed Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4004"}
+{"code": "CSSE4010", "name": "Digital System Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4010"}
+{"code": "CSSE4011", "name": "Advanced Embedded Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4011"}
+{"code": "CSSE4020", "name": "Wireless Sensor Networks", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4020"}
+{"code": "CSSE4080", "name": "Special Topics in Computer Systems 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4080"}
+{"code": "CSSE4081", "name": "Special Topics in Computer Systems 4B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4081"}
+{"code": "CSSE4090", "name": "Special Topics in Software Engineering 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4090"}
+{"code": "CSSE4091", "name": "Special Topics in Software Engineering 4B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4091"}
+{"code": "CSSE4603", "name": "Models of Software Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4603"}
+{"code": "CSSE4630", "name": "Principles of Program Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE4630"}
+{"code": "CSSE7001", "name": "The Software Process", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7001"}
+{"code": "CSSE7023", "name": "Advanced Software Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7023"}
+{"code": "CSSE7030", "name": "Introduction to Software Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7030"}
+{"code": "CSSE7032", "name": "Models of Software Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7032"}
+{"code": "CSSE7080", "name": "Advanced Topics in Computer Systems A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7080"}
+{"code": "CSSE7081", "name": "Advanced Topics in Computer Systems B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7081"}
+{"code": "CSSE7090", "name": "Advanced Topics in Software Engineering A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7090"}
+{"code": "CSSE7091", "name": "Advanced Topics in Software Engineering B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7091"}
+{"code": "CSSE7100", "name": "Reasoning about Programs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7100"}
+{"code": "CSSE7201", "name": "Introduction to Computer Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7201"}
+{"code": "CSSE7301", "name": "Embedded Systems Design & Interfacing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7301"}
+{"code": "CSSE7306", "name": "Special Projects in Computer Systems and Software Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7306"}
+{"code": "CSSE7420", "name": "Wireless Sensor Networks", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7420"}
+{"code": "CSSE7500", "name": "Modelling and Simulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7500"}
+{"code": "CSSE7510", "name": "Reconfigurable Embedded Systems - Concepts and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7510"}
+{"code": "CSSE7520", "name": "Unmanned Aerial Vehicles - Avionics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7520"}
+{"code": "CSSE7530", "name": "VLSI Circuits and Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7530"}
+{"code": "CSSE7610", "name": "Concurrency: Theory and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7610"}
+{"code": "CSSE7620", "name": "Model-Driven Software Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7620"}
+{"code": "CSSE7630", "name": "Principles of Program Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7630"}
+{"code": "CSSE7640", "name": "Formal Modelling and Verification", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CSSE7640"}
+{"code": "CYBR7001", "name": "Fundamentals of Cyber Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CYBR7001"}
+{"code": "CYBR7002", "name": "Information Security Essentials", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CYBR7002"}
+{"code": "CYBR7003", "name": "Cyber Security Governance, Policy, Ethics & Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CYBR7003"}
+{"code": "CYBR7901", "name": "Cyber Security Capstone Project 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CYBR7901"}
+{"code": "CYBR7902", "name": "Cyber Security Capstone Project 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=CYBR7902"}
+{"code": "DATA7001", "name": "Introduction to Data Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7001"}
+{"code": "DATA7002", "name": "Responsible Data Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7002"}
+{"code": "DATA7201", "name": "Data Analytics at Scale", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7201"}
+{"code": "DATA7202", "name": "Statistical Methods for Data Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7202"}
+{"code": "DATA7203", "name": "Computational Models for Data Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7203"}
+{"code": "DATA7703", "name": "Machine Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7703"}
+{"code": "DATA7901", "name": "Data Science Capstone Project 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7901"}
+{"code": "DATA7902", "name": "Data Science Capstone Project 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7902"}
+{"code": "DATA7903", "name": "Data Science Capstone Project 2B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DATA7903"}
+{"code": "DECO1100", "name": "Design Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO1100"}
+{"code": "DECO1400", "name": "Introduction to Web Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO1400"}
+{"code": "DECO1800", "name": "Design Computing Studio I - Interactive Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO1800"}
+{"code": "DECO2000", "name": "Special Topics in Design Computing 2A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO2000"}
+{"code": "DECO2001", "name": "Special Topics in Design Computing 2B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO2001"}
+{"code": "DECO2200", "name": "Graphic Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO2200"}
+{"code": "DECO2300", "name": "Digital Prototyping", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO2300"}
+{"code": "DECO2500", "name": "Human-Computer Interaction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO2500"}
+{"code": "DECO2800", "name": "Design Computing Studio 2 - Testing & Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO2800"}
+{"code": "DECO3000", "name": "Special Topics in Design Computing 3A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO3000"}
+{"code": "DECO3001", "name": "Special Topics in Design Computing 3B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO3001"}
+{"code": "DECO3500", "name": "Social & Mobile Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO3500"}
+{"code": "DECO3800", "name": "Design Computing Studio 3 - Proposal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO3800"}
+{"code": "DECO3801", "name": "Design Computing Studio 3 - Build", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO3801"}
+{"code": "DECO3850", "name": "Physical Computing & Interaction Design Studio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO3850"}
+{"code": "DECO4000", "name": "Special Topics in Design Computing 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO4000"}
+{"code": "DECO4001", "name": "Special Topics in Design Computing 4B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO4001"}
+{"code": "DECO6000", "name": "Special Topics in Design Computing Honours A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO6000"}
+{"code": "DECO6001", "name": "Special Topics in Design Computing Honours B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO6001"}
+{"code": "DECO6002", "name": "Special Topics in Design Computing Honours C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO6002"}
+{"code": "DECO6003", "name": "Special Topics in Design Computing Honours D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO6003"}
+{"code": "DECO6500", "name": "Advanced Human-Computer Interaction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO6500"}
+{"code": "DECO6801", "name": "Design Computing Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO6801"}
+{"code": "DECO6802", "name": "Design Computing Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO6802"}
+{"code": "DECO7000", "name": "Special Topics in Design Computing 7A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7000"}
+{"code": "DECO7001", "name": "Special Topics in Design Computing 7B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7001"}
+{"code": "DECO7002", "name": "Special Topics in Design Computing 7C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7002"}
+{"code": "DECO7003", "name": "Special Topics in Design Computing 7D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7003"}
+{"code": "DECO7110", "name": "Design Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7110"}
+{"code": "DECO7140", "name": "Introduction to Web Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7140"}
+{"code": "DECO7180", "name": "Design Computing Studio 1 - Interactive Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7180"}
+{"code": "DECO7220", "name": "Graphic Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7220"}
+{"code": "DECO7230", "name": "Digital Prototyping", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7230"}
+{"code": "DECO7250", "name": "Human-Computer Interaction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7250"}
+{"code": "DECO7280", "name": "Design Computing Studio 2 - Testing & Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7280"}
+{"code": "DECO7350", "name": "Social & Mobile Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7350"}
+{"code": "DECO7380", "name": "Design Computing Studio 3 - Proposal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7380"}
+{"code": "DECO7381", "name": "Design Computing Studio 3 - Build", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7381"}
+{"code": "DECO7385", "name": "Physical Computing & Interaction Design Studio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7385"}
+{"code": "DECO7860", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7860"}
+{"code": "DECO7861", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7861"}
+{"code": "DECO7862", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DECO7862"}
+{"code": "DENT1011", "name": "Foundations of Dental Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT1011"}
+{"code": "DENT1020", "name": "Dental Science I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT1020"}
+{"code": "DENT1030", "name": "Foundations of Oral Rehabilitation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT1030"}
+{"code": "DENT1050", "name": "Dental Practice I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT1050"}
+{"code": "DENT2022", "name": "Dental Practice I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2022"}
+{"code": "DENT2030", "name": "Oral Rehabilitation I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2030"}
+{"code": "DENT2040", "name": "Dental Science II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2040"}
+{"code": "DENT2044", "name": "Immunology & Microbiology for Dentistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2044"}
+{"code": "DENT2050", "name": "Dental Practice II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2050"}
+{"code": "DENT2052", "name": "Advanced Biomedical Sciences for Dentistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2052"}
+{"code": "DENT2062", "name": "Advanced Oral Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2062"}
+{"code": "DENT2074", "name": "Head & Neck Anatomy for Dentistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT2074"}
+{"code": "DENT3000", "name": "Population Oral Health and Professional Practice I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3000"}
+{"code": "DENT3020", "name": "Dental Practice II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3020"}
+{"code": "DENT3021", "name": "Research Informed Practice I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3021"}
+{"code": "DENT3030", "name": "Oral Rehabilitation II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3030"}
+{"code": "DENT3042", "name": "Dentistry for Children I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3042"}
+{"code": "DENT3050", "name": "Personal & Professional Development I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3050"}
+{"code": "DENT3060", "name": "Dental Practice IIIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3060"}
+{"code": "DENT3061", "name": "Dental Practice IIIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3061"}
+{"code": "DENT3062", "name": "Oral Diagnostic Sciences I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3062"}
+{"code": "DENT3070", "name": "Dental Disciplines A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3070"}
+{"code": "DENT3071", "name": "Dental Disciplines B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3071"}
+{"code": "DENT3072", "name": "Oral Surgical Sciences I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3072"}
+{"code": "DENT3082", "name": "Periodontology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3082"}
+{"code": "DENT3092", "name": "Population Oral Health and Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3092"}
+{"code": "DENT3100", "name": "Dental Practice III A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3100"}
+{"code": "DENT3200", "name": "Dental Practice III B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT3200"}
+{"code": "DENT4000", "name": "Population Oral Health and Professional Practice II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4000"}
+{"code": "DENT4021", "name": "Research Informed Practice II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4021"}
+{"code": "DENT4022", "name": "Dental Practice III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4022"}
+{"code": "DENT4030", "name": "Oral Rehabilitation III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4030"}
+{"code": "DENT4042", "name": "Dentistry for Children II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4042"}
+{"code": "DENT4052", "name": "Personal & Professional Development II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4052"}
+{"code": "DENT4060", "name": "Dental Practice IVA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4060"}
+{"code": "DENT4061", "name": "Dental Practice IVB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4061"}
+{"code": "DENT4062", "name": "Oral Diagnostic Sciences II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4062"}
+{"code": "DENT4070", "name": "Advanced Dental Disciplines A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4070"}
+{"code": "DENT4071", "name": "Advanced Dental Disciplines B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4071"}
+{"code": "DENT4072", "name": "Oral Surgical Sciences II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4072"}
+{"code": "DENT4082", "name": "Periodontics & Dental Implantology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4082"}
+{"code": "DENT4092", "name": "Research Processes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4092"}
+{"code": "DENT4093", "name": "Foundations of Research Informed Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4093"}
+{"code": "DENT4100", "name": "Dental Practice IV A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4100"}
+{"code": "DENT4200", "name": "Dental Practice IV B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4200"}
+{"code": "DENT4500", "name": "BDentSt Dentistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT4500"}
+{"code": "DENT5012", "name": "General Dental Practice in the Community", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT5012"}
+{"code": "DENT5022", "name": "Research Informed Practice III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT5022"}
+{"code": "DENT5023", "name": "Research Informed Practice III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT5023"}
+{"code": "DENT5100", "name": "Dental Practice V A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT5100"}
+{"code": "DENT5200", "name": "Dental Practice V B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT5200"}
+{"code": "DENT5222", "name": "Research Informed Practice III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT5222"}
+{"code": "DENT5599", "name": "Research Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT5599"}
+{"code": "DENT7901", "name": "Dental & Oral Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT7901"}
+{"code": "DENT7911", "name": "Clinical Sciences I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT7911"}
+{"code": "DENT7912", "name": "Clinical Sciences II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT7912"}
+{"code": "DENT8010", "name": "Advanced Clinical Practice IA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8010"}
+{"code": "DENT8020", "name": "Advanced Clinical Practice IB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8020"}
+{"code": "DENT8030", "name": "Advanced Clinical Practice IIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8030"}
+{"code": "DENT8040", "name": "Advanced Clinical Practice IIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8040"}
+{"code": "DENT8050", "name": "Advanced Clinical Practice IIIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8050"}
+{"code": "DENT8060", "name": "Advanced Clinical Practice IIIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8060"}
+{"code": "DENT8070", "name": "Research Project (In Progress)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8070"}
+{"code": "DENT8071", "name": "Data Collection & Analyses", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8071"}
+{"code": "DENT8072", "name": "Research Completion & Report", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT8072"}
+{"code": "DENT9001", "name": "Higher Doctorate Published Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DENT9001"}
+{"code": "DEVB3001", "name": "Developmental Neurobiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DEVB3001"}
+{"code": "DEVB3002", "name": "Stem Cells and Regenerative Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DEVB3002"}
+{"code": "DIET7101", "name": "Medical Nutrition Therapy 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7101"}
+{"code": "DIET7102", "name": "Professional Practice in Medical Nutrition Therapy 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7102"}
+{"code": "DIET7103", "name": "Interviewing & Counselling for Dietetics Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7103"}
+{"code": "DIET7104", "name": "Applied Food Sciences for Dietetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7104"}
+{"code": "DIET7201", "name": "Medical Nutrition Therapy 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7201"}
+{"code": "DIET7202", "name": "Professional Practice in Medical Nutrition Therapy 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7202"}
+{"code": "DIET7203", "name": "Food and Nutrition Service Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7203"}
+{"code": "DIET7204", "name": "Professional Practice in Nutrition and Dietetics 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7204"}
+{"code": "DIET7301", "name": "Evidence Based Practice in Dietetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7301"}
+{"code": "DIET7302", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7302"}
+{"code": "DIET7303", "name": "Professional Practice in Nutrition and Dietetics 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7303"}
+{"code": "DIET7304", "name": "Professional Practice in Nutrition and Dietetics 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIET7304"}
+{"code": "DIPAG1120", "name": "Agricultural Mechanisation & Skills Training 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPAG1120"}
+{"code": "DIPAG1210", "name": "Crop Agronomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPAG1210"}
+{"code": "DIPAG1225", "name": "Agricultural Mechanisation & Skills Training 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPAG1225"}
+{"code": "DIPAH1205", "name": "Animal Husbandry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPAH1205"}
+{"code": "DIPMG1110", "name": "Learning and Communication 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPMG1110"}
+{"code": "DIPMG1215", "name": "Rural Business 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPMG1215"}
+{"code": "DIPMG1220", "name": "Technologies of Land Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPMG1220"}
+{"code": "DIPSC1105", "name": "Plant and Animal Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPSC1105"}
+{"code": "DIPSC1115", "name": "Soil and Water Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DIPSC1115"}
+{"code": "DRAM1010", "name": "Elements of Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM1010"}
+{"code": "DRAM1100", "name": "The Theatre Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM1100"}
+{"code": "DRAM2025", "name": "Major Movements in European Theatre (1500-1800)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM2025"}
+{"code": "DRAM2030", "name": "Experimentation in 20th Century Theatre", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM2030"}
+{"code": "DRAM2040", "name": "Contemporary Theatre & Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM2040"}
+{"code": "DRAM2050", "name": "Australian Drama", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM2050"}
+{"code": "DRAM2090", "name": "Ancient Greek and Roman Theatre", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM2090"}
+{"code": "DRAM2200", "name": "Live Theatre Production: Performance Creation & Event Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM2200"}
+{"code": "DRAM2400", "name": "Performative Communication: Presentation and Public Speaking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM2400"}
+{"code": "DRAM3102", "name": "Playwriting & Dramaturgy: Creative Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM3102"}
+{"code": "DRAM3103", "name": "Theatre Historiography: Making the Connections", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM3103"}
+{"code": "DRAM3104", "name": "Independent Practice: Secondments, Field Trips, Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM3104"}
+{"code": "DRAM3105", "name": "Directing & Dramaturgy: From History to Workshop", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM3105"}
+{"code": "DRAM6050", "name": "Honours Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM6050"}
+{"code": "DRAM6100", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM6100"}
+{"code": "DRAM6101", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM6101"}
+{"code": "DRAM6500", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM6500"}
+{"code": "DRAM7400", "name": "Performative Communication: Presentation and Public Speaking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=DRAM7400"}
+{"code": "ECHO7002", "name": "Echocardiography: Basic Clinical Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECHO7002"}
+{"code": "ECHO7003", "name": "Echocardiography: Advanced Clinical Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECHO7003"}
+{"code": "ECHO7004", "name": "Echocardiography: Care of the critically ill", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECHO7004"}
+{"code": "ECOL6821", "name": "Advanced Outback Ecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECOL6821"}
+{"code": "ECON1001E", "name": "Pre-University Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1001E"}
+{"code": "ECON1010", "name": "Introductory Microeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1010"}
+{"code": "ECON1011", "name": "Economics for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1011"}
+{"code": "ECON1020", "name": "Introductory Macroeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1020"}
+{"code": "ECON1021E", "name": "Pre-University Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1021E"}
+{"code": "ECON1031E", "name": "Pre-University Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1031E"}
+{"code": "ECON1050", "name": "Tools of Economic Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1050"}
+{"code": "ECON1110", "name": "Australian Economic Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1110"}
+{"code": "ECON1120", "name": "The Economics of Social Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1120"}
+{"code": "ECON1200", "name": "Money and Mind", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1200"}
+{"code": "ECON1310", "name": "Quantitative Economic & Business Analysis A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1310"}
+{"code": "ECON1320", "name": "Quantitative Economic & Business Analysis B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1320"}
+{"code": "ECON1901D", "name": "Microeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1901D"}
+{"code": "ECON1902D", "name": "Macroeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1902D"}
+{"code": "ECON1911D", "name": "Economic Statistics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1911D"}
+{"code": "ECON1912D", "name": "Economics Statistics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON1912D"}
+{"code": "ECON2010", "name": "Microeconomic Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2010"}
+{"code": "ECON2011", "name": "Principles of Microeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2011"}
+{"code": "ECON2012", "name": "Microeconomics for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2012"}
+{"code": "ECON2020", "name": "Macroeconomic Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2020"}
+{"code": "ECON2021", "name": "Principles of Macroeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2021"}
+{"code": "ECON2022", "name": "Macroeconomics for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2022"}
+{"code": "ECON2030", "name": "Microeconomic Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2030"}
+{"code": "ECON2040", "name": "Macroeconomic Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2040"}
+{"code": "ECON2050", "name": "Mathematical Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2050"}
+{"code": "ECON2060", "name": "Behavioural and Evolutionary Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2060"}
+{"code": "ECON2070", "name": "Introduction to Strategic Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2070"}
+{"code": "ECON2100", "name": "Philosophy of Economic Thought", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2100"}
+{"code": "ECON2110", "name": "Political Economy & Comparative Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2110"}
+{"code": "ECON2120", "name": "Political Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2120"}
+{"code": "ECON2200", "name": "Management of Financial Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2200"}
+{"code": "ECON2300", "name": "Introductory Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2300"}
+{"code": "ECON2320", "name": "Business & Economic Decision Techniques", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2320"}
+{"code": "ECON2333", "name": "Big Data and Machine Learning for Economics and Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2333"}
+{"code": "ECON2410", "name": "Economics of Business Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2410"}
+{"code": "ECON2420", "name": "The Macroeconomy & Business Conditions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2420"}
+{"code": "ECON2440", "name": "Economics of Entertainment and Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2440"}
+{"code": "ECON2460", "name": "Health Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2460"}
+{"code": "ECON2500", "name": "China: Emergence, Implications & Challenges", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2500"}
+{"code": "ECON2510", "name": "Development Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2510"}
+{"code": "ECON2540", "name": "Economics of Innovation and Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2540"}
+{"code": "ECON2560", "name": "Economics of Globalisation and Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2560"}
+{"code": "ECON2610", "name": "International Economy in the Twentieth Century", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2610"}
+{"code": "ECON2800", "name": "Labour Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2800"}
+{"code": "ECON2810", "name": "Industrial & Labour Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2810"}
+{"code": "ECON2830", "name": "Economics of Professional Sports", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON2830"}
+{"code": "ECON3010", "name": "Advanced Microeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3010"}
+{"code": "ECON3020", "name": "Advanced Macroeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3020"}
+{"code": "ECON3050", "name": "Game Theory & Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3050"}
+{"code": "ECON3060", "name": "Experimental Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3060"}
+{"code": "ECON3200", "name": "Monetary Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3200"}
+{"code": "ECON3210", "name": "Financial Markets & Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3210"}
+{"code": "ECON3220", "name": "Benefit-Cost Analysis for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3220"}
+{"code": "ECON3230", "name": "Trading Floor and Economic Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3230"}
+{"code": "ECON3320", "name": "Statistical Theory for Economists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3320"}
+{"code": "ECON3330", "name": "Econometric Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3330"}
+{"code": "ECON3340", "name": "Productivity and Efficiency Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3340"}
+{"code": "ECON3350", "name": "Applied Econometrics for Macroeconomics and Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3350"}
+{"code": "ECON3360", "name": "Causal Inference for Microeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3360"}
+{"code": "ECON3370", "name": "Econometrics of Panel Data and Discrete Variables", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3370"}
+{"code": "ECON3400", "name": "Industrial Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3400"}
+{"code": "ECON3430", "name": "Managerial Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3430"}
+{"code": "ECON3440", "name": "Competition Policy and Regulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3440"}
+{"code": "ECON3450", "name": "Public Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3450"}
+{"code": "ECON3510", "name": "International Trade Theory & Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3510"}
+{"code": "ECON3520", "name": "Economics of International Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3520"}
+{"code": "ECON3540", "name": "Evolution of Economic Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3540"}
+{"code": "ECON3550", "name": "Economic Institutions and Global Banking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3550"}
+{"code": "ECON3600", "name": "Australian Economic History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3600"}
+{"code": "ECON3700", "name": "Environmental Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3700"}
+{"code": "ECON3710", "name": "Economics of Natural Resources", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3710"}
+{"code": "ECON3800", "name": "Human Resource Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3800"}
+{"code": "ECON3820", "name": "Understanding China", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3820"}
+{"code": "ECON3900", "name": "Special Unit", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON3900"}
+{"code": "ECON4390", "name": "Financial Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON4390"}
+{"code": "ECON4411", "name": "Team Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON4411"}
+{"code": "ECON6010", "name": "Microeconomics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6010"}
+{"code": "ECON6020", "name": "Macroeconomics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6020"}
+{"code": "ECON6030", "name": "Microeconomics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6030"}
+{"code": "ECON6040", "name": "Macroeconomics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6040"}
+{"code": "ECON6080", "name": "Computational Methods in Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6080"}
+{"code": "ECON6300", "name": "Advanced Microeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6300"}
+{"code": "ECON6310", "name": "Advanced Econometric Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6310"}
+{"code": "ECON6370", "name": "Special Topics in Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6370"}
+{"code": "ECON6380", "name": "Advanced Macroeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6380"}
+{"code": "ECON6390", "name": "Financial Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6390"}
+{"code": "ECON6420", "name": "Public Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6420"}
+{"code": "ECON6500", "name": "Economic Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6500"}
+{"code": "ECON6700", "name": "Ecological & Environmental Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6700"}
+{"code": "ECON6900", "name": "Special Unit", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6900"}
+{"code": "ECON6910", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6910"}
+{"code": "ECON6920", "name": "Honours Thesis (Arts)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON6920"}
+{"code": "ECON7000", "name": "Foundations in Microeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7000"}
+{"code": "ECON7001", "name": "Foundations in Macroeconomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7001"}
+{"code": "ECON7002", "name": "Economics for Commerce", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7002"}
+{"code": "ECON7003", "name": "Economics for Managers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7003"}
+{"code": "ECON7010", "name": "Consumer and Firm Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7010"}
+{"code": "ECON7012", "name": "Business Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7012"}
+{"code": "ECON7020", "name": "The Macroeconomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7020"}
+{"code": "ECON7021", "name": "The Macroeconomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7021"}
+{"code": "ECON7030", "name": "Microeconomic Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7030"}
+{"code": "ECON7040", "name": "Macroeconomic Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7040"}
+{"code": "ECON7060", "name": "Evolution of Economic Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7060"}
+{"code": "ECON7070", "name": "Economic Analysis of Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7070"}
+{"code": "ECON7080", "name": "Economics Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7080"}
+{"code": "ECON7110", "name": "Consumer and Firm Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7110"}
+{"code": "ECON7150", "name": "Mathematical Techniques for Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7150"}
+{"code": "ECON7200", "name": "Economics of Financial Markets", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7200"}
+{"code": "ECON7230", "name": "Trading Floor and Financial Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7230"}
+{"code": "ECON7250", "name": "Advanced Mathematical Techniques for Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7250"}
+{"code": "ECON7300", "name": "Statistics for Business & Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7300"}
+{"code": "ECON7310", "name": "Elements of Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7310"}
+{"code": "ECON7320", "name": "Advanced Microeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7320"}
+{"code": "ECON7321", "name": "Statistical Theory for Economists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7321"}
+{"code": "ECON7322", "name": "Business & Economic Decision Techniques", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7322"}
+{"code": "ECON7330", "name": "Advanced Econometric Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7330"}
+{"code": "ECON7331", "name": "Econometric Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7331"}
+{"code": "ECON7333", "name": "Big Data and Machine Learning for Economics and Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7333"}
+{"code": "ECON7341", "name": "Productivity and Efficiency Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7341"}
+{"code": "ECON7350", "name": "Applied Econometrics for Macroeconomics and Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7350"}
+{"code": "ECON7360", "name": "Causal Inference for Microeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7360"}
+{"code": "ECON7370", "name": "Special Topics in Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7370"}
+{"code": "ECON7371", "name": "Econometrics of Panel Data and Discrete Variables", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7371"}
+{"code": "ECON7380", "name": "Advanced Macroeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7380"}
+{"code": "ECON7390", "name": "Financial Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7390"}
+{"code": "ECON7400", "name": "International Industry Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7400"}
+{"code": "ECON7410", "name": "Advanced Managerial Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7410"}
+{"code": "ECON7430", "name": "Competition Policy and Regulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7430"}
+{"code": "ECON7440", "name": "Public Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7440"}
+{"code": "ECON7460", "name": "Health Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7460"}
+{"code": "ECON7510", "name": "Economic Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7510"}
+{"code": "ECON7520", "name": "International Macroeconomics and Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7520"}
+{"code": "ECON7530", "name": "International Trade & Investment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7530"}
+{"code": "ECON7540", "name": "Economics of Innovation & Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7540"}
+{"code": "ECON7550", "name": "Global Banking & Economic Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7550"}
+{"code": "ECON7560", "name": "Globalisation and Economic Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7560"}
+{"code": "ECON7570", "name": "Contemporary Issues in Economic Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7570"}
+{"code": "ECON7600", "name": "Economic History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7600"}
+{"code": "ECON7700", "name": "Social Choice & Economic Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7700"}
+{"code": "ECON7710", "name": "Economic Institutions & Policy Formation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7710"}
+{"code": "ECON7720", "name": "Ecological & Environmental Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7720"}
+{"code": "ECON7730", "name": "Natural Resource Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7730"}
+{"code": "ECON7740", "name": "Benefit-Cost Analysis & Project Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7740"}
+{"code": "ECON7760", "name": "The Economics of Climate Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7760"}
+{"code": "ECON7810", "name": "Economic Evaluation and Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7810"}
+{"code": "ECON7820", "name": "Understanding China", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7820"}
+{"code": "ECON7830", "name": "Health Economics and Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7830"}
+{"code": "ECON7840", "name": "Health & Economic Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7840"}
+{"code": "ECON7850", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7850"}
+{"code": "ECON7852", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7852"}
+{"code": "ECON7900", "name": "Special Unit", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7900"}
+{"code": "ECON7910", "name": "Research Report", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7910"}
+{"code": "ECON7920", "name": "Research Methods in Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7920"}
+{"code": "ECON7921", "name": "Research Methods in Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7921"}
+{"code": "ECON7930", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7930"}
+{"code": "ECON7931", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7931"}
+{"code": "ECON7932", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7932"}
+{"code": "ECON7940", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7940"}
+{"code": "ECON7941", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7941"}
+{"code": "ECON7942", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7942"}
+{"code": "ECON7950", "name": "Research Methods in Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON7950"}
+{"code": "ECON8000", "name": "Quantitative Skills for Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8000"}
+{"code": "ECON8010", "name": "Microeconomics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8010"}
+{"code": "ECON8020", "name": "Macroeconomics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8020"}
+{"code": "ECON8030", "name": "Microeconomics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8030"}
+{"code": "ECON8040", "name": "Macroeconomics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8040"}
+{"code": "ECON8080", "name": "Computational Methods in Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8080"}
+{"code": "ECON8300", "name": "Advanced Microeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8300"}
+{"code": "ECON8380", "name": "Advanced Macroeconometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8380"}
+{"code": "ECON8800", "name": "Advanced Studies in Economics I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8800"}
+{"code": "ECON8810", "name": "Advanced Studies in Economics 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8810"}
+{"code": "ECON8820", "name": "Advanced Studies in Econometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ECON8820"}
+{"code": "EDUC1002", "name": "Communication for Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1002"}
+{"code": "EDUC1029", "name": "Introduction to Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1029"}
+{"code": "EDUC1050", "name": "Teaching and Learning Tools in 21st Century Knowledge Societies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1050"}
+{"code": "EDUC1601", "name": "Learning and Development for Music Educators", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1601"}
+{"code": "EDUC1650", "name": "Learning and Development for Educators", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1650"}
+{"code": "EDUC1702", "name": "Child and Adolescent Development for Educators", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1702"}
+{"code": "EDUC1703", "name": "Introduction to Teaching Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1703"}
+{"code": "EDUC1704", "name": "Education and Creativity: Pedagogical Content Knowledge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1704"}
+{"code": "EDUC1706", "name": "Introduction to Role of Science and Technology Education in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1706"}
+{"code": "EDUC1707", "name": "Literacy in Primary and Middle Years Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1707"}
+{"code": "EDUC1708", "name": "Introduction to Teaching Humanities and Social Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1708"}
+{"code": "EDUC1710", "name": "A Sociological Orientation to Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1710"}
+{"code": "EDUC1715", "name": "Primary Professional Experience 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1715"}
+{"code": "EDUC1720", "name": "Mathematics and Numeracy for Quality Teaching in the Primary Years", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1720"}
+{"code": "EDUC1730", "name": "Introduction to Teaching English and Literacy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1730"}
+{"code": "EDUC1740", "name": "Introduction to Primary Professional Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1740"}
+{"code": "EDUC1750", "name": "Learning and Development for Educators", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1750"}
+{"code": "EDUC1760", "name": "Early Years Curriculum and Pedagogical Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC1760"}
+{"code": "EDUC2000", "name": "Communication for Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2000"}
+{"code": "EDUC2001", "name": "Youth, Sport & Physical Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2001"}
+{"code": "EDUC2003", "name": "Teaching Games and Sport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2003"}
+{"code": "EDUC2004", "name": "Supportive Learning Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2004"}
+{"code": "EDUC2005", "name": "Contemporary Approaches to Teaching Movement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2005"}
+{"code": "EDUC2009", "name": "Health Education in Schools", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2009"}
+{"code": "EDUC2010", "name": "Literacy and Numeracy in Health and Physical Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2010"}
+{"code": "EDUC2011", "name": "Sports Leadership in Primary schools", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2011"}
+{"code": "EDUC2012", "name": "P-10 Health and Physical Education Curriculum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2012"}
+{"code": "EDUC2017", "name": "International Field Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2017"}
+{"code": "EDUC2049", "name": "Identity, Youth Cultures and Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2049"}
+{"code": "EDUC2090", "name": "Indigenous Knowledge & Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2090"}
+{"code": "EDUC2601", "name": "Literacies within and across the Curriculum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2601"}
+{"code": "EDUC2602", "name": "Music Teachers as Educational Innovators and Agents of Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2602"}
+{"code": "EDUC2604", "name": "Teachers as Educational Innovators and Agents of Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2604"}
+{"code": "EDUC2703", "name": "Teaching Mathematics 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2703"}
+{"code": "EDUC2704", "name": "Early Years Curriculum Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2704"}
+{"code": "EDUC2706", "name": "Teaching English 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2706"}
+{"code": "EDUC2707", "name": "Health, Well-being and Education Pedagogical Content Knowledge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2707"}
+{"code": "EDUC2710", "name": "Education and Creativity: Pedagogical Content Knowledge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2710"}
+{"code": "EDUC2712", "name": "Primary Professional Experience 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2712"}
+{"code": "EDUC2714", "name": "Primary Professional Experience 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2714"}
+{"code": "EDUC2716", "name": "Learning, Mind and Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2716"}
+{"code": "EDUC2730", "name": "Teaching Mathematics in Primary Contexts 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2730"}
+{"code": "EDUC2740", "name": "Primary Professional Experience 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2740"}
+{"code": "EDUC2750", "name": "Multilingualism and Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2750"}
+{"code": "EDUC2760", "name": "Introduction to Teaching Humanities and Social Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC2760"}
+{"code": "EDUC3003", "name": "Introductory Practicum (Education)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3003"}
+{"code": "EDUC3004", "name": "Supportive Learning Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3004"}
+{"code": "EDUC3006", "name": "Inquiry Based Pedagogies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3006"}
+{"code": "EDUC3007", "name": "Pedagogical Applications of Human Movement Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3007"}
+{"code": "EDUC3008", "name": "HPE Curriculum and Assessment Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3008"}
+{"code": "EDUC3009", "name": "Educating for Better Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3009"}
+{"code": "EDUC3010", "name": "Technology, HPE and Sport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3010"}
+{"code": "EDUC3011", "name": "Youth, Sport and Physical Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3011"}
+{"code": "EDUC3012", "name": "Senior Health and Physical Education Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3012"}
+{"code": "EDUC3013", "name": "Assessment, Data, Technology and Health and Physical Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3013"}
+{"code": "EDUC3079", "name": "Becoming A Professional Educator", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3079"}
+{"code": "EDUC3099", "name": "Towards Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3099"}
+{"code": "EDUC3250", "name": "Junior Science Curriculum for HMS", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3250"}
+{"code": "EDUC3292", "name": "Science Teaching for Human Movement Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3292"}
+{"code": "EDUC3293", "name": "Junior Science in Action", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3293"}
+{"code": "EDUC3602", "name": "Numeracy across the Curriculum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3602"}
+{"code": "EDUC3605", "name": "Building Professional Knowledge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3605"}
+{"code": "EDUC3606", "name": "Building Inclusive Secondary Classrooms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3606"}
+{"code": "EDUC3701", "name": "Diversity and Inclusive Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3701"}
+{"code": "EDUC3702", "name": "Teaching Health and Physical Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3702"}
+{"code": "EDUC3703", "name": "Teaching Technology and The Arts in the Twenty-First Century", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3703"}
+{"code": "EDUC3705", "name": "Teaching Science in Primary and Middle Schools", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3705"}
+{"code": "EDUC3706", "name": "Teaching Mathematics 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3706"}
+{"code": "EDUC3707", "name": "Teaching Humanities and Social Sciences Curriculum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3707"}
+{"code": "EDUC3710", "name": "Teaching English 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3710"}
+{"code": "EDUC3714", "name": "Primary Professional Experience 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3714"}
+{"code": "EDUC3720", "name": "Teaching Mathematics in Primary Contexts 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3720"}
+{"code": "EDUC3724", "name": "Middle Years of Schooling Professional Experience 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3724"}
+{"code": "EDUC3730", "name": "Teaching Science in Primary Schools", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3730"}
+{"code": "EDUC3740", "name": "Health, Well-being and Education Pedagogical Content Knowledge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3740"}
+{"code": "EDUC3750", "name": "Primary Professional Experience 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3750"}
+{"code": "EDUC3760", "name": "Building Inclusive Primary Classrooms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC3760"}
+{"code": "EDUC4004", "name": "Leadership, Innovation and Research in HPE", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4004"}
+{"code": "EDUC4005", "name": "Major Practicum (Health & Physical Education)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4005"}
+{"code": "EDUC4006", "name": "Leadership and Research in Health & Physical Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4006"}
+{"code": "EDUC4292", "name": "Junior Science for Human Movement Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4292"}
+{"code": "EDUC4607", "name": "Assessment for Learning and Teaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4607"}
+{"code": "EDUC4615", "name": "Developing Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4615"}
+{"code": "EDUC4620", "name": "Teachers as Researchers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4620"}
+{"code": "EDUC4625", "name": "Achieving Professional Engagement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4625"}
+{"code": "EDUC4631", "name": "Biology: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4631"}
+{"code": "EDUC4632", "name": "Business: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4632"}
+{"code": "EDUC4633", "name": "Chemistry: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4633"}
+{"code": "EDUC4634", "name": "Chinese: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4634"}
+{"code": "EDUC4635", "name": "Drama: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4635"}
+{"code": "EDUC4636", "name": "English: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4636"}
+{"code": "EDUC4637", "name": "French: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4637"}
+{"code": "EDUC4638", "name": "Geography: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4638"}
+{"code": "EDUC4639", "name": "German: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4639"}
+{"code": "EDUC4641", "name": "History: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4641"}
+{"code": "EDUC4642", "name": "Digital Technologies: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4642"}
+{"code": "EDUC4643", "name": "Japanese: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4643"}
+{"code": "EDUC4644", "name": "Mathematics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4644"}
+{"code": "EDUC4645", "name": "Music: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4645"}
+{"code": "EDUC4646", "name": "Physics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4646"}
+{"code": "EDUC4647", "name": "Earth and Environmental Science: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4647"}
+{"code": "EDUC4648", "name": "Spanish: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4648"}
+{"code": "EDUC4652", "name": "Advanced Mathematics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4652"}
+{"code": "EDUC4654", "name": "Economics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4654"}
+{"code": "EDUC4655", "name": "Film, TV and New Media: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4655"}
+{"code": "EDUC4657", "name": "Legal Studies: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4657"}
+{"code": "EDUC4658", "name": "Choral and Instrumental Music: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4658"}
+{"code": "EDUC4659", "name": "Psychology: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4659"}
+{"code": "EDUC4700", "name": "Teachers as Researchers Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4700"}
+{"code": "EDUC4702", "name": "Teaching English 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4702"}
+{"code": "EDUC4703", "name": "Teachers as Professionals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4703"}
+{"code": "EDUC4705", "name": "Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4705"}
+{"code": "EDUC4706", "name": "Research Project (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4706"}
+{"code": "EDUC4710", "name": "Introduction to Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4710"}
+{"code": "EDUC4714", "name": "Primary Professional Experience 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4714"}
+{"code": "EDUC4715", "name": "Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4715"}
+{"code": "EDUC4720", "name": "Teaching English 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4720"}
+{"code": "EDUC4730", "name": "Digital Technologies: STEM Connections", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4730"}
+{"code": "EDUC4740", "name": "Teaching Health and Physical Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4740"}
+{"code": "EDUC4750", "name": "Primary Professional Experience 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4750"}
+{"code": "EDUC4770", "name": "Teaching the Arts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC4770"}
+{"code": "EDUC6106", "name": "Designing Teaching and Assessment in Clinical Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6106"}
+{"code": "EDUC6107", "name": "Educational Intervention in Clinical Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6107"}
+{"code": "EDUC6530", "name": "Middle Years of Schooling Curriculum: English Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6530"}
+{"code": "EDUC6550", "name": "Middle Years of Schooling Curriculum: Science Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6550"}
+{"code": "EDUC6610", "name": "Introduction to Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6610"}
+{"code": "EDUC6615", "name": "Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6615"}
+{"code": "EDUC6620", "name": "Inclusive Practices in the Classroom Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6620"}
+{"code": "EDUC6625", "name": "World Religions in Youth Cultures Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6625"}
+{"code": "EDUC6635", "name": "New Developments in the Middle Years of Schooling Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6635"}
+{"code": "EDUC6650", "name": "Introduction to Career Development: Assisting Students Building Careers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6650"}
+{"code": "EDUC6655", "name": "Youth Disadvantage, Diversity and Risk Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6655"}
+{"code": "EDUC6700", "name": "Business: Curriculum Foundations Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6700"}
+{"code": "EDUC6705", "name": "English: Curriculum Foundations Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6705"}
+{"code": "EDUC6710", "name": "Health and Physical Education: Curriculum Foundations Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6710"}
+{"code": "EDUC6715", "name": "Information Technology: Curriculum Foundations Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6715"}
+{"code": "EDUC6720", "name": "Languages: Curriculum Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6720"}
+{"code": "EDUC6725", "name": "Mathematics: Curriculum Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6725"}
+{"code": "EDUC6730", "name": "Music: Curriculum Foundation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6730"}
+{"code": "EDUC6735", "name": "Science: Curriculum Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6735"}
+{"code": "EDUC6745", "name": "Humanities and Social Sciences: Curriculum Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6745"}
+{"code": "EDUC6755", "name": "Accounting: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6755"}
+{"code": "EDUC6760", "name": "Agriculture: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6760"}
+{"code": "EDUC6765", "name": "Asian Languages: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6765"}
+{"code": "EDUC6770", "name": "Biology: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6770"}
+{"code": "EDUC6775", "name": "Business Management and Business Communication Technologies: STA Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6775"}
+{"code": "EDUC6780", "name": "Chemistry: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6780"}
+{"code": "EDUC6785", "name": "Drama: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6785"}
+{"code": "EDUC6790", "name": "Economics: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6790"}
+{"code": "EDUC6795", "name": "English: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6795"}
+{"code": "EDUC6800", "name": "English as a Second Language: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6800"}
+{"code": "EDUC6805", "name": "European Languages: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6805"}
+{"code": "EDUC6810", "name": "Geography: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6810"}
+{"code": "EDUC6815", "name": "Physical Education and Health: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6815"}
+{"code": "EDUC6820", "name": "History: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6820"}
+{"code": "EDUC6830", "name": "Information Processing and Technology / Information Technology Systems: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6830"}
+{"code": "EDUC6835", "name": "Legal Studies: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6835"}
+{"code": "EDUC6840", "name": "Mathematics: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6840"}
+{"code": "EDUC6841", "name": "Mathematics A: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6841"}
+{"code": "EDUC6845", "name": "Film, Television and the New Media: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6845"}
+{"code": "EDUC6850", "name": "Music: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6850"}
+{"code": "EDUC6851", "name": "Music-Choral: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6851"}
+{"code": "EDUC6852", "name": "Music-Instrumental: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6852"}
+{"code": "EDUC6853", "name": "Philosophy and Reason: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6853"}
+{"code": "EDUC6855", "name": "Physics: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6855"}
+{"code": "EDUC6860", "name": "Science 21, Earth and Environmental Science: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6860"}
+{"code": "EDUC6865", "name": "Learning Support: Specialist Teaching Area Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6865"}
+{"code": "EDUC6870", "name": "Supervised Project: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6870"}
+{"code": "EDUC6875", "name": "Aboriginal and Torres Strait Islander Studies: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6875"}
+{"code": "EDUC6880", "name": "Study of Religion: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6880"}
+{"code": "EDUC6885", "name": "Study of Society: Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6885"}
+{"code": "EDUC6890", "name": "Tourism Studies Specialist Teaching Area", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6890"}
+{"code": "EDUC6900", "name": "Honours Thesis Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6900"}
+{"code": "EDUC6901", "name": "Honours Thesis Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6901"}
+{"code": "EDUC6902", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC6902"}
+{"code": "EDUC7000", "name": "Dilemmas of Development: Risks of Youth", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7000"}
+{"code": "EDUC7001", "name": "On the Edge: Identifying and Assisting Students at Risk", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7001"}
+{"code": "EDUC7002", "name": "Promoting Positive Student Behaviour in Educational Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7002"}
+{"code": "EDUC7007", "name": "Tasks & Tests: Individual Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7007"}
+{"code": "EDUC7008", "name": "Counselling in Professional Contexts: Helping Groups and Individuals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7008"}
+{"code": "EDUC7009", "name": "Career Guidance: Counselling for Life Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7009"}
+{"code": "EDUC7010", "name": "Proactive Interventions in Guidance, Counselling and Careers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7010"}
+{"code": "EDUC7011", "name": "Practicum in Guidance, Counselling and Careers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7011"}
+{"code": "EDUC7012", "name": "Practicum in Guidance, Counselling and Careers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7012"}
+{"code": "EDUC7014", "name": "Creating classrooms of the future with digital technologies across learning areas", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7014"}
+{"code": "EDUC7019", "name": "Cognition and Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7019"}
+{"code": "EDUC7020", "name": "Professional Development, Mentoring & Supervision", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7020"}
+{"code": "EDUC7026", "name": "Special Topics in Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7026"}
+{"code": "EDUC7027", "name": "Guided Study: Educational Investigation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7027"}
+{"code": "EDUC7031", "name": "TESOL Curriculum & Pedagogy: Classroom Strategies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7031"}
+{"code": "EDUC7032", "name": "Critical Perspectives on TESOL in Educational Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7032"}
+{"code": "EDUC7047", "name": "Language in Education Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7047"}
+{"code": "EDUC7049", "name": "Pedagogies for the Body", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7049"}
+{"code": "EDUC7050", "name": "Special Study HPE", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7050"}
+{"code": "EDUC7052", "name": "Career Development In Practice: Constructing Careers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7052"}
+{"code": "EDUC7053", "name": "Foundations in Global Education for International Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7053"}
+{"code": "EDUC7059", "name": "Foundation of the Science of Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7059"}
+{"code": "EDUC7060", "name": "Building Leadership Capacity: Bridging Theory and Practice in the Workplace", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7060"}
+{"code": "EDUC7071", "name": "Psychology Curriculum: Design and Resources", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7071"}
+{"code": "EDUC7072", "name": "Psychology Curriculum: Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7072"}
+{"code": "EDUC7100", "name": "Debates in Educational Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7100"}
+{"code": "EDUC7101", "name": "Meeting the Challenges of Educational Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7101"}
+{"code": "EDUC7103", "name": "Work, Careers and Educational Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7103"}
+{"code": "EDUC7111", "name": "Globalisation, Educational Policy and Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7111"}
+{"code": "EDUC7112", "name": "Teachers as Leaders and Innovators", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7112"}
+{"code": "EDUC7113", "name": "Multiliteracies and Numeracy Across Learning Areas", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7113"}
+{"code": "EDUC7114", "name": "Cross-curricular Perspectives", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7114"}
+{"code": "EDUC7117", "name": "Curriculum, Pedagogy and Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7117"}
+{"code": "EDUC7205", "name": "Development in Multiple Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7205"}
+{"code": "EDUC7210", "name": "Teaching and Learning in Inclusive Settings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7210"}
+{"code": "EDUC7211", "name": "Educational Inquiry and Research: Evidence for Policies and Practices", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7211"}
+{"code": "EDUC7212", "name": "Educational Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7212"}
+{"code": "EDUC7220", "name": "Supporting Teachers and their Students with Learning Difficulties - Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7220"}
+{"code": "EDUC7230", "name": "Working with Students with Challenging Behaviours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7230"}
+{"code": "EDUC7240", "name": "Assessment, Planning and Instruction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7240"}
+{"code": "EDUC7510", "name": "Indigenous Knowledge and Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7510"}
+{"code": "EDUC7516", "name": "Building Inclusive Primary Classrooms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7516"}
+{"code": "EDUC7520", "name": "Teachers as Researchers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7520"}
+{"code": "EDUC7530", "name": "Primary Professional Experience 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7530"}
+{"code": "EDUC7535", "name": "Primary Professional Experience 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7535"}
+{"code": "EDUC7540", "name": "Primary Professional Experience 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7540"}
+{"code": "EDUC7550", "name": "Teaching English 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7550"}
+{"code": "EDUC7555", "name": "Teaching English 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7555"}
+{"code": "EDUC7565", "name": "Introduction to Teaching Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7565"}
+{"code": "EDUC7570", "name": "Teaching Mathematics 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7570"}
+{"code": "EDUC7575", "name": "Teaching Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7575"}
+{"code": "EDUC7580", "name": "Teaching Humanities and Social Sciences Curriculum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7580"}
+{"code": "EDUC7585", "name": "Teaching the Arts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7585"}
+{"code": "EDUC7590", "name": "Teaching Technologies in the 21st Century", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7590"}
+{"code": "EDUC7595", "name": "Teaching Health and Physical Education in Primary Schools", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7595"}
+{"code": "EDUC7600", "name": "Global Issues and Social Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7600"}
+{"code": "EDUC7601", "name": "Literacy within and across the Curriculum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7601"}
+{"code": "EDUC7602", "name": "Numeracy Across the Curriculum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7602"}
+{"code": "EDUC7603", "name": "Contemporary Theories of Development and Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7603"}
+{"code": "EDUC7604", "name": "Teachers as Educational Innovators and Agents of Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7604"}
+{"code": "EDUC7605", "name": "Building Professional Knowledge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7605"}
+{"code": "EDUC7606", "name": "Building Inclusive Secondary Classrooms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7606"}
+{"code": "EDUC7607", "name": "Assessment for Learning and Teaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7607"}
+{"code": "EDUC7615", "name": "Developing Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7615"}
+{"code": "EDUC7625", "name": "Achieving Professional Engagement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7625"}
+{"code": "EDUC7631", "name": "Biology: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7631"}
+{"code": "EDUC7632", "name": "Business: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7632"}
+{"code": "EDUC7633", "name": "Chemistry: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7633"}
+{"code": "EDUC7634", "name": "Chinese: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7634"}
+{"code": "EDUC7635", "name": "Drama: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7635"}
+{"code": "EDUC7636", "name": "English: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7636"}
+{"code": "EDUC7637", "name": "French: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7637"}
+{"code": "EDUC7638", "name": "Geography: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7638"}
+{"code": "EDUC7639", "name": "German: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7639"}
+{"code": "EDUC7640", "name": "Health and Physical Education: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7640"}
+{"code": "EDUC7641", "name": "History: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7641"}
+{"code": "EDUC7642", "name": "Digital Technologies: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7642"}
+{"code": "EDUC7643", "name": "Japanese: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7643"}
+{"code": "EDUC7644", "name": "Mathematics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7644"}
+{"code": "EDUC7645", "name": "Music: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7645"}
+{"code": "EDUC7646", "name": "Physics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7646"}
+{"code": "EDUC7647", "name": "Earth and Environmental Science: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7647"}
+{"code": "EDUC7648", "name": "Spanish: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7648"}
+{"code": "EDUC7652", "name": "Advanced Mathematics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7652"}
+{"code": "EDUC7654", "name": "Economics: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7654"}
+{"code": "EDUC7655", "name": "Film, TV and New Media: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7655"}
+{"code": "EDUC7657", "name": "Legal Studies: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7657"}
+{"code": "EDUC7658", "name": "Choral and Instrumental Music: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7658"}
+{"code": "EDUC7659", "name": "Psychology: Curriculum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7659"}
+{"code": "EDUC7910", "name": "Project A: MEdSt", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7910"}
+{"code": "EDUC7911", "name": "Project A: MEdSt Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7911"}
+{"code": "EDUC7912", "name": "Project A: MEdSt Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7912"}
+{"code": "EDUC7915", "name": "Project B: MEdSt", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7915"}
+{"code": "EDUC7916", "name": "Project B: MEdSt Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7916"}
+{"code": "EDUC7917", "name": "Project B: MEdSt Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EDUC7917"}
+{"code": "EIBS7300", "name": "Creativity for Innovation and Design Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7300"}
+{"code": "EIBS7301", "name": "Idea Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7301"}
+{"code": "EIBS7302", "name": "Evidence Based Innovation: From Business Model To Business Plan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7302"}
+{"code": "EIBS7303", "name": "Building Innovation Capability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7303"}
+{"code": "EIBS7304", "name": "Entrepreneurial Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7304"}
+{"code": "EIBS7305", "name": "Commercialisation in Practice Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7305"}
+{"code": "EIBS7306", "name": "Grand Challenges", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7306"}
+{"code": "EIBS7307", "name": "Lean Start Up", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7307"}
+{"code": "EIBS7308", "name": "Corporate Spin-Out", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7308"}
+{"code": "EIBS7309", "name": "Entrepreneurship Challenge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7309"}
+{"code": "EIBS7800", "name": "Entrepreneurship Capstone", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EIBS7800"}
+{"code": "ELEC2003", "name": "Electromechanics & Electronics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC2003"}
+{"code": "ELEC2004", "name": "Circuits, Signals & Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC2004"}
+{"code": "ELEC3000", "name": "Special Topics in Electrical Engineering 3A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC3000"}
+{"code": "ELEC3001", "name": "Special Topics in Electrical Engineering 3B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC3001"}
+{"code": "ELEC3004", "name": "Signals, Systems & Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC3004"}
+{"code": "ELEC3100", "name": "Fundamentals of Electromagnetic Fields & Waves", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC3100"}
+{"code": "ELEC3300", "name": "Electrical Energy Conversion & Utilisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC3300"}
+{"code": "ELEC3400", "name": "Electronic Circuits", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC3400"}
+{"code": "ELEC3401", "name": "Medical & Industrial Instrumentation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC3401"}
+{"code": "ELEC4000", "name": "Special Topics in Electrical Engineering 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4000"}
+{"code": "ELEC4001", "name": "Special Topics in Electrical Engineering 4B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4001"}
+{"code": "ELEC4300", "name": "Power Systems Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4300"}
+{"code": "ELEC4302", "name": "Power System Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4302"}
+{"code": "ELEC4320", "name": "Modern Asset Management and Condition Monitoring in Power System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4320"}
+{"code": "ELEC4400", "name": "Advanced Electronic & Power Electronics Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4400"}
+{"code": "ELEC4401", "name": "Medical & Industrial Instrumentation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4401"}
+{"code": "ELEC4620", "name": "Digital Signal Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4620"}
+{"code": "ELEC4630", "name": "Image Processing and Computer Vision", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC4630"}
+{"code": "ELEC6403", "name": "Medical & Industrial Instrumentation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC6403"}
+{"code": "ELEC6601", "name": "Medical Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC6601"}
+{"code": "ELEC7050", "name": "Generator Technology Design & Application", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7050"}
+{"code": "ELEC7051", "name": "Transformer Technology Design and Operation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7051"}
+{"code": "ELEC7052", "name": "Plant Control Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7052"}
+{"code": "ELEC7300", "name": "Advanced Topics in Power", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7300"}
+{"code": "ELEC7302", "name": "Electrical Energy Conversion & Utilisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7302"}
+{"code": "ELEC7303", "name": "Power Systems Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7303"}
+{"code": "ELEC7309", "name": "Power System Planning and Reliability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7309"}
+{"code": "ELEC7310", "name": "Electricity Market Operation and Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7310"}
+{"code": "ELEC7313", "name": "Renewable Energy Integration: Technologies to Technical Challenges", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7313"}
+{"code": "ELEC7402", "name": "Advanced Electronic & Power Electronics Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7402"}
+{"code": "ELEC7403", "name": "Medical & Industrial Instrumentation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7403"}
+{"code": "ELEC7605", "name": "Computer Vision & Pattern Recognition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7605"}
+{"code": "ELEC7901", "name": "Advanced Medical Device Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7901"}
+{"code": "ELEC7902", "name": "Biomedical Signal Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7902"}
+{"code": "ELEC7903", "name": "Biomedical Engineering in Sports Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ELEC7903"}
+{"code": "ENGG1100", "name": "Engineering Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1100"}
+{"code": "ENGG1111", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1111"}
+{"code": "ENGG1112", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1112"}
+{"code": "ENGG1113", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1113"}
+{"code": "ENGG1114", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1114"}
+{"code": "ENGG1200", "name": "Engineering Modelling & Problem Solving", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1200"}
+{"code": "ENGG1211", "name": "Engineering Design, Modelling & Problem Solving", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1211"}
+{"code": "ENGG1300", "name": "Introduction to Electrical Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1300"}
+{"code": "ENGG1400", "name": "Engineering Mechanics: Statics & Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1400"}
+{"code": "ENGG1500", "name": "Engineering Thermodynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1500"}
+{"code": "ENGG1600", "name": "Introduction to Research Practices - The Big Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1600"}
+{"code": "ENGG2000", "name": "Humanitarian Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG2000"}
+{"code": "ENGG2800", "name": "Team Project I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG2800"}
+{"code": "ENGG3500", "name": "Reservoir Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG3500"}
+{"code": "ENGG3700", "name": "Introduction to Fire Safety Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG3700"}
+{"code": "ENGG3800", "name": "Team Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG3800"}
+{"code": "ENGG4000", "name": "Introduction to Systems Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4000"}
+{"code": "ENGG4011", "name": "Professional Engineering Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4011"}
+{"code": "ENGG4020", "name": "Systems Safety Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4020"}
+{"code": "ENGG4103", "name": "Engineering Asset Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4103"}
+{"code": "ENGG4281", "name": "Engineering Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4281"}
+{"code": "ENGG4282", "name": "Engineering Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4282"}
+{"code": "ENGG4510", "name": "Engineering Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4510"}
+{"code": "ENGG4800", "name": "Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4800"}
+{"code": "ENGG4801", "name": "Thesis Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4801"}
+{"code": "ENGG4802", "name": "Thesis Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4802"}
+{"code": "ENGG4805", "name": "Thesis Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4805"}
+{"code": "ENGG4810", "name": "Team Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4810"}
+{"code": "ENGG4900", "name": "Professional Practice and the Business Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG4900"}
+{"code": "ENGG7000", "name": "Systems Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7000"}
+{"code": "ENGG7020", "name": "Systems Safety Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7020"}
+{"code": "ENGG7111", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7111"}
+{"code": "ENGG7112", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7112"}
+{"code": "ENGG7113", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7113"}
+{"code": "ENGG7114", "name": "Double Degree Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7114"}
+{"code": "ENGG7201", "name": "Special Topics in Engineering I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7201"}
+{"code": "ENGG7202", "name": "Special Topics in Engineering II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7202"}
+{"code": "ENGG7220", "name": "Engineering Project 2A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7220"}
+{"code": "ENGG7221", "name": "Engineering Project 2B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7221"}
+{"code": "ENGG7240", "name": "Engineering Project 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7240"}
+{"code": "ENGG7241", "name": "Engineering Project 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7241"}
+{"code": "ENGG7242", "name": "Engineering Project 4A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7242"}
+{"code": "ENGG7244", "name": "Engineering Project 4B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7244"}
+{"code": "ENGG7280", "name": "Engineering Project 8A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7280"}
+{"code": "ENGG7281", "name": "Engineering Project 8A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7281"}
+{"code": "ENGG7282", "name": "Engineering Project 8A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7282"}
+{"code": "ENGG7290", "name": "Engineering Placement Semester", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7290"}
+{"code": "ENGG7300", "name": "Advanced Topics in Engineering I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7300"}
+{"code": "ENGG7301", "name": "Advanced Topics in Engineering II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7301"}
+{"code": "ENGG7302", "name": "Advanced Computational Techniques in Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7302"}
+{"code": "ENGG7500", "name": "Geoscience for Petroleum Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7500"}
+{"code": "ENGG7501", "name": "Well Logging for Petroleum Engineers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7501"}
+{"code": "ENGG7502", "name": "Reservoir Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7502"}
+{"code": "ENGG7503", "name": "Well Test Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7503"}
+{"code": "ENGG7504", "name": "Reservoir Simulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7504"}
+{"code": "ENGG7505", "name": "Production Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7505"}
+{"code": "ENGG7506", "name": "Drilling Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7506"}
+{"code": "ENGG7507", "name": "Petroleum Project Economics and Decision Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7507"}
+{"code": "ENGG7508", "name": "Petroleum Eng Field Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7508"}
+{"code": "ENGG7509", "name": "Individual Project in Petroleum Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7509"}
+{"code": "ENGG7510", "name": "Geoscience for Petroleum Engineers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7510"}
+{"code": "ENGG7511", "name": "Reservoir Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7511"}
+{"code": "ENGG7512", "name": "Drilling Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7512"}
+{"code": "ENGG7513", "name": "Well Logging for Petroleum Engineers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7513"}
+{"code": "ENGG7514", "name": "Reservoir Simulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7514"}
+{"code": "ENGG7515", "name": "Well Test Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7515"}
+{"code": "ENGG7516", "name": "Production Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7516"}
+{"code": "ENGG7517", "name": "Petroleum Project Economics and Decision Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7517"}
+{"code": "ENGG7701", "name": "Engineering Grand Challenges", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7701"}
+{"code": "ENGG7802", "name": "Engineering Postgraduate Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7802"}
+{"code": "ENGG7803", "name": "Engineering Postgraduate Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7803"}
+{"code": "ENGG7804", "name": "Engineering Postgraduate Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7804"}
+{"code": "ENGG7806", "name": "Engineering Postgraduate Project D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7806"}
+{"code": "ENGG7807", "name": "Engineering Postgraduate Project D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7807"}
+{"code": "ENGG7808", "name": "Engineering Postgraduate Project D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7808"}
+{"code": "ENGG7811", "name": "Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7811"}
+{"code": "ENGG7820", "name": "Engineering Thesis Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7820"}
+{"code": "ENGG7830", "name": "Engineering Placement Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7830"}
+{"code": "ENGG7901", "name": "Professional Engineering and the Business Environment: Global Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7901"}
+{"code": "ENGG7902", "name": "Engineering Innovation and Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG7902"}
+{"code": "ENGL1002E", "name": "Academic English for University Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL1002E"}
+{"code": "ENGL1022E", "name": "Academic English for University Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL1022E"}
+{"code": "ENGL1032E", "name": "Academic English for University Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL1032E"}
+{"code": "ENGL1500", "name": "Contemporary Literature: Reading & Writing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL1500"}
+{"code": "ENGL1800", "name": "Literary Classics: Texts and Traditions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL1800"}
+{"code": "ENGL1900", "name": "The Birth of the Modern: Literature and Thought from 1850 to 1960", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL1900"}
+{"code": "ENGL2010", "name": "New World Exchanges: Literature in the Age of Discovery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2010"}
+{"code": "ENGL2040", "name": "Gothic Fiction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2040"}
+{"code": "ENGL2060", "name": "Shakespeare and His Contemporaries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2060"}
+{"code": "ENGL2065", "name": "Jane Austen and her Influence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2065"}
+{"code": "ENGL2070", "name": "Contemporary British and American Fiction: Ethics, Politics,and Literature", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2070"}
+{"code": "ENGL2405", "name": "Thinking about Literature: Criticism and Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2405"}
+{"code": "ENGL2440", "name": "The Novel: Realism, History, Fiction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2440"}
+{"code": "ENGL2460", "name": "Poetry: Tradition and Revolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL2460"}
+{"code": "ENGL3020", "name": "Journals, Repositories & Conferences Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL3020"}
+{"code": "ENGL3030", "name": "Adaptation: Studies in Transmission Between Cultures and Forms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL3030"}
+{"code": "ENGL3100", "name": "Australian Literature", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL3100"}
+{"code": "ENGL3500", "name": "Gender and Textuality", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL3500"}
+{"code": "ENGL3630", "name": "Postmodernism: Fiction and Theories", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL3630"}
+{"code": "ENGL6050", "name": "Honours Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL6050"}
+{"code": "ENGL6085", "name": "Research Methods & Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL6085"}
+{"code": "ENGL6100", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL6100"}
+{"code": "ENGL6101", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL6101"}
+{"code": "ENGL6500", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL6500"}
+{"code": "ENGL9000", "name": "Advanced Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGL9000"}
+{"code": "ENGY4000", "name": "Energy Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY4000"}
+{"code": "ENGY7000", "name": "Energy Principles and Renewable Energy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7000"}
+{"code": "ENGY7001", "name": "Climate Science and Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7001"}
+{"code": "ENGY7002", "name": "Energy and Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7002"}
+{"code": "ENGY7003", "name": "Low Emission Technologies and Supply Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7003"}
+{"code": "ENGY7004", "name": "Energy Investment and Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7004"}
+{"code": "ENGY7010", "name": "Bridging Course for Sustainable Energy MicroMasters", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7010"}
+{"code": "ENGY7100", "name": "Carbon Reduction Options", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7100"}
+{"code": "ENGY7101", "name": "Carbon Policy, Law and Regulations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7101"}
+{"code": "ENGY7102", "name": "Principles of Carbon Capture & Storage", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7102"}
+{"code": "ENGY7103", "name": "Project Management for Energy Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7103"}
+{"code": "ENGY7104", "name": "Risk Assessment for Energy Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7104"}
+{"code": "ENGY7105", "name": "Social Engagement for Energy Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7105"}
+{"code": "ENGY7106", "name": "Carbon Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7106"}
+{"code": "ENGY7107", "name": "Economics and Finance of Energy Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7107"}
+{"code": "ENGY7108", "name": "Advanced Carbon Capture Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7108"}
+{"code": "ENGY7109", "name": "Advanced Carbon Storage Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7109"}
+{"code": "ENGY7110", "name": "Industry Project in Energy Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7110"}
+{"code": "ENGY7111", "name": "Dissertation in Energy Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7111"}
+{"code": "ENGY7112", "name": "Professional Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7112"}
+{"code": "ENGY7113", "name": "Professional Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7113"}
+{"code": "ENGY7114", "name": "Professional Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7114"}
+{"code": "ENGY7115", "name": "Professional Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7115"}
+{"code": "ENGY7116", "name": "Professional Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7116"}
+{"code": "ENGY7117", "name": "Energy Markets, Law and Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7117"}
+{"code": "ENGY7200", "name": "Energy Strategy, Innovation, and Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7200"}
+{"code": "ENGY7201", "name": "Applied Carbon Management Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7201"}
+{"code": "ENGY7210", "name": "Frontiers in Renewable Energy Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7210"}
+{"code": "ENGY7215", "name": "Mini Project in Energy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7215"}
+{"code": "ENGY7300", "name": "Power Generation Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7300"}
+{"code": "ENGY7301", "name": "Energy Efficiency and Transport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENGY7301"}
+{"code": "ENTM6003", "name": "Terrestrial Arthropods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENTM6003"}
+{"code": "ENVH7001", "name": "Environmental Health Risk - Biological Hazards", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7001"}
+{"code": "ENVH7002", "name": "Environmental Health Risks - Chemical Hazards", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7002"}
+{"code": "ENVH7003", "name": "Environmental Health Risks - Physical Hazards", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7003"}
+{"code": "ENVH7004", "name": "Pharmacokinetics, Pharmacodynamics and Toxicology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7004"}
+{"code": "ENVH7005", "name": "Independent Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7005"}
+{"code": "ENVH7006", "name": "Independent Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7006"}
+{"code": "ENVH7007", "name": "Environment Health Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7007"}
+{"code": "ENVH7008", "name": "Environment Health Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVH7008"}
+{"code": "ENVM1501", "name": "Introduction to Environmental Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM1501"}
+{"code": "ENVM1512", "name": "Ecological Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM1512"}
+{"code": "ENVM1522", "name": "Carbon and Energy Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM1522"}
+{"code": "ENVM2000", "name": "Environmental Data Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2000"}
+{"code": "ENVM2001", "name": "Wildlife Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2001"}
+{"code": "ENVM2002", "name": "Marine & Coastal Environmental Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2002"}
+{"code": "ENVM2008", "name": "Cultural Heritage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2008"}
+{"code": "ENVM2100", "name": "Sustainable Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2100"}
+{"code": "ENVM2101", "name": "Sustainable Consumption and Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2101"}
+{"code": "ENVM2200", "name": "Resource Management & Environmental Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2200"}
+{"code": "ENVM2203", "name": "Environmental Impact Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2203"}
+{"code": "ENVM2521", "name": "Participatory Research, Development and Extension Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2521"}
+{"code": "ENVM2522", "name": "Carbon & Energy Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM2522"}
+{"code": "ENVM3001", "name": "Principles of Wildlife Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3001"}
+{"code": "ENVM3102", "name": "Industry Placement (Environmental Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3102"}
+{"code": "ENVM3103", "name": "Regulatory Frameworks for Environmental Management & Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3103"}
+{"code": "ENVM3104", "name": "International Regulatory Frameworks for Climate Change & Environmental Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3104"}
+{"code": "ENVM3105", "name": "Field Excursion (Natural Systems & Wildlife)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3105"}
+{"code": "ENVM3106", "name": "Field Excursion (Sustainable Development)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3106"}
+{"code": "ENVM3107", "name": "Northern Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3107"}
+{"code": "ENVM3112", "name": "Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3112"}
+{"code": "ENVM3113", "name": "Industry Placement Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3113"}
+{"code": "ENVM3115", "name": "Climate Change and Environmental Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3115"}
+{"code": "ENVM3200", "name": "Coastal Processes & Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3200"}
+{"code": "ENVM3201", "name": "Catchment Processes & Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3201"}
+{"code": "ENVM3203", "name": "Tools for Environmental Assessment and Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3203"}
+{"code": "ENVM3211", "name": "Environmental Toxicology and Monitoring", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3211"}
+{"code": "ENVM3215", "name": "People, Fire and Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3215"}
+{"code": "ENVM3220", "name": "Resource Management and Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3220"}
+{"code": "ENVM3305", "name": "Environmental Management in Mining", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3305"}
+{"code": "ENVM3400", "name": "International Experience Field Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3400"}
+{"code": "ENVM3405", "name": "Managing Post-Mining Landscapes: Land Rehabilitation in the Mining Industry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3405"}
+{"code": "ENVM3506", "name": "International & National Conservation Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3506"}
+{"code": "ENVM3517", "name": "Protected Area Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3517"}
+{"code": "ENVM3523", "name": "Natural Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3523"}
+{"code": "ENVM3525", "name": "Sustainable Business Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3525"}
+{"code": "ENVM3529", "name": "Northern and Tropical Queensland Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM3529"}
+{"code": "ENVM4008", "name": "Science & the Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4008"}
+{"code": "ENVM4100", "name": "Environmental Management Case Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4100"}
+{"code": "ENVM4110", "name": "Environmental Management Case Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4110"}
+{"code": "ENVM4200", "name": "Environmental Management Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4200"}
+{"code": "ENVM4201", "name": "Environmental Management Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4201"}
+{"code": "ENVM4321", "name": "Environmental Science Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4321"}
+{"code": "ENVM4323", "name": "Environmental Science Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4323"}
+{"code": "ENVM4324", "name": "Environmental Science Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4324"}
+{"code": "ENVM4501", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4501"}
+{"code": "ENVM4502", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4502"}
+{"code": "ENVM4512", "name": "Environmental Problem Solving", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4512"}
+{"code": "ENVM4525", "name": "Sustainable Business Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM4525"}
+{"code": "ENVM7001", "name": "Foundations in Environmental Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7001"}
+{"code": "ENVM7002", "name": "Marine & Coastal Environmental Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7002"}
+{"code": "ENVM7003", "name": "Applied Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7003"}
+{"code": "ENVM7030", "name": "Sustainable Agriculture and Conservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7030"}
+{"code": "ENVM7100", "name": "Foundations of Sustainable Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7100"}
+{"code": "ENVM7104", "name": "Sustainable Consumption and Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7104"}
+{"code": "ENVM7109", "name": "Research Topic (Environmental Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7109"}
+{"code": "ENVM7110", "name": "Research Project (Environmental Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7110"}
+{"code": "ENVM7115", "name": "Research Project (Environmental Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7115"}
+{"code": "ENVM7117", "name": "Research Project (Environmental Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7117"}
+{"code": "ENVM7118", "name": "Research Project (Environmental Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7118"}
+{"code": "ENVM7123", "name": "Regulatory Frameworks for Environmental Management & Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7123"}
+{"code": "ENVM7124", "name": "International Regulatory Frameworks for Climate Change & Environmental Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7124"}
+{"code": "ENVM7125", "name": "Environmental Management Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7125"}
+{"code": "ENVM7126", "name": "Environmental Management Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7126"}
+{"code": "ENVM7127", "name": "Environmental Management Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7127"}
+{"code": "ENVM7128", "name": "Environmental Management Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7128"}
+{"code": "ENVM7130", "name": "Environmental Management Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7130"}
+{"code": "ENVM7131", "name": "Environmental Management Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7131"}
+{"code": "ENVM7132", "name": "Environmental Management Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7132"}
+{"code": "ENVM7134", "name": "Environmental Management Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7134"}
+{"code": "ENVM7190", "name": "Environmental Management Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7190"}
+{"code": "ENVM7191", "name": "Environmental Management Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7191"}
+{"code": "ENVM7192", "name": "Environmental Management Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7192"}
+{"code": "ENVM7200", "name": "Coastal Processes & Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7200"}
+{"code": "ENVM7201", "name": "Catchment Processes & Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7201"}
+{"code": "ENVM7202", "name": "Resource Management & Environmental Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7202"}
+{"code": "ENVM7205", "name": "Climate Change and Environmental Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7205"}
+{"code": "ENVM7206", "name": "Tools for Environmental Assessment and Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7206"}
+{"code": "ENVM7305", "name": "Environmental Management in Mining", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7305"}
+{"code": "ENVM7405", "name": "Managing Post-Mining Landscapes: Land Rehabilitation in the Mining Industry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7405"}
+{"code": "ENVM7505", "name": "International & National Conservation Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7505"}
+{"code": "ENVM7511", "name": "Natural Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7511"}
+{"code": "ENVM7512", "name": "Environmental Problem Solving", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7512"}
+{"code": "ENVM7513", "name": "Environment & Community", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7513"}
+{"code": "ENVM7522", "name": "Protected Area Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7522"}
+{"code": "ENVM7524", "name": "Carbon & Energy Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7524"}
+{"code": "ENVM7529", "name": "Northern and Tropical Queensland Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7529"}
+{"code": "ENVM7530", "name": "People, Fire and Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7530"}
+{"code": "ENVM7535", "name": "Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ENVM7535"}
+{"code": "ERTH1000", "name": "Planet Earth: The Big Picture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH1000"}
+{"code": "ERTH1501", "name": "Earth Processes & Geological Materials for Engineers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH1501"}
+{"code": "ERTH2002", "name": "Paleobiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH2002"}
+{"code": "ERTH2003", "name": "Sedimentology, Stratigraphy and Paleoenvironments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH2003"}
+{"code": "ERTH2004", "name": "Structural Geology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH2004"}
+{"code": "ERTH2005", "name": "Mineralogy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH2005"}
+{"code": "ERTH2006", "name": "Igneous & Metamorphic Petrology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH2006"}
+{"code": "ERTH2020", "name": "Introduction to Geophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH2020"}
+{"code": "ERTH2050", "name": "Field Geology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH2050"}
+{"code": "ERTH3001", "name": "Ore Deposits & Exploration Geology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3001"}
+{"code": "ERTH3002", "name": "Advanced Field Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3002"}
+{"code": "ERTH3003", "name": "Geomicrobiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3003"}
+{"code": "ERTH3004", "name": "Geostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3004"}
+{"code": "ERTH3021", "name": "Exploration & Mining Geophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3021"}
+{"code": "ERTH3050", "name": "Field Geology: Mapping in the Outback", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3050"}
+{"code": "ERTH3060", "name": "Advanced Structural Geology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3060"}
+{"code": "ERTH3103", "name": "Sedimentary Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3103"}
+{"code": "ERTH3104", "name": "Tectonics and Crustal Evolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3104"}
+{"code": "ERTH3110", "name": "Marine Geoscience and Paleoceanography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3110"}
+{"code": "ERTH3203", "name": "Energy Resources", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3203"}
+{"code": "ERTH3205", "name": "Geochemistry and Geochronology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3205"}
+{"code": "ERTH3212", "name": "Geology of Coral Reefs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3212"}
+{"code": "ERTH3222", "name": "Exploration Geochemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3222"}
+{"code": "ERTH3250", "name": "Hydrogeology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3250"}
+{"code": "ERTH3301", "name": "Ore Body Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH3301"}
+{"code": "ERTH4120", "name": "Geophysical Signal Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH4120"}
+{"code": "ERTH4121", "name": "Gravity & Magnetic Exploration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH4121"}
+{"code": "ERTH4220", "name": "Exploration Seismology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH4220"}
+{"code": "ERTH4221", "name": "Electrical & Electromagnetic Exploration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH4221"}
+{"code": "ERTH4222", "name": "Exploration Geochemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH4222"}
+{"code": "ERTH6201", "name": "Earth Sciences Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6201"}
+{"code": "ERTH6202", "name": "Earth Sciences Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6202"}
+{"code": "ERTH6501", "name": "Geology Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6501"}
+{"code": "ERTH6502", "name": "Geology Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6502"}
+{"code": "ERTH6503", "name": "Geology Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6503"}
+{"code": "ERTH6504", "name": "Geology Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6504"}
+{"code": "ERTH6506", "name": "Geology Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6506"}
+{"code": "ERTH6507", "name": "Geology Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6507"}
+{"code": "ERTH6550", "name": "Industrial Applications of Exploration Geophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6550"}
+{"code": "ERTH6560", "name": "Advanced Geophysical Signal Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6560"}
+{"code": "ERTH6701", "name": "Geology Literature Review and Research Proposal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH6701"}
+{"code": "ERTH7000", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7000"}
+{"code": "ERTH7001", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7001"}
+{"code": "ERTH7101", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7101"}
+{"code": "ERTH7102", "name": "Special Topics I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7102"}
+{"code": "ERTH7103", "name": "Special Topics II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7103"}
+{"code": "ERTH7104", "name": "Special Topics III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7104"}
+{"code": "ERTH7105", "name": "Special Topics IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7105"}
+{"code": "ERTH7111", "name": "Ore Deposits & Exploration Geology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7111"}
+{"code": "ERTH7200", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7200"}
+{"code": "ERTH7201", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7201"}
+{"code": "ERTH7301", "name": "Ore Body Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7301"}
+{"code": "ERTH7311", "name": "Exploration Geochemistry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7311"}
+{"code": "ERTH7411", "name": "Basin Analysis in Exploration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7411"}
+{"code": "ERTH7510", "name": "Geophysical Signal Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7510"}
+{"code": "ERTH7511", "name": "Gravity & Magnetic Exploration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7511"}
+{"code": "ERTH7520", "name": "Exploration Seismology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7520"}
+{"code": "ERTH7521", "name": "Electrical & Electromagnetic Exploration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7521"}
+{"code": "ERTH7611", "name": "Advanced Field Geology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7611"}
+{"code": "ERTH7711", "name": "Advanced Structural Geology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ERTH7711"}
+{"code": "EVNT2000", "name": "Fundamentals of Event Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT2000"}
+{"code": "EVNT2003", "name": "Event Planning and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT2003"}
+{"code": "EVNT2004", "name": "Event Marketing and Consumer Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT2004"}
+{"code": "EVNT3003", "name": "Event Operations Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT3003"}
+{"code": "EVNT3004", "name": "Event Sponsorship & Fundraising", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT3004"}
+{"code": "EVNT3005", "name": "Strategic Event Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT3005"}
+{"code": "EVNT7050", "name": "International Event Issues and Strategies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT7050"}
+{"code": "EVNT7051", "name": "Event Planning & Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT7051"}
+{"code": "EVNT7052", "name": "Event Marketing, Sponsorship & Fundraising", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT7052"}
+{"code": "EVNT7053", "name": "Event Design, Staging & Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EVNT7053"}
+{"code": "EXCH1011", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1011"}
+{"code": "EXCH1012", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1012"}
+{"code": "EXCH1013", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1013"}
+{"code": "EXCH1014", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1014"}
+{"code": "EXCH1015", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1015"}
+{"code": "EXCH1021", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1021"}
+{"code": "EXCH1022", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1022"}
+{"code": "EXCH1023", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1023"}
+{"code": "EXCH1024", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1024"}
+{"code": "EXCH1025", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1025"}
+{"code": "EXCH1031", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1031"}
+{"code": "EXCH1032", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1032"}
+{"code": "EXCH1101", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1101"}
+{"code": "EXCH1102", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1102"}
+{"code": "EXCH1103", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1103"}
+{"code": "EXCH1104", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1104"}
+{"code": "EXCH1105", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1105"}
+{"code": "EXCH1121", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1121"}
+{"code": "EXCH1122", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1122"}
+{"code": "EXCH1123", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1123"}
+{"code": "EXCH1124", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1124"}
+{"code": "EXCH1125", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1125"}
+{"code": "EXCH1201", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1201"}
+{"code": "EXCH1202", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1202"}
+{"code": "EXCH1203", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1203"}
+{"code": "EXCH1204", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1204"}
+{"code": "EXCH1205", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1205"}
+{"code": "EXCH1221", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1221"}
+{"code": "EXCH1222", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1222"}
+{"code": "EXCH1223", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1223"}
+{"code": "EXCH1224", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1224"}
+{"code": "EXCH1225", "name": "Exchange Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXCH1225"}
+{"code": "EXMD2362", "name": "Exercise Prescription & Programming", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD2362"}
+{"code": "EXMD2382", "name": "Exercise Science Technical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD2382"}
+{"code": "EXMD3070", "name": "Physical Activity for People with Motor, Sensory, Cognitive or Behavioural Impairments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD3070"}
+{"code": "EXMD3372", "name": "Exercise Science Professional Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD3372"}
+{"code": "EXMD4700", "name": "Clinical Exercise Physiology Practicum (Clinical Populations)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD4700"}
+{"code": "EXMD4701", "name": "Clinical Exercise Physiology Practicum: Cardiopulmonary/Metabolic Populations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD4701"}
+{"code": "EXMD4702", "name": "Clinical Exercise Physiology Practicum: Musculoskeletal/Neurological Populations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD4702"}
+{"code": "EXMD4740", "name": "Exercise Prescription & Programming for Musculoskeletal Conditions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD4740"}
+{"code": "EXMD4741", "name": "Exercise Prescription & Programming for Ageing, Metabolic Disease & Cancer", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD4741"}
+{"code": "EXMD4742", "name": "Exercise Prescription & Programming for Cardiorespiratory Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD4742"}
+{"code": "EXMD4743", "name": "Exercise Prescription and Programming for Metabolic and Kidney Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD4743"}
+{"code": "EXMD6383", "name": "Exercise Science Technical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD6383"}
+{"code": "EXMD7070", "name": "Adv. Phys. Activity for people with motor, sensory, cognitive or behav. impairments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7070"}
+{"code": "EXMD7314", "name": "Clinical Exercise Physiology Major Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7314"}
+{"code": "EXMD7315", "name": "Clinical Exercise Physiology Major Practicum: Cardiopulmonary/Metabolic Populations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7315"}
+{"code": "EXMD7316", "name": "Clinical Exercise Physiology Major Practicum: Musculoskeletal/Neurological Populations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7316"}
+{"code": "EXMD7362", "name": "Prescription & Programming for Healthy Individuals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7362"}
+{"code": "EXMD7372", "name": "Clinical Exercise Physiology Professional Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7372"}
+{"code": "EXMD7382", "name": "Exercise Science Technical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7382"}
+{"code": "EXMD7740", "name": "Prescription & Programming for Musculoskeletal Conditions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7740"}
+{"code": "EXMD7741", "name": "Prescription & Programming for Ageing, Obesity & Cancer", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7741"}
+{"code": "EXMD7742", "name": "Prescription & Programming for Cardiorespiratory Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=EXMD7742"}
+{"code": "FINM1401", "name": "Personal Wealth Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM1401"}
+{"code": "FINM1415", "name": "Introduction to Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM1415"}
+{"code": "FINM1416", "name": "Introduction to Financial Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM1416"}
+{"code": "FINM2400", "name": "Managerial Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM2400"}
+{"code": "FINM2401", "name": "Financial Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM2401"}
+{"code": "FINM2411", "name": "Principles of Financial Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM2411"}
+{"code": "FINM2412", "name": "Financial Management for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM2412"}
+{"code": "FINM2415", "name": "Corporate Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM2415"}
+{"code": "FINM2416", "name": "Asset Pricing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM2416"}
+{"code": "FINM2460", "name": "Financing the Health System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM2460"}
+{"code": "FINM3400", "name": "International Study Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3400"}
+{"code": "FINM3401", "name": "Corporate Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3401"}
+{"code": "FINM3402", "name": "Investments & Portfolio Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3402"}
+{"code": "FINM3403", "name": "International Financial Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3403"}
+{"code": "FINM3404", "name": "Banking & Lending Decisions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3404"}
+{"code": "FINM3405", "name": "Derivatives and Risk Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3405"}
+{"code": "FINM3411", "name": "Applied Corporate Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3411"}
+{"code": "FINM3412", "name": "Advanced Investments and Portfolio Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3412"}
+{"code": "FINM3414", "name": "Financial Institutions Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3414"}
+{"code": "FINM3421", "name": "Fixed Income Analytics and Treasury Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3421"}
+{"code": "FINM3422", "name": "Financial Modelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3422"}
+{"code": "FINM3960", "name": "Investment Project Appraisal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM3960"}
+{"code": "FINM4401", "name": "Advanced Studies in Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM4401"}
+{"code": "FINM4411", "name": "Team Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM4411"}
+{"code": "FINM4412", "name": "Financial Statement Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM4412"}
+{"code": "FINM4413", "name": "Advanced Corporate Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM4413"}
+{"code": "FINM4999", "name": "Professional Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM4999"}
+{"code": "FINM6401", "name": "Corporate Finance Honours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6401"}
+{"code": "FINM6402", "name": "Empirical Finance Honours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6402"}
+{"code": "FINM6403", "name": "Critical Issues in Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6403"}
+{"code": "FINM6900", "name": "Finance Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6900"}
+{"code": "FINM6901", "name": "Special Topics in Finance 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6901"}
+{"code": "FINM6902", "name": "Special Topics in Finance 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6902"}
+{"code": "FINM6903", "name": "Special Topics in Finance 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6903"}
+{"code": "FINM6904", "name": "Special Topics in Finance 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6904"}
+{"code": "FINM6905", "name": "Finance Empirical", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM6905"}
+{"code": "FINM7401", "name": "Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7401"}
+{"code": "FINM7402", "name": "Corporate Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7402"}
+{"code": "FINM7403", "name": "Portfolio Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7403"}
+{"code": "FINM7404", "name": "Empirical Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7404"}
+{"code": "FINM7405", "name": "Financial Risk Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7405"}
+{"code": "FINM7406", "name": "International Financial Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7406"}
+{"code": "FINM7407", "name": "Financial Institutions and Markets", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7407"}
+{"code": "FINM7408", "name": "Superannuation, Insurance and Deposit Products", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7408"}
+{"code": "FINM7409", "name": "Financial Management for Decision Makers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7409"}
+{"code": "FINM7410", "name": "Environmental Finance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7410"}
+{"code": "FINM7701", "name": "Finance and Accounting for Non-Finance Executives", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7701"}
+{"code": "FINM7805", "name": "Financial Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7805"}
+{"code": "FINM7901", "name": "Fundamentals of Finance and Accounting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7901"}
+{"code": "FINM7902", "name": "Business Management in the Public Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7902"}
+{"code": "FINM7903", "name": "Financial Management in the Public Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7903"}
+{"code": "FINM7904", "name": "Asset Management in the Public Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7904"}
+{"code": "FINM7905", "name": "Treasury Management in the Public Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7905"}
+{"code": "FINM7960", "name": "Agribusiness Project Appraisal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FINM7960"}
+{"code": "FIRE3700", "name": "Introduction to Fire Safety Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE3700"}
+{"code": "FIRE4610", "name": "Fire Engineering Design: Solutions for Implicit Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE4610"}
+{"code": "FIRE6000", "name": "Basic Fire Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE6000"}
+{"code": "FIRE6020", "name": "Fire Protection Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE6020"}
+{"code": "FIRE6030", "name": "Prescriptive Solutions for Fire Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE6030"}
+{"code": "FIRE6040", "name": "Performance Based Solutions in Fire Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE6040"}
+{"code": "FIRE6050", "name": "Fire Dynamics Laboratory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE6050"}
+{"code": "FIRE6060", "name": "Design Project: Code Based", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE6060"}
+{"code": "FIRE6070", "name": "Research Project: Performance Based", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE6070"}
+{"code": "FIRE7500", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7500"}
+{"code": "FIRE7501", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7501"}
+{"code": "FIRE7511", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7511"}
+{"code": "FIRE7512", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7512"}
+{"code": "FIRE7600", "name": "Introduction to Fire Safety Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7600"}
+{"code": "FIRE7610", "name": "Fire Engineering Design:Solutions for Implicit Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7610"}
+{"code": "FIRE7620", "name": "Fire Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7620"}
+{"code": "FIRE7640", "name": "Fire Dynamics Laboratory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7640"}
+{"code": "FIRE7660", "name": "Structural Fire Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7660"}
+{"code": "FIRE7680", "name": "Fire Engineering Design: Explicit Quantification of Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FIRE7680"}
+{"code": "FOOD1001", "name": "Principles of Food Preservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD1001"}
+{"code": "FOOD2000", "name": "Food Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD2000"}
+{"code": "FOOD2003", "name": "Food Process Engineering I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD2003"}
+{"code": "FOOD3000", "name": "Functional Foods & Nutraceuticals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3000"}
+{"code": "FOOD3007", "name": "Food Structure & Sensory Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3007"}
+{"code": "FOOD3008", "name": "Food Process Engineering II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3008"}
+{"code": "FOOD3009", "name": "Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3009"}
+{"code": "FOOD3011", "name": "Food Product Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3011"}
+{"code": "FOOD3017", "name": "Food Policy, Safety & Quality Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3017"}
+{"code": "FOOD3022", "name": "Bush Foods of Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3022"}
+{"code": "FOOD3030", "name": "Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3030"}
+{"code": "FOOD3601", "name": "Special Topic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD3601"}
+{"code": "FOOD4618", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD4618"}
+{"code": "FOOD4619", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD4619"}
+{"code": "FOOD4620", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD4620"}
+{"code": "FOOD6001", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD6001"}
+{"code": "FOOD6002", "name": "Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD6002"}
+{"code": "FOOD7000", "name": "Advanced Food Materials Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7000"}
+{"code": "FOOD7006", "name": "Food Safety & Quality Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7006"}
+{"code": "FOOD7011", "name": "Principles of Food Preservation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7011"}
+{"code": "FOOD7013", "name": "Food Chemistry & Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7013"}
+{"code": "FOOD7016", "name": "Food Sensory & Physical Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7016"}
+{"code": "FOOD7018", "name": "Food Bioprocessing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7018"}
+{"code": "FOOD7019", "name": "Food Product and Process Designs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7019"}
+{"code": "FOOD7020", "name": "Food Processing Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7020"}
+{"code": "FOOD7021", "name": "Professional Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7021"}
+{"code": "FOOD7022", "name": "Bush Foods of Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7022"}
+{"code": "FOOD7024", "name": "Special Studies in Food Science and Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7024"}
+{"code": "FOOD7025", "name": "Advanced Functional Foods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7025"}
+{"code": "FOOD7617", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7617"}
+{"code": "FOOD7618", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7618"}
+{"code": "FOOD7619", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FOOD7619"}
+{"code": "FREN1010", "name": "Introductory French 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN1010"}
+{"code": "FREN1020", "name": "Introductory French 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN1020"}
+{"code": "FREN2010", "name": "Intermediate French 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN2010"}
+{"code": "FREN2020", "name": "Intermediate French 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN2020"}
+{"code": "FREN3111", "name": "French Language and Culture 1: Streams A and B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3111"}
+{"code": "FREN3112", "name": "French Language and Culture 1: Post-secondary", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3112"}
+{"code": "FREN3113", "name": "French Language and Culture 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3113"}
+{"code": "FREN3114", "name": "French Language and Culture 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3114"}
+{"code": "FREN3115", "name": "French Language and Culture 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3115"}
+{"code": "FREN3116", "name": "French Language and Culture 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3116"}
+{"code": "FREN3210", "name": "Textes et Modernite", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3210"}
+{"code": "FREN3310", "name": "French>English Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3310"}
+{"code": "FREN3330", "name": "French for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3330"}
+{"code": "FREN3350", "name": "Litterature contemporaine: Contemporary Literature in French", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3350"}
+{"code": "FREN3360", "name": "Le Cinema en francais", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3360"}
+{"code": "FREN3375", "name": "Teaching and Learning French", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3375"}
+{"code": "FREN3380", "name": "Identites francaises et francophones", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3380"}
+{"code": "FREN3910", "name": "French Study Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN3910"}
+{"code": "FREN6340", "name": "Advanced French Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN6340"}
+{"code": "FREN6350", "name": "Special Topics in French Language Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN6350"}
+{"code": "FREN6364", "name": "Special Topics in French Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN6364"}
+{"code": "FREN6910", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN6910"}
+{"code": "FREN6911", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN6911"}
+{"code": "FREN6920", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=FREN6920"}
+{"code": "GEND1010", "name": "Gender Matters", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEND1010"}
+{"code": "GEND2001", "name": "Genders & Cultures: Comparative Perspectives on Race and Ethnicity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEND2001"}
+{"code": "GEND3001", "name": "Gender Futures: Research in Action", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEND3001"}
+{"code": "GEND6004", "name": "Feminist Methodology Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEND6004"}
+{"code": "GENP7001", "name": "Health Care Integration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7001"}
+{"code": "GENP7002", "name": "Chronic Disease Management in General Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7002"}
+{"code": "GENP7003", "name": "Caring for Ageing Australians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7003"}
+{"code": "GENP7004", "name": "General Practice Dermatology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7004"}
+{"code": "GENP7005", "name": "General Practice Dermatology Clinical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7005"}
+{"code": "GENP7006", "name": "Primary Care Ophthalmology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7006"}
+{"code": "GENP7007", "name": "Mental Health & the GP", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7007"}
+{"code": "GENP7008", "name": "Reflective Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7008"}
+{"code": "GENP7009", "name": "Advanced Diabetes Care in General Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GENP7009"}
+{"code": "GEOG1000", "name": "Human Settlements", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG1000"}
+{"code": "GEOG2000", "name": "Economic Geography: Location and Land Use", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG2000"}
+{"code": "GEOG2001", "name": "Human Mobility and Migration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG2001"}
+{"code": "GEOG2104", "name": "Urban Geography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG2104"}
+{"code": "GEOG2205", "name": "Global Population Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG2205"}
+{"code": "GEOG3000", "name": "Regional Economic Development Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG3000"}
+{"code": "GEOG3003", "name": "The Global Metropolis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG3003"}
+{"code": "GEOG3205", "name": "Applied Demography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG3205"}
+{"code": "GEOG7000", "name": "Applied Demography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG7000"}
+{"code": "GEOG7002", "name": "Global Population Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOG7002"}
+{"code": "GEOM1000", "name": "Fundamentals of Geographic Information and Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM1000"}
+{"code": "GEOM2000", "name": "Introduction to Earth Observation Sciences (EOS)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM2000"}
+{"code": "GEOM2001", "name": "Geographical Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM2001"}
+{"code": "GEOM3001", "name": "Advanced Earth Observation Sciences (EOS)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM3001"}
+{"code": "GEOM3002", "name": "Advanced Geographical Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM3002"}
+{"code": "GEOM3005", "name": "Geospatial Processing and Web Mapping", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM3005"}
+{"code": "GEOM7000", "name": "Introduction to Earth Observation Sciences (EOS)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7000"}
+{"code": "GEOM7001", "name": "Advanced Earth Observation Sciences (EOS)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7001"}
+{"code": "GEOM7002", "name": "Advanced Geographical Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7002"}
+{"code": "GEOM7004", "name": "Geospatial Processing and Web Mapping", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7004"}
+{"code": "GEOM7005", "name": "Geographical Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7005"}
+{"code": "GEOM7007", "name": "Spatial Sciences Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7007"}
+{"code": "GEOM7008", "name": "Spatial Sciences Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7008"}
+{"code": "GEOM7009", "name": "Spatial Sciences Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7009"}
+{"code": "GEOM7010", "name": "Spatial Sciences Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7010"}
+{"code": "GEOM7011", "name": "Spatial Sciences Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7011"}
+{"code": "GEOM7200", "name": "Fundamentals of Geographic Information and Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7200"}
+{"code": "GEOM7400", "name": "Geographic Information Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOM7400"}
+{"code": "GEOS1100", "name": "Environment & Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS1100"}
+{"code": "GEOS2100", "name": "Environmental Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS2100"}
+{"code": "GEOS2101", "name": "Climatology & Hydrology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS2101"}
+{"code": "GEOS2103", "name": "Biogeography & Geomorphology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS2103"}
+{"code": "GEOS2105", "name": "Geography of Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS2105"}
+{"code": "GEOS2110", "name": "Tectonics of Active Plate Boundaries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS2110"}
+{"code": "GEOS3004", "name": "International Field Studies: Natural & Built Environments of a Selected Region", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3004"}
+{"code": "GEOS3102", "name": "Global Change: Problems and Prospects", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3102"}
+{"code": "GEOS3103", "name": "Progress in Geography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3103"}
+{"code": "GEOS3106", "name": "Environmental Hazards", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3106"}
+{"code": "GEOS3107", "name": "Plants, People and the Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3107"}
+{"code": "GEOS3108", "name": "Meteorology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3108"}
+{"code": "GEOS3400", "name": "Research Topic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3400"}
+{"code": "GEOS3401", "name": "Advanced Science Research Topic in Geographical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3401"}
+{"code": "GEOS3402", "name": "Advanced Science Research Topic in Geographical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS3402"}
+{"code": "GEOS6001", "name": "Research Philosophy, Design & Implementation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS6001"}
+{"code": "GEOS6100", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS6100"}
+{"code": "GEOS6101", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS6101"}
+{"code": "GEOS7001", "name": "Research Philosophy, Design & Implementation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7001"}
+{"code": "GEOS7103", "name": "Biogeography & Geomorphology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7103"}
+{"code": "GEOS7106", "name": "Environmental Hazards", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7106"}
+{"code": "GEOS7400", "name": "Research Topic 1 (Geographical Sciences)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7400"}
+{"code": "GEOS7401", "name": "Research Topic 2 (Geographical Sciences)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7401"}
+{"code": "GEOS7403", "name": "Research Project (Geographical Sciences)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7403"}
+{"code": "GEOS7413", "name": "Research Project (Geographical Sciences)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7413"}
+{"code": "GEOS7414", "name": "Research Project (Geographical Sciences)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GEOS7414"}
+{"code": "GREK1110", "name": "Introductory Greek", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK1110"}
+{"code": "GREK2120", "name": "Intermediate Greek", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK2120"}
+{"code": "GREK2230", "name": "Greek Language & Literature 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK2230"}
+{"code": "GREK2240", "name": "Greek Language & Literature 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK2240"}
+{"code": "GREK3001", "name": "Advanced Greek 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK3001"}
+{"code": "GREK3002", "name": "Advanced Greek 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK3002"}
+{"code": "GREK6311", "name": "Greek Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK6311"}
+{"code": "GREK6312", "name": "Greek Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK6312"}
+{"code": "GREK6640", "name": "Greek Set Texts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK6640"}
+{"code": "GREK6675", "name": "Greek Guided Texts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GREK6675"}
+{"code": "GRMN1010", "name": "Introductory German Language 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN1010"}
+{"code": "GRMN1020", "name": "Introductory German Language 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN1020"}
+{"code": "GRMN2010", "name": "Continuing German Language 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN2010"}
+{"code": "GRMN2020", "name": "Continuing German Language 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN2020"}
+{"code": "GRMN2030", "name": "Advanced Conversational German", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN2030"}
+{"code": "GRMN2130", "name": "Translation from German - Theory & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN2130"}
+{"code": "GRMN2330", "name": "Inside Germany - Contemporary German Cultures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN2330"}
+{"code": "GRMN3010", "name": "Advanced German Language 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN3010"}
+{"code": "GRMN3020", "name": "Advanced German Language 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN3020"}
+{"code": "GRMN3110", "name": "Advanced German Language 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN3110"}
+{"code": "GRMN3120", "name": "Advanced German Language 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN3120"}
+{"code": "GRMN3330", "name": "Advanced Special Topics in German Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN3330"}
+{"code": "GRMN6291", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN6291"}
+{"code": "GRMN6340", "name": "Advanced German Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN6340"}
+{"code": "GRMN6350", "name": "Special Topics in German Language Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN6350"}
+{"code": "GRMN6364", "name": "Special Topics in German Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN6364"}
+{"code": "GRMN6910", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN6910"}
+{"code": "GRMN6920", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=GRMN6920"}
+{"code": "HIST1201", "name": "The Australian Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST1201"}
+{"code": "HIST1400", "name": "The Medieval and Early Modern World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST1400"}
+{"code": "HIST1600", "name": "History of the Future", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST1600"}
+{"code": "HIST1601", "name": "Turning Points in World History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST1601"}
+{"code": "HIST2013", "name": "Medieval Study Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2013"}
+{"code": "HIST2030", "name": "History of Medicine, Science and the Body", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2030"}
+{"code": "HIST2100", "name": "China: From Empire to Republic, 1500-1951", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2100"}
+{"code": "HIST2101", "name": "Contemporary China: The People's Republic, Hong Kong & Taiwan since 1949", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2101"}
+{"code": "HIST2107", "name": "The Modern Middle East", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2107"}
+{"code": "HIST2118", "name": "India from 1600 to Independence: Empires, Factories, Nations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2118"}
+{"code": "HIST2119", "name": "Modern Southeast Asia: Freedom, Power and the State", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2119"}
+{"code": "HIST2140", "name": "Indian History and Religion Study Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2140"}
+{"code": "HIST2211", "name": "America in Film", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2211"}
+{"code": "HIST2245", "name": "Australians at War", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2245"}
+{"code": "HIST2247", "name": "The Making of Modern Australia: Society & Culture since 1901", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2247"}
+{"code": "HIST2312", "name": "The History Makers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2312"}
+{"code": "HIST2404", "name": "Imperial Britain: Society & Culture in the Age of Empire (1780-1880)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2404"}
+{"code": "HIST2407", "name": "Germany from Bismarck to Hitler (1870-1933)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2407"}
+{"code": "HIST2408", "name": "Germany from Hitler to Reunification (1933-1991)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2408"}
+{"code": "HIST2411", "name": "Witchcraft & Demonology in Early Modern Europe & Its Colonies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2411"}
+{"code": "HIST2412", "name": "The British Isles: 1500-1700", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2412"}
+{"code": "HIST2414", "name": "The Radical Right & Fascism in Europe", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2414"}
+{"code": "HIST2416", "name": "Medieval Heresy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2416"}
+{"code": "HIST2417", "name": "Imperial Britain: Crisis and Conflict, 1815-1945", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2417"}
+{"code": "HIST2603", "name": "The History of Sexuality", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2603"}
+{"code": "HIST2611", "name": "Body, Fashion & Consumption in History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2611"}
+{"code": "HIST2615", "name": "Age of Crusades", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2615"}
+{"code": "HIST2619", "name": "Japan and the World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2619"}
+{"code": "HIST2707", "name": "The Anatomy of a Super Power: the US since 1945", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST2707"}
+{"code": "HIST3002", "name": "History of Sport & Physical Activity in Australian Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3002"}
+{"code": "HIST3003", "name": "Playing on the Big Stage: Histories of the Olympics and Paralympics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3003"}
+{"code": "HIST3004", "name": "The Problematic Past: History and Controversy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3004"}
+{"code": "HIST3301", "name": "History of Genocide", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3301"}
+{"code": "HIST3302", "name": "The City in History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3302"}
+{"code": "HIST3303", "name": "Trafficking Bodies from the Ancient World to the Present", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3303"}
+{"code": "HIST3609", "name": "Independent Historical Studies A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3609"}
+{"code": "HIST3616", "name": "History in Popular Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST3616"}
+{"code": "HIST6680", "name": "History Honours: Theory & Method", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST6680"}
+{"code": "HIST6690", "name": "History Honours Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST6690"}
+{"code": "HIST6700", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST6700"}
+{"code": "HIST6701", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST6701"}
+{"code": "HIST7002", "name": "History of Sport and Physical Activity in Australian Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7002"}
+{"code": "HIST7104", "name": "The Making of the Modern Asia Pacific", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7104"}
+{"code": "HIST7247", "name": "Australia since Federation: Society & Culture from 1901", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7247"}
+{"code": "HIST7249", "name": "War and Australian Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7249"}
+{"code": "HIST7400", "name": "European Radical Right & Fascism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7400"}
+{"code": "HIST7401", "name": "Industry and Empire: Britain 1780-1880", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7401"}
+{"code": "HIST7404", "name": "Europe in the High Middle Ages", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7404"}
+{"code": "HIST7405", "name": "Genocide in the Modern World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7405"}
+{"code": "HIST7603", "name": "Special Studies in History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7603"}
+{"code": "HIST7606", "name": "Research Methods for Historians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7606"}
+{"code": "HIST7800", "name": "Problems in History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7800"}
+{"code": "HIST7801", "name": "History Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7801"}
+{"code": "HIST7802", "name": "History Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7802"}
+{"code": "HIST7803", "name": "History Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HIST7803"}
+{"code": "HLTH1000", "name": "Professions, People and Healthcare", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH1000"}
+{"code": "HLTH1001E", "name": "Health, Exercise & Diet", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH1001E"}
+{"code": "HLTH1021E", "name": "Health, Exercise & Diet", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH1021E"}
+{"code": "HLTH1031E", "name": "Health, Exercise & Diet", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH1031E"}
+{"code": "HLTH2000", "name": "Understanding Digital Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH2000"}
+{"code": "HLTH2001", "name": "Introduction to Clinical Telehealth", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH2001"}
+{"code": "HLTH3000", "name": "Legal & Ethical Principles in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH3000"}
+{"code": "HLTH3001", "name": "Practicum in Health Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH3001"}
+{"code": "HLTH3007", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH3007"}
+{"code": "HLTH3010", "name": "Mental Health (A)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH3010"}
+{"code": "HLTH6000", "name": "Advanced Discipline Readings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH6000"}
+{"code": "HLTH6001", "name": "Research Methods & Thesis Preparation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH6001"}
+{"code": "HLTH6002", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH6002"}
+{"code": "HLTH6003", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH6003"}
+{"code": "HLTH6100", "name": "Introduction to Clinical Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH6100"}
+{"code": "HLTH6101", "name": "Designing Teaching, Learning & Assessment in Clinical Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH6101"}
+{"code": "HLTH6102", "name": "Educational Interventions in a Clinical Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH6102"}
+{"code": "HLTH7000", "name": "Loss & Disability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7000"}
+{"code": "HLTH7001", "name": "Introduction to Digital Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7001"}
+{"code": "HLTH7002", "name": "Digital Health in Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7002"}
+{"code": "HLTH7003", "name": "Digital Health and Clinical Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7003"}
+{"code": "HLTH7004", "name": "Digital Health & Patient-Centred Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7004"}
+{"code": "HLTH7005", "name": "e-Healthcare Systems Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7005"}
+{"code": "HLTH7006", "name": "Critical Evaluation in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7006"}
+{"code": "HLTH7007", "name": "Critical Evaluation in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7007"}
+{"code": "HLTH7012", "name": "Chronic Conditions & Palliative Care: Client Management Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7012"}
+{"code": "HLTH7016", "name": "Cross-Cultural Perspectives in Loss & Grief", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7016"}
+{"code": "HLTH7051", "name": "Unravelling the Australian Healthcare System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7051"}
+{"code": "HLTH7052", "name": "Future Trends in Healthcare", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7052"}
+{"code": "HLTH7053", "name": "HLTH7053 The Australian Healthcare System: Present & Future Challenges (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7053"}
+{"code": "HLTH7061", "name": "Clinical Quality Improvement Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7061"}
+{"code": "HLTH7062", "name": "Using Measurement to Improve Healthcare", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7062"}
+{"code": "HLTH7063", "name": "HLTH7063 Managing for Quality & Performance in Healthcare Systems (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7063"}
+{"code": "HLTH7071", "name": "Workforce Innovation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7071"}
+{"code": "HLTH7072", "name": "Strategic Planning for Health Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7072"}
+{"code": "HLTH7073", "name": "HLTH7073 Strategic Planning for Health Workforce Innovation (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7073"}
+{"code": "HLTH7074", "name": "Fundamentals of Managing Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7074"}
+{"code": "HLTH7075", "name": "Creating a Positive Work Culture in Health Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7075"}
+{"code": "HLTH7076", "name": "HLTH7076 Human Face of Change in Healthcare (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7076"}
+{"code": "HLTH7077", "name": "Everyday Leadership - Leading People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7077"}
+{"code": "HLTH7078", "name": "Making Things Happen (Project Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7078"}
+{"code": "HLTH7079", "name": "HLTH7079 Clinicians Making Things Happen Through Projects & People (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7079"}
+{"code": "HLTH7086", "name": "HLTH7086 Professional Practice Educational Intervention Design and Assessment (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7086"}
+{"code": "HLTH7091", "name": "Managing Health Service Teams", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7091"}
+{"code": "HLTH7092", "name": "The Right People on the Job (The Basics of Human Resource Management)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7092"}
+{"code": "HLTH7093", "name": "HLTH7093 Skills for Healthcare Team Leaders (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7093"}
+{"code": "HLTH7097", "name": "Learning in a Clinical Setting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7097"}
+{"code": "HLTH7098", "name": "Teaching in a Clinical Setting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7098"}
+{"code": "HLTH7099", "name": "HLTH7099 Introduction to Clinical Education (Assessment Pack)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7099"}
+{"code": "HLTH7111", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7111"}
+{"code": "HLTH7112", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7112"}
+{"code": "HLTH7113", "name": "Introduction to Clinical Telehealth", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7113"}
+{"code": "HLTH7114", "name": "Application of Clinical Telehealth", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7114"}
+{"code": "HLTH7115", "name": "e-Healthcare Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7115"}
+{"code": "HLTH7200", "name": "The Australian Healthcare System: Present & Future Challenges", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7200"}
+{"code": "HLTH7201", "name": "Achieving Patient-Centred, Evidence-Based Healthcare", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7201"}
+{"code": "HLTH7202", "name": "Patient Safety & Quality: Principles & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7202"}
+{"code": "HLTH7203", "name": "Managing for Quality & Performance in Healthcare Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7203"}
+{"code": "HLTH7204", "name": "Education in Clinical Nursing & Midwifery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7204"}
+{"code": "HLTH7205", "name": "Planning & Evaluating Health Professional Development Programs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7205"}
+{"code": "HLTH7207", "name": "Leading Innovation in Health Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7207"}
+{"code": "HLTH7208", "name": "Strategic Planning for Health Workforce Innovation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7208"}
+{"code": "HLTH7209", "name": "Human Face of Change in Healthcare", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7209"}
+{"code": "HLTH7210", "name": "Clinicians Making Things Happen Through Projects & People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7210"}
+{"code": "HLTH7211", "name": "Special Communication Requirements for Healthcare Teams", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7211"}
+{"code": "HLTH7212", "name": "Clinical Leadership in Action: Project Design and Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7212"}
+{"code": "HLTH7213", "name": "Clinical Leadership in Action: Implementation and Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7213"}
+{"code": "HLTH7214", "name": "Clinical Leadership in Action: Implementation and Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7214"}
+{"code": "HLTH7215", "name": "Clinical Leadership in Action: Implementation and Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7215"}
+{"code": "HLTH7219", "name": "The Business of Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7219"}
+{"code": "HLTH7220", "name": "Skills for Healthcare Team Leaders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7220"}
+{"code": "HLTH7221", "name": "Developing Evidence Based Clinical Practice Guidelines", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7221"}
+{"code": "HLTH7225", "name": "Leadership & Management in Nursing & Midwifery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7225"}
+{"code": "HLTH7283", "name": "Creative Writing for Clinical Excellence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7283"}
+{"code": "HLTH7303", "name": "Principles of Primary Care Medicine 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7303"}
+{"code": "HLTH7305", "name": "Evidence based Nursing and Midwifery 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7305"}
+{"code": "HLTH7306", "name": "Evidence Based Nursing and Midwifery 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7306"}
+{"code": "HLTH7308", "name": "Developing a Research Proposal", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7308"}
+{"code": "HLTH7310", "name": "Undertaking a Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HLTH7310"}
+{"code": "HMST1002", "name": "Communication, Learning and Human Movement Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST1002"}
+{"code": "HMST1910", "name": "From Bradman to Freeman: Mythic Qualities of Australian Sport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST1910"}
+{"code": "HMST2190", "name": "From Playground to Podium: Critical Analysis of Sporting Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST2190"}
+{"code": "HMST3000", "name": "Sports Technology, Analytics and Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3000"}
+{"code": "HMST3001", "name": "Clinical Exercise Physiology Practicum (Healthy Populations)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3001"}
+{"code": "HMST3103", "name": "Management & Marketing of Sport & Physical Activity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3103"}
+{"code": "HMST3190", "name": "Sport and Health in Society and Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3190"}
+{"code": "HMST3191", "name": "Indigenous Studies for Sport, Exercise, Physical Education and Nutrition Professionals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3191"}
+{"code": "HMST3392", "name": "Musculoskeletal Rehabilitation in Exercise Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3392"}
+{"code": "HMST3533", "name": "Advanced Motor Control: Perception & Action", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3533"}
+{"code": "HMST3633", "name": "Advanced Biomechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3633"}
+{"code": "HMST3846", "name": "Research Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3846"}
+{"code": "HMST3915", "name": "Individual Research Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3915"}
+{"code": "HMST3935", "name": "Individual Field Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3935"}
+{"code": "HMST3963", "name": "Special Topic in Human Movement Studies A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3963"}
+{"code": "HMST3973", "name": "Special Topic in Human Movement Studies B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST3973"}
+{"code": "HMST4314", "name": "Major Practicum (Exercise and Sports Science)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST4314"}
+{"code": "HMST4925", "name": "Individual Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST4925"}
+{"code": "HMST6001", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST6001"}
+{"code": "HMST6002", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST6002"}
+{"code": "HMST6533", "name": "Advanced Motor Control: Perception & Action", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST6533"}
+{"code": "HMST6611", "name": "Principles of Ergonomics for Improving Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST6611"}
+{"code": "HMST6846", "name": "Research Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST6846"}
+{"code": "HMST6945", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST6945"}
+{"code": "HMST6965", "name": "Directed Study A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST6965"}
+{"code": "HMST7113", "name": "The Global Sports Industry: Economics, Marketing & Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7113"}
+{"code": "HMST7326", "name": "Exercise Rehabilitation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7326"}
+{"code": "HMST7336", "name": "Electrocardiography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7336"}
+{"code": "HMST7356", "name": "Physical Activity Assessment for People with, or at Risk of, Cardiopulmonary Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7356"}
+{"code": "HMST7611", "name": "Advanced Ergonomics Tools & Techniques", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7611"}
+{"code": "HMST7616", "name": "Ergonomics Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7616"}
+{"code": "HMST7732", "name": "Advanced Physiology of Exercise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7732"}
+{"code": "HMST7846", "name": "Research Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7846"}
+{"code": "HMST7903", "name": "Directed Study B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HMST7903"}
+{"code": "HORT1100D", "name": "Horticultural Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HORT1100D"}
+{"code": "HORT2007", "name": "Horticultural Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HORT2007"}
+{"code": "HORT3003", "name": "Production Horticulture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HORT3003"}
+{"code": "HORT3009", "name": "Horticultural Science 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HORT3009"}
+{"code": "HORT7002", "name": "Horticulture Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HORT7002"}
+{"code": "HOSP1000", "name": "Rooms Division Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP1000"}
+{"code": "HOSP1001", "name": "Food and Beverage Service", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP1001"}
+{"code": "HOSP1003", "name": "Food and Catering Service", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP1003"}
+{"code": "HOSP1004", "name": "International Hotel Management - SpecialTopic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP1004"}
+{"code": "HOSP2000", "name": "Restaurant Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP2000"}
+{"code": "HOSP2001", "name": "Hotel Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP2001"}
+{"code": "HOSP2003", "name": "Entrepreneurship in Hospitality", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP2003"}
+{"code": "HOSP2004", "name": "Discourses in Hospitality", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP2004"}
+{"code": "HOSP2005", "name": "Food and Beverage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP2005"}
+{"code": "HOSP3000", "name": "Gaming and Casino Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP3000"}
+{"code": "HOSP3003", "name": "Food and Beverage Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP3003"}
+{"code": "HOSP3004", "name": "Strategic Hospitality Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP3004"}
+{"code": "HOSP3005", "name": "Discourses in Hospitality", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP3005"}
+{"code": "HOSP6001", "name": "International Hotel Management Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP6001"}
+{"code": "HOSP7050", "name": "Designing Food and Beverage Experiences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP7050"}
+{"code": "HOSP7051", "name": "Global Hospitality Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP7051"}
+{"code": "HOSP7052", "name": "Global Hotel, Resort and Casino Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP7052"}
+{"code": "HOSP7053", "name": "Service Leadership in Hospitality", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HOSP7053"}
+{"code": "HPRM1000", "name": "Physical Activity & Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM1000"}
+{"code": "HPRM1100", "name": "Introduction to Health Promotion Principles & Strategies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM1100"}
+{"code": "HPRM2000", "name": "Promoting Health through Physical Activity, Exercise and Diet", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM2000"}
+{"code": "HPRM3000", "name": "Health Promotion: Perspectives & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM3000"}
+{"code": "HPRM3001", "name": "Promoting Physical Activity & Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM3001"}
+{"code": "HPRM4001", "name": "Promoting Physical Activity & Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM4001"}
+{"code": "HPRM6001", "name": "Promoting Physical Activity & Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM6001"}
+{"code": "HPRM7004", "name": "Introduction to Substance Use & Misuse", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM7004"}
+{"code": "HPRM7005", "name": "Assessment & Interventions for Substance Misuse", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM7005"}
+{"code": "HPRM7006", "name": "Alcohol & Drug Harm Minimisation & Policy Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM7006"}
+{"code": "HPRM7010", "name": "Anthropology of Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM7010"}
+{"code": "HPRM7015", "name": "Counselling for Substance Misuse & Dependence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM7015"}
+{"code": "HPRM7016", "name": "Recent Developments in Substance Use & Misuse", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM7016"}
+{"code": "HPRM7100", "name": "Perspectives & Practice in Health Promotion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HPRM7100"}
+{"code": "HRSS3101", "name": "Health Sciences Research Discovery I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS3101"}
+{"code": "HRSS3102", "name": "Health Sciences Research Evaluation I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS3102"}
+{"code": "HRSS3200", "name": "Evidence-based Practice and Research in Health Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS3200"}
+{"code": "HRSS4100", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS4100"}
+{"code": "HRSS4109", "name": "People in Pain", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS4109"}
+{"code": "HRSS4200", "name": "Evidence Based Practice in Allied Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS4200"}
+{"code": "HRSS4210", "name": "Health Sciences Research Project: Service Development through Action Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS4210"}
+{"code": "HRSS4300", "name": "Health Sciences Research Advanced Project I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS4300"}
+{"code": "HRSS6009", "name": "Principles of Ergonomics for Injury Prevention", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS6009"}
+{"code": "HRSS7101", "name": "Health Sciences Research Discovery II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7101"}
+{"code": "HRSS7102", "name": "Health Sciences Research Evaluation II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7102"}
+{"code": "HRSS7200", "name": "Health Sciences Research Project: Service Development through Action Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7200"}
+{"code": "HRSS7300", "name": "Health Sciences Research Advanced Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7300"}
+{"code": "HRSS7800", "name": "Applied Research in Health Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7800"}
+{"code": "HRSS7801", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7801"}
+{"code": "HRSS7803", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7803"}
+{"code": "HRSS7805", "name": "Research Report for Occupational Therapy Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7805"}
+{"code": "HRSS7807", "name": "Evidence-based Practice & Research in Health Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7807"}
+{"code": "HRSS7809", "name": "Evidence-based Practice in Allied Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HRSS7809"}
+{"code": "HSER1011", "name": "Contemporary Approaches to Human Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER1011"}
+{"code": "HSER1022", "name": "Ethics, Rights and Law for the Human Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER1022"}
+{"code": "HSER1024", "name": "Foundations for Interpersonal Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER1024"}
+{"code": "HSER1033", "name": "Studying Human Services: Academic and Professional Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER1033"}
+{"code": "HSER2001", "name": "Practicum 1: Engagement and Reflection in Fieldwork", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER2001"}
+{"code": "HSER2022", "name": "Working with Teams and Groups", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER2022"}
+{"code": "HSER2066", "name": "Working with Communities in Human Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER2066"}
+{"code": "HSER3000", "name": "Practicum 2: Working in the Field", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER3000"}
+{"code": "HSER3046", "name": "Human Services Practice with Indigenous Australians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER3046"}
+{"code": "HSER6001", "name": "Honours Thesis Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER6001"}
+{"code": "HSER7046", "name": "Human Services Practice with Indigenous Australians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HSER7046"}
+{"code": "HUFA7502", "name": "Human Centred Design in the Resources Industry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUFA7502"}
+{"code": "HUMN1100", "name": "Interdisciplinary Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN1100"}
+{"code": "HUMN1201", "name": "Perspectives in Humanities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN1201"}
+{"code": "HUMN1500", "name": "Perspectives: Practices, Cultures and Creative Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN1500"}
+{"code": "HUMN2100", "name": "Great Works and the Humanities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN2100"}
+{"code": "HUMN2200", "name": "Cross-Cultural Humanities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN2200"}
+{"code": "HUMN2500", "name": "Collaborations: Relating and Working Together", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN2500"}
+{"code": "HUMN3001", "name": "Contemporary Studies Special Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN3001"}
+{"code": "HUMN3100", "name": "Humanities and the Big Questions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN3100"}
+{"code": "HUMN3200", "name": "Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN3200"}
+{"code": "HUMN3300", "name": "Masterclass- Advanced Research in the Humanities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN3300"}
+{"code": "HUMN3600", "name": "Creating the Future: Work, Worth and Well-Being", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN3600"}
+{"code": "HUMN3700", "name": "Creativity: Myths, Methods & Impact", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN3700"}
+{"code": "HUMN4000", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN4000"}
+{"code": "HUMN4100", "name": "Honours Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN4100"}
+{"code": "HUMN6002", "name": "Contemporary Studies Honours Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN6002"}
+{"code": "HUMN6005", "name": "Contemporary Studies Special Topic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=HUMN6005"}
+{"code": "IBUS2301", "name": "International Business Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS2301"}
+{"code": "IBUS2302", "name": "Globalisation & Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS2302"}
+{"code": "IBUS2303", "name": "Business Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS2303"}
+{"code": "IBUS2309", "name": "Understanding Cultures in International Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS2309"}
+{"code": "IBUS3303", "name": "Global Production and Logistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS3303"}
+{"code": "IBUS3304", "name": "Business in Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS3304"}
+{"code": "IBUS3305", "name": "Doing Business in Europe", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS3305"}
+{"code": "IBUS3306", "name": "Managing International Legal Complexity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS3306"}
+{"code": "IBUS3309", "name": "Managing Across Cultures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS3309"}
+{"code": "IBUS3310", "name": "International Business Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS3310"}
+{"code": "IBUS3960", "name": "Export Marketing & Practices", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS3960"}
+{"code": "IBUS4301", "name": "Advanced Studies in International Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS4301"}
+{"code": "IBUS7302", "name": "Operating International Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7302"}
+{"code": "IBUS7306", "name": "Globalisation & the World Economy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7306"}
+{"code": "IBUS7311", "name": "Managing the International Enterprise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7311"}
+{"code": "IBUS7312", "name": "Doing Business in Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7312"}
+{"code": "IBUS7313", "name": "International Study in Business 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7313"}
+{"code": "IBUS7314", "name": "Management Consulting in Asian Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7314"}
+{"code": "IBUS7315", "name": "Extended International Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7315"}
+{"code": "IBUS7316", "name": "International Supply Chains", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7316"}
+{"code": "IBUS7322", "name": "International Service Operations Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7322"}
+{"code": "IBUS7323", "name": "Global Management Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7323"}
+{"code": "IBUS7324", "name": "Global Management Thesis A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7324"}
+{"code": "IBUS7325", "name": "Global Management Thesis B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7325"}
+{"code": "IBUS7326", "name": "Global Management Thesis C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7326"}
+{"code": "IBUS7330", "name": "Global Management Outbound A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7330"}
+{"code": "IBUS7331", "name": "Global Management Outbound B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IBUS7331"}
+{"code": "IENV2200", "name": "Foundations of Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV2200"}
+{"code": "IENV2201", "name": "Agile Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV2201"}
+{"code": "IENV3101", "name": "Information Visualisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV3101"}
+{"code": "IENV6300", "name": "Advanced Interactive Media Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV6300"}
+{"code": "IENV6801", "name": "Information Environments Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV6801"}
+{"code": "IENV6802", "name": "Information Environments Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV6802"}
+{"code": "IENV7921", "name": "Masters Studio 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV7921"}
+{"code": "IENV7922", "name": "Agile Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV7922"}
+{"code": "IENV7931", "name": "Masters Studio 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV7931"}
+{"code": "IENV7932", "name": "Advanced Information Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV7932"}
+{"code": "IENV7941", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV7941"}
+{"code": "IENV7943", "name": "Information Visualisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV7943"}
+{"code": "IENV7966", "name": "Foundations of Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IENV7966"}
+{"code": "IMED7001", "name": "Core Knowledge & Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7001"}
+{"code": "IMED7002", "name": "Clinical and Dermatoscopic Diagnosis in Skin Cancer Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7002"}
+{"code": "IMED7003", "name": "Assessment & Diagnosis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7003"}
+{"code": "IMED7004", "name": "Therapeutics 1: Medical Treatments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7004"}
+{"code": "IMED7005", "name": "Therapeutics 2: Surgical Repair", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7005"}
+{"code": "IMED7008", "name": "Critical Thinking & Research Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7008"}
+{"code": "IMED7009", "name": "Critical Thinking & Research Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7009"}
+{"code": "IMED7010", "name": "Foundation Therapeutics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7010"}
+{"code": "IMED7011", "name": "Advanced Therapeutics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7011"}
+{"code": "IMED7012", "name": "Advanced Clinical Cases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7012"}
+{"code": "IMED7013", "name": "Advanced Clinical Cases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7013"}
+{"code": "IMED7014", "name": "Clinical Audit and Research Focus", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7014"}
+{"code": "IMED7015", "name": "Advanced Clinical Cases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7015"}
+{"code": "IMED7016", "name": "Advanced Diagnostics & Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7016"}
+{"code": "IMED7017", "name": "Skin Cancer Research Project (Minor)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7017"}
+{"code": "IMED7018", "name": "Skin Cancer Research Project (Major)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=IMED7018"}
+{"code": "INDH1005", "name": "Aboriginal & Torres Strait Islander Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH1005"}
+{"code": "INDH2100", "name": "Aboriginal & Torres Strait Islander Health Services & Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH2100"}
+{"code": "INDH2102", "name": "Health Promotion for Indigenous Communities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH2102"}
+{"code": "INDH2107", "name": "Working with Aboriginal and Torres Strait Islander People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH2107"}
+{"code": "INDH2109", "name": "Alcohol, Substance Use & Aboriginal & Torres Strait Islander People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH2109"}
+{"code": "INDH2110", "name": "Social Sciences & Aboriginal & Torres Strait Islander Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH2110"}
+{"code": "INDH3104", "name": "Nutrition & Health in Aboriginal & Torres Strait Islander Communities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH3104"}
+{"code": "INDH3105", "name": "Sexual & Reproductive Health in Aboriginal & Torres Strait Islander Communities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH3105"}
+{"code": "INDH7001", "name": "Substance Use Among Aboriginal and Torres Strait Islander Peoples", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH7001"}
+{"code": "INDH7002", "name": "Aboriginal & Torres Strait Islander Public Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH7002"}
+{"code": "INDH7003", "name": "Indigenous Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH7003"}
+{"code": "INDH7004", "name": "Indigenous Health Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH7004"}
+{"code": "INDH7006", "name": "Fieldwork in an Indigenous setting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH7006"}
+{"code": "INDH7107", "name": "Working with Aboriginal and Torres Strait Islander People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDH7107"}
+{"code": "INDN1000", "name": "Introductory Indonesian A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN1000"}
+{"code": "INDN1001", "name": "Introductory Indonesian B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN1001"}
+{"code": "INDN2000", "name": "Intermediate Indonesian A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN2000"}
+{"code": "INDN2001", "name": "Intermediate Indonesian B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN2001"}
+{"code": "INDN3000", "name": "Advanced Indonesian", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN3000"}
+{"code": "INDN3002", "name": "Indonesian Contemporary Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN3002"}
+{"code": "INDN3006", "name": "Indonesian Studies Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN3006"}
+{"code": "INDN6120", "name": "Thesis - Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN6120"}
+{"code": "INDN6340", "name": "Advanced Indonesian Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN6340"}
+{"code": "INDN6350", "name": "Special Topics Indonesian Language Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN6350"}
+{"code": "INDN6364", "name": "Special Topics in Indonesian Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN6364"}
+{"code": "INDN6500", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN6500"}
+{"code": "INDN6501", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INDN6501"}
+{"code": "INFS1200", "name": "Introduction to Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS1200"}
+{"code": "INFS1300", "name": "The Web from the Inside Out - from Geeks to Google & Facebook", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS1300"}
+{"code": "INFS2200", "name": "Relational Database Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS2200"}
+{"code": "INFS2244", "name": "Electronic Commerce Systems Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS2244"}
+{"code": "INFS3101", "name": "Ontology and the Semantic Web", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS3101"}
+{"code": "INFS3200", "name": "Advanced Database Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS3200"}
+{"code": "INFS3202", "name": "Web Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS3202"}
+{"code": "INFS3204", "name": "Service-Oriented Architectures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS3204"}
+{"code": "INFS3208", "name": "Cloud Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS3208"}
+{"code": "INFS4203", "name": "Data Mining", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS4203"}
+{"code": "INFS4205", "name": "Advanced Techniques for High Dimensional Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS4205"}
+{"code": "INFS4206", "name": "Advanced Topics in Database", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS4206"}
+{"code": "INFS7130", "name": "The Web from the Inside Out - from Geeks to Google & Facebook", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7130"}
+{"code": "INFS7202", "name": "Web Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7202"}
+{"code": "INFS7203", "name": "Data Mining", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7203"}
+{"code": "INFS7204", "name": "Service-Oriented Architectures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7204"}
+{"code": "INFS7205", "name": "Advanced Techniques for High Dimensional Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7205"}
+{"code": "INFS7206", "name": "Advanced Topics in Database", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7206"}
+{"code": "INFS7208", "name": "Cloud Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7208"}
+{"code": "INFS7211", "name": "Developing Electronic Commerce Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7211"}
+{"code": "INFS7410", "name": "Information Retrieval and Web Search", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7410"}
+{"code": "INFS7450", "name": "Social Media Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7450"}
+{"code": "INFS7900", "name": "Introduction to Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7900"}
+{"code": "INFS7901", "name": "Database Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7901"}
+{"code": "INFS7903", "name": "Relational Database Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7903"}
+{"code": "INFS7907", "name": "Advanced Database Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=INFS7907"}
+{"code": "JAPN1011", "name": "Foundational Japanese 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN1011"}
+{"code": "JAPN1012", "name": "Foundational Japanese 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN1012"}
+{"code": "JAPN1013", "name": "Japanese 1A standard", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN1013"}
+{"code": "JAPN1023", "name": "Japanese 1B standard", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN1023"}
+{"code": "JAPN2021", "name": "Foundational Japanese 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN2021"}
+{"code": "JAPN2022", "name": "Foundational Japanese 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN2022"}
+{"code": "JAPN2101", "name": "Continuing Japanese 1A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN2101"}
+{"code": "JAPN3002", "name": "Continuing Japanese 1B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3002"}
+{"code": "JAPN3003", "name": "Continuing Japanese 2A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3003"}
+{"code": "JAPN3004", "name": "Continuing Japanese 2B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3004"}
+{"code": "JAPN3101", "name": "Continuing Japanese 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3101"}
+{"code": "JAPN3102", "name": "Continuing Japanese 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3102"}
+{"code": "JAPN3110", "name": "Voices from Japan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3110"}
+{"code": "JAPN3130", "name": "Anime Japanese", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3130"}
+{"code": "JAPN3140", "name": "Japanese Rapid Reading and Creative Writing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3140"}
+{"code": "JAPN3205", "name": "Teaching Japanese Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3205"}
+{"code": "JAPN3209", "name": "Introduction to Japanese Linguistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3209"}
+{"code": "JAPN3210", "name": "Japanese Language in Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3210"}
+{"code": "JAPN3299", "name": "Japanese/English Interpreting and Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3299"}
+{"code": "JAPN3500", "name": "Language and Society in Japan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN3500"}
+{"code": "JAPN6114", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN6114"}
+{"code": "JAPN6115", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN6115"}
+{"code": "JAPN6120", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN6120"}
+{"code": "JAPN6340", "name": "Advanced Japanese Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN6340"}
+{"code": "JAPN6350", "name": "Special Topics in Japanese Language Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN6350"}
+{"code": "JAPN6364", "name": "Special Topics in Japanese Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN6364"}
+{"code": "JAPN7110", "name": "Public Speaking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7110"}
+{"code": "JAPN7120", "name": "Advanced Textual Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7120"}
+{"code": "JAPN7130", "name": "Applied Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7130"}
+{"code": "JAPN7140", "name": "Consecutive Interpreting into English", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7140"}
+{"code": "JAPN7150", "name": "Consecutive Interpreting into Japanese", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7150"}
+{"code": "JAPN7160", "name": "Advanced Translation I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7160"}
+{"code": "JAPN7170", "name": "Theory of Translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7170"}
+{"code": "JAPN7200", "name": "Live Interpreting Forum I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7200"}
+{"code": "JAPN7210", "name": "Technical Translation I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7210"}
+{"code": "JAPN7220", "name": "Conference Interpreting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7220"}
+{"code": "JAPN7230", "name": "Live Interpreting Forum II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7230"}
+{"code": "JAPN7260", "name": "Advanced/Technical Translation II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JAPN7260"}
+{"code": "JOUR1112", "name": "Journalistic Narratives", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR1112"}
+{"code": "JOUR1710", "name": "Journalistic Investigation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR1710"}
+{"code": "JOUR2000", "name": "Broadcast Journalism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR2000"}
+{"code": "JOUR2100", "name": "Social Justice Storytelling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR2100"}
+{"code": "JOUR2221", "name": "International Journalism & Mass Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR2221"}
+{"code": "JOUR3000", "name": "Data Journalism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR3000"}
+{"code": "JOUR3122", "name": "Field Study - Journalism & Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR3122"}
+{"code": "JOUR3222", "name": "Journalism Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR3222"}
+{"code": "JOUR3401", "name": "Journalism Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR3401"}
+{"code": "JOUR3801", "name": "Journalism Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR3801"}
+{"code": "JOUR6002", "name": "Research Design in Journalism and Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR6002"}
+{"code": "JOUR6500", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR6500"}
+{"code": "JOUR6710", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR6710"}
+{"code": "JOUR7802", "name": "Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR7802"}
+{"code": "JOUR7888", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=JOUR7888"}
+{"code": "KORN1010", "name": "Spoken Korean IA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN1010"}
+{"code": "KORN1011", "name": "Written Korean IA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN1011"}
+{"code": "KORN2003", "name": "Written Korean II A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN2003"}
+{"code": "KORN2005", "name": "Foundation in Korean Language and Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN2005"}
+{"code": "KORN2020", "name": "Spoken Korean IB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN2020"}
+{"code": "KORN2022", "name": "Written Korean IB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN2022"}
+{"code": "KORN2101", "name": "Spoken Korean IIA", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN2101"}
+{"code": "KORN3010", "name": "Spoken Korean IIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3010"}
+{"code": "KORN3011", "name": "Written Korean IIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3011"}
+{"code": "KORN3101", "name": "Advanced Korean I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3101"}
+{"code": "KORN3112", "name": "Korean-English Translation and Interpreting A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3112"}
+{"code": "KORN3201", "name": "Advanced Korean II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3201"}
+{"code": "KORN3212", "name": "Korean-English Translation and Interpreting B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3212"}
+{"code": "KORN3220", "name": "Korean for Korean Speakers and Advanced Non-Korean Speakers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3220"}
+{"code": "KORN3300", "name": "Korean Study Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN3300"}
+{"code": "KORN6000", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN6000"}
+{"code": "KORN6100", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN6100"}
+{"code": "KORN6101", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN6101"}
+{"code": "KORN6340", "name": "Advanced Korean Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN6340"}
+{"code": "KORN6350", "name": "Special Topics in Korean Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN6350"}
+{"code": "KORN6364", "name": "Special Topics in Korean Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=KORN6364"}
+{"code": "LAND1120D", "name": "Soil & Water Resources", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND1120D"}
+{"code": "LAND1125D", "name": "Technologies of Land Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND1125D"}
+{"code": "LAND2003", "name": "The Soil Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND2003"}
+{"code": "LAND3005", "name": "Soil Plant Relationships", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND3005"}
+{"code": "LAND3006", "name": "Soils, Landscapes & Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND3006"}
+{"code": "LAND3007", "name": "Land Use & Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND3007"}
+{"code": "LAND7000", "name": "Water & Land Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND7000"}
+{"code": "LAND7009", "name": "Soil and Growth Media Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAND7009"}
+{"code": "LATN1110", "name": "Introductory Latin", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN1110"}
+{"code": "LATN2120", "name": "Intermediate Latin", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN2120"}
+{"code": "LATN2230", "name": "Latin Language & Literature 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN2230"}
+{"code": "LATN2240", "name": "Latin Language & Literature 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN2240"}
+{"code": "LATN3001", "name": "Advanced Latin 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN3001"}
+{"code": "LATN3002", "name": "Advanced Latin 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN3002"}
+{"code": "LATN6140", "name": "Latin Set Texts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN6140"}
+{"code": "LATN6270", "name": "Latin Guided Texts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN6270"}
+{"code": "LATN6311", "name": "Latin Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN6311"}
+{"code": "LATN6312", "name": "Latin Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LATN6312"}
+{"code": "LAWS1100", "name": "Business Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1100"}
+{"code": "LAWS1110", "name": "Law in the Criminal Justice System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1110"}
+{"code": "LAWS1111", "name": "Legal Method", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1111"}
+{"code": "LAWS1112", "name": "Law, Justice and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1112"}
+{"code": "LAWS1113", "name": "Law of Torts A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1113"}
+{"code": "LAWS1114", "name": "Law of Torts B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1114"}
+{"code": "LAWS1115", "name": "Principles of Public Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1115"}
+{"code": "LAWS1116", "name": "Constitutional Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1116"}
+{"code": "LAWS1700", "name": "Foundations of Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1700"}
+{"code": "LAWS1701", "name": "Law of Contract I: Principles of Contractual Agreement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1701"}
+{"code": "LAWS1702", "name": "Law of Contract II: Principles of Contractual Liability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1702"}
+{"code": "LAWS1703", "name": "Principles of Public Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1703"}
+{"code": "LAWS1901D", "name": "Business Law A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1901D"}
+{"code": "LAWS1902D", "name": "Business Law B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS1902D"}
+{"code": "LAWS2000", "name": "Real Estate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2000"}
+{"code": "LAWS2111", "name": "Law of Contract A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2111"}
+{"code": "LAWS2112", "name": "Law of Contract B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2112"}
+{"code": "LAWS2113", "name": "Criminal Law and Procedure A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2113"}
+{"code": "LAWS2114", "name": "Criminal Law and Procedure B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2114"}
+{"code": "LAWS2115", "name": "Administrative Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2115"}
+{"code": "LAWS2220", "name": "Criminal Law in Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2220"}
+{"code": "LAWS2700", "name": "Criminal Law: Principles, Offences and Defences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2700"}
+{"code": "LAWS2701", "name": "Criminal Law: Process and Procedure", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2701"}
+{"code": "LAWS2702", "name": "Law of Torts I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2702"}
+{"code": "LAWS2703", "name": "Law of Torts II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2703"}
+{"code": "LAWS2704", "name": "Trusts and Equity I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2704"}
+{"code": "LAWS2705", "name": "Trusts and Equity II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2705"}
+{"code": "LAWS2706", "name": "Foundations of Property Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2706"}
+{"code": "LAWS2707", "name": "Interests in Property", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2707"}
+{"code": "LAWS2800", "name": "Occupational Health & Safety Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS2800"}
+{"code": "LAWS3100", "name": "Corporations Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3100"}
+{"code": "LAWS3101", "name": "Income Tax Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3101"}
+{"code": "LAWS3102", "name": "Business and Taxation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3102"}
+{"code": "LAWS3111", "name": "Law of Property A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3111"}
+{"code": "LAWS3112", "name": "Law of Property B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3112"}
+{"code": "LAWS3113", "name": "Law of Trusts A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3113"}
+{"code": "LAWS3114", "name": "Law of Trusts B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3114"}
+{"code": "LAWS3115", "name": "Law of Remedies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3115"}
+{"code": "LAWS3330", "name": "Transnational Crime and International Criminal Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3330"}
+{"code": "LAWS3700", "name": "Constitutional Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3700"}
+{"code": "LAWS3701", "name": "Administrative Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3701"}
+{"code": "LAWS3702", "name": "Corporate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3702"}
+{"code": "LAWS3703", "name": "Ethics and the Legal Profession", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3703"}
+{"code": "LAWS3704", "name": "Jurisprudence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3704"}
+{"code": "LAWS3705", "name": "Public International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS3705"}
+{"code": "LAWS4111", "name": "Seminars in Jurisprudence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS4111"}
+{"code": "LAWS4112", "name": "Corporate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS4112"}
+{"code": "LAWS4114", "name": "Advanced Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS4114"}
+{"code": "LAWS4700", "name": "Law of Evidence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS4700"}
+{"code": "LAWS4701", "name": "Civil Dispute Resolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS4701"}
+{"code": "LAWS5019", "name": "Law of Insolvency", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5019"}
+{"code": "LAWS5020", "name": "Administrative Law B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5020"}
+{"code": "LAWS5121", "name": "Family Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5121"}
+{"code": "LAWS5122", "name": "Labour Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5122"}
+{"code": "LAWS5124", "name": "Human Rights Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5124"}
+{"code": "LAWS5125", "name": "Unjust Enrichment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5125"}
+{"code": "LAWS5126", "name": "Medical Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5126"}
+{"code": "LAWS5127", "name": "Media Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5127"}
+{"code": "LAWS5130", "name": "Succession Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5130"}
+{"code": "LAWS5131", "name": "Planning Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5131"}
+{"code": "LAWS5134", "name": "Environmental Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5134"}
+{"code": "LAWS5135", "name": "Comparative Native Title Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5135"}
+{"code": "LAWS5136", "name": "Commercial Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5136"}
+{"code": "LAWS5138", "name": "Competition Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5138"}
+{"code": "LAWS5139", "name": "Insurance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5139"}
+{"code": "LAWS5142", "name": "Consumer Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5142"}
+{"code": "LAWS5144", "name": "Introduction to Taxation Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5144"}
+{"code": "LAWS5151", "name": "Law and Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5151"}
+{"code": "LAWS5152", "name": "Banking and Finance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5152"}
+{"code": "LAWS5153", "name": "Private International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5153"}
+{"code": "LAWS5154", "name": "Public International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5154"}
+{"code": "LAWS5156", "name": "International Humanitarian & Criminal Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5156"}
+{"code": "LAWS5160", "name": "Maritime Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5160"}
+{"code": "LAWS5161", "name": "International Maritime Arbitration Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5161"}
+{"code": "LAWS5162", "name": "European Union Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5162"}
+{"code": "LAWS5163", "name": "International Trade Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5163"}
+{"code": "LAWS5165", "name": "Jessup International Law Moot", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5165"}
+{"code": "LAWS5167", "name": "Asian Legal Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5167"}
+{"code": "LAWS5168", "name": "Comparative Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5168"}
+{"code": "LAWS5169", "name": "Legal History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5169"}
+{"code": "LAWS5171", "name": "Advanced Crime and Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5171"}
+{"code": "LAWS5172", "name": "Advanced Jurisprudence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5172"}
+{"code": "LAWS5179", "name": "Advanced Legal Drafting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5179"}
+{"code": "LAWS5180", "name": "Clinical Legal Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5180"}
+{"code": "LAWS5181", "name": "Law Journals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5181"}
+{"code": "LAWS5182", "name": "Special Topic A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5182"}
+{"code": "LAWS5183", "name": "Research Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5183"}
+{"code": "LAWS5189", "name": "Islamic Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5189"}
+{"code": "LAWS5202", "name": "Immigration and Refugee Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5202"}
+{"code": "LAWS5206", "name": "Copyright Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5206"}
+{"code": "LAWS5207", "name": "Patent and Trademark Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5207"}
+{"code": "LAWS5208", "name": "Law Moot A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5208"}
+{"code": "LAWS5209", "name": "Law Moot B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5209"}
+{"code": "LAWS5212", "name": "Alternative Dispute Resolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5212"}
+{"code": "LAWS5213", "name": "Research Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5213"}
+{"code": "LAWS5214", "name": "Research Project C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5214"}
+{"code": "LAWS5215", "name": "Civil Procedure", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5215"}
+{"code": "LAWS5216", "name": "Law of Evidence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5216"}
+{"code": "LAWS5217", "name": "The Legal Profession", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5217"}
+{"code": "LAWS5219", "name": "International Organisations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5219"}
+{"code": "LAWS5220", "name": "Personal and Corporate Insolvency", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5220"}
+{"code": "LAWS5221", "name": "Advanced Private Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5221"}
+{"code": "LAWS5222", "name": "Advanced Public Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5222"}
+{"code": "LAWS5223", "name": "Advanced Tax", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5223"}
+{"code": "LAWS5224", "name": "Special Topic B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5224"}
+{"code": "LAWS5225", "name": "Special Topic C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5225"}
+{"code": "LAWS5226", "name": "Special Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5226"}
+{"code": "LAWS5227", "name": "Law of Political Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5227"}
+{"code": "LAWS5228", "name": "Privacy Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5228"}
+{"code": "LAWS5229", "name": "Special Topic D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5229"}
+{"code": "LAWS5230", "name": "Advocacy: Principles, Procedures and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5230"}
+{"code": "LAWS5231", "name": "Transnational Organised Crime Working Group", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5231"}
+{"code": "LAWS5233", "name": "Transnational Perspectives in Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS5233"}
+{"code": "LAWS6100", "name": "Corporations, Law and Governance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS6100"}
+{"code": "LAWS6900", "name": "Introductory Maritime Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS6900"}
+{"code": "LAWS7012", "name": "Business Taxation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7012"}
+{"code": "LAWS7013", "name": "Advanced Corporate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7013"}
+{"code": "LAWS7017", "name": "Real Estate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7017"}
+{"code": "LAWS7020", "name": "Introduction to Criminal Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7020"}
+{"code": "LAWS7021", "name": "Public Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7021"}
+{"code": "LAWS7022", "name": "Financial Planning Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7022"}
+{"code": "LAWS7023", "name": "Business and Corporate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7023"}
+{"code": "LAWS7024", "name": "Occupational Health & Safety Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7024"}
+{"code": "LAWS7025", "name": "Private Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7025"}
+{"code": "LAWS7026", "name": "Corporate Governance Law and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7026"}
+{"code": "LAWS7027", "name": "International Trade Law and Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7027"}
+{"code": "LAWS7028", "name": "International Commercial Dispute Resolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7028"}
+{"code": "LAWS7029", "name": "Protecting Intellectual Property and Intangible Assets", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7029"}
+{"code": "LAWS7100", "name": "Law of Torts A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7100"}
+{"code": "LAWS7101", "name": "Law of Contract A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7101"}
+{"code": "LAWS7102", "name": "Law of Torts B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7102"}
+{"code": "LAWS7103", "name": "Law of Contract B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7103"}
+{"code": "LAWS7104", "name": "Criminal Law and Procedure A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7104"}
+{"code": "LAWS7105", "name": "Constitutional Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7105"}
+{"code": "LAWS7108", "name": "Jurisprudence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7108"}
+{"code": "LAWS7109", "name": "Law of Property A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7109"}
+{"code": "LAWS7111", "name": "Law of Property B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7111"}
+{"code": "LAWS7113", "name": "Civil Procedure", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7113"}
+{"code": "LAWS7114", "name": "Law of Evidence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7114"}
+{"code": "LAWS7118", "name": "Administrative Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7118"}
+{"code": "LAWS7119", "name": "Law of Insolvency", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7119"}
+{"code": "LAWS7120", "name": "Administrative Law B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7120"}
+{"code": "LAWS7121", "name": "Family Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7121"}
+{"code": "LAWS7122", "name": "Labour Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7122"}
+{"code": "LAWS7124", "name": "Human Rights Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7124"}
+{"code": "LAWS7125", "name": "Unjust Enrichment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7125"}
+{"code": "LAWS7126", "name": "Medical Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7126"}
+{"code": "LAWS7127", "name": "Media Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7127"}
+{"code": "LAWS7130", "name": "Succession Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7130"}
+{"code": "LAWS7131", "name": "Planning Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7131"}
+{"code": "LAWS7133", "name": "Natural Resources Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7133"}
+{"code": "LAWS7134", "name": "Environmental Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7134"}
+{"code": "LAWS7135", "name": "Comparative Native Title Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7135"}
+{"code": "LAWS7136", "name": "Commercial Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7136"}
+{"code": "LAWS7138", "name": "Competition Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7138"}
+{"code": "LAWS7139", "name": "Principles of General Insurance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7139"}
+{"code": "LAWS7142", "name": "Consumer Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7142"}
+{"code": "LAWS7144", "name": "Introduction to Taxation Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7144"}
+{"code": "LAWS7151", "name": "Law and Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7151"}
+{"code": "LAWS7152", "name": "Banking and Finance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7152"}
+{"code": "LAWS7153", "name": "Private International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7153"}
+{"code": "LAWS7154", "name": "Public International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7154"}
+{"code": "LAWS7156", "name": "International Humanitarian & Criminal Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7156"}
+{"code": "LAWS7160", "name": "Maritime Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7160"}
+{"code": "LAWS7161", "name": "International Maritime Arbitration Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7161"}
+{"code": "LAWS7162", "name": "European Union Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7162"}
+{"code": "LAWS7163", "name": "International Trade Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7163"}
+{"code": "LAWS7165", "name": "Jessup International Law Moot", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7165"}
+{"code": "LAWS7167", "name": "Asian Legal Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7167"}
+{"code": "LAWS7168", "name": "Comparative Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7168"}
+{"code": "LAWS7169", "name": "Legal History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7169"}
+{"code": "LAWS7171", "name": "Advanced Crime and Criminology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7171"}
+{"code": "LAWS7172", "name": "Advanced Jurisprudence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7172"}
+{"code": "LAWS7180", "name": "Clinical Legal Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7180"}
+{"code": "LAWS7182", "name": "Special Topic A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7182"}
+{"code": "LAWS7183", "name": "Research Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7183"}
+{"code": "LAWS7189", "name": "Islamic Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7189"}
+{"code": "LAWS7202", "name": "Immigration and Refugee Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7202"}
+{"code": "LAWS7206", "name": "Copyright Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7206"}
+{"code": "LAWS7207", "name": "Patent and Trademark Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7207"}
+{"code": "LAWS7208", "name": "Law Moot", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7208"}
+{"code": "LAWS7209", "name": "Law Moot B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7209"}
+{"code": "LAWS7212", "name": "Alternative Dispute Resolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7212"}
+{"code": "LAWS7213", "name": "The Legal Profession", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7213"}
+{"code": "LAWS7215", "name": "JD Dissertation A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7215"}
+{"code": "LAWS7216", "name": "JD Dissertation B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7216"}
+{"code": "LAWS7217", "name": "Structure of Private Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7217"}
+{"code": "LAWS7219", "name": "International Organisations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7219"}
+{"code": "LAWS7220", "name": "Personal and Corporate Insolvency", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7220"}
+{"code": "LAWS7221", "name": "Advanced Private Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7221"}
+{"code": "LAWS7222", "name": "Advanced Public Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7222"}
+{"code": "LAWS7223", "name": "Advanced Tax", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7223"}
+{"code": "LAWS7224", "name": "Special Topic B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7224"}
+{"code": "LAWS7225", "name": "Special Topic C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7225"}
+{"code": "LAWS7226", "name": "Special Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7226"}
+{"code": "LAWS7227", "name": "Law of Political Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7227"}
+{"code": "LAWS7228", "name": "Privacy Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7228"}
+{"code": "LAWS7229", "name": "Special Topic D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7229"}
+{"code": "LAWS7230", "name": "Principles of Public Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7230"}
+{"code": "LAWS7231", "name": "Criminal Law and Procedure B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7231"}
+{"code": "LAWS7232", "name": "Law of Trusts A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7232"}
+{"code": "LAWS7233", "name": "Law of Trusts B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7233"}
+{"code": "LAWS7234", "name": "Corporate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7234"}
+{"code": "LAWS7302", "name": "Business and Commercial Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7302"}
+{"code": "LAWS7303", "name": "Principles of Sports Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7303"}
+{"code": "LAWS7700", "name": "Water Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7700"}
+{"code": "LAWS7701", "name": "Major Dissertation A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7701"}
+{"code": "LAWS7702", "name": "Expert Evidence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7702"}
+{"code": "LAWS7703", "name": "Estate Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7703"}
+{"code": "LAWS7704", "name": "Estate Litigation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7704"}
+{"code": "LAWS7705", "name": "Superannuation Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7705"}
+{"code": "LAWS7706", "name": "Major Dissertation B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7706"}
+{"code": "LAWS7707", "name": "Major Dissertation B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7707"}
+{"code": "LAWS7708", "name": "Intellectual Property Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7708"}
+{"code": "LAWS7709", "name": "Modern Statutory Interpretation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7709"}
+{"code": "LAWS7710", "name": "Principles of International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7710"}
+{"code": "LAWS7711", "name": "Law of Armed Conflict", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7711"}
+{"code": "LAWS7712", "name": "International Minerals & Energy Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7712"}
+{"code": "LAWS7713", "name": "Law, Terrorism and Human Rights", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7713"}
+{"code": "LAWS7714", "name": "Refugees, Asylum Seekers and the Law: Rights and Realities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7714"}
+{"code": "LAWS7715", "name": "States in Transition: Issues in Constitutional and International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7715"}
+{"code": "LAWS7721", "name": "Current Issues in Private Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7721"}
+{"code": "LAWS7722", "name": "Current Issues in Public Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7722"}
+{"code": "LAWS7723", "name": "Current Issues in International Law (Private)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7723"}
+{"code": "LAWS7724", "name": "Current Issues in International Law (Public)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7724"}
+{"code": "LAWS7725", "name": "Current Issues in Legal Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7725"}
+{"code": "LAWS7800", "name": "Corporate Insolvency", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7800"}
+{"code": "LAWS7801", "name": "Constitutional Government & Public Power", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7801"}
+{"code": "LAWS7805", "name": "Natural Resources Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7805"}
+{"code": "LAWS7807", "name": "Current Issues in Evidence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7807"}
+{"code": "LAWS7808", "name": "Local Government Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7808"}
+{"code": "LAWS7814", "name": "International & Comparative Copyright Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7814"}
+{"code": "LAWS7818", "name": "Information Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7818"}
+{"code": "LAWS7821", "name": "Taxation of Entities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7821"}
+{"code": "LAWS7823", "name": "Taxation of International Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7823"}
+{"code": "LAWS7825", "name": "Supervised Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7825"}
+{"code": "LAWS7826", "name": "Dissertation B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7826"}
+{"code": "LAWS7828", "name": "Cultural Heritage Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7828"}
+{"code": "LAWS7841", "name": "Theories in Dispute Resolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7841"}
+{"code": "LAWS7844", "name": "International & Comparative Patent Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7844"}
+{"code": "LAWS7846", "name": "International & Comparative Trademark Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7846"}
+{"code": "LAWS7849", "name": "Special Topic A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7849"}
+{"code": "LAWS7850", "name": "Special Topic B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7850"}
+{"code": "LAWS7851", "name": "Mediation and Conflict Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7851"}
+{"code": "LAWS7853", "name": "Law of the World Trade Organization", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7853"}
+{"code": "LAWS7855", "name": "Law, Technology and Global Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7855"}
+{"code": "LAWS7860", "name": "Insurance Law and Risk Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7860"}
+{"code": "LAWS7863", "name": "Admiralty Jurisdiction & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7863"}
+{"code": "LAWS7865", "name": "Maritime Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7865"}
+{"code": "LAWS7866", "name": "International Law of the Sea", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7866"}
+{"code": "LAWS7867", "name": "Marine Environment Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7867"}
+{"code": "LAWS7868", "name": "International Commercial Arbitration Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7868"}
+{"code": "LAWS7876", "name": "Carriage of Goods by Sea", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7876"}
+{"code": "LAWS7881", "name": "Competition Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7881"}
+{"code": "LAWS7884", "name": "Civil Litigation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7884"}
+{"code": "LAWS7893", "name": "Corporate Governance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7893"}
+{"code": "LAWS7899", "name": "International Air Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7899"}
+{"code": "LAWS7902", "name": "Government Contracting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7902"}
+{"code": "LAWS7904", "name": "Dissertation B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7904"}
+{"code": "LAWS7908", "name": "Native Title Law and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7908"}
+{"code": "LAWS7909", "name": "Intellectual Property - Issues in Science & Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7909"}
+{"code": "LAWS7917", "name": "Pacific Comparative Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7917"}
+{"code": "LAWS7926", "name": "Comparative Law Seminar A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7926"}
+{"code": "LAWS7927", "name": "Comparative Law Seminar B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7927"}
+{"code": "LAWS7930", "name": "Special Topic C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7930"}
+{"code": "LAWS7931", "name": "Special Topic D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7931"}
+{"code": "LAWS7932", "name": "Special Topic E", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7932"}
+{"code": "LAWS7933", "name": "Special Topic F", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7933"}
+{"code": "LAWS7935", "name": "Offshore Oil and Gas Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7935"}
+{"code": "LAWS7936", "name": "Fundamentals of the Common Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7936"}
+{"code": "LAWS7939", "name": "Comparative Constitutional Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7939"}
+{"code": "LAWS7944", "name": "Dissertation A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7944"}
+{"code": "LAWS7946", "name": "IP Management & Commercialisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7946"}
+{"code": "LAWS7947", "name": "Selected Topics in Intellectual Property Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7947"}
+{"code": "LAWS7948", "name": "Contract Interpretation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7948"}
+{"code": "LAWS7951", "name": "Marine Insurance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7951"}
+{"code": "LAWS7953", "name": "International Dispute Settlement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7953"}
+{"code": "LAWS7955", "name": "Fraud and Money Laundering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7955"}
+{"code": "LAWS7970", "name": "Comparative Criminal Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7970"}
+{"code": "LAWS7974", "name": "International Trade Finance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7974"}
+{"code": "LAWS7975", "name": "Corporate Social Responsibility", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7975"}
+{"code": "LAWS7976", "name": "Civil Remedies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7976"}
+{"code": "LAWS7977", "name": "Advanced Administrative Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7977"}
+{"code": "LAWS7978", "name": "Climate Change Law and Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7978"}
+{"code": "LAWS7979", "name": "Commercial Conflict of Laws", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7979"}
+{"code": "LAWS7980", "name": "Commercial Property", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7980"}
+{"code": "LAWS7981", "name": "Complex Litigation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7981"}
+{"code": "LAWS7982", "name": "Consumer Protection Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7982"}
+{"code": "LAWS7983", "name": "Doing Business in Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7983"}
+{"code": "LAWS7984", "name": "Elder Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7984"}
+{"code": "LAWS7985", "name": "Ethics of Lawyering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7985"}
+{"code": "LAWS7986", "name": "Family Property Law Mediation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7986"}
+{"code": "LAWS7987", "name": "International Law & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7987"}
+{"code": "LAWS7988", "name": "International Sale of Goods Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7988"}
+{"code": "LAWS7989", "name": "Environmental Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7989"}
+{"code": "LAWS7990", "name": "Native Title Mediation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7990"}
+{"code": "LAWS7991", "name": "Personal Property Securities Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7991"}
+{"code": "LAWS7992", "name": "Principles and Practice of Regulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7992"}
+{"code": "LAWS7993", "name": "Corporate Finance Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7993"}
+{"code": "LAWS7994", "name": "Shareholders Rights and Remedies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7994"}
+{"code": "LAWS7995", "name": "Special Taxpayers and Incentives", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7995"}
+{"code": "LAWS7996", "name": "Takeovers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7996"}
+{"code": "LAWS7997", "name": "Taxation of Small and Medium Enterprises", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7997"}
+{"code": "LAWS7998", "name": "Tribunals - Procedure and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7998"}
+{"code": "LAWS7999", "name": "US Corporate Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LAWS7999"}
+{"code": "LEIS2000", "name": "Recreation Participation & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS2000"}
+{"code": "LEIS2001", "name": "Leisure in Natural Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS2001"}
+{"code": "LEIS2004", "name": "Leisure in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS2004"}
+{"code": "LEIS2005", "name": "Adventure Recreation and Tourism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS2005"}
+{"code": "LEIS3000", "name": "Leisure Industry Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS3000"}
+{"code": "LEIS3001", "name": "Issues in Leisure Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS3001"}
+{"code": "LEIS7000", "name": "Commercial Recreation & Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS7000"}
+{"code": "LEIS7001", "name": "Sport and Recreation Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LEIS7001"}
+{"code": "LING1000", "name": "The Secret Life of Language: Words and Sentences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING1000"}
+{"code": "LING1005", "name": "The Sound Patterns of Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING1005"}
+{"code": "LING2000", "name": "Semantics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING2000"}
+{"code": "LING2010", "name": "Phonology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING2010"}
+{"code": "LING2035", "name": "Language & Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING2035"}
+{"code": "LING2040", "name": "Morphology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING2040"}
+{"code": "LING2045", "name": "Generative Syntax", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING2045"}
+{"code": "LING2055", "name": "Pragmatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING2055"}
+{"code": "LING2110", "name": "English Through Time and Space", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING2110"}
+{"code": "LING3010", "name": "Grammar and Discourse", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING3010"}
+{"code": "LING3015", "name": "Language Contact", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING3015"}
+{"code": "LING3025", "name": "Study on an Australian Aboriginal Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING3025"}
+{"code": "LING3030", "name": "Mind and Language: Cognitive Strategies for Meaning Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING3030"}
+{"code": "LING3050", "name": "Advanced Linguistics Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING3050"}
+{"code": "LING3100", "name": "Special Research Topics in Linguistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING3100"}
+{"code": "LING6050", "name": "Advanced Research Topic A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING6050"}
+{"code": "LING6053", "name": "Special Topics in Linguistic Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING6053"}
+{"code": "LING6055", "name": "Advanced Research Topic B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING6055"}
+{"code": "LING6090", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING6090"}
+{"code": "LING6091", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING6091"}
+{"code": "LING6095", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING6095"}
+{"code": "LING6105", "name": "Introduction to Linguistics: Phonetics and Phonology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LING6105"}
+{"code": "LPWM3005", "name": "Game Management - the Science of Sustainable Use", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LPWM3005"}
+{"code": "LTCS2006", "name": "Japanese Popular Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2006"}
+{"code": "LTCS2018", "name": "Books the Nazis Burned: German Literature & Society 1914-1945", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2018"}
+{"code": "LTCS2022", "name": "Imagining Latin America in the 20th Century", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2022"}
+{"code": "LTCS2023", "name": "Korean Popular Culture: Korean wave", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2023"}
+{"code": "LTCS2024", "name": "Francophone Cultures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2024"}
+{"code": "LTCS2026", "name": "Cultures of Latin America", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2026"}
+{"code": "LTCS2027", "name": "Magical Realism and Beyond: Contemporary Latin America", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2027"}
+{"code": "LTCS2030", "name": "Modern Japanese Literature & Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2030"}
+{"code": "LTCS2310", "name": "Russia Now and Then", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2310"}
+{"code": "LTCS2401", "name": "Indonesia and its Neighbours: Evolving in the Asian Century", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS2401"}
+{"code": "LTCS3000", "name": "Latin American Perspectives", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS3000"}
+{"code": "LTCS3001", "name": "Doing things with \"French Theory\"", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS3001"}
+{"code": "LTCS3002", "name": "Translating & Interpreting Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS3002"}
+{"code": "LTCS3007", "name": "Japanese Studies Individual Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS3007"}
+{"code": "LTCS6000", "name": "General Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS6000"}
+{"code": "LTCS6110", "name": "Asian Studies Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS6110"}
+{"code": "LTCS6364", "name": "Special Topics in World Literatures and Cultures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS6364"}
+{"code": "LTCS6920", "name": "Asian Studies Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS6920"}
+{"code": "LTCS6921", "name": "World Literatures and Cultures Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS6921"}
+{"code": "LTCS6922", "name": "World Literatures and Cultures Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS6922"}
+{"code": "LTCS7000", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=LTCS7000"}
+{"code": "MARS2005", "name": "Australia's Marine Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MARS2005"}
+{"code": "MARS2014", "name": "Marine Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MARS2014"}
+{"code": "MARS3012", "name": "Physical-biological Oceanography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MARS3012"}
+{"code": "MATE7001", "name": "Environmental Performance of Materials", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATE7001"}
+{"code": "MATE7013", "name": "Advanced Manufacturing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATE7013"}
+{"code": "MATE7014", "name": "Advanced Materials Characterization", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATE7014"}
+{"code": "MATE7015", "name": "Additive Manufacturing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATE7015"}
+{"code": "MATE7016", "name": "Materials for Energy Conversion and Storage", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATE7016"}
+{"code": "MATE7605", "name": "Special Topics in Materials Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATE7605"}
+{"code": "MATH1001E", "name": "Pre-University Mathematics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1001E"}
+{"code": "MATH1002E", "name": "Pre-University Mathematics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1002E"}
+{"code": "MATH1021E", "name": "Pre-University Mathematics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1021E"}
+{"code": "MATH1022E", "name": "Pre-University Mathematics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1022E"}
+{"code": "MATH1031E", "name": "Pre-University Mathematics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1031E"}
+{"code": "MATH1032E", "name": "Pre-University Mathematics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1032E"}
+{"code": "MATH1040", "name": "Basic Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1040"}
+{"code": "MATH1050", "name": "Mathematical Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1050"}
+{"code": "MATH1051", "name": "Calculus & Linear Algebra I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1051"}
+{"code": "MATH1052", "name": "Multivariate Calculus & Ordinary Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1052"}
+{"code": "MATH1061", "name": "Discrete Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1061"}
+{"code": "MATH1071", "name": "Advanced Calculus & Linear Algebra I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1071"}
+{"code": "MATH1072", "name": "Advanced Multivariate Calculus & Ordinary Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1072"}
+{"code": "MATH1901D", "name": "Mathematics for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH1901D"}
+{"code": "MATH2000", "name": "Calculus & Linear Algebra II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2000"}
+{"code": "MATH2001", "name": "Advanced Calculus & Linear Algebra II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2001"}
+{"code": "MATH2010", "name": "Analysis of Ordinary Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2010"}
+{"code": "MATH2011", "name": "Analysis of Partial Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2011"}
+{"code": "MATH2070", "name": "Natural Resource Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2070"}
+{"code": "MATH2100", "name": "Applied Mathematical Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2100"}
+{"code": "MATH2301", "name": "Linear & Abstract Algebra & Number Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2301"}
+{"code": "MATH2302", "name": "Discrete Mathematics II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2302"}
+{"code": "MATH2400", "name": "Mathematical Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2400"}
+{"code": "MATH2401", "name": "Mathematical Analysis and Advanced Topics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH2401"}
+{"code": "MATH3070", "name": "Natural Resource Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3070"}
+{"code": "MATH3090", "name": "Financial Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3090"}
+{"code": "MATH3101", "name": "Bifurcation and Chaos", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3101"}
+{"code": "MATH3102", "name": "Methods & Models of Applied Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3102"}
+{"code": "MATH3103", "name": "Algebraic Methods of Mathematical Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3103"}
+{"code": "MATH3104", "name": "Mathematical Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3104"}
+{"code": "MATH3201", "name": "Scientific Computing: Advanced Techniques and Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3201"}
+{"code": "MATH3202", "name": "Operations Research & Mathematical Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3202"}
+{"code": "MATH3204", "name": "Numerical Linear Algebra and Optimisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3204"}
+{"code": "MATH3301", "name": "Graph Theory and Design Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3301"}
+{"code": "MATH3302", "name": "Coding & Cryptography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3302"}
+{"code": "MATH3303", "name": "Abstract Algebra & Number Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3303"}
+{"code": "MATH3306", "name": "Set Theory & Mathematical Logic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3306"}
+{"code": "MATH3401", "name": "Complex Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3401"}
+{"code": "MATH3402", "name": "Functional Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3402"}
+{"code": "MATH3403", "name": "Partial Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3403"}
+{"code": "MATH3404", "name": "Optimisation Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3404"}
+{"code": "MATH3405", "name": "Differential Geometry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH3405"}
+{"code": "MATH4090", "name": "Computation in Financial Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4090"}
+{"code": "MATH4091", "name": "Financial Calculus", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4091"}
+{"code": "MATH4104", "name": "Advanced Hamiltonian Dynamics & Chaos", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4104"}
+{"code": "MATH4105", "name": "General Relativity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4105"}
+{"code": "MATH4106", "name": "Advanced Mathematical Methods & Models A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4106"}
+{"code": "MATH4107", "name": "Advanced Mathematical Methods & Models B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4107"}
+{"code": "MATH4201", "name": "Applications of Scientific Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4201"}
+{"code": "MATH4202", "name": "Advanced Topics in Operations Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4202"}
+{"code": "MATH4301", "name": "Advanced Algebra", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4301"}
+{"code": "MATH4302", "name": "Combinatorial Designs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4302"}
+{"code": "MATH4303", "name": "Advanced Combinatorics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4303"}
+{"code": "MATH4304", "name": "Number Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4304"}
+{"code": "MATH4402", "name": "Ordinary Differential Equations III/IVH", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4402"}
+{"code": "MATH4403", "name": "Partial Differential Equations III/IVH", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4403"}
+{"code": "MATH4404", "name": "Functional Analysis III/IVH", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4404"}
+{"code": "MATH4405", "name": "Measure Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4405"}
+{"code": "MATH4406", "name": "Control Theory III/IVH", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH4406"}
+{"code": "MATH6006", "name": "Special Topics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH6006"}
+{"code": "MATH6007", "name": "Special Topics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH6007"}
+{"code": "MATH6010", "name": "Mathematics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH6010"}
+{"code": "MATH6020", "name": "Mathematics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH6020"}
+{"code": "MATH6030", "name": "Mathematics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH6030"}
+{"code": "MATH7000", "name": "Calculus & Linear Algebra II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7000"}
+{"code": "MATH7010", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7010"}
+{"code": "MATH7011", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7011"}
+{"code": "MATH7012", "name": "Project or Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7012"}
+{"code": "MATH7013", "name": "Minor Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7013"}
+{"code": "MATH7014", "name": "Minor Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7014"}
+{"code": "MATH7015", "name": "Mini Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7015"}
+{"code": "MATH7016", "name": "Mini Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7016"}
+{"code": "MATH7020", "name": "Project or Thesis in Financial Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7020"}
+{"code": "MATH7021", "name": "Project or Thesis in Financial Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7021"}
+{"code": "MATH7022", "name": "Project or Thesis in Financial Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7022"}
+{"code": "MATH7039", "name": "Financial Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7039"}
+{"code": "MATH7040", "name": "Basic Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7040"}
+{"code": "MATH7049", "name": "Computation in Financial Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7049"}
+{"code": "MATH7050", "name": "Mathematical Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7050"}
+{"code": "MATH7051", "name": "Calculus & Linear Algebra I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7051"}
+{"code": "MATH7052", "name": "Multivariate Calculus & Ordinary Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7052"}
+{"code": "MATH7091", "name": "Financial Calculus", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7091"}
+{"code": "MATH7100", "name": "Applied Mathematical Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7100"}
+{"code": "MATH7105", "name": "General Relativity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7105"}
+{"code": "MATH7106", "name": "Advanced Mathematical Methods & Models A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7106"}
+{"code": "MATH7107", "name": "Advanced Mathematical Methods & Models B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7107"}
+{"code": "MATH7133", "name": "Algebraic Methods of Mathematical Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7133"}
+{"code": "MATH7134", "name": "Mathematical Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7134"}
+{"code": "MATH7144", "name": "Advanced Hamiltonian Dynamics & Chaos", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7144"}
+{"code": "MATH7201", "name": "Applications of Scientific Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7201"}
+{"code": "MATH7202", "name": "Advanced Topics in Operations Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7202"}
+{"code": "MATH7232", "name": "Operations Research & Mathematical Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7232"}
+{"code": "MATH7301", "name": "Advanced Algebra", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7301"}
+{"code": "MATH7302", "name": "Combinatorial Designs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7302"}
+{"code": "MATH7303", "name": "Advanced Combinatorics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7303"}
+{"code": "MATH7304", "name": "Number Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7304"}
+{"code": "MATH7305", "name": "Applied Cryptography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7305"}
+{"code": "MATH7306", "name": "Quantum Algorithms and Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7306"}
+{"code": "MATH7307", "name": "Linear & Abstract Algebra & Number Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7307"}
+{"code": "MATH7308", "name": "Discrete Mathematics II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7308"}
+{"code": "MATH7331", "name": "Graph Theory and Design Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7331"}
+{"code": "MATH7333", "name": "Abstract Algebra & Number Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7333"}
+{"code": "MATH7402", "name": "Advanced Ordinary Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7402"}
+{"code": "MATH7403", "name": "Advanced Partial Differential Equations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7403"}
+{"code": "MATH7404", "name": "Functional Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7404"}
+{"code": "MATH7405", "name": "Measure Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7405"}
+{"code": "MATH7406", "name": "Control Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7406"}
+{"code": "MATH7501", "name": "Mathematics for Data Science 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7501"}
+{"code": "MATH7502", "name": "Mathematics for Data Science 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7502"}
+{"code": "MATH7701", "name": "Special Topics I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7701"}
+{"code": "MATH7702", "name": "Special Topics II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7702"}
+{"code": "MATH7703", "name": "Special Topics III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7703"}
+{"code": "MATH7704", "name": "Special Topics IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7704"}
+{"code": "MATH7861", "name": "Discrete Mathematics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MATH7861"}
+{"code": "MECH2100", "name": "Machine Element Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH2100"}
+{"code": "MECH2210", "name": "Intermediate Mechanical & Space Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH2210"}
+{"code": "MECH2300", "name": "Structures & Materials", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH2300"}
+{"code": "MECH2305", "name": "Introduction to Engineering Design and Manufacturing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH2305"}
+{"code": "MECH2310", "name": "Science & Engineering of Metals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH2310"}
+{"code": "MECH2410", "name": "Fundamentals of Fluid Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH2410"}
+{"code": "MECH2700", "name": "Engineering Analysis I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH2700"}
+{"code": "MECH3100", "name": "Mechanical Systems Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3100"}
+{"code": "MECH3200", "name": "Advanced Dynamics & Vibrations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3200"}
+{"code": "MECH3250", "name": "Engineering Acoustics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3250"}
+{"code": "MECH3300", "name": "Finite Element Method & Fracture Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3300"}
+{"code": "MECH3301", "name": "Materials Selection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3301"}
+{"code": "MECH3305", "name": "Science & Engineering of Metals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3305"}
+{"code": "MECH3400", "name": "Thermodynamics & Heat Transfer", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3400"}
+{"code": "MECH3410", "name": "Fluid Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3410"}
+{"code": "MECH3600", "name": "Engineering Management & Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3600"}
+{"code": "MECH3750", "name": "Engineering Analysis II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH3750"}
+{"code": "MECH4301", "name": "Materials Selection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4301"}
+{"code": "MECH4304", "name": "Net Shape Manufacturing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4304"}
+{"code": "MECH4450", "name": "Aerospace Propulsion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4450"}
+{"code": "MECH4460", "name": "Energy & Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4460"}
+{"code": "MECH4470", "name": "Hypersonics & Rarefied Gas Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4470"}
+{"code": "MECH4480", "name": "Computational Fluid Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4480"}
+{"code": "MECH4500", "name": "Engineering Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4500"}
+{"code": "MECH4501", "name": "Engineering Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4501"}
+{"code": "MECH4552", "name": "Major Design Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4552"}
+{"code": "MECH4561", "name": "Major Design Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4561"}
+{"code": "MECH4800", "name": "Space Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4800"}
+{"code": "MECH4950", "name": "Advanced Manufacturing in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4950"}
+{"code": "MECH4951", "name": "Special Topics D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH4951"}
+{"code": "MECH7101", "name": "Design of Experiments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH7101"}
+{"code": "MECH7260", "name": "Gas & Plant Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH7260"}
+{"code": "MECH7350", "name": "Rotating Machinery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH7350"}
+{"code": "MECH7480", "name": "Computational Fluid Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH7480"}
+{"code": "MECH7650", "name": "Regulation, Compliance & Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH7650"}
+{"code": "MECH7900", "name": "Special Topics in Mechanical Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MECH7900"}
+{"code": "MEDI3003", "name": "Surgery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3003"}
+{"code": "MEDI3004", "name": "Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3004"}
+{"code": "MEDI3005", "name": "General Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3005"}
+{"code": "MEDI3006", "name": "General Practice (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3006"}
+{"code": "MEDI3007", "name": "Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3007"}
+{"code": "MEDI3008", "name": "Critical Appraisal of Published Material", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3008"}
+{"code": "MEDI3009", "name": "Scientific Literature Review (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3009"}
+{"code": "MEDI3010", "name": "Mental Health (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3010"}
+{"code": "MEDI3011", "name": "Surgery (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3011"}
+{"code": "MEDI3012", "name": "Medicine (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3012"}
+{"code": "MEDI3013", "name": "Medicine in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3013"}
+{"code": "MEDI3014", "name": "Medicine in Society (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3014"}
+{"code": "MEDI3020", "name": "Scholarship of Research 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3020"}
+{"code": "MEDI3021", "name": "Critical Appraisal Skills for the Medical Professional", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI3021"}
+{"code": "MEDI4010", "name": "Obstetrics & Gynaecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4010"}
+{"code": "MEDI4012", "name": "Paediatrics & Child Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4012"}
+{"code": "MEDI4014", "name": "Medical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4014"}
+{"code": "MEDI4018", "name": "Clinical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4018"}
+{"code": "MEDI4019", "name": "Critical Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4019"}
+{"code": "MEDI4020", "name": "Surgical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4020"}
+{"code": "MEDI4021", "name": "Critical Appraisal Skills for the Medical Professional", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4021"}
+{"code": "MEDI4022", "name": "Scholarship of Research for the Medical Professional", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI4022"}
+{"code": "MEDI7101", "name": "Health, Society & Research 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7101"}
+{"code": "MEDI7102", "name": "Health, Society & Research 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7102"}
+{"code": "MEDI7111", "name": "Clinical Science 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7111"}
+{"code": "MEDI7112", "name": "Clinical Science 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7112"}
+{"code": "MEDI7121", "name": "Clinical Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7121"}
+{"code": "MEDI7122", "name": "Clinical Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7122"}
+{"code": "MEDI7131", "name": "Ethics and Professional Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7131"}
+{"code": "MEDI7132", "name": "Ethics & Professional Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7132"}
+{"code": "MEDI7141", "name": "Health, Society & Research 1: Evidence-Based Practice and Introduction to Research in Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7141"}
+{"code": "MEDI7142", "name": "Health, Society & Research 2 Indigenous Health and Research & Research Ethics and Integrity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7142"}
+{"code": "MEDI7201", "name": "Health, Society & Research 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7201"}
+{"code": "MEDI7202", "name": "Health, Society & Research 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7202"}
+{"code": "MEDI7211", "name": "Clinical Science 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7211"}
+{"code": "MEDI7212", "name": "Integrated Clinical Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7212"}
+{"code": "MEDI7221", "name": "Clinical Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7221"}
+{"code": "MEDI7222", "name": "Clinical Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7222"}
+{"code": "MEDI7231", "name": "Ethics and Professional Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7231"}
+{"code": "MEDI7232", "name": "Ethics and Professional Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7232"}
+{"code": "MEDI7241", "name": "Health, Society and Research 3 Community Medicine and Research Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7241"}
+{"code": "MEDI7242", "name": "Health, Society and Research 4: Global Health and Scholarship of Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7242"}
+{"code": "MEDI7280", "name": "Urban LInCC", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7280"}
+{"code": "MEDI7281", "name": "Foundations of Medical Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7281"}
+{"code": "MEDI7282", "name": "Preparation for US Medical Licensing Examination (USMLE) Step 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7282"}
+{"code": "MEDI7284", "name": "Introduction to Rural and Remote Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7284"}
+{"code": "MEDI7285", "name": "Introduction to Digital Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7285"}
+{"code": "MEDI7301", "name": "Surgery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7301"}
+{"code": "MEDI7302", "name": "Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7302"}
+{"code": "MEDI7303", "name": "General Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7303"}
+{"code": "MEDI7304", "name": "Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7304"}
+{"code": "MEDI7305", "name": "Medicine in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7305"}
+{"code": "MEDI7306", "name": "Preparation for Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7306"}
+{"code": "MEDI7311", "name": "Surgery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7311"}
+{"code": "MEDI7312", "name": "Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7312"}
+{"code": "MEDI7313", "name": "General Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7313"}
+{"code": "MEDI7314", "name": "Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7314"}
+{"code": "MEDI7315", "name": "Rural and Remote Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7315"}
+{"code": "MEDI7316", "name": "Year 3 Workplace Learning Portfolio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7316"}
+{"code": "MEDI7317", "name": "Year 3 Supplementary Workplace Learning Portfolio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7317"}
+{"code": "MEDI7318", "name": "Year 3 Workplace Learning Portfolio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7318"}
+{"code": "MEDI7319", "name": "General Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7319"}
+{"code": "MEDI7320", "name": "Rural and Remote Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7320"}
+{"code": "MEDI7321", "name": "Medicine in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7321"}
+{"code": "MEDI7322", "name": "Medicine in Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7322"}
+{"code": "MEDI7401", "name": "Obstetrics & Gynaecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7401"}
+{"code": "MEDI7402", "name": "Paediatrics & Child Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7402"}
+{"code": "MEDI7403", "name": "Critical Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7403"}
+{"code": "MEDI7404", "name": "Medical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7404"}
+{"code": "MEDI7405", "name": "Surgical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7405"}
+{"code": "MEDI7406", "name": "Preparation for Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7406"}
+{"code": "MEDI7411", "name": "Obstetrics & Gynaecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7411"}
+{"code": "MEDI7412", "name": "Paediatrics & Child Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7412"}
+{"code": "MEDI7413", "name": "Personalised Learning Course", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7413"}
+{"code": "MEDI7414", "name": "Medical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7414"}
+{"code": "MEDI7415", "name": "Critical Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7415"}
+{"code": "MEDI7416", "name": "Surgical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7416"}
+{"code": "MEDI7417", "name": "Year 4 Workplace Learning Portfolio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7417"}
+{"code": "MEDI7418", "name": "Year 4 Supplementary Workplace Learning Portfolio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7418"}
+{"code": "MEDI7419", "name": "Year 4 Workplace Learning Portfolio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7419"}
+{"code": "MEDI7420", "name": "Obstetrics and Gynaecology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7420"}
+{"code": "MEDI7421", "name": "Paediatrics & Child Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7421"}
+{"code": "MEDI7424", "name": "Medical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7424"}
+{"code": "MEDI7425", "name": "Critical Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7425"}
+{"code": "MEDI7426", "name": "Surgical Specialties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI7426"}
+{"code": "MEDI9001", "name": "Higher Doctorate Published Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MEDI9001"}
+{"code": "METR2800", "name": "Mechatronic System Design Project I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR2800"}
+{"code": "METR3100", "name": "Control System Implementation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR3100"}
+{"code": "METR3200", "name": "Control Engineering 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR3200"}
+{"code": "METR3800", "name": "Mechatronic System Design Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR3800"}
+{"code": "METR4201", "name": "Control Engineering 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR4201"}
+{"code": "METR4202", "name": "Robotics & Automation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR4202"}
+{"code": "METR4810", "name": "Mechatronic System Design Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR4810"}
+{"code": "METR4900", "name": "Thesis/Design Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR4900"}
+{"code": "METR4901", "name": "Thesis/Design Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR4901"}
+{"code": "METR7200", "name": "Control Engineering 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR7200"}
+{"code": "METR7203", "name": "Control Engineering 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR7203"}
+{"code": "METR7603", "name": "Special Topics in Mechatronic Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR7603"}
+{"code": "METR7800", "name": "Mechatronic System Design Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR7800"}
+{"code": "METR7820", "name": "Engineering Thesis Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR7820"}
+{"code": "METR7830", "name": "Engineering Placement Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=METR7830"}
+{"code": "MGTS1001E", "name": "Pre-University Business Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1001E"}
+{"code": "MGTS1021E", "name": "Pre-University Business Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1021E"}
+{"code": "MGTS1031E", "name": "Pre-University Business Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1031E"}
+{"code": "MGTS1301", "name": "Introduction to Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1301"}
+{"code": "MGTS1601", "name": "Organisational Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1601"}
+{"code": "MGTS1901D", "name": "Management Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1901D"}
+{"code": "MGTS1911D", "name": "Business Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1911D"}
+{"code": "MGTS1912D", "name": "Business Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1912D"}
+{"code": "MGTS1921D", "name": "Information Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1921D"}
+{"code": "MGTS1931D", "name": "Business Communication A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1931D"}
+{"code": "MGTS1932D", "name": "Business Communication B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1932D"}
+{"code": "MGTS1933D", "name": "Organisational Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1933D"}
+{"code": "MGTS1962C", "name": "Rural Business Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1962C"}
+{"code": "MGTS1965D", "name": "Learning & Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1965D"}
+{"code": "MGTS1966D", "name": "Rural Business Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1966D"}
+{"code": "MGTS1967D", "name": "Rural Business and Human Resources 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1967D"}
+{"code": "MGTS1968D", "name": "Enterprise Compliance Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1968D"}
+{"code": "MGTS1982", "name": "Working with Groups and Teams", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS1982"}
+{"code": "MGTS2000", "name": "Practicum 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS2000"}
+{"code": "MGTS2001", "name": "Practicum II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS2001"}
+{"code": "MGTS2603", "name": "Leading & Managing People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS2603"}
+{"code": "MGTS2604", "name": "Introduction to Human Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS2604"}
+{"code": "MGTS2606", "name": "Managerial Skills & Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS2606"}
+{"code": "MGTS2607", "name": "Employment Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS2607"}
+{"code": "MGTS3006", "name": "Tourism and Hospitality Risk Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3006"}
+{"code": "MGTS3204", "name": "Electronic Commerce Infrastructure Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3204"}
+{"code": "MGTS3301", "name": "Business Policy and Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3301"}
+{"code": "MGTS3302", "name": "The Business of Professional Sports", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3302"}
+{"code": "MGTS3526", "name": "Systems Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3526"}
+{"code": "MGTS3601", "name": "Organisational Design & Change Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3601"}
+{"code": "MGTS3602", "name": "Managing Workplace Conflict", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3602"}
+{"code": "MGTS3603", "name": "Strategic Human Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3603"}
+{"code": "MGTS3604", "name": "Human Resource Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3604"}
+{"code": "MGTS3605", "name": "Negotiating Employment Agreements", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3605"}
+{"code": "MGTS3606", "name": "Global Human Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3606"}
+{"code": "MGTS3607", "name": "Managing Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3607"}
+{"code": "MGTS3608", "name": "People, Productivity and the Public Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3608"}
+{"code": "MGTS3611", "name": "Working in Teams", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3611"}
+{"code": "MGTS3614", "name": "Knowledge, Innovation and Creativity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3614"}
+{"code": "MGTS3968", "name": "Sustainable Food Supply Chains", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS3968"}
+{"code": "MGTS4602", "name": "Leadership and Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS4602"}
+{"code": "MGTS4603", "name": "Advanced Studies in Human Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS4603"}
+{"code": "MGTS6000", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS6000"}
+{"code": "MGTS6002", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS6002"}
+{"code": "MGTS6003", "name": "Thesis (Honours)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS6003"}
+{"code": "MGTS6301", "name": "Theory and Research in Strategic Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS6301"}
+{"code": "MGTS6600", "name": "Organisational Research Paradigms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS6600"}
+{"code": "MGTS7000", "name": "Management Development Workshop", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7000"}
+{"code": "MGTS7095", "name": "Leadership Workshop", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7095"}
+{"code": "MGTS7212", "name": "Managing Electronic Commerce Infrastructure", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7212"}
+{"code": "MGTS7301", "name": "Tools and Techniques for Business Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7301"}
+{"code": "MGTS7303", "name": "Principles of Strategic Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7303"}
+{"code": "MGTS7304", "name": "Advanced Strategic Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7304"}
+{"code": "MGTS7308", "name": "Social Enterprises and Not for Profits", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7308"}
+{"code": "MGTS7309", "name": "Decision Making & Reporting for Sustainability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7309"}
+{"code": "MGTS7310", "name": "Business Negotiation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7310"}
+{"code": "MGTS7329", "name": "Cross Cultural Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7329"}
+{"code": "MGTS7523", "name": "System Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7523"}
+{"code": "MGTS7524", "name": "Sustainability Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7524"}
+{"code": "MGTS7525", "name": "Business Dynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7525"}
+{"code": "MGTS7526", "name": "Risk Assessment and Decision Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7526"}
+{"code": "MGTS7601", "name": "Managing Organisational Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7601"}
+{"code": "MGTS7603", "name": "Strategic Human Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7603"}
+{"code": "MGTS7604", "name": "International Human Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7604"}
+{"code": "MGTS7605", "name": "Performance Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7605"}
+{"code": "MGTS7607", "name": "Ethical Issues in Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7607"}
+{"code": "MGTS7608", "name": "Business and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7608"}
+{"code": "MGTS7609", "name": "Contemporary Employment Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7609"}
+{"code": "MGTS7610", "name": "Management Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7610"}
+{"code": "MGTS7611", "name": "Employee and Organisational Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7611"}
+{"code": "MGTS7612", "name": "The Fundamentals of Designing and Staffing Organisations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7612"}
+{"code": "MGTS7615", "name": "Public Sector Accountability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7615"}
+{"code": "MGTS7616", "name": "Designing Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7616"}
+{"code": "MGTS7618", "name": "Wise Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7618"}
+{"code": "MGTS7619", "name": "Leadership: Theory & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7619"}
+{"code": "MGTS7620", "name": "Leadership in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7620"}
+{"code": "MGTS7621", "name": "Career Transition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7621"}
+{"code": "MGTS7631", "name": "Becoming an Effective Leader in Cyber Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7631"}
+{"code": "MGTS7632", "name": "Leading the Organisation for Cyber Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7632"}
+{"code": "MGTS7633", "name": "Leading High Performing Cyber Security Teams", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7633"}
+{"code": "MGTS7635", "name": "Cyber Security Human Capital Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7635"}
+{"code": "MGTS7702", "name": "Leading People and Teams", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7702"}
+{"code": "MGTS7703", "name": "Negotiating Skills for Today", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7703"}
+{"code": "MGTS7704", "name": "Special Topics in Contemporary Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7704"}
+{"code": "MGTS7705", "name": "Strategy in Action", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7705"}
+{"code": "MGTS7706", "name": "Valuing Human Capital", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7706"}
+{"code": "MGTS7707", "name": "The Leadership Challenge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7707"}
+{"code": "MGTS7708", "name": "Leadership Styles and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7708"}
+{"code": "MGTS7709", "name": "Sustaining Corporations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7709"}
+{"code": "MGTS7710", "name": "Supply Chain Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7710"}
+{"code": "MGTS7711", "name": "Innovation Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7711"}
+{"code": "MGTS7712", "name": "Special Topics in Contemporary Leadership 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7712"}
+{"code": "MGTS7713", "name": "Special Topics in Contemporary Leadership 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7713"}
+{"code": "MGTS7714", "name": "Special Topics in Contemporary Leadership 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7714"}
+{"code": "MGTS7715", "name": "Executive Leadership Industry Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7715"}
+{"code": "MGTS7801", "name": "Management Frameworks", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7801"}
+{"code": "MGTS7803", "name": "Integrated Strategic Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7803"}
+{"code": "MGTS7809", "name": "Strategic Human Resources Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7809"}
+{"code": "MGTS7810", "name": "Leading People and Teams", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7810"}
+{"code": "MGTS7813", "name": "Industry Consulting A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7813"}
+{"code": "MGTS7814", "name": "Industry Consulting B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7814"}
+{"code": "MGTS7815", "name": "Industry Consulting C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7815"}
+{"code": "MGTS7816", "name": "Industry Consulting D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7816"}
+{"code": "MGTS7817", "name": "Industry Consulting E", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7817"}
+{"code": "MGTS7818", "name": "Industry Engagement Capstone", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7818"}
+{"code": "MGTS7819", "name": "Special Topics in Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7819"}
+{"code": "MGTS7901", "name": "Principles of Business and Leadership in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7901"}
+{"code": "MGTS7902", "name": "Strategic Analysis and Implementation in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7902"}
+{"code": "MGTS7903", "name": "Service Quality and Customer Co-Creation in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7903"}
+{"code": "MGTS7904", "name": "Leadership and People Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7904"}
+{"code": "MGTS7905", "name": "Strategic Analysis and Implementation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7905"}
+{"code": "MGTS7906", "name": "Principles of Business Management and Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7906"}
+{"code": "MGTS7907", "name": "Negotiation, Communication and Decision Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7907"}
+{"code": "MGTS7908", "name": "Service Quality and Customer Co-Creation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7908"}
+{"code": "MGTS7909", "name": "Principles of Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7909"}
+{"code": "MGTS7910", "name": "Special Topics in Business Leadership 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7910"}
+{"code": "MGTS7911", "name": "Special Topics in Business Leadership 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7911"}
+{"code": "MGTS7912", "name": "Special Topics in Business Leadership 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7912"}
+{"code": "MGTS7913", "name": "Special Topics in Business Leadership 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7913"}
+{"code": "MGTS7914", "name": "The Sports Industry and Sports Markets", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7914"}
+{"code": "MGTS7963", "name": "Evaluation of Programs & Projects", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7963"}
+{"code": "MGTS7968", "name": "Rural Community Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7968"}
+{"code": "MGTS7976", "name": "Effective Stakeholder Engagement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7976"}
+{"code": "MGTS7995", "name": "Private Sector Innovation and Sustainable Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7995"}
+{"code": "MGTS7997", "name": "Brokering Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MGTS7997"}
+{"code": "MICR2000", "name": "Microbiology & Immunology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR2000"}
+{"code": "MICR2001", "name": "Food Microbiology I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR2001"}
+{"code": "MICR3001", "name": "Microbes & Human Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR3001"}
+{"code": "MICR3002", "name": "Virology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR3002"}
+{"code": "MICR3003", "name": "Molecular Microbiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR3003"}
+{"code": "MICR3004", "name": "Microbial Genomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR3004"}
+{"code": "MICR3860", "name": "Food Microbiology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR3860"}
+{"code": "MICR7001", "name": "Food Microbiology and Biotechnology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR7001"}
+{"code": "MICR7002", "name": "Immunology and Infectious Diseases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR7002"}
+{"code": "MICR7003", "name": "Principles of Food Microbiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MICR7003"}
+{"code": "MIDW1005", "name": "Preconception & Pregnancy Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1005"}
+{"code": "MIDW1006", "name": "The Midwife & Healthy Pregnancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1006"}
+{"code": "MIDW1007", "name": "Preparing for Birth & Parenting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1007"}
+{"code": "MIDW1008", "name": "Clinical Midwifery Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1008"}
+{"code": "MIDW1101", "name": "Introduction to Midwifery Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1101"}
+{"code": "MIDW1103", "name": "Clinical Midwifery Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1103"}
+{"code": "MIDW1104", "name": "Working in Partnership with Women and Families", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1104"}
+{"code": "MIDW1105", "name": "Clinical Midwifery Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW1105"}
+{"code": "MIDW2001", "name": "Promoting Normal Birth", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2001"}
+{"code": "MIDW2002", "name": "Birth & Immediate Postnatal Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2002"}
+{"code": "MIDW2003", "name": "The Midwife & High Risk Pregnancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2003"}
+{"code": "MIDW2004", "name": "Clinical Midwifery Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2004"}
+{"code": "MIDW2005", "name": "Mental Health in Pregnancy, Birth & Beyond", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2005"}
+{"code": "MIDW2006", "name": "The Midwife & Acute Trauma Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2006"}
+{"code": "MIDW2007", "name": "Caring for the Vulnerable Newborn", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2007"}
+{"code": "MIDW2008", "name": "Clinical Midwifery Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2008"}
+{"code": "MIDW2009", "name": "Transition to Midwifery Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2009"}
+{"code": "MIDW2010", "name": "Clinical Midwifery Practice A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2010"}
+{"code": "MIDW2102", "name": "Health Complexities in Pregnancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2102"}
+{"code": "MIDW2103", "name": "Clinical Midwifery Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2103"}
+{"code": "MIDW2104", "name": "Postpartum and Infancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2104"}
+{"code": "MIDW2105", "name": "Critical Illness in the Mother and Neonate", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2105"}
+{"code": "MIDW2106", "name": "Clinical Midwifery Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2106"}
+{"code": "MIDW2108", "name": "Foundations of Midwifery and Midwifery with Complex Pregnancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW2108"}
+{"code": "MIDW3001", "name": "Clinical Midwifery Practice 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW3001"}
+{"code": "MIDW3002", "name": "Clinical Midwifery Practice 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW3002"}
+{"code": "MIDW3003", "name": "Extending Midwifery Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW3003"}
+{"code": "MIDW3102", "name": "Clinical Midwifery Practice 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW3102"}
+{"code": "MIDW3104", "name": "Clinical Midwifery Practice 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW3104"}
+{"code": "MIDW3105", "name": "Woman Centred Care towards a Philosophy of Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW3105"}
+{"code": "MIDW6001", "name": "Advanced Discipline Readings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW6001"}
+{"code": "MIDW6002", "name": "Research Methods & Thesis Preparation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW6002"}
+{"code": "MIDW6003", "name": "Thesis (full time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW6003"}
+{"code": "MIDW6004", "name": "Thesis (part time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW6004"}
+{"code": "MIDW7200", "name": "Advanced Practice Midwifery I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7200"}
+{"code": "MIDW7201", "name": "Advanced Practice Midwifery II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7201"}
+{"code": "MIDW7202", "name": "Advanced Practice Midwifery III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7202"}
+{"code": "MIDW7203", "name": "Advanced Practice Midwifery IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7203"}
+{"code": "MIDW7300", "name": "Complex Midwifery Care I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7300"}
+{"code": "MIDW7301", "name": "Complex Midwifery Care II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7301"}
+{"code": "MIDW7302", "name": "Complex Midwifery Care III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7302"}
+{"code": "MIDW7303", "name": "Complex Midwifery Care IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MIDW7303"}
+{"code": "MINE2105", "name": "Introduction to Mining and Mineral Processing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE2105"}
+{"code": "MINE2106", "name": "Resource Geology & Mine Surveying", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE2106"}
+{"code": "MINE2107", "name": "Mining Data Analytics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE2107"}
+{"code": "MINE2201", "name": "Physical & Chemical Processing of Minerals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE2201"}
+{"code": "MINE3106", "name": "Minerals Industry Visit", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3106"}
+{"code": "MINE3108", "name": "Special Topics in Mining I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3108"}
+{"code": "MINE3109", "name": "Special Topics in Mining II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3109"}
+{"code": "MINE3120", "name": "Resource Estimation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3120"}
+{"code": "MINE3121", "name": "Mining Geomechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3121"}
+{"code": "MINE3122", "name": "Mining Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3122"}
+{"code": "MINE3123", "name": "Mine Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3123"}
+{"code": "MINE3124", "name": "Mine Ventilation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3124"}
+{"code": "MINE3125", "name": "Explosives and Blasting Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3125"}
+{"code": "MINE3126", "name": "Underground Mining Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3126"}
+{"code": "MINE3127", "name": "Socio-Environmental Aspects of Mining", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3127"}
+{"code": "MINE3128", "name": "Surface Mining Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3128"}
+{"code": "MINE3204", "name": "Process Experimentation & Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3204"}
+{"code": "MINE3208", "name": "Mineral and Coal Beneficiation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3208"}
+{"code": "MINE3209", "name": "Mineral Processing I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3209"}
+{"code": "MINE3211", "name": "Special Topics in Minerals Processing II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3211"}
+{"code": "MINE3212", "name": "Pyrometallurgy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3212"}
+{"code": "MINE3219", "name": "Process Mineralogy and Comminution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE3219"}
+{"code": "MINE4000", "name": "Mine Waste Management & Landform Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4000"}
+{"code": "MINE4120", "name": "Mine Geotechnical Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4120"}
+{"code": "MINE4121", "name": "Mine Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4121"}
+{"code": "MINE4124", "name": "Hard Rock Mine Design & Feasibility", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4124"}
+{"code": "MINE4125", "name": "Coal Mine Design and Feasibility", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4125"}
+{"code": "MINE4128", "name": "Coal Mine Strata Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4128"}
+{"code": "MINE4201", "name": "Metallurgical Plant Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4201"}
+{"code": "MINE4202", "name": "Pyrometallurgy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4202"}
+{"code": "MINE4203", "name": "Flotation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4203"}
+{"code": "MINE4204", "name": "Aqueous Solution Processing & Electrometallurgy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4204"}
+{"code": "MINE4205", "name": "Project Thesis in Minerals Process Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4205"}
+{"code": "MINE4207", "name": "Special Topics in Minerals Processing I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE4207"}
+{"code": "MINE6204", "name": "Mineral Science Research Proposal & Literature Review", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE6204"}
+{"code": "MINE7003", "name": "Special Topics III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7003"}
+{"code": "MINE7009", "name": "Project or Thesis V", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7009"}
+{"code": "MINE7010", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7010"}
+{"code": "MINE7023", "name": "Community Development for the Resources Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7023"}
+{"code": "MINE7024", "name": "Community Engagement for the Resources Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7024"}
+{"code": "MINE7029", "name": "Project or Thesis V", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7029"}
+{"code": "MINE7032", "name": "Sustainable Management of Risk in Industry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7032"}
+{"code": "MINE7033", "name": "Resources Sector Risk Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7033"}
+{"code": "MINE7035", "name": "Special Project in the Resources Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7035"}
+{"code": "MINE7041", "name": "Mine Occupational Health & Safety Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7041"}
+{"code": "MINE7042", "name": "Incident Investigation & Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7042"}
+{"code": "MINE7050", "name": "Water Management in the Resources Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7050"}
+{"code": "MINE7052", "name": "Community Aspects in Resource Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7052"}
+{"code": "MINE7053", "name": "Sustainable Development in the Resources Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7053"}
+{"code": "MINE7055", "name": "Regional and Local Economic Development in the Resources Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7055"}
+{"code": "MINE7056", "name": "Research Methods for the Resources Sector", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7056"}
+{"code": "MINE7061", "name": "Sustainable Development in the Resources Sector - Tools and Integration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7061"}
+{"code": "MINE7202", "name": "Advanced Metallurgy Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7202"}
+{"code": "MINE7204", "name": "Metallurgical Engineering ME Design Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MINE7204"}
+{"code": "MKTG1501", "name": "Foundations of Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG1501"}
+{"code": "MKTG1901D", "name": "Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG1901D"}
+{"code": "MKTG2501", "name": "Consumer Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG2501"}
+{"code": "MKTG2505", "name": "Product and Service Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG2505"}
+{"code": "MKTG2508", "name": "Brand Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG2508"}
+{"code": "MKTG2509", "name": "Service and Relationship Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG2509"}
+{"code": "MKTG2510", "name": "Marketing Intelligence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG2510"}
+{"code": "MKTG2511", "name": "Marketing Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG2511"}
+{"code": "MKTG3501", "name": "Marketing Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3501"}
+{"code": "MKTG3503", "name": "Sales and Account Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3503"}
+{"code": "MKTG3504", "name": "Applied Market Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3504"}
+{"code": "MKTG3506", "name": "Digital Marketing and Social Media", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3506"}
+{"code": "MKTG3508", "name": "Targeting and Pricing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3508"}
+{"code": "MKTG3509", "name": "Contemporary Issues in Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3509"}
+{"code": "MKTG3960", "name": "Applied Market Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3960"}
+{"code": "MKTG3961", "name": "Commodities, Futures and Options", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG3961"}
+{"code": "MKTG4501", "name": "Advanced Studies in Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG4501"}
+{"code": "MKTG6500", "name": "Marketing Theory and Research I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG6500"}
+{"code": "MKTG6501", "name": "Marketing Theory & Research II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG6501"}
+{"code": "MKTG7501", "name": "Fundamentals of Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7501"}
+{"code": "MKTG7502", "name": "Strategic Branding", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7502"}
+{"code": "MKTG7503", "name": "Consumer & Buyer Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7503"}
+{"code": "MKTG7504", "name": "Service Strategy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7504"}
+{"code": "MKTG7505", "name": "Product Strategy & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7505"}
+{"code": "MKTG7510", "name": "Market & Consumer Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7510"}
+{"code": "MKTG7512", "name": "Strategic Marketing Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7512"}
+{"code": "MKTG7513", "name": "Marketing for Social Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7513"}
+{"code": "MKTG7708", "name": "Strategic Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7708"}
+{"code": "MKTG7806", "name": "Marketing Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7806"}
+{"code": "MKTG7915", "name": "Principles of Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7915"}
+{"code": "MKTG7960", "name": "Commodities, Futures and Options", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7960"}
+{"code": "MKTG7961", "name": "Agribusiness Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7961"}
+{"code": "MKTG7966", "name": "Applied Market Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MKTG7966"}
+{"code": "MMDS1400", "name": "Introduction to Web Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS1400"}
+{"code": "MMDS1801", "name": "Multimedia Studio 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS1801"}
+{"code": "MMDS2200", "name": "Graphic Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS2200"}
+{"code": "MMDS2201", "name": "Digital Video Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS2201"}
+{"code": "MMDS2202", "name": "Digital Audio Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS2202"}
+{"code": "MMDS2801", "name": "Multimedia Studio 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS2801"}
+{"code": "MMDS3201", "name": "Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS3201"}
+{"code": "MMDS3301", "name": "Affective Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS3301"}
+{"code": "MMDS3801", "name": "Multimedia Project I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS3801"}
+{"code": "MMDS3811", "name": "Multimedia Major Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS3811"}
+{"code": "MMDS6801", "name": "Multimedia Design Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS6801"}
+{"code": "MMDS6802", "name": "Multimedia Design Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS6802"}
+{"code": "MMDS7968", "name": "Digital Audio Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MMDS7968"}
+{"code": "MOLI7101", "name": "Molecular Targets and Imaging Probes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7101"}
+{"code": "MOLI7102", "name": "Clinical Molecular Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7102"}
+{"code": "MOLI7103", "name": "Molecular Imaging Advanced", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7103"}
+{"code": "MOLI7104", "name": "Cell-labelling and tracking technologies in MR and molecular imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7104"}
+{"code": "MOLI7105", "name": "Minor Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7105"}
+{"code": "MOLI7106", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7106"}
+{"code": "MOLI7107", "name": "MR-PET Hardware and Software Integration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7107"}
+{"code": "MOLI7108", "name": "Clinical Magnetic Resonance Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7108"}
+{"code": "MOLI7109", "name": "Radiotracer Based Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7109"}
+{"code": "MOLI7110", "name": "Pathological Correlates of Molecular Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7110"}
+{"code": "MOLI7200", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7200"}
+{"code": "MOLI7201", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7201"}
+{"code": "MOLI7202", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7202"}
+{"code": "MOLI7203", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MOLI7203"}
+{"code": "MRES7002", "name": "Magnetic Resonance Instrumentation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7002"}
+{"code": "MRES7003", "name": "MR Safety & Monitoring", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7003"}
+{"code": "MRES7005", "name": "Fast Imaging Techniques", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7005"}
+{"code": "MRES7006", "name": "Vascular Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7006"}
+{"code": "MRES7007", "name": "Diffusion & Perfusion Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7007"}
+{"code": "MRES7008", "name": "Functional Magnetic Resonance Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7008"}
+{"code": "MRES7009", "name": "MagneticResonance Spectroscopy & Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7009"}
+{"code": "MRES7010", "name": "Minor Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7010"}
+{"code": "MRES7013", "name": "Fundamental MRI of the Brain & Spine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7013"}
+{"code": "MRES7014", "name": "Fundamental Musculoskeletal MRI", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7014"}
+{"code": "MRES7015", "name": "Independent Clinical MRI Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7015"}
+{"code": "MRES7016", "name": "Cardiac MRI - Techniques and Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7016"}
+{"code": "MRES7017", "name": "Breast MRI", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7017"}
+{"code": "MRES7018", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7018"}
+{"code": "MRES7019", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7019"}
+{"code": "MRES7020", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7020"}
+{"code": "MRES7023", "name": "Medical Image Processing and Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7023"}
+{"code": "MRES7024", "name": "Advanced Techniques in Magnetic Resonance Imaging", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7024"}
+{"code": "MRES7025", "name": "Magnetic Resonance Clinical Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7025"}
+{"code": "MRES7100", "name": "Magnetic Resonance Imaging: Fundamentals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7100"}
+{"code": "MRES7400", "name": "MRI pulse sequence construction and image contrast", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MRES7400"}
+{"code": "MSTU1001", "name": "Introduction to Film & Television Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU1001"}
+{"code": "MSTU2005", "name": "Film Movements & Genres", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2005"}
+{"code": "MSTU2006", "name": "Australian Cinema", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2006"}
+{"code": "MSTU2008", "name": "Television: Forms and Genres", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2008"}
+{"code": "MSTU2011", "name": "Contemporary German Cinema", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2011"}
+{"code": "MSTU2012", "name": "European Film Today", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2012"}
+{"code": "MSTU2015", "name": "Globalisation: the Australian Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2015"}
+{"code": "MSTU2020", "name": "Country Matters: Country Music & the Media", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2020"}
+{"code": "MSTU2140", "name": "Studies in Photography", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2140"}
+{"code": "MSTU2160", "name": "Film and Television History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU2160"}
+{"code": "MSTU3000", "name": "Topics in Media Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU3000"}
+{"code": "MSTU3001", "name": "Contemporary Korean Film and TV Drama Review", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU3001"}
+{"code": "MSTU3005", "name": "Critical Concepts in Film & Television", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU3005"}
+{"code": "MSTU3010", "name": "Studies in Aesthetics and the Creative Arts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU3010"}
+{"code": "MSTU3012", "name": "Independent Media Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU3012"}
+{"code": "MSTU3150", "name": "Recent Approaches to Film and Television", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MSTU3150"}
+{"code": "MUSC1010", "name": "Introduction to Music Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1010"}
+{"code": "MUSC1050", "name": "Western Art Music 1700-1900: Approaches and Concepts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1050"}
+{"code": "MUSC1060", "name": "Introduction to Musicianship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1060"}
+{"code": "MUSC1100", "name": "Ensemble Studies 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1100"}
+{"code": "MUSC1110", "name": "Large Ensembles B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1110"}
+{"code": "MUSC1150", "name": "Introduction to Guitar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1150"}
+{"code": "MUSC1201", "name": "Practical Studies 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1201"}
+{"code": "MUSC1250", "name": "Performance and Ensemble Studies 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1250"}
+{"code": "MUSC1260", "name": "Performance and Ensemble Studies 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1260"}
+{"code": "MUSC1300", "name": "Introduction to Music Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1300"}
+{"code": "MUSC1600", "name": "Musicianship 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1600"}
+{"code": "MUSC1700", "name": "Introduction to Popular Music Studies: The Rock Era", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC1700"}
+{"code": "MUSC2000", "name": "Music Subcultures and the Media", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2000"}
+{"code": "MUSC2010", "name": "Music Technology for Live Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2010"}
+{"code": "MUSC2051", "name": "Music in Society 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2051"}
+{"code": "MUSC2060", "name": "Musicianship 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2060"}
+{"code": "MUSC2100", "name": "Ensemble Studies 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2100"}
+{"code": "MUSC2110", "name": "Large Ensembles D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2110"}
+{"code": "MUSC2145", "name": "Chamber Music Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2145"}
+{"code": "MUSC2201", "name": "Practical Studies 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2201"}
+{"code": "MUSC2250", "name": "Performance and Ensemble Studies 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2250"}
+{"code": "MUSC2260", "name": "Performance and Ensemble Studies 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2260"}
+{"code": "MUSC2300", "name": "Music and Human Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2300"}
+{"code": "MUSC2310", "name": "Music, Wellbeing and Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2310"}
+{"code": "MUSC2501", "name": "Musicology and Early Music", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2501"}
+{"code": "MUSC2510", "name": "Contemporary Art Music", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2510"}
+{"code": "MUSC2620", "name": "Advanced Musicianship 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2620"}
+{"code": "MUSC2630", "name": "Advanced Musicianship 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2630"}
+{"code": "MUSC2700", "name": "Beyond Rock: Music in the Digital Age", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2700"}
+{"code": "MUSC2710", "name": "Music in War, Protest and Peace", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2710"}
+{"code": "MUSC2750", "name": "Chamber Ensemble Studies 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2750"}
+{"code": "MUSC2755", "name": "Chamber Ensemble Studies 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2755"}
+{"code": "MUSC2800", "name": "World Music", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2800"}
+{"code": "MUSC2810", "name": "Indigenous Australian Music: Indigenous music-making in Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC2810"}
+{"code": "MUSC3010", "name": "Creative Music Production", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3010"}
+{"code": "MUSC3020", "name": "Sound Recording Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3020"}
+{"code": "MUSC3060", "name": "Musicianship 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3060"}
+{"code": "MUSC3145", "name": "Advanced Chamber Music Performance 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3145"}
+{"code": "MUSC3160", "name": "Choral Conducting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3160"}
+{"code": "MUSC3165", "name": "Conducting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3165"}
+{"code": "MUSC3170", "name": "Instrumental Conducting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3170"}
+{"code": "MUSC3180", "name": "Advanced Large Ensembles A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3180"}
+{"code": "MUSC3190", "name": "Advanced Large Ensembles B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3190"}
+{"code": "MUSC3201", "name": "Practical Studies 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3201"}
+{"code": "MUSC3211", "name": "Practical Studies 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3211"}
+{"code": "MUSC3215", "name": "Practical Studies 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3215"}
+{"code": "MUSC3231", "name": "Composition 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3231"}
+{"code": "MUSC3240", "name": "Adjunct Music Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3240"}
+{"code": "MUSC3255", "name": "Performance and Ensemble Studies 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3255"}
+{"code": "MUSC3265", "name": "Performance and Ensemble Studies 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3265"}
+{"code": "MUSC3280", "name": "Advanced Large Ensembles C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3280"}
+{"code": "MUSC3290", "name": "Advanced Large Ensembles D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3290"}
+{"code": "MUSC3340", "name": "Music, Cognition & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3340"}
+{"code": "MUSC3540", "name": "Music Communication, Writing and Critique", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3540"}
+{"code": "MUSC3560", "name": "Historical Performance Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3560"}
+{"code": "MUSC3580", "name": "Music Analysis and Criticism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3580"}
+{"code": "MUSC3600", "name": "Counterpoint", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3600"}
+{"code": "MUSC3720", "name": "Music in Film and Television", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3720"}
+{"code": "MUSC3730", "name": "Songwriting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3730"}
+{"code": "MUSC3750", "name": "Chamber Ensemble Studies 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3750"}
+{"code": "MUSC3755", "name": "Chamber Ensemble Studies 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3755"}
+{"code": "MUSC3840", "name": "Multi-Instrumental Pedagogy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3840"}
+{"code": "MUSC3850", "name": "Multi-Instrumental Pedagogy B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3850"}
+{"code": "MUSC3890", "name": "Creative Music Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3890"}
+{"code": "MUSC3900", "name": "Music Career Skills and Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3900"}
+{"code": "MUSC3910", "name": "Music Special Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3910"}
+{"code": "MUSC3920", "name": "Music Special Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC3920"}
+{"code": "MUSC4145", "name": "Advanced Chamber Music Performance 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4145"}
+{"code": "MUSC4201", "name": "Practical Studies 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4201"}
+{"code": "MUSC4211", "name": "Practical Studies 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4211"}
+{"code": "MUSC4231", "name": "Composition 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4231"}
+{"code": "MUSC4255", "name": "Performance and Ensemble Studies 7", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4255"}
+{"code": "MUSC4265", "name": "Performance and Ensemble Studies 8", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4265"}
+{"code": "MUSC4270", "name": "Work Integrated Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4270"}
+{"code": "MUSC4410", "name": "Artistic and Musicological Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4410"}
+{"code": "MUSC4420", "name": "Independent Study in Historical Musicology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4420"}
+{"code": "MUSC4430", "name": "Music Education and Psychology Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4430"}
+{"code": "MUSC4500", "name": "Music Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4500"}
+{"code": "MUSC4550", "name": "Portfolio of Artistic Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4550"}
+{"code": "MUSC4610", "name": "Creative Practice and Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4610"}
+{"code": "MUSC4630", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4630"}
+{"code": "MUSC4750", "name": "Chamber Ensemble Studies 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4750"}
+{"code": "MUSC4755", "name": "Chamber Ensemble Studies 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC4755"}
+{"code": "MUSC6850", "name": "Choral Conducting and Pedagogy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC6850"}
+{"code": "MUSC7010", "name": "Applications of Music Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7010"}
+{"code": "MUSC7160", "name": "Advanced Choral Conducting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7160"}
+{"code": "MUSC7170", "name": "Advanced Instrumental Conducting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7170"}
+{"code": "MUSC7180", "name": "Contemporary Perspectives in Music Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7180"}
+{"code": "MUSC7250", "name": "Performance and Ensemble Studies 9", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7250"}
+{"code": "MUSC7260", "name": "Performance and Ensemble Studies 10", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7260"}
+{"code": "MUSC7370", "name": "Psychology for Musicians: Performing, Teaching and Wellbeing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7370"}
+{"code": "MUSC7460", "name": "Advanced Music Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7460"}
+{"code": "MUSC7510", "name": "Artistic and Musicological Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7510"}
+{"code": "MUSC7530", "name": "Music Education and Psychology Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7530"}
+{"code": "MUSC7630", "name": "Instrumental and Vocal Studio Pedagogy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7630"}
+{"code": "MUSC7710", "name": "Professional Engagement Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7710"}
+{"code": "MUSC7790", "name": "Composing Music: techniques and strategies for creating music", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7790"}
+{"code": "MUSC7820", "name": "Music Performance A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7820"}
+{"code": "MUSC7830", "name": "Music Performance B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7830"}
+{"code": "MUSC7880", "name": "Composing Music", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7880"}
+{"code": "MUSC7900", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7900"}
+{"code": "MUSC7920", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7920"}
+{"code": "MUSC7930", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSC7930"}
+{"code": "MUSM7000", "name": "Museum Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7000"}
+{"code": "MUSM7002", "name": "Collections", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7002"}
+{"code": "MUSM7003", "name": "Museum Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7003"}
+{"code": "MUSM7004", "name": "Museums & Community Engagement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7004"}
+{"code": "MUSM7006", "name": "Exhibiting Culture: Theory & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7006"}
+{"code": "MUSM7007", "name": "Case Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7007"}
+{"code": "MUSM7008", "name": "Dissertation Museum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7008"}
+{"code": "MUSM7010", "name": "Museum Studies Field School A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7010"}
+{"code": "MUSM7011", "name": "Digital Heritage: Theory and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7011"}
+{"code": "MUSM7012", "name": "Applied Museology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7012"}
+{"code": "MUSM7018", "name": "Dissertation Museum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7018"}
+{"code": "MUSM7028", "name": "Dissertation Museum Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=MUSM7028"}
+{"code": "NEUR1020", "name": "The Brain and Behavioural Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR1020"}
+{"code": "NEUR2020", "name": "Neuroscience for Psychologists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR2020"}
+{"code": "NEUR2530", "name": "Motor Control & Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR2530"}
+{"code": "NEUR3001", "name": "Molecular & Cellular Neuroscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR3001"}
+{"code": "NEUR3002", "name": "The Integrated Brain", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR3002"}
+{"code": "NEUR3192", "name": "Sensory Neuroscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR3192"}
+{"code": "NEUR3272", "name": "The Neuroscience of Social Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR3272"}
+{"code": "NEUR3302", "name": "Cognitive Neuroscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR3302"}
+{"code": "NEUR3733", "name": "Neuromechanical Basis of Human Movement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR3733"}
+{"code": "NEUR7001", "name": "Neuroscience Laboratory Rotation 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7001"}
+{"code": "NEUR7002", "name": "Neuroscience Laboratory Rotation 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7002"}
+{"code": "NEUR7003", "name": "Neuroscience Laboratory Rotation 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7003"}
+{"code": "NEUR7004", "name": "Systems Neuroscience: Sensory and Motor", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7004"}
+{"code": "NEUR7005", "name": "Cognitive Behavioural Neuroscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7005"}
+{"code": "NEUR7006", "name": "Molecular and Cellular Neuroscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7006"}
+{"code": "NEUR7530", "name": "Learning & Motor Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7530"}
+{"code": "NEUR7733", "name": "Neuromechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NEUR7733"}
+{"code": "NUMW1102", "name": "Professional Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUMW1102"}
+{"code": "NUMW2101", "name": "Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUMW2101"}
+{"code": "NUMW3101", "name": "Evidence Based Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUMW3101"}
+{"code": "NUMW3103", "name": "Professional Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUMW3103"}
+{"code": "NURS1001", "name": "Embryology, Neonate & Child", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1001"}
+{"code": "NURS1002", "name": "Adolescents & Young Adults", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1002"}
+{"code": "NURS1003", "name": "Adults & Older Persons", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1003"}
+{"code": "NURS1004", "name": "Clinical Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1004"}
+{"code": "NURS1005", "name": "Cardiovascular Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1005"}
+{"code": "NURS1006", "name": "Respiratory Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1006"}
+{"code": "NURS1007", "name": "Musculo-skeletal Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1007"}
+{"code": "NURS1008", "name": "Clinical Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1008"}
+{"code": "NURS1009", "name": "Clinical Practice A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1009"}
+{"code": "NURS1101", "name": "Health Across the Lifespan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1101"}
+{"code": "NURS1103", "name": "Clinical Nursing Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1103"}
+{"code": "NURS1104", "name": "Older Adults' Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1104"}
+{"code": "NURS1105", "name": "Clinical Nursing Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS1105"}
+{"code": "NURS2001", "name": "Nutritional & Metabolic Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2001"}
+{"code": "NURS2002", "name": "Immunological Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2002"}
+{"code": "NURS2003", "name": "Neuro-endocrine Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2003"}
+{"code": "NURS2004", "name": "Clinical Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2004"}
+{"code": "NURS2005", "name": "Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2005"}
+{"code": "NURS2006", "name": "Injury Prevention", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2006"}
+{"code": "NURS2007", "name": "Healthy Ageing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2007"}
+{"code": "NURS2008", "name": "Clinical Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2008"}
+{"code": "NURS2102", "name": "Acute Care Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2102"}
+{"code": "NURS2103", "name": "Clinical Nursing Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2103"}
+{"code": "NURS2104", "name": "Child & Family Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2104"}
+{"code": "NURS2105", "name": "Managing Chronic Health Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2105"}
+{"code": "NURS2106", "name": "Clinical Nursing Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS2106"}
+{"code": "NURS3001", "name": "Clinical Practice 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3001"}
+{"code": "NURS3002", "name": "Clinical Practice 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3002"}
+{"code": "NURS3003", "name": "Indigenous Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3003"}
+{"code": "NURS3004", "name": "Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3004"}
+{"code": "NURS3005", "name": "Acute Medical & Surgical Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3005"}
+{"code": "NURS3006", "name": "Aged Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3006"}
+{"code": "NURS3007", "name": "Clinical Practice 7", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3007"}
+{"code": "NURS3008", "name": "Clinical Practice 8", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3008"}
+{"code": "NURS3009", "name": "Community Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3009"}
+{"code": "NURS3010", "name": "Rural Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3010"}
+{"code": "NURS3011", "name": "Paediatric Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3011"}
+{"code": "NURS3012", "name": "Speciality Clinical Elective - Palliative Care Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3012"}
+{"code": "NURS3013", "name": "Extending Nursing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3013"}
+{"code": "NURS3102", "name": "Clinical Nursing Practice 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3102"}
+{"code": "NURS3104", "name": "Clinical Nursing Practice 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS3104"}
+{"code": "NURS6001", "name": "Advanced Discipline Readings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS6001"}
+{"code": "NURS6002", "name": "Research Methods & Thesis Preparation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS6002"}
+{"code": "NURS6003", "name": "Thesis (full-time study)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS6003"}
+{"code": "NURS6004", "name": "Thesis (part-time study)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS6004"}
+{"code": "NURS6007", "name": "Triage & Collaborative Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS6007"}
+{"code": "NURS7001", "name": "Advanced Nursing Practice I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7001"}
+{"code": "NURS7002", "name": "Advanced Clinical Practice I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7002"}
+{"code": "NURS7003", "name": "Advanced Nursing Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7003"}
+{"code": "NURS7004", "name": "Advanced Clinical Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7004"}
+{"code": "NURS7006", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7006"}
+{"code": "NURS7007", "name": "Nurse Practitioner Professional Development of Provided Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7007"}
+{"code": "NURS7010", "name": "Emergency Care in Rural & Remote Areas", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7010"}
+{"code": "NURS7013", "name": "Foundations of Mental Health Nursing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7013"}
+{"code": "NURS7014", "name": "Mental Health Nursing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7014"}
+{"code": "NURS7015", "name": "Application of Specialist Mental Health Nursing Skills in Mental Health Practice A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7015"}
+{"code": "NURS7016", "name": "Application of Specialist Mental Health Nursing Skills in Mental Health Practice B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7016"}
+{"code": "NURS7017", "name": "Mental Health Nursing Practice with Special Populations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7017"}
+{"code": "NURS7018", "name": "Clinical Leadership in Mental Health Nursing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7018"}
+{"code": "NURS7020", "name": "Professional Practice Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7020"}
+{"code": "NURS7071", "name": "Nurse Practitioner Care in MHN", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7071"}
+{"code": "NURS7072", "name": "Advanced Clinical Practice in Mental Health Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7072"}
+{"code": "NURS7073", "name": "Professional Practice Project in Mental Health Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7073"}
+{"code": "NURS7101", "name": "Early Lifespan Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7101"}
+{"code": "NURS7102", "name": "Middle Lifespan Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7102"}
+{"code": "NURS7103", "name": "Adult & Elder Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7103"}
+{"code": "NURS7104", "name": "Clinical Nursing Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7104"}
+{"code": "NURS7105", "name": "Cardiovascular & Respiratory Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7105"}
+{"code": "NURS7106", "name": "Musculoskeletal Health & Injury Prevention", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7106"}
+{"code": "NURS7107", "name": "Neuroendocrine & MH Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7107"}
+{"code": "NURS7108", "name": "Clinical Nursing Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7108"}
+{"code": "NURS7109", "name": "Interprofessional Practice Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7109"}
+{"code": "NURS7110", "name": "Clinical Nursing Practice 3: Translating research into practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7110"}
+{"code": "NURS7111", "name": "Clinical Nursing Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7111"}
+{"code": "NURS7112", "name": "Introduction to Contemporary Nursing Practice and Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7112"}
+{"code": "NURS7113", "name": "Introduction to Indigenous History, Culture and Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7113"}
+{"code": "NURS7122", "name": "Health Across the Lifespan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7122"}
+{"code": "NURS7123", "name": "Acute Care Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7123"}
+{"code": "NURS7124", "name": "Clinical Nursing Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7124"}
+{"code": "NURS7125", "name": "Older Adults' Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7125"}
+{"code": "NURS7126", "name": "Managing Chronic Health Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7126"}
+{"code": "NURS7127", "name": "Clinical Nursing Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7127"}
+{"code": "NURS7128", "name": "Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7128"}
+{"code": "NURS7129", "name": "Clinical Nursing Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7129"}
+{"code": "NURS7130", "name": "Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7130"}
+{"code": "NURS7131", "name": "Clinical Nursing Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7131"}
+{"code": "NURS7132", "name": "Translating Research into Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7132"}
+{"code": "NURS7200", "name": "Health Assessment Skills for Specialist Nursing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7200"}
+{"code": "NURS7201", "name": "Specialist Nursing Practice & Models of Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7201"}
+{"code": "NURS7202", "name": "Contemporary Specialist Nursing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7202"}
+{"code": "NURS7203", "name": "Advanced Specialist Nursing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7203"}
+{"code": "NURS7300", "name": "Professional Practice in Acute Paediatric Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7300"}
+{"code": "NURS7301", "name": "Professional Practice in Child Health Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7301"}
+{"code": "NURS7302", "name": "Contemporary Nursing of Children & Young People", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7302"}
+{"code": "NURS7303", "name": "Working in Partnership with Families", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7303"}
+{"code": "NURS7400", "name": "Foundations of Chronic Disease Management and Palliative Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7400"}
+{"code": "NURS7401", "name": "Introduction to Nursing Practice in Chronic Disease Management and Palliative Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7401"}
+{"code": "NURS7402", "name": "Complex Supportive Care in Chronic Disease Management and Palliative Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7402"}
+{"code": "NURS7403", "name": "Clinical Practice in Chronic Disease Management & Palliative Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7403"}
+{"code": "NURS7500", "name": "Rural and Remote Nursing: Foundations of Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7500"}
+{"code": "NURS7501", "name": "Rural and Remote Nursing: Collaborative Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7501"}
+{"code": "NURS7502", "name": "Rural and Remote Nursing: High Acuity Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7502"}
+{"code": "NURS7503", "name": "Rural and Remote Nursing: Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7503"}
+{"code": "NURS7600", "name": "Foundations of Primary Health Care Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7600"}
+{"code": "NURS7601", "name": "Triage & Acute Care in the Primary Health Care Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7601"}
+{"code": "NURS7602", "name": "Primary Health Care, Nursing, Policy, Politics & Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7602"}
+{"code": "NURS7603", "name": "Chronic Disease Management in the Primary Health Care Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7603"}
+{"code": "NURS7700", "name": "Foundations of Gastroenterology Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7700"}
+{"code": "NURS7701", "name": "Gastroenterology Nursing Specialist Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7701"}
+{"code": "NURS7702", "name": "Advanced Gastroenterology Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7702"}
+{"code": "NURS7703", "name": "Complex Gastroenterology Nursing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7703"}
+{"code": "NURS7800", "name": "Issues in Aged Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7800"}
+{"code": "NURS7801", "name": "Clinical and Corporate Governance in Aged Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7801"}
+{"code": "NURS7802", "name": "Financial Management in Aged Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7802"}
+{"code": "NURS7803", "name": "Workforce Service and Management in Aged Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7803"}
+{"code": "NURS7900", "name": "Fundamentals of Paediatric/Neonatal Specialty Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7900"}
+{"code": "NURS7901", "name": "Identification and Care of the Deteriorating Paediatric/Neonatal Patient", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7901"}
+{"code": "NURS7902", "name": "Paediatric and Neonatal Advanced Practice Respiratory Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7902"}
+{"code": "NURS7903", "name": "Paediatric and Neonatal Cardiovascular and Specialty Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NURS7903"}
+{"code": "NUTR1023", "name": "Health & Fitness Through Diet & Exercise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR1023"}
+{"code": "NUTR2003", "name": "Nutrition in the Lifespan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR2003"}
+{"code": "NUTR2101", "name": "Nutrition Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR2101"}
+{"code": "NUTR2201", "name": "Advanced Topics in Nutrition Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR2201"}
+{"code": "NUTR3000", "name": "Nutrition & Exercise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3000"}
+{"code": "NUTR3001", "name": "Nutrition in Health & Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3001"}
+{"code": "NUTR3002", "name": "Nutrition, Food & Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3002"}
+{"code": "NUTR3003", "name": "Nutrition Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3003"}
+{"code": "NUTR3011", "name": "Understanding Population Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3011"}
+{"code": "NUTR3012", "name": "Community & Public Health Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3012"}
+{"code": "NUTR3201", "name": "Advanced Nutrition Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3201"}
+{"code": "NUTR3601", "name": "Special Topics in Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR3601"}
+{"code": "NUTR4000", "name": "Sports Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR4000"}
+{"code": "NUTR6001", "name": "Nutrition & Exercise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR6001"}
+{"code": "NUTR7001", "name": "Nutrition & Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7001"}
+{"code": "NUTR7002", "name": "Evidence in Public Health Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7002"}
+{"code": "NUTR7003", "name": "Nutrition Policies & Programs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7003"}
+{"code": "NUTR7005", "name": "Nutritional Epidemiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7005"}
+{"code": "NUTR7006", "name": "Special Topics in Public Health Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7006"}
+{"code": "NUTR7007", "name": "Nutrition & Pharmacy in Sports Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7007"}
+{"code": "NUTR7008", "name": "Nutrition in International Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7008"}
+{"code": "NUTR7009", "name": "Recovery & Nutrition for Elite Athlete", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=NUTR7009"}
+{"code": "OCTY1102", "name": "Introduction to Professional Skills in Occupational Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY1102"}
+{"code": "OCTY1105", "name": "Introduction to Occupation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY1105"}
+{"code": "OCTY1203", "name": "Occupational Performance Across the Lifespan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY1203"}
+{"code": "OCTY1205", "name": "Introduction to the Occupational Therapy Process", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY1205"}
+{"code": "OCTY2103", "name": "Promoting Participation through Occupation & the Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2103"}
+{"code": "OCTY2104", "name": "Occupational Therapy for Children & Youth I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2104"}
+{"code": "OCTY2105", "name": "Chronic Physical & Mental Health Conditions & Occupational Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2105"}
+{"code": "OCTY2106", "name": "The Societal Context of Occupation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2106"}
+{"code": "OCTY2207", "name": "Creating Inclusive Communities to Promote Occupational Performance & Participation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2207"}
+{"code": "OCTY2208", "name": "Occupational Therapy for Children & Youth II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2208"}
+{"code": "OCTY2209", "name": "Psychosocial Aspects of Occupational Therapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2209"}
+{"code": "OCTY2210", "name": "Occupational Performance & Participation for Adults with Acute & Chronic Medical Conditions.", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY2210"}
+{"code": "OCTY3102", "name": "Professional Practice Preparation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3102"}
+{"code": "OCTY3103", "name": "Promoting Occ Performance & Participation for Individuals with Complex Issues & Life Situations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3103"}
+{"code": "OCTY3104", "name": "Occupational Therapy Practice in Community Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3104"}
+{"code": "OCTY3136", "name": "The Occupational Therapy Practitioner", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3136"}
+{"code": "OCTY3140", "name": "Optimising Human Performance in the Home Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3140"}
+{"code": "OCTY3141", "name": "Application of Occupational Therapy Practice in Mental Health Settings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3141"}
+{"code": "OCTY3204", "name": "Clinical Reasoning & Reflective Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3204"}
+{"code": "OCTY3206", "name": "Occupational Therapy Clinical Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3206"}
+{"code": "OCTY3207", "name": "Occupational Therapy Clinical Practice II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3207"}
+{"code": "OCTY3208", "name": "Occupational Therapy Clinical Practice and Clinical Reasoning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY3208"}
+{"code": "OCTY4101", "name": "Advanced Clinical Reasoning & Reflective Practice for Pass Level Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4101"}
+{"code": "OCTY4102", "name": "Clinical Reasoning & Reflective Practice for Honours Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4102"}
+{"code": "OCTY4104", "name": "Advanced Occupational Therapy Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4104"}
+{"code": "OCTY4106", "name": "Occupational Therapy Practice: Academic Analysis & Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4106"}
+{"code": "OCTY4107", "name": "Advanced Occupational Therapy Clinical Practice & Reasoning for Honours Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4107"}
+{"code": "OCTY4120", "name": "Utilising Technology in Occupational Therapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4120"}
+{"code": "OCTY4205", "name": "Service Development through Action Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4205"}
+{"code": "OCTY4206", "name": "Professional Issues for New Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4206"}
+{"code": "OCTY4207", "name": "Social Change in Occupational Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4207"}
+{"code": "OCTY4208", "name": "Occupational Therapy Practice Specialisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4208"}
+{"code": "OCTY4236", "name": "Occupational Therapy Practice Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4236"}
+{"code": "OCTY4250", "name": "Work Injury and Disability Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY4250"}
+{"code": "OCTY7120", "name": "Utilising Technology Resources in Occupational Therapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7120"}
+{"code": "OCTY7140", "name": "Home Modification & Environmental Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7140"}
+{"code": "OCTY7809", "name": "Introduction to Occupational Therapy for Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7809"}
+{"code": "OCTY7810", "name": "Occupational Performance & Evaluation across the Lifespan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7810"}
+{"code": "OCTY7811", "name": "Human Anatomy & Occupation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7811"}
+{"code": "OCTY7815", "name": "Occupational Therapy Clinical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7815"}
+{"code": "OCTY7817", "name": "Occupational Therapy Clinical Reasoning & Reflective Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7817"}
+{"code": "OCTY7818", "name": "Advanced Occupational Therapy Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7818"}
+{"code": "OCTY7819", "name": "Professional Issues for New Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7819"}
+{"code": "OCTY7820", "name": "Occupational Therapy Service Development through Action Learning for Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7820"}
+{"code": "OCTY7821", "name": "Academic Analysis & Study for Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7821"}
+{"code": "OCTY7823", "name": "Promoting Participation through Occupation & the Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7823"}
+{"code": "OCTY7824", "name": "Occupational Therapy for Children & Youth I for Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7824"}
+{"code": "OCTY7825", "name": "Chronic Physical & Mental Health Conditions & Occupational Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7825"}
+{"code": "OCTY7826", "name": "Occupational Therapy for Children & Youth II for Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7826"}
+{"code": "OCTY7827", "name": "Psychosocial Aspects of Occupational Therapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7827"}
+{"code": "OCTY7828", "name": "Occupational Performance & Participation for Adults with Acute & Chronic Medical Conditions.", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7828"}
+{"code": "OCTY7829", "name": "Creating Inclusive Communities to Promote Occupational Performance & Participation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7829"}
+{"code": "OCTY7830", "name": "Social Change in Occupational Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7830"}
+{"code": "OCTY7831", "name": "Creating Inclusive Communities to Promote Occupational Performance & Participation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7831"}
+{"code": "OCTY7832", "name": "Advanced Occupational Therapy Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7832"}
+{"code": "OCTY7833", "name": "Advanced Occupational Therapy Clinical Practice and Reasoning for Research Stream Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7833"}
+{"code": "OCTY7834", "name": "Creating Inclusive Communities: OT Practices for Promoting Inclusion (of People with Disability)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7834"}
+{"code": "OCTY7835", "name": "Promoting Occupational Performance for People with Chronic Medical and Mental Health Conditions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7835"}
+{"code": "OCTY7836", "name": "Occupational Therapy Clinical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7836"}
+{"code": "OCTY7840", "name": "Occupational Therapy Practice Specialisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OCTY7840"}
+{"code": "OHSS1000", "name": "Introduction to Occupational Health & Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS1000"}
+{"code": "OHSS1100", "name": "Occupational Health and Safety: An Industry Perspective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS1100"}
+{"code": "OHSS2000", "name": "Occupational Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS2000"}
+{"code": "OHSS2001", "name": "Occupational Safety Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS2001"}
+{"code": "OHSS3000", "name": "Occupational Hygiene 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS3000"}
+{"code": "OHSS3001", "name": "Physical Ergonomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS3001"}
+{"code": "OHSS3002", "name": "Risk Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS3002"}
+{"code": "OHSS3003", "name": "Occupational Hygiene 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS3003"}
+{"code": "OHSS3004", "name": "Occupational Health & Safety Management Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS3004"}
+{"code": "OHSS3617", "name": "Ergonomics in Occupational Health & Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS3617"}
+{"code": "OHSS4000", "name": "Professional Practice & Emerging Issues in Occupational Health & Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS4000"}
+{"code": "OHSS4004", "name": "Research & Evaluation of Interventions in OHS", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS4004"}
+{"code": "OHSS4012", "name": "Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS4012"}
+{"code": "OHSS4014", "name": "Industry Research Project in Occupational Health and Safety Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS4014"}
+{"code": "OHSS6610", "name": "Ergonomics in Occupational Health & Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS6610"}
+{"code": "OHSS6612", "name": "Ergonomics Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS6612"}
+{"code": "OHSS6617", "name": "Principles of Occupational Health & Safety for Ergonomists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS6617"}
+{"code": "OHSS7000", "name": "Occupational Health and Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7000"}
+{"code": "OHSS7001", "name": "Occupational Safety Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7001"}
+{"code": "OHSS7002", "name": "Occupational Hygiene 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7002"}
+{"code": "OHSS7003", "name": "Occupational Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7003"}
+{"code": "OHSS7004", "name": "Occupational Hygiene 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7004"}
+{"code": "OHSS7005", "name": "Occupational Health & Safety Management Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7005"}
+{"code": "OHSS7006", "name": "Risk Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7006"}
+{"code": "OHSS7007", "name": "Physical Ergonomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7007"}
+{"code": "OHSS7008", "name": "Industry Research Project in Occupational Health and Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7008"}
+{"code": "OHSS7009", "name": "Professional Practice & Emerging Issues in Occupational Health and Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7009"}
+{"code": "OHSS7028", "name": "Industry Research Project in Occupational Health and Safety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7028"}
+{"code": "OHSS7612", "name": "Ergonomics Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7612"}
+{"code": "OHSS7613", "name": "Ergonomics Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7613"}
+{"code": "OHSS7614", "name": "Ergonomics Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7614"}
+{"code": "OHSS7615", "name": "Ergonomics Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7615"}
+{"code": "OHSS7616", "name": "Ergonomics Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7616"}
+{"code": "OHSS7617", "name": "Ergonomics Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=OHSS7617"}
+{"code": "ORAL1010", "name": "Biomedical Foundations of Oral Health I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL1010"}
+{"code": "ORAL1020", "name": "Oral Biosciences I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL1020"}
+{"code": "ORAL1030", "name": "Introduction to Clinical Practice I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL1030"}
+{"code": "ORAL1050", "name": "Oral Biosciences II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL1050"}
+{"code": "ORAL1060", "name": "Introduction to Clinical Practice II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL1060"}
+{"code": "ORAL2010", "name": "Community Oral Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL2010"}
+{"code": "ORAL2062", "name": "Advanced Biosciences for Oral Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL2062"}
+{"code": "ORAL2070", "name": "Essentials of Oral Health Therapy I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL2070"}
+{"code": "ORAL2080", "name": "Essentials of Oral Health Therapy II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL2080"}
+{"code": "ORAL3031", "name": "Dimensions of Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL3031"}
+{"code": "ORAL3070", "name": "Advanced Oral Health Therapy I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL3070"}
+{"code": "ORAL3080", "name": "Advanced Oral Health Therapy II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL3080"}
+{"code": "ORAL6010", "name": "Advanced Discipline Readings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL6010"}
+{"code": "ORAL6020", "name": "Oral Health Honours Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORAL6020"}
+{"code": "ORGC2601", "name": "Influence & Persuasion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORGC2601"}
+{"code": "ORGC2609", "name": "Communication, Change & Sustainability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORGC2609"}
+{"code": "ORGC2610", "name": "Corporate Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORGC2610"}
+{"code": "ORGC7610", "name": "Communication and Organisation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=ORGC7610"}
+{"code": "PARA3002", "name": "Biomedical Parasitology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PARA3002"}
+{"code": "PATH1000", "name": "Applied Pathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PATH1000"}
+{"code": "PCOL2000", "name": "Introduction to Basic and Clinical Pharmacology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PCOL2000"}
+{"code": "PHIL1002", "name": "Introduction to Philosophy: What is Philosophy?", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL1002"}
+{"code": "PHIL1010", "name": "Introductory Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL1010"}
+{"code": "PHIL1013", "name": "Introduction to Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL1013"}
+{"code": "PHIL1020", "name": "Introduction to Logic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL1020"}
+{"code": "PHIL1110", "name": "Critical Reasoning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL1110"}
+{"code": "PHIL2000", "name": "Epistemology & Metaphysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2000"}
+{"code": "PHIL2010", "name": "Representation & Reality: The Philosophy of Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2010"}
+{"code": "PHIL2011", "name": "Philosophy of Modern Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2011"}
+{"code": "PHIL2013", "name": "Rise of Modern Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2013"}
+{"code": "PHIL2020", "name": "Paradoxes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2020"}
+{"code": "PHIL2050", "name": "Mind and Cognition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2050"}
+{"code": "PHIL2090", "name": "Philosophy of Science: select topics in the foundations of scientific enquiry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2090"}
+{"code": "PHIL2110", "name": "Formal Logic: an introduction to classical formal logic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2110"}
+{"code": "PHIL2190", "name": "Feminist Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2190"}
+{"code": "PHIL2210", "name": "Environmental Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2210"}
+{"code": "PHIL2220", "name": "Kant & European Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2220"}
+{"code": "PHIL2300", "name": "Phenomenology & Existentialism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2300"}
+{"code": "PHIL2310", "name": "European Social Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2310"}
+{"code": "PHIL2330", "name": "Political Philosophy and Applied Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2330"}
+{"code": "PHIL2500", "name": "Philosophy & Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2500"}
+{"code": "PHIL2700", "name": "Philosophy and Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2700"}
+{"code": "PHIL2750", "name": "Economic Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL2750"}
+{"code": "PHIL3002", "name": "Philosophy Today", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL3002"}
+{"code": "PHIL3020", "name": "Philosophical Logic: Thinking about Logic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL3020"}
+{"code": "PHIL3110", "name": "Advanced Logic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL3110"}
+{"code": "PHIL3300", "name": "Special Topics in Philosophy A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL3300"}
+{"code": "PHIL3612", "name": "Advanced Topics in Metaphysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL3612"}
+{"code": "PHIL3620", "name": "Contemporary European Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL3620"}
+{"code": "PHIL3630", "name": "Advanced Topics in Moral & Political Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL3630"}
+{"code": "PHIL6004", "name": "Philosophy Honours Coursework 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL6004"}
+{"code": "PHIL6005", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL6005"}
+{"code": "PHIL6006", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL6006"}
+{"code": "PHIL6007", "name": "Philosophy Honours Seminar 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL6007"}
+{"code": "PHIL6008", "name": "Philosophy Honours Seminar 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL6008"}
+{"code": "PHIL7100", "name": "Introductory Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7100"}
+{"code": "PHIL7102", "name": "Introduction to Logic (Graduate)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7102"}
+{"code": "PHIL7111", "name": "Critical Reasoning (Graduate)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7111"}
+{"code": "PHIL7113", "name": "Introduction to Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7113"}
+{"code": "PHIL7121", "name": "Environment and Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7121"}
+{"code": "PHIL7140", "name": "Philosophy, Sexuality & Self", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7140"}
+{"code": "PHIL7200", "name": "Epistemology & Metaphysics (Graduate)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7200"}
+{"code": "PHIL7201", "name": "Representation & Reality: The Philosophy of Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7201"}
+{"code": "PHIL7202", "name": "Paradoxes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7202"}
+{"code": "PHIL7205", "name": "Consciousness, Rationality & the Emotions: The Philosophy of Mind", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7205"}
+{"code": "PHIL7207", "name": "Chance, Coincidence & Chaos", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7207"}
+{"code": "PHIL7210", "name": "Worlds, Possible & Impossible: An Introduction to Non-Classical Logic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7210"}
+{"code": "PHIL7213", "name": "The Nature of Moral Values", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7213"}
+{"code": "PHIL7214", "name": "Social Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7214"}
+{"code": "PHIL7215", "name": "Philosophy of the Life Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7215"}
+{"code": "PHIL7216", "name": "Advanced Topics in the Philosophy of Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7216"}
+{"code": "PHIL7218", "name": "The Rise of Modern Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7218"}
+{"code": "PHIL7219", "name": "Women,Reason,Desire: Feminisim &Western Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7219"}
+{"code": "PHIL7220", "name": "Time Travel", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7220"}
+{"code": "PHIL7221", "name": "Environmental Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7221"}
+{"code": "PHIL7222", "name": "Kant & European Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7222"}
+{"code": "PHIL7228", "name": "Bioethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7228"}
+{"code": "PHIL7230", "name": "Phenomenology & Existentialism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7230"}
+{"code": "PHIL7231", "name": "The Political in French Philosophy (Graduate)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7231"}
+{"code": "PHIL7233", "name": "Political Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7233"}
+{"code": "PHIL7234", "name": "Postmodernism & Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7234"}
+{"code": "PHIL7250", "name": "Philosophy & Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7250"}
+{"code": "PHIL7260", "name": "Greek Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7260"}
+{"code": "PHIL7275", "name": "Social & Economic Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7275"}
+{"code": "PHIL7285", "name": "Crime & Punishment: Issues in Legal Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7285"}
+{"code": "PHIL7330", "name": "Special Topic in Philosophy A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7330"}
+{"code": "PHIL7362", "name": "Contemporary European Philosophy (Graduate)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7362"}
+{"code": "PHIL7363", "name": "Advanced Topics in Moral and Political Philosophy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7363"}
+{"code": "PHIL7990", "name": "Masters Thesis I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7990"}
+{"code": "PHIL7991", "name": "Masters Thesis II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIL7991"}
+{"code": "PHIP7121", "name": "Drug Design and Formulation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7121"}
+{"code": "PHIP7122", "name": "Pre-clinical Drug Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7122"}
+{"code": "PHIP7141", "name": "Clinical Drug Development and Biometrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7141"}
+{"code": "PHIP7142", "name": "Post-registration Life Cycle Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7142"}
+{"code": "PHIP7161", "name": "Device Development, Drug Manufacturing, Regulatory Affairs and Governance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7161"}
+{"code": "PHIP7162", "name": "Project Management and Commercialisation in the Pharmaceutical Industry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7162"}
+{"code": "PHIP7201", "name": "Pharmaceutical Industry Placement I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7201"}
+{"code": "PHIP7202", "name": "Pharmaceutical Industry Placement II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7202"}
+{"code": "PHIP7280", "name": "Independent Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHIP7280"}
+{"code": "PHRM1011", "name": "Introductory Pharmacy 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM1011"}
+{"code": "PHRM1012", "name": "Introductory Pharmacy 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM1012"}
+{"code": "PHRM1020", "name": "Pharmacy - Data Analysis & Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM1020"}
+{"code": "PHRM2011", "name": "Quality Use of Medicines A1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2011"}
+{"code": "PHRM2012", "name": "Quality Use of Medicines A2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2012"}
+{"code": "PHRM2021", "name": "Dosage Form Design A1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2021"}
+{"code": "PHRM2022", "name": "Dosage Form Design A2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2022"}
+{"code": "PHRM2030", "name": "Social & Professional Aspects of Pharmacy A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2030"}
+{"code": "PHRM2040", "name": "Drug Discovery A1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2040"}
+{"code": "PHRM2041", "name": "Drug Discovery A2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2041"}
+{"code": "PHRM2050", "name": "Biological Fate of Drugs A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM2050"}
+{"code": "PHRM3011", "name": "Quality Use of Medicines B1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3011"}
+{"code": "PHRM3012", "name": "Quality Use of Medicines B2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3012"}
+{"code": "PHRM3021", "name": "Dosage Form Design B1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3021"}
+{"code": "PHRM3031", "name": "Social and Professional Aspects of Pharmacy B1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3031"}
+{"code": "PHRM3032", "name": "Social & Professional Aspects of Pharmacy B2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3032"}
+{"code": "PHRM3041", "name": "Drug Discovery B1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3041"}
+{"code": "PHRM3042", "name": "Pharmaceutical Discovery & Microbiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3042"}
+{"code": "PHRM3052", "name": "Biological Fate of Drugs B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM3052"}
+{"code": "PHRM4011", "name": "Integrated Patient Centred Care 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4011"}
+{"code": "PHRM4012", "name": "Integrated Patient Centred Care 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4012"}
+{"code": "PHRM4021", "name": "Integrated Pharmaceutical Development 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4021"}
+{"code": "PHRM4022", "name": "Integrated Pharmaceutical Development 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4022"}
+{"code": "PHRM4031", "name": "The Business of Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4031"}
+{"code": "PHRM4061", "name": "QUM Research Focussed Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4061"}
+{"code": "PHRM4062", "name": "QUM Pharmacy Practice Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4062"}
+{"code": "PHRM4080", "name": "Independent Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM4080"}
+{"code": "PHRM7001", "name": "Quality Use of Medicines, Drug Pharmacokinetics and Drug Pharmacodynamics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7001"}
+{"code": "PHRM7010", "name": "Advanced Skills for Clinical Pharmacy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7010"}
+{"code": "PHRM7021", "name": "Evaluation and Research in Pharmacy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7021"}
+{"code": "PHRM7030", "name": "Pharmacotherapy in Patient Care I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7030"}
+{"code": "PHRM7031", "name": "Pharmacotherapy in Patient Care A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7031"}
+{"code": "PHRM7032", "name": "Pharmacotherapy in Patient Care B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7032"}
+{"code": "PHRM7033", "name": "Pharmacotherapy in Patient Care C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7033"}
+{"code": "PHRM7040", "name": "Pharmacists in the Modern Health System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7040"}
+{"code": "PHRM7051", "name": "Leading and Managing the Future in Pharmacy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7051"}
+{"code": "PHRM7060", "name": "Pharmacotherapy in Patient Care II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7060"}
+{"code": "PHRM7071", "name": "Masters Research Project (P/T)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7071"}
+{"code": "PHRM7072", "name": "Masters Research Project (P/T)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7072"}
+{"code": "PHRM7081", "name": "Applied Pharmacy Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7081"}
+{"code": "PHRM7082", "name": "Applied Pharmacy Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7082"}
+{"code": "PHRM7091", "name": "Patient Focused Quality Use of Medicines 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7091"}
+{"code": "PHRM7092", "name": "Patient Focused Quality Use of Medicines 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7092"}
+{"code": "PHRM7095", "name": "Advanced Practice Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM7095"}
+{"code": "PHRM8010", "name": "Master of Clinical Pharmacy Placements", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM8010"}
+{"code": "PHRM8021", "name": "Doctorate Research Project (P/T)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHRM8021"}
+{"code": "PHSS2000", "name": "Practical Employability Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHSS2000"}
+{"code": "PHTY1110", "name": "Physiotherapy Foundations I: Physiotherapy Profession & Basic Processes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY1110"}
+{"code": "PHTY1200", "name": "Introduction to Principles of Physiotherapy Assessment and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY1200"}
+{"code": "PHTY1221", "name": "Principles of Exercise in Physiotherapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY1221"}
+{"code": "PHTY2101", "name": "Foundations of Physiotherapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY2101"}
+{"code": "PHTY2110", "name": "Physiotherapy Specialities: Musculoskeletal IA (Lower Limb)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY2110"}
+{"code": "PHTY2210", "name": "Physiotherapy Specialities: Musculoskeletal B (Upper Limb)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY2210"}
+{"code": "PHTY2220", "name": "Physiotherapy Specialities: Musculoskeletal IB (Lumbar Spine & Pelvis)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY2220"}
+{"code": "PHTY2230", "name": "Physiotherapy across the Lifespan A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY2230"}
+{"code": "PHTY2240", "name": "Physiotherapy Foundations II: Physiotherapy Practice and Modalities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY2240"}
+{"code": "PHTY3120", "name": "Physiotherapy Specialities: Musculoskeletal IIA (Upper Limb)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY3120"}
+{"code": "PHTY3130", "name": "Physiotherapy Across the Lifespan B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY3130"}
+{"code": "PHTY3140", "name": "Physiotherapy Specialities: Neurology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY3140"}
+{"code": "PHTY3250", "name": "Physiotherapy Specialities: Cardiothoracics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY3250"}
+{"code": "PHTY3260", "name": "Physiotherapy Specialties: Musculoskeletal IIB (Cervical and Thoracic Spine)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY3260"}
+{"code": "PHTY3280", "name": "Health Promotion, Participation and Preparation for Physiotherapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY3280"}
+{"code": "PHTY4301", "name": "Physiotherapy Professional Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4301"}
+{"code": "PHTY4302", "name": "Physiotherapy Professional Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4302"}
+{"code": "PHTY4303", "name": "Physiotherapy Professional Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4303"}
+{"code": "PHTY4304", "name": "Physiotherapy Professional Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4304"}
+{"code": "PHTY4305", "name": "Physiotherapy Professional Practice (Hons)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4305"}
+{"code": "PHTY4401", "name": "Professional Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4401"}
+{"code": "PHTY4402", "name": "Professional Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4402"}
+{"code": "PHTY4403", "name": "Professional Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4403"}
+{"code": "PHTY4404", "name": "Professional Practice 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4404"}
+{"code": "PHTY4405", "name": "Professional Practice 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4405"}
+{"code": "PHTY4406", "name": "Professional Practice 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4406"}
+{"code": "PHTY4407", "name": "Integrative Professional Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4407"}
+{"code": "PHTY4408", "name": "Integrative Professional Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4408"}
+{"code": "PHTY4409", "name": "Professional Practice 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY4409"}
+{"code": "PHTY7018", "name": "Directed Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7018"}
+{"code": "PHTY7101", "name": "Advanced Studies in the Basic, Behavioural & Medical Sciences A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7101"}
+{"code": "PHTY7102", "name": "Advanced Studies in the Basic, Behavioural & Medical Sciences B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7102"}
+{"code": "PHTY7103", "name": "Theory & Practice of Musculoskeletal Physiotherapy A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7103"}
+{"code": "PHTY7106", "name": "Theory & Practice of Musculoskeletal Physiotherapy B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7106"}
+{"code": "PHTY7111", "name": "The Scientific Basis of Advanced Therapeutic Exercise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7111"}
+{"code": "PHTY7201", "name": "Science of Physiotherapy Practice in Ageing & Neurology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7201"}
+{"code": "PHTY7203", "name": "Applied Physiotherapy Procedures for Neurological & Ageing Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7203"}
+{"code": "PHTY7205", "name": "Applied Physiotherapy Practice in Neurology & Geriatrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7205"}
+{"code": "PHTY7207", "name": "Advanced Physiotherapy Practice in Geriatrics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7207"}
+{"code": "PHTY7280", "name": "Health Promotion, Participation and Preparation for Physiotherapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7280"}
+{"code": "PHTY7303", "name": "Theory & Practice of Sports Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7303"}
+{"code": "PHTY7305", "name": "Advanced Studies in Sports Science for Sports Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7305"}
+{"code": "PHTY7602", "name": "Motor Learning in Children with Motor Dysfunction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7602"}
+{"code": "PHTY7606", "name": "Advanced Studies in Physiotherapy Management of Children", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7606"}
+{"code": "PHTY7802", "name": "Foundations of Physiotherapy I: Fundamentals of Communication, Movement & Exercise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7802"}
+{"code": "PHTY7803", "name": "Foundations of Physiotherapy II: Fundamentals of Examination & Measurement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7803"}
+{"code": "PHTY7811", "name": "Theory, Practice & Research: Musculoskeletal Phty - Lower Limb", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7811"}
+{"code": "PHTY7812", "name": "Theory, Practice & Research: Musculoskeletal Phty - Lumbar Spine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7812"}
+{"code": "PHTY7813", "name": "Theory, Practice & Research: Phty across the Lifespan 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7813"}
+{"code": "PHTY7814", "name": "Theory, Practice & Research: Neurological Phty", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7814"}
+{"code": "PHTY7815", "name": "Foundations of Physiotherapy III: Practice & Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7815"}
+{"code": "PHTY7821", "name": "Theory, Practice & Research: Musculoskeletal Phty - Upper Limb", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7821"}
+{"code": "PHTY7822", "name": "Theory, Practice & Research: Musculoskeletal Phty - Cervical & Thoracic Spine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7822"}
+{"code": "PHTY7823", "name": "Practice & Research in Physiotherapy Across the Lifespan 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7823"}
+{"code": "PHTY7825", "name": "Theory, Practice & Research: Cardiothoracic Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7825"}
+{"code": "PHTY7881", "name": "Clinical Practice & Professional Studies - Intro Musculoskeletal & Acute Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7881"}
+{"code": "PHTY7882", "name": "Clinical Practice & Professional Issues 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7882"}
+{"code": "PHTY7883", "name": "Clinical Practice & Professional Issues 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7883"}
+{"code": "PHTY7884", "name": "Clinical Practice & Professional Issues 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7884"}
+{"code": "PHTY7887", "name": "Clinical Practice & Professional Issues 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7887"}
+{"code": "PHTY7888", "name": "Clinical Practice & Professional Issues 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7888"}
+{"code": "PHTY7889", "name": "Integrative Practice and Professional Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7889"}
+{"code": "PHTY7901", "name": "Integrated sciences & evidence based musculoskeletal physiotherapy for head, neck & thorax", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7901"}
+{"code": "PHTY7902", "name": "Integrated sciences & evidence based musculoskeletal physiotherapy for upper limb", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7902"}
+{"code": "PHTY7903", "name": "Integrated sciences & evidence based musculoskeletal physiotherapy for the back & pelvis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7903"}
+{"code": "PHTY7904", "name": "Integrated sciences & evidence based musculoskeletal physiotherapy for the lower limb", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7904"}
+{"code": "PHTY7911", "name": "Advanced musculoskeletal physiotherapy clinical practice skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7911"}
+{"code": "PHTY7923", "name": "Research & evidence based practice in advanced sports physiotherapy clinical practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7923"}
+{"code": "PHTY7931", "name": "Clinical Reasoning in an Evidence Based Practice Paradigm", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7931"}
+{"code": "PHTY7932", "name": "Pain, Disability and the Biopsychosocial Model in Musculoskeletal and Sports Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7932"}
+{"code": "PHTY7933", "name": "Clinical Reasoning and the Biomedical Model in Musculoskeletal and Sports Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7933"}
+{"code": "PHTY7934", "name": "Exercise is Musculoskeletal and Sport Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7934"}
+{"code": "PHTY7941", "name": "Advanced Musculoskeletal Physiotherapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7941"}
+{"code": "PHTY7942", "name": "Advanced Musculoskeletal Physiotherapy Clinical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7942"}
+{"code": "PHTY7943", "name": "Clinical Practicum in Advanced Musculoskeletal Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7943"}
+{"code": "PHTY7944", "name": "Sports Physiotherapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7944"}
+{"code": "PHTY7945", "name": "Sports Physiotherapy Clinical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7945"}
+{"code": "PHTY7946", "name": "Clinical Practicum in Sports Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7946"}
+{"code": "PHTY7947", "name": "Research in Sports and Musculoskeletal Physiotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHTY7947"}
+{"code": "PHYL1007", "name": "Physiology for Human Movement Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL1007"}
+{"code": "PHYL2062", "name": "Physiology I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL2062"}
+{"code": "PHYL2063", "name": "Physiology I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL2063"}
+{"code": "PHYL2064", "name": "Physiology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL2064"}
+{"code": "PHYL2065", "name": "Physiology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL2065"}
+{"code": "PHYL2066", "name": "Human Function in Health & Disease A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL2066"}
+{"code": "PHYL2067", "name": "Human Function in Health & Disease B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL2067"}
+{"code": "PHYL2730", "name": "Exercise Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL2730"}
+{"code": "PHYL3732", "name": "Advanced Exercise Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL3732"}
+{"code": "PHYL6000", "name": "Sport Science (Anatomy, Biomechanics, Physiology)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL6000"}
+{"code": "PHYL6600", "name": "Exercise Physiology in Sport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL6600"}
+{"code": "PHYL6733", "name": "Advanced Exercise Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL6733"}
+{"code": "PHYL7730", "name": "Exercise Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYL7730"}
+{"code": "PHYS1001", "name": "Mechanics & Thermal Physics I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS1001"}
+{"code": "PHYS1002", "name": "Electromagnetism and Modern Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS1002"}
+{"code": "PHYS1171", "name": "Physical Basis of Biological Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS1171"}
+{"code": "PHYS2020", "name": "Thermodynamics & Condensed Matter Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS2020"}
+{"code": "PHYS2041", "name": "Introduction to Quantum Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS2041"}
+{"code": "PHYS2055", "name": "Introduction to Fields in Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS2055"}
+{"code": "PHYS2082", "name": "Space Science & Stellar Astrophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS2082"}
+{"code": "PHYS2100", "name": "Dynamics, Chaos & Special Relativity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS2100"}
+{"code": "PHYS2101", "name": "Advanced Dynamics and Special Relativity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS2101"}
+{"code": "PHYS2810", "name": "Electronics & Circuit Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS2810"}
+{"code": "PHYS3020", "name": "Statistical Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3020"}
+{"code": "PHYS3040", "name": "Quantum Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3040"}
+{"code": "PHYS3051", "name": "Fields in Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3051"}
+{"code": "PHYS3071", "name": "Computational Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3071"}
+{"code": "PHYS3080", "name": "Extragalactic Astrophysics & Cosmology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3080"}
+{"code": "PHYS3825", "name": "Advanced Experimental Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3825"}
+{"code": "PHYS3900", "name": "Perspectives in Physics Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3900"}
+{"code": "PHYS3901", "name": "Advanced Physics Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS3901"}
+{"code": "PHYS4030", "name": "Condensed Matter Physics: Electronic properties of crystals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS4030"}
+{"code": "PHYS4040", "name": "Advanced Quantum Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS4040"}
+{"code": "PHYS4055", "name": "Laser Physics & Quantum Optics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS4055"}
+{"code": "PHYS4070", "name": "Advanced Computational Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS4070"}
+{"code": "PHYS4080", "name": "Frontiers in Astrophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS4080"}
+{"code": "PHYS6004", "name": "Special Topics in Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS6004"}
+{"code": "PHYS6487", "name": "Physics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS6487"}
+{"code": "PHYS6488", "name": "Physics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS6488"}
+{"code": "PHYS6500", "name": "Advanced Research Literature Review", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS6500"}
+{"code": "PHYS6502", "name": "Advanced Physics Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS6502"}
+{"code": "PHYS6504", "name": "Advanced Physics Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS6504"}
+{"code": "PHYS7002", "name": "Special Topics in Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7002"}
+{"code": "PHYS7004", "name": "Special Topics in Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7004"}
+{"code": "PHYS7021", "name": "Statistical Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7021"}
+{"code": "PHYS7033", "name": "Condensed Matter Physics: Electronic properties of crystals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7033"}
+{"code": "PHYS7042", "name": "Quantum Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7042"}
+{"code": "PHYS7045", "name": "Quantum Technologies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7045"}
+{"code": "PHYS7055", "name": "Laser Physics & Quantum Optics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7055"}
+{"code": "PHYS7073", "name": "Computational Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7073"}
+{"code": "PHYS7080", "name": "Extragalactic Astrophysics & Cosmology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7080"}
+{"code": "PHYS7120", "name": "Thermodynamics & Condensed Matter Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7120"}
+{"code": "PHYS7141", "name": "Introduction to Quantum Mechanics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7141"}
+{"code": "PHYS7155", "name": "Introduction to Fields in Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7155"}
+{"code": "PHYS7200", "name": "Dynamics, Chaos & Special Relativity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7200"}
+{"code": "PHYS7241", "name": "Advanced Quantum Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7241"}
+{"code": "PHYS7250", "name": "Fields in Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7250"}
+{"code": "PHYS7270", "name": "Advanced Computational Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7270"}
+{"code": "PHYS7280", "name": "Frontiers in Astrophysics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7280"}
+{"code": "PHYS7712", "name": "Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7712"}
+{"code": "PHYS7713", "name": "Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7713"}
+{"code": "PHYS7714", "name": "Project C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7714"}
+{"code": "PHYS7722", "name": "Research Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7722"}
+{"code": "PHYS7723", "name": "Research Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7723"}
+{"code": "PHYS7730", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7730"}
+{"code": "PHYS7731", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7731"}
+{"code": "PHYS7732", "name": "Advanced Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7732"}
+{"code": "PHYS7743", "name": "Extended Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7743"}
+{"code": "PHYS7744", "name": "Extended Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7744"}
+{"code": "PHYS7745", "name": "Extended Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7745"}
+{"code": "PHYS7825", "name": "Advanced Experimental Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7825"}
+{"code": "PHYS7900", "name": "Perspectives in Physics Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PHYS7900"}
+{"code": "PLAN1000", "name": "The Planning Challenge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN1000"}
+{"code": "PLAN1001", "name": "Introduction to Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN1001"}
+{"code": "PLAN1100", "name": "Foundational Ideas for Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN1100"}
+{"code": "PLAN1101", "name": "Teamwork and Negotiation for Planners", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN1101"}
+{"code": "PLAN2000", "name": "Urban Design Studio", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN2000"}
+{"code": "PLAN2003", "name": "Urban Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN2003"}
+{"code": "PLAN2005", "name": "History of the Built Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN2005"}
+{"code": "PLAN2100", "name": "Transport Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN2100"}
+{"code": "PLAN3000", "name": "Plan Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN3000"}
+{"code": "PLAN3001", "name": "Applied Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN3001"}
+{"code": "PLAN3005", "name": "Community Planning & Participation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN3005"}
+{"code": "PLAN3200", "name": "International Field Course: Exploring Development Complexities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN3200"}
+{"code": "PLAN3202", "name": "Property Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN3202"}
+{"code": "PLAN4001", "name": "Planning Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN4001"}
+{"code": "PLAN4008", "name": "Planning Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN4008"}
+{"code": "PLAN4010", "name": "Research Topic (Planning)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN4010"}
+{"code": "PLAN4100", "name": "Advanced Planning Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN4100"}
+{"code": "PLAN4130", "name": "Professional Planning Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN4130"}
+{"code": "PLAN7010", "name": "Planning Research Topic", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7010"}
+{"code": "PLAN7113", "name": "Urban Research & Evaluation Techniques", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7113"}
+{"code": "PLAN7116", "name": "Transport Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7116"}
+{"code": "PLAN7120", "name": "Planning Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7120"}
+{"code": "PLAN7121", "name": "Community Planning & Participation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7121"}
+{"code": "PLAN7122", "name": "Urban Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7122"}
+{"code": "PLAN7124", "name": "Strategic Metropolitan Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7124"}
+{"code": "PLAN7126", "name": "Plan Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7126"}
+{"code": "PLAN7130", "name": "Planning Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7130"}
+{"code": "PLAN7200", "name": "International Field Course: Understanding Development Complexities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7200"}
+{"code": "PLAN7202", "name": "Property Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7202"}
+{"code": "PLAN7400", "name": "Research Project (Planning)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7400"}
+{"code": "PLAN7410", "name": "Research Project (Planning)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7410"}
+{"code": "PLAN7420", "name": "Research Project (Planning)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7420"}
+{"code": "PLAN7430", "name": "Research Project (Planning)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7430"}
+{"code": "PLAN7440", "name": "Research Project (Planning)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7440"}
+{"code": "PLAN7510", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7510"}
+{"code": "PLAN7520", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7520"}
+{"code": "PLAN7530", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7530"}
+{"code": "PLAN7540", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7540"}
+{"code": "PLAN7612", "name": "Global South Cities: Development planning theory and practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7612"}
+{"code": "PLAN7615", "name": "Global Metropolis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7615"}
+{"code": "PLAN7638", "name": "Assessment of Development Projects", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7638"}
+{"code": "PLAN7900", "name": "Industry Mentored Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7900"}
+{"code": "PLAN7901", "name": "Principles of Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7901"}
+{"code": "PLAN7902", "name": "Applications of Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLAN7902"}
+{"code": "PLNT2002", "name": "Plant Physiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT2002"}
+{"code": "PLNT2011", "name": "Plant and Environmental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT2011"}
+{"code": "PLNT3009", "name": "Plant Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT3009"}
+{"code": "PLNT3012", "name": "Weed Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT3012"}
+{"code": "PLNT3017", "name": "Plant and Environmental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT3017"}
+{"code": "PLNT6894", "name": "Principles of Weed Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT6894"}
+{"code": "PLNT7005", "name": "Plant Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT7005"}
+{"code": "PLNT7014", "name": "Principles of Integrated Plant Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PLNT7014"}
+{"code": "PMDC1101", "name": "Public Health for Paramedics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC1101"}
+{"code": "PMDC1102", "name": "Preparation for Paramedic Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC1102"}
+{"code": "PMDC1202", "name": "Preparation for Paramedic Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC1202"}
+{"code": "PMDC1303", "name": "Paramedic Clinical Placement 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC1303"}
+{"code": "PMDC2100", "name": "Paramedic Clinical Skills 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC2100"}
+{"code": "PMDC2101", "name": "Cardiovascular Conditions & Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC2101"}
+{"code": "PMDC2102", "name": "Respiratory Conditions and Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC2102"}
+{"code": "PMDC2200", "name": "Paramedic Clinical Skills 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC2200"}
+{"code": "PMDC2201", "name": "Trauma & Environmental Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC2201"}
+{"code": "PMDC2202", "name": "Behavioural Conditions & Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC2202"}
+{"code": "PMDC2203", "name": "Paramedic Clinical Placement 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC2203"}
+{"code": "PMDC3101", "name": "Obstetric & Gynaecological Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC3101"}
+{"code": "PMDC3102", "name": "Multispeciality Conditions & Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC3102"}
+{"code": "PMDC3103", "name": "Paramedic Clinical Placement 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC3103"}
+{"code": "PMDC3201", "name": "Paediatric Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC3201"}
+{"code": "PMDC3202", "name": "Preparation for Paramedic Practice 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC3202"}
+{"code": "PMDC3203", "name": "Paramedic Clinical Placement 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PMDC3203"}
+{"code": "POLS1000", "name": "Politics and Social Policy in Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1000"}
+{"code": "POLS1101", "name": "Introduction to Australian Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1101"}
+{"code": "POLS1102", "name": "Introduction to Politics & Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1102"}
+{"code": "POLS1201", "name": "Introduction to International Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1201"}
+{"code": "POLS1301", "name": "Introduction to Political Ideas", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1301"}
+{"code": "POLS1501", "name": "Introduction to Peace & Conflict Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1501"}
+{"code": "POLS1601", "name": "Power, Politics & Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1601"}
+{"code": "POLS1701", "name": "Introduction to International Inequality & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1701"}
+{"code": "POLS1901D", "name": "Introduction to Politics, Business & Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS1901D"}
+{"code": "POLS2101", "name": "Indigenous Politics & Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2101"}
+{"code": "POLS2201", "name": "Australian Foreign Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2201"}
+{"code": "POLS2204", "name": "International Relations of East Asia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2204"}
+{"code": "POLS2207", "name": "Terrorism & Insurgency in World Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2207"}
+{"code": "POLS2209", "name": "Global Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2209"}
+{"code": "POLS2211", "name": "International Organisations & Political Cooperation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2211"}
+{"code": "POLS2217", "name": "European Political Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2217"}
+{"code": "POLS2222", "name": "Humanitarianism in World Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2222"}
+{"code": "POLS2224", "name": "Culture and World Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2224"}
+{"code": "POLS2302", "name": "Political Thought: Machiavelli to Modernity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2302"}
+{"code": "POLS2401", "name": "Politics & the Economy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2401"}
+{"code": "POLS2402", "name": "Globalisation & International Political Economy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2402"}
+{"code": "POLS2404", "name": "The Political Dynamics of Development and Resistance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2404"}
+{"code": "POLS2409", "name": "International Relations of the Twentieth Century", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2409"}
+{"code": "POLS2503", "name": "Conflict & Nonviolent Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2503"}
+{"code": "POLS2515", "name": "Theories of Peace and Conflict Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2515"}
+{"code": "POLS2603", "name": "Gender and Global Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2603"}
+{"code": "POLS2703", "name": "Principles of Research: Social and Comparative Perspectives", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2703"}
+{"code": "POLS2805", "name": "Advanced Topics in Political Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS2805"}
+{"code": "POLS3102", "name": "Governance & Australian Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3102"}
+{"code": "POLS3115", "name": "Environmental Politics & Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3115"}
+{"code": "POLS3118", "name": "Advances in Political Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3118"}
+{"code": "POLS3203", "name": "Power and Order in Transnational Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3203"}
+{"code": "POLS3206", "name": "Policy Challenges of Asia-Pacific Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3206"}
+{"code": "POLS3208", "name": "Conceptions of World Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3208"}
+{"code": "POLS3502", "name": "Ethics in International Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3502"}
+{"code": "POLS3511", "name": "The Politics of Peacebuilding", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3511"}
+{"code": "POLS3512", "name": "Global Media, War and Peace", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3512"}
+{"code": "POLS3801", "name": "Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3801"}
+{"code": "POLS3802", "name": "Independent Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3802"}
+{"code": "POLS3803", "name": "Landmarks of Political Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3803"}
+{"code": "POLS3807", "name": "Policy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS3807"}
+{"code": "POLS6301", "name": "Honours Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6301"}
+{"code": "POLS6305", "name": "Honours Research Thesis Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6305"}
+{"code": "POLS6306", "name": "Honours Research Thesis Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6306"}
+{"code": "POLS6312", "name": "Knowledge, Power and Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6312"}
+{"code": "POLS6315", "name": "Creativity and Design in Political Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6315"}
+{"code": "POLS6316", "name": "Creativity and Design in Political Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6316"}
+{"code": "POLS6325", "name": "Frontiers of Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6325"}
+{"code": "POLS6326", "name": "Frontiers of Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS6326"}
+{"code": "POLS7000", "name": "Writing Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7000"}
+{"code": "POLS7012", "name": "Foundations in Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7012"}
+{"code": "POLS7013", "name": "Foundations in Political Ideas", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7013"}
+{"code": "POLS7100", "name": "Overview of Australian Political Institutions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7100"}
+{"code": "POLS7101", "name": "Dynamics of Governance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7101"}
+{"code": "POLS7107", "name": "Globalisation, International Political Economy and Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7107"}
+{"code": "POLS7108", "name": "Independent Study (Master of Governance and Public Policy)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7108"}
+{"code": "POLS7110", "name": "Law, Policy and Governance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7110"}
+{"code": "POLS7111", "name": "Dynamics of Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7111"}
+{"code": "POLS7112", "name": "Overview of Policy Knowledge", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7112"}
+{"code": "POLS7113", "name": "Comparative Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7113"}
+{"code": "POLS7114", "name": "Knowledge and Evidence in Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7114"}
+{"code": "POLS7115", "name": "Politics of Environmental Change", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7115"}
+{"code": "POLS7118", "name": "Special Studies Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7118"}
+{"code": "POLS7120", "name": "Research Project (MGPP)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7120"}
+{"code": "POLS7121", "name": "Research Project (MGPP) Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7121"}
+{"code": "POLS7122", "name": "Research Project (MGPP) Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7122"}
+{"code": "POLS7125", "name": "Internship (Master of Governance and Public Policy)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7125"}
+{"code": "POLS7190", "name": "Indigenous Politics within and beyond the state", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7190"}
+{"code": "POLS7207", "name": "Independent Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7207"}
+{"code": "POLS7208", "name": "International Relations of the Asia- Pacific", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7208"}
+{"code": "POLS7211", "name": "International Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7211"}
+{"code": "POLS7216", "name": "Evolution of the International System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7216"}
+{"code": "POLS7218", "name": "Specialist Studies in International Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7218"}
+{"code": "POLS7220", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7220"}
+{"code": "POLS7223", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7223"}
+{"code": "POLS7224", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7224"}
+{"code": "POLS7225", "name": "Foreign Policy and Diplomacy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7225"}
+{"code": "POLS7226", "name": "New Security Challenges", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7226"}
+{"code": "POLS7227", "name": "Critical Security Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7227"}
+{"code": "POLS7228", "name": "Strategic Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7228"}
+{"code": "POLS7229", "name": "Global Governance: Origins, Challenges and Trajectories", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7229"}
+{"code": "POLS7230", "name": "Diplomacy in the Global Order", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7230"}
+{"code": "POLS7232", "name": "Humanitarian Emergencies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7232"}
+{"code": "POLS7251", "name": "Theories in International Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7251"}
+{"code": "POLS7253", "name": "Power and Order in Transnational Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7253"}
+{"code": "POLS7258", "name": "Foundations in International Relations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7258"}
+{"code": "POLS7260", "name": "Politics of International Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7260"}
+{"code": "POLS7302", "name": "Politics of Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7302"}
+{"code": "POLS7306", "name": "International Crisis Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7306"}
+{"code": "POLS7311", "name": "Diplomacy and Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7311"}
+{"code": "POLS7325", "name": "Security and Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7325"}
+{"code": "POLS7406", "name": "Economic Analysis & Public Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7406"}
+{"code": "POLS7408", "name": "International Political Economy of the Asia Pacific", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7408"}
+{"code": "POLS7409", "name": "Governance and Regionalism in the Asia Pacific", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7409"}
+{"code": "POLS7502", "name": "Conflict Resolution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7502"}
+{"code": "POLS7503", "name": "Ethics and Human Rights", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7503"}
+{"code": "POLS7504", "name": "Contemporary Peacekeeping", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7504"}
+{"code": "POLS7505", "name": "Peacebuilding", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7505"}
+{"code": "POLS7506", "name": "Arms Control & Disarmament", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7506"}
+{"code": "POLS7509", "name": "Gender and the Global Politics of Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7509"}
+{"code": "POLS7511", "name": "Diplomacy & Conflict Mediation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7511"}
+{"code": "POLS7512", "name": "Contested Peace: Critical Concepts in Peace and Conflict Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7512"}
+{"code": "POLS7514", "name": "The Politics and Power of Nonviolence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7514"}
+{"code": "POLS7515", "name": "Hybridity, Local Peace and Governance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7515"}
+{"code": "POLS7518", "name": "Specialist Studies in Peace and Conflict", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7518"}
+{"code": "POLS7521", "name": "Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7521"}
+{"code": "POLS7523", "name": "Gender, Peace and Security in Global and Local Perspective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7523"}
+{"code": "POLS7524", "name": "Preventing Sexual and Gender Based Violence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7524"}
+{"code": "POLS7530", "name": "Preventing War Crimes and Atrocities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7530"}
+{"code": "POLS7551", "name": "Studying Peace and Conflict", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7551"}
+{"code": "POLS7701", "name": "Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7701"}
+{"code": "POLS7704", "name": "Research Report", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7704"}
+{"code": "POLS7705", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7705"}
+{"code": "POLS7706", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7706"}
+{"code": "POLS7707", "name": "Final Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7707"}
+{"code": "POLS7712", "name": "Knowledge Power and Politics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLS7712"}
+{"code": "POLY1000", "name": "Australian Social Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLY1000"}
+{"code": "POLY2000", "name": "Australian Social Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLY2000"}
+{"code": "POLY2001", "name": "Health Care Policy in Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLY2001"}
+{"code": "POLY3000", "name": "Policy Development and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLY3000"}
+{"code": "POLY7002", "name": "Policy Development and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=POLY7002"}
+{"code": "PPES1101", "name": "Politics, Philosophy, Economics 1: A Short History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PPES1101"}
+{"code": "PPES2101", "name": "Politics, Philosophy, Economics 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PPES2101"}
+{"code": "PPES3101", "name": "Politics, Philosophy, Economics 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PPES3101"}
+{"code": "PPES4101", "name": "Politics, Philosophy, Economics 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PPES4101"}
+{"code": "PPES4201", "name": "Team Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PPES4201"}
+{"code": "PPES4202", "name": "PPE Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PPES4202"}
+{"code": "PPES4999", "name": "Professional Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PPES4999"}
+{"code": "PSYC1020", "name": "Introduction to Psychology: Minds, Brains and Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC1020"}
+{"code": "PSYC1030", "name": "Introduction to Psychology: Developmental, Social & Clinical Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC1030"}
+{"code": "PSYC1040", "name": "Psychological Research Methodology I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC1040"}
+{"code": "PSYC2000", "name": "Psychology of Sport and Exercise", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2000"}
+{"code": "PSYC2010", "name": "Psychological Research Methodology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2010"}
+{"code": "PSYC2020", "name": "Neuroscience for Psychologists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2020"}
+{"code": "PSYC2030", "name": "Developmental Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2030"}
+{"code": "PSYC2040", "name": "Social & Organisational Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2040"}
+{"code": "PSYC2050", "name": "Learning & Cognition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2050"}
+{"code": "PSYC2063", "name": "Psychological Approaches to Complex Problems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2063"}
+{"code": "PSYC2311", "name": "Developmental Disorders of Childhood", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2311"}
+{"code": "PSYC2341", "name": "Psychological Problems of Adolescence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2341"}
+{"code": "PSYC2361", "name": "Psychology of Criminal Justice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2361"}
+{"code": "PSYC2371", "name": "The Science of Everyday Thinking", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2371"}
+{"code": "PSYC2381", "name": "Positive Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2381"}
+{"code": "PSYC2991", "name": "Research Experience I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2991"}
+{"code": "PSYC2992", "name": "Research Experience II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC2992"}
+{"code": "PSYC3000", "name": "Applied Sport and Exercise Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3000"}
+{"code": "PSYC3010", "name": "Psychological Research Methodology III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3010"}
+{"code": "PSYC3020", "name": "Measurement in Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3020"}
+{"code": "PSYC3032", "name": "Topics in Social Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3032"}
+{"code": "PSYC3034", "name": "Topics in Applied Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3034"}
+{"code": "PSYC3042", "name": "Psychological Research: Interpretation & Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3042"}
+{"code": "PSYC3052", "name": "Judgment & Decision-Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3052"}
+{"code": "PSYC3062", "name": "Introduction to Human Factors", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3062"}
+{"code": "PSYC3082", "name": "Psychotherapies and Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3082"}
+{"code": "PSYC3092", "name": "Language Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3092"}
+{"code": "PSYC3102", "name": "Psychopathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3102"}
+{"code": "PSYC3122", "name": "Attitudes & Social Cognition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3122"}
+{"code": "PSYC3132", "name": "Health Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3132"}
+{"code": "PSYC3142", "name": "Intergroup Relations & Group Processes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3142"}
+{"code": "PSYC3152", "name": "Applied Topics in Lifespan Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3152"}
+{"code": "PSYC3162", "name": "Development in Infancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3162"}
+{"code": "PSYC3172", "name": "Basic Processes in Cognition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3172"}
+{"code": "PSYC3192", "name": "Sensory Neuroscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3192"}
+{"code": "PSYC3202", "name": "Industrial & Organisational Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3202"}
+{"code": "PSYC3241", "name": "Individual Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3241"}
+{"code": "PSYC3262", "name": "Evolutionary Approaches to Human Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3262"}
+{"code": "PSYC3272", "name": "The Neuroscience of Social Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3272"}
+{"code": "PSYC3282", "name": "Developmental Perspectives on the Origins of Human Culture", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3282"}
+{"code": "PSYC3292", "name": "Psychology of Emotion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3292"}
+{"code": "PSYC3302", "name": "Cognitive Neuroscience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3302"}
+{"code": "PSYC3312", "name": "Parenting and Family Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3312"}
+{"code": "PSYC3991", "name": "Research Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3991"}
+{"code": "PSYC3992", "name": "Research Practicum II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC3992"}
+{"code": "PSYC4000", "name": "Applied Sport and Exercise Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4000"}
+{"code": "PSYC4050", "name": "Psychological Research Methodology IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4050"}
+{"code": "PSYC4060", "name": "Ethical Considerations for Psychologists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4060"}
+{"code": "PSYC4070", "name": "Individual Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4070"}
+{"code": "PSYC4071", "name": "Individual Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4071"}
+{"code": "PSYC4091", "name": "Team Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4091"}
+{"code": "PSYC4092", "name": "Group Supervised Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4092"}
+{"code": "PSYC4102", "name": "Psychopathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4102"}
+{"code": "PSYC4121", "name": "The Scientist-Practitioner Model", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4121"}
+{"code": "PSYC4141", "name": "Reading Course", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4141"}
+{"code": "PSYC4161", "name": "Personnel Training", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4161"}
+{"code": "PSYC4171", "name": "Personnel Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4171"}
+{"code": "PSYC4181", "name": "Applied Social Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4181"}
+{"code": "PSYC4191", "name": "Improving Human Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4191"}
+{"code": "PSYC4211", "name": "From Classic to Contemporary Topics in Organisational Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4211"}
+{"code": "PSYC4221", "name": "Work and Research in Applied Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4221"}
+{"code": "PSYC4311", "name": "Advanced Topics in Social Cognition & Group Processes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4311"}
+{"code": "PSYC4321", "name": "Advanced Topics in Communication & Relationships", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4321"}
+{"code": "PSYC4331", "name": "Topics in Perception & Cognition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4331"}
+{"code": "PSYC4341", "name": "Special Topics in Clinical Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4341"}
+{"code": "PSYC4351", "name": "Human Individual Differences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4351"}
+{"code": "PSYC4361", "name": "Evolutionary & Comparative Perspectives in Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4361"}
+{"code": "PSYC4371", "name": "Advanced Topics in Child Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4371"}
+{"code": "PSYC4881", "name": "Advanced Topics in Psychology I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4881"}
+{"code": "PSYC4882", "name": "Advanced Topics in Psychology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4882"}
+{"code": "PSYC4883", "name": "Advanced Topics in Psychology III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4883"}
+{"code": "PSYC4884", "name": "Advanced Topics in Psychology IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4884"}
+{"code": "PSYC4885", "name": "Advanced Topics in Psychology V", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4885"}
+{"code": "PSYC4886", "name": "Advanced Topics in Psychology VI", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4886"}
+{"code": "PSYC4887", "name": "Advanced Topics in Psychology VII", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4887"}
+{"code": "PSYC4888", "name": "Advanced Topics in Psychology VIII", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4888"}
+{"code": "PSYC4981", "name": "Current Issues in Psychology 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4981"}
+{"code": "PSYC4982", "name": "Current Issues in Psychology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4982"}
+{"code": "PSYC4991", "name": "Advanced Seminar in Psychology 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4991"}
+{"code": "PSYC4992", "name": "Advanced Seminar in Psychology II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4992"}
+{"code": "PSYC4993", "name": "Advanced Seminar in Psychology III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC4993"}
+{"code": "PSYC6000", "name": "Advanced Sport and Exercise Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC6000"}
+{"code": "PSYC7000", "name": "Advanced Sport and Exercise Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7000"}
+{"code": "PSYC7011", "name": "Clinical Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7011"}
+{"code": "PSYC7042", "name": "Child & Adolescent Behavioural Assessment & Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7042"}
+{"code": "PSYC7052", "name": "Behavioural Family Intervention", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7052"}
+{"code": "PSYC7100", "name": "Advanced Sport & Exercise Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7100"}
+{"code": "PSYC7112", "name": "Assessment in Psychological Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7112"}
+{"code": "PSYC7191", "name": "Clinical Psychopathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7191"}
+{"code": "PSYC7211", "name": "Clinical Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7211"}
+{"code": "PSYC7231", "name": "Ethical Practice and Research Approaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7231"}
+{"code": "PSYC7241", "name": "Acceptance and Commitment Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7241"}
+{"code": "PSYC7251", "name": "Evidence-based Psychotherapies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7251"}
+{"code": "PSYC7261", "name": "Addiction Science and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7261"}
+{"code": "PSYC7405", "name": "Business Skills for Consultants", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7405"}
+{"code": "PSYC7414", "name": "Organisational Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7414"}
+{"code": "PSYC7415", "name": "Business Psychology Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7415"}
+{"code": "PSYC7424", "name": "Job & Organisational Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7424"}
+{"code": "PSYC7425", "name": "Business Psychology Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7425"}
+{"code": "PSYC7434", "name": "Organisational Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7434"}
+{"code": "PSYC7435", "name": "Business Psychology Project C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7435"}
+{"code": "PSYC7444", "name": "Applied Decision Making", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7444"}
+{"code": "PSYC7454", "name": "Advanced Organisational Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7454"}
+{"code": "PSYC7464", "name": "Organisational Change: Theory & Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7464"}
+{"code": "PSYC7474", "name": "Applied Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7474"}
+{"code": "PSYC7484", "name": "Advanced Personnel Training", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7484"}
+{"code": "PSYC7494", "name": "Advanced Personnel Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7494"}
+{"code": "PSYC7504", "name": "Human Factors", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7504"}
+{"code": "PSYC7514", "name": "Advanced Psychological Research Methodology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7514"}
+{"code": "PSYC7524", "name": "Organisational Psychology Practicum A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7524"}
+{"code": "PSYC7534", "name": "Organisational Psychology Practicum B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7534"}
+{"code": "PSYC7544", "name": "Organisational Psychology Practicum C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7544"}
+{"code": "PSYC7554", "name": "Organisational Psychology Practicum D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7554"}
+{"code": "PSYC7564", "name": "Teams in Organisations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7564"}
+{"code": "PSYC7584", "name": "Readings in Organisational Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7584"}
+{"code": "PSYC7594", "name": "Motivating & Leading in the Workplace", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7594"}
+{"code": "PSYC7604", "name": "Professional Skill Development for Organisational Psychologists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7604"}
+{"code": "PSYC7715", "name": "Sport & Exercise Psychology Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7715"}
+{"code": "PSYC7725", "name": "Psychological Skills Training Techniques in Sport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7725"}
+{"code": "PSYC7735", "name": "Psychological Skills Training Techniques in Sport B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7735"}
+{"code": "PSYC7745", "name": "Sport Psychology Placement B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7745"}
+{"code": "PSYC7755", "name": "Sport Psychology Placement D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7755"}
+{"code": "PSYC7775", "name": "Introduction to Applied Practice in Sport & Exercise Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7775"}
+{"code": "PSYC7785", "name": "Sport Psychology Externship B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7785"}
+{"code": "PSYC7795", "name": "Externship C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7795"}
+{"code": "PSYC7800", "name": "Applied Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7800"}
+{"code": "PSYC7801", "name": "Interpersonal Skills in Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7801"}
+{"code": "PSYC7802", "name": "Assessment and Evaluation in Applied Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7802"}
+{"code": "PSYC7803", "name": "Foundations of Psychological Intervention", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7803"}
+{"code": "PSYC7804", "name": "Couples Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7804"}
+{"code": "PSYC7805", "name": "Mental Health and Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7805"}
+{"code": "PSYC7806", "name": "Working with Children and Young People in Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7806"}
+{"code": "PSYC7807", "name": "Understanding and Caring for Those Affected by Loss", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7807"}
+{"code": "PSYC7808", "name": "Clinical Health Approaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7808"}
+{"code": "PSYC7809", "name": "Ethics and Professional Practice Issues in Counselling", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7809"}
+{"code": "PSYC7810", "name": "Applied Psychology Placement A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7810"}
+{"code": "PSYC7811", "name": "Master of Psychology Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7811"}
+{"code": "PSYC7820", "name": "Applied Psychology Placement C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7820"}
+{"code": "PSYC7830", "name": "Clinical Health Placement B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7830"}
+{"code": "PSYC7840", "name": "Health Promotion Placement D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7840"}
+{"code": "PSYC7850", "name": "Counselling Placement B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7850"}
+{"code": "PSYC7860", "name": "Counselling Placement D", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7860"}
+{"code": "PSYC7901", "name": "Psychology: Brain and Cognition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7901"}
+{"code": "PSYC7902", "name": "Psychology: Individual and Social Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7902"}
+{"code": "PSYC7990", "name": "Applied Psychology Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7990"}
+{"code": "PSYC7991", "name": "Clinical Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7991"}
+{"code": "PSYC7994", "name": "Organisational Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7994"}
+{"code": "PSYC7995", "name": "Sport & Exercise Psychology Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC7995"}
+{"code": "PSYC8005", "name": "Dissertation - In Progress", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8005"}
+{"code": "PSYC8010", "name": "Dissertation - In Progress", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8010"}
+{"code": "PSYC8011", "name": "Doctor of Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8011"}
+{"code": "PSYC8012", "name": "Doctor of Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8012"}
+{"code": "PSYC8017", "name": "Public Health Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8017"}
+{"code": "PSYC8018", "name": "Rehabilitation Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8018"}
+{"code": "PSYC8111", "name": "Advanced Clinical Health Psychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8111"}
+{"code": "PSYC8151", "name": "Sex and Couples Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8151"}
+{"code": "PSYC8161", "name": "Functional Neuroanatomy and Cognitive Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8161"}
+{"code": "PSYC8171", "name": "Clinical Neuropsychology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8171"}
+{"code": "PSYC8181", "name": "Advanced Clinical Neuropsychology and Neurorehabilitation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8181"}
+{"code": "PSYC8191", "name": "Clinical Leadership and Supervision", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8191"}
+{"code": "PSYC8291", "name": "Applied Gerontology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8291"}
+{"code": "PSYC8301", "name": "Internship and Professional Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8301"}
+{"code": "PSYC8302", "name": "Internship and Professional Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8302"}
+{"code": "PSYC8305", "name": "Internship and Professional Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8305"}
+{"code": "PSYC8315", "name": "Internship and Professional Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8315"}
+{"code": "PSYC8320", "name": "Externship Placement 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8320"}
+{"code": "PSYC8330", "name": "Externship Placement 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8330"}
+{"code": "PSYC8340", "name": "Externship Placement 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8340"}
+{"code": "PSYC8990", "name": "Advanced Individual Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8990"}
+{"code": "PSYC8991", "name": "Doctor of Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8991"}
+{"code": "PSYC8992", "name": "Doctor of Psychology Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PSYC8992"}
+{"code": "PUBH1102", "name": "Introduction to Public Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH1102"}
+{"code": "PUBH1103", "name": "Health Systems & Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH1103"}
+{"code": "PUBH1104", "name": "Major Diseases & their Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH1104"}
+{"code": "PUBH1108", "name": "Health Research & Evidence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH1108"}
+{"code": "PUBH1109", "name": "Measurement in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH1109"}
+{"code": "PUBH1110", "name": "Intergrative Thinking in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH1110"}
+{"code": "PUBH2004", "name": "Understanding Health Behaviours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH2004"}
+{"code": "PUBH2005", "name": "Influencing Health Behaviours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH2005"}
+{"code": "PUBH2006", "name": "Prevention Practicum 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH2006"}
+{"code": "PUBH2007", "name": "Health Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH2007"}
+{"code": "PUBH2008", "name": "Major Diseases & their control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH2008"}
+{"code": "PUBH2009", "name": "Environmental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH2009"}
+{"code": "PUBH2010", "name": "Global Health and Infectious Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH2010"}
+{"code": "PUBH3001", "name": "Health Services Planning & Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH3001"}
+{"code": "PUBH3002", "name": "Health Policy in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH3002"}
+{"code": "PUBH3003", "name": "Evaluation of Health Programs: Field Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH3003"}
+{"code": "PUBH3005", "name": "Influencing Health Behaviours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH3005"}
+{"code": "PUBH3009", "name": "Environmental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH3009"}
+{"code": "PUBH3010", "name": "Global Health and Infectious Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH3010"}
+{"code": "PUBH4001", "name": "New Directions in Environmental Health: an ecosystem approach", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH4001"}
+{"code": "PUBH7000", "name": "Public Health Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7000"}
+{"code": "PUBH7003", "name": "Qualitative Research: Public Health Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7003"}
+{"code": "PUBH7005", "name": "The Australian Health System", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7005"}
+{"code": "PUBH7008", "name": "Applied Qualitative Research Methods in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7008"}
+{"code": "PUBH7009", "name": "Substance Use & Misuse in Special Populations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7009"}
+{"code": "PUBH7010", "name": "Health Aspects of Ageing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7010"}
+{"code": "PUBH7012", "name": "Delivering Health Care in Communities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7012"}
+{"code": "PUBH7014", "name": "Health Financing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7014"}
+{"code": "PUBH7016", "name": "Health Systems Resourcing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7016"}
+{"code": "PUBH7021", "name": "Evaluation in Public Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7021"}
+{"code": "PUBH7022", "name": "New Directions in Environmental Health: An Ecosystem Approach", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7022"}
+{"code": "PUBH7024", "name": "Project in Clinical Epidemiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7024"}
+{"code": "PUBH7025", "name": "Anthropology of Health & Illness", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7025"}
+{"code": "PUBH7026", "name": "Mental Health Across the Globe: Challenges & Opportunities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7026"}
+{"code": "PUBH7027", "name": "Introduction to Environmental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7027"}
+{"code": "PUBH7028", "name": "Alcohol in Contemporary Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7028"}
+{"code": "PUBH7030", "name": "Health Planning & Management in Settings with Limited Resources", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7030"}
+{"code": "PUBH7031", "name": "One Health: Diseases at the Human-Animal interface", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7031"}
+{"code": "PUBH7032", "name": "Children's Environmental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7032"}
+{"code": "PUBH7034", "name": "Health Promotion in Public Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7034"}
+{"code": "PUBH7035", "name": "Health Promotion Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7035"}
+{"code": "PUBH7036", "name": "Health Promotion Implementation and Evaluation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7036"}
+{"code": "PUBH7044", "name": "Public Health Professional Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7044"}
+{"code": "PUBH7100", "name": "International Disease Control Priorities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7100"}
+{"code": "PUBH7101", "name": "Communicable Disease Management & Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7101"}
+{"code": "PUBH7102", "name": "Vector-borne Diseases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7102"}
+{"code": "PUBH7103", "name": "Control of Non-communicable Diseases in Developing Countries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7103"}
+{"code": "PUBH7106", "name": "Sexual, Reproductive & Child Health: A Global Hlth Perspective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7106"}
+{"code": "PUBH7108", "name": "Project Planning for International Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7108"}
+{"code": "PUBH7110", "name": "Directed Studies in Population Health A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7110"}
+{"code": "PUBH7111", "name": "Directed Studies in Population Health B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7111"}
+{"code": "PUBH7113", "name": "Global Health & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7113"}
+{"code": "PUBH7114", "name": "Analysis of Population Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7114"}
+{"code": "PUBH7115", "name": "Mortality Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7115"}
+{"code": "PUBH7116", "name": "Communicable Disease Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7116"}
+{"code": "PUBH7117", "name": "Health Aspects of Disasters", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7117"}
+{"code": "PUBH7118", "name": "Global HIV/AIDS", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7118"}
+{"code": "PUBH7120", "name": "Public Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7120"}
+{"code": "PUBH7122", "name": "Health Behaviour Interventions: Concepts & Applications", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7122"}
+{"code": "PUBH7123", "name": "Determinants of Health Behaviours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7123"}
+{"code": "PUBH7124", "name": "Tobacco Cessation & Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7124"}
+{"code": "PUBH7127", "name": "Understanding Health Behaviours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7127"}
+{"code": "PUBH7128", "name": "Health Behaviour Interventions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7128"}
+{"code": "PUBH7286", "name": "Qualitative Research for Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7286"}
+{"code": "PUBH7287", "name": "Introduction to Environmental Health for Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7287"}
+{"code": "PUBH7288", "name": "Health Promotion in Public Health for Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7288"}
+{"code": "PUBH7289", "name": "Communicable Disease Management & Control for Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7289"}
+{"code": "PUBH7290", "name": "Introduction to Biostatistics for Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7290"}
+{"code": "PUBH7291", "name": "Global Health Policy in Practice for Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7291"}
+{"code": "PUBH7600", "name": "Introduction to Epidemiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7600"}
+{"code": "PUBH7611", "name": "Epidemiology in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7611"}
+{"code": "PUBH7612", "name": "Control of Non-Communicable Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7612"}
+{"code": "PUBH7614", "name": "Health Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7614"}
+{"code": "PUBH7616", "name": "Burden of Disease Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7616"}
+{"code": "PUBH7618", "name": "Cost Effectiveness in Health and Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7618"}
+{"code": "PUBH7620", "name": "Social Perspectives in Public Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7620"}
+{"code": "PUBH7630", "name": "Introduction to Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7630"}
+{"code": "PUBH7631", "name": "Practical Regression Analyses", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7631"}
+{"code": "PUBH7632", "name": "Advanced Biostatistics & Epidemiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7632"}
+{"code": "PUBH7635", "name": "Special Topics in Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7635"}
+{"code": "PUBH7645", "name": "Global Health Policy in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7645"}
+{"code": "PUBH7650", "name": "Clinical Epidemiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7650"}
+{"code": "PUBH7651", "name": "Systematic Reviews of Evidence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7651"}
+{"code": "PUBH7653", "name": "Methods of Clinical Epidemiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7653"}
+{"code": "PUBH7670", "name": "Injury Epidemiology & Prevention", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7670"}
+{"code": "PUBH7900", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7900"}
+{"code": "PUBH7901", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7901"}
+{"code": "PUBH7902", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7902"}
+{"code": "PUBH7950", "name": "Dissertation (full time study)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7950"}
+{"code": "PUBH7955", "name": "Dissertation (part time study)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7955"}
+{"code": "PUBH7957", "name": "Dissertation (part time study)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBH7957"}
+{"code": "PUBT6000", "name": "Public Transport Introduction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBT6000"}
+{"code": "PUBT6020", "name": "Public Transport Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBT6020"}
+{"code": "PUBT6030", "name": "Public Transport Operations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBT6030"}
+{"code": "PUBT6040", "name": "Public Transport Funding", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBT6040"}
+{"code": "PUBT6050", "name": "Review of Public Transport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBT6050"}
+{"code": "PUBT6060", "name": "Transport Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBT6060"}
+{"code": "PUBT6070", "name": "Public Transport Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PUBT6070"}
+{"code": "PXMH7000", "name": "Comprehensive Systems of Mental Health Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7000"}
+{"code": "PXMH7023", "name": "Foundation Knowledge for Mental Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7023"}
+{"code": "PXMH7024", "name": "Foundation Skills for Mental Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7024"}
+{"code": "PXMH7025", "name": "Application of Foundation Skills in Mental Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7025"}
+{"code": "PXMH7026", "name": "Application of Specialist Psychotherapy Skills in Mental Health Practice A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7026"}
+{"code": "PXMH7028", "name": "Core Knowledge for Mental Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7028"}
+{"code": "PXMH7029", "name": "Core Skills for Mental Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7029"}
+{"code": "PXMH7030", "name": "Application of Core Skills in Mental Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7030"}
+{"code": "PXMH7035", "name": "Art Therapy in Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7035"}
+{"code": "PXMH7036", "name": "Art Therapy with Special Populations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7036"}
+{"code": "PXMH7037", "name": "Application of Specialist Art Therapy Skills in Mental Health Practice A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7037"}
+{"code": "PXMH7038", "name": "Application of Specialist Art Therapy Skills in Mental Health Practice B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7038"}
+{"code": "PXMH7043", "name": "Clinical Practice in Systemic Family Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7043"}
+{"code": "PXMH7044", "name": "Advanced Clinical Practice in Systemic Family Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7044"}
+{"code": "PXMH7045", "name": "Application of Specialist Family Therapy Skills in Mental Health Practice A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7045"}
+{"code": "PXMH7046", "name": "Application of Specialist Family Therapy Skills in Mental Health Practice B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7046"}
+{"code": "PXMH7047", "name": "Brief Psychotherapy Interventions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7047"}
+{"code": "PXMH7048", "name": "Exploratory Psychotherapy Interventions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7048"}
+{"code": "PXMH7049", "name": "Application Psychotherapy Practice B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7049"}
+{"code": "PXMH7067", "name": "Independent Mental Health Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7067"}
+{"code": "PXMH7068", "name": "Independent Mental Health Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7068"}
+{"code": "PXMH7069", "name": "Pharmacology for mental health professionals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7069"}
+{"code": "PXMH7070", "name": "Psychotherapy Approaches for Treatment Resistant Cases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7070"}
+{"code": "PXMH7071", "name": "Group Psychotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7071"}
+{"code": "PXMH7101", "name": "Understanding Mental Health and Psychotherapeutic Interventions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7101"}
+{"code": "PXMH7102", "name": "Ethics and Mental Health Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7102"}
+{"code": "PXMH7103", "name": "Common and Specific Factors in Mental Health Treatments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7103"}
+{"code": "PXMH7104", "name": "Human Development and Relationships Across the Life Span", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7104"}
+{"code": "PXMH7105", "name": "Advanced Therapy Skills: Working with Complex and Non-traditional Clients", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7105"}
+{"code": "PXMH7106", "name": "Advanced Therapy Skills: Working with Families and Groups", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7106"}
+{"code": "PXMH7107", "name": "Practicum 1 in Art Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7107"}
+{"code": "PXMH7108", "name": "Practicum 2 in Art Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7108"}
+{"code": "PXMH7109", "name": "Practicum 3 in Art Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7109"}
+{"code": "PXMH7110", "name": "Practicum 4 in Art Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7110"}
+{"code": "PXMH7111", "name": "Practicum 1 in Psychotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7111"}
+{"code": "PXMH7112", "name": "Practicum 2 in Psychotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7112"}
+{"code": "PXMH7113", "name": "Practicum 3 in Psychotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7113"}
+{"code": "PXMH7114", "name": "Practicum 4 in Psychotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7114"}
+{"code": "PXMH7115", "name": "Mental Health Research Thesis 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7115"}
+{"code": "PXMH7116", "name": "Mental Health Research Thesis 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXMH7116"}
+{"code": "PXPY7022", "name": "Interpersonal Processes in Psychotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7022"}
+{"code": "PXPY7023", "name": "Assessment for Psychotherapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7023"}
+{"code": "PXPY7025", "name": "Introduction to Psychodynamic Therapies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7025"}
+{"code": "PXPY7026", "name": "Basic Procedures in Cognitive Behaviour Therapy for Anxiety", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7026"}
+{"code": "PXPY7029", "name": "Clinical Practice in Psychodynamic Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7029"}
+{"code": "PXPY7030", "name": "Individual Clinical Supervision for Psychodynamic Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7030"}
+{"code": "PXPY7031", "name": "Cognitive Behavioural Therapy for Depression", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7031"}
+{"code": "PXPY7032", "name": "Cognitive Behavioural Therapy for Schizophrenia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7032"}
+{"code": "PXPY7033", "name": "Group Clinical Supervision for Psychodynamic Therapy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7033"}
+{"code": "PXPY7050", "name": "Assessment Skills in Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7050"}
+{"code": "PXPY7051", "name": "Case Management in Mental Health I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7051"}
+{"code": "PXPY7052", "name": "Case Management in Mental Health II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7052"}
+{"code": "PXPY7053", "name": "Mental Health Service Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7053"}
+{"code": "PXPY7054", "name": "Clinical Processes in Child & Youth Mental Health I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7054"}
+{"code": "PXPY7055", "name": "Clinical Processes in Child & Youth Mental Health II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7055"}
+{"code": "PXPY7056", "name": "Community Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7056"}
+{"code": "PXPY7057", "name": "Consumer Groups & Patient/Family Participation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=PXPY7057"}
+{"code": "QBIO7001", "name": "Foundations in Quantitative Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7001"}
+{"code": "QBIO7002", "name": "Exploring Biological Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7002"}
+{"code": "QBIO7003", "name": "Stochastic Models and Statistical Inference", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7003"}
+{"code": "QBIO7004", "name": "Computational Methods in Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7004"}
+{"code": "QBIO7005", "name": "Optimisation in Biological Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7005"}
+{"code": "QBIO7006", "name": "Science Communication in Quantitative Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7006"}
+{"code": "QBIO7007", "name": "Introduction to \u00c2\u00bfBig Data\u00c2\u00bf Biological Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7007"}
+{"code": "QBIO7008", "name": "Research project in Quantitative Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7008"}
+{"code": "QBIO7009", "name": "Research Experience in Quantitative Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=QBIO7009"}
+{"code": "RBUS2900", "name": "Business Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS2900"}
+{"code": "RBUS3460", "name": "Evaluation of Health Communication Programs: Field Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS3460"}
+{"code": "RBUS3903", "name": "Special Topics in Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS3903"}
+{"code": "RBUS3904", "name": "Integrated Commerce in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS3904"}
+{"code": "RBUS3999", "name": "Business Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS3999"}
+{"code": "RBUS4999", "name": "Business Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS4999"}
+{"code": "RBUS6601", "name": "Readings in Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6601"}
+{"code": "RBUS6901", "name": "Qualitative Business Research Methods II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6901"}
+{"code": "RBUS6902", "name": "Quantitative Business Research Methods I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6902"}
+{"code": "RBUS6903", "name": "Quantitative Business Research Methods II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6903"}
+{"code": "RBUS6904", "name": "Qualitative Business Research Methods I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6904"}
+{"code": "RBUS6911", "name": "Commerce Honours Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6911"}
+{"code": "RBUS6913", "name": "Commerce Contemporary Research Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6913"}
+{"code": "RBUS6914", "name": "Research Process in Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6914"}
+{"code": "RBUS6921", "name": "Scientific Method in Commerce", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6921"}
+{"code": "RBUS6922", "name": "Scientific Method in Commerce", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6922"}
+{"code": "RBUS6923", "name": "Scientific Methods in Commerce", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6923"}
+{"code": "RBUS6931", "name": "Scientific Method in Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6931"}
+{"code": "RBUS6932", "name": "Scientific Method in Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6932"}
+{"code": "RBUS6933", "name": "Research Design for Honours", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6933"}
+{"code": "RBUS6980", "name": "Industry Report", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6980"}
+{"code": "RBUS6981", "name": "Industry Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6981"}
+{"code": "RBUS6991", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6991"}
+{"code": "RBUS6993", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6993"}
+{"code": "RBUS6994", "name": "Honours Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6994"}
+{"code": "RBUS6996", "name": "Honours Thesis A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6996"}
+{"code": "RBUS6997", "name": "Honours Thesis B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS6997"}
+{"code": "RBUS7913", "name": "Special Topics in Business I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7913"}
+{"code": "RBUS7914", "name": "Special Topics in Business II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7914"}
+{"code": "RBUS7980", "name": "Research Report", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7980"}
+{"code": "RBUS7981", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7981"}
+{"code": "RBUS7982", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7982"}
+{"code": "RBUS7983", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7983"}
+{"code": "RBUS7991", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7991"}
+{"code": "RBUS7993", "name": "Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7993"}
+{"code": "RBUS7994", "name": "Research Process", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7994"}
+{"code": "RBUS7999", "name": "Business Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RBUS7999"}
+{"code": "REDE1100", "name": "Valuation Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE1100"}
+{"code": "REDE1300", "name": "Building Construction Management & Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE1300"}
+{"code": "REDE2201", "name": "Real Estate Investment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE2201"}
+{"code": "REDE3100", "name": "Investment Method of Valuation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE3100"}
+{"code": "REDE3101", "name": "Statutory Valuation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE3101"}
+{"code": "REDE3102", "name": "Advanced Valuation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE3102"}
+{"code": "REDE3200", "name": "Real Estate Development Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE3200"}
+{"code": "REDE3201", "name": "Sustainable Real Estate Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE3201"}
+{"code": "REDE3202", "name": "Development Appraisal Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE3202"}
+{"code": "REDE6200", "name": "Advanced Real Estate & Development Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE6200"}
+{"code": "REDE7100", "name": "Valuation of Industrial and Commercial Property", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE7100"}
+{"code": "REDE7101", "name": "Valuation for Statutory Purposes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE7101"}
+{"code": "REDE7102", "name": "Valuation of Specialist Properties", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE7102"}
+{"code": "REDE7201", "name": "International Property Investment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE7201"}
+{"code": "REDE7202", "name": "Property Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE7202"}
+{"code": "REDE7203", "name": "Strategic Property Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE7203"}
+{"code": "REDE7300", "name": "Sustainable Building Construction Management and Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REDE7300"}
+{"code": "REIT9000", "name": "Research Methods for RHD", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=REIT9000"}
+{"code": "RELN1000", "name": "World Religions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN1000"}
+{"code": "RELN1001", "name": "Belief & Unbelief", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN1001"}
+{"code": "RELN1510", "name": "The History of the Supernatural", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN1510"}
+{"code": "RELN2000", "name": "The idea of the sacred: texts, places and festivals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2000"}
+{"code": "RELN2113", "name": "Spirituality in the Everyday", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2113"}
+{"code": "RELN2115", "name": "Playing God: Religion & Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2115"}
+{"code": "RELN2117", "name": "Sociology of Religion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2117"}
+{"code": "RELN2119", "name": "The Meaning of Death", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2119"}
+{"code": "RELN2300", "name": "Rituals, Priests & Kings: A History of Hinduism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2300"}
+{"code": "RELN2301", "name": "Buddhism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2301"}
+{"code": "RELN2307", "name": "Islam", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2307"}
+{"code": "RELN2310", "name": "Religion, Peace and Violence", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2310"}
+{"code": "RELN2409", "name": "The World of Jesus and the Early Christians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2409"}
+{"code": "RELN2410", "name": "The Bible: Narratives & Interpretations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2410"}
+{"code": "RELN2411", "name": "Western Religious Thought from the Middle Ages to the Present", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN2411"}
+{"code": "RELN3000", "name": "The Future of Religion: An Advanced Study of Contemporary Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN3000"}
+{"code": "RELN3001", "name": "Independent Study Unit", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN3001"}
+{"code": "RELN3500", "name": "Advanced Study of Religious Texts A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN3500"}
+{"code": "RELN3501", "name": "Advanced Study of Religious Texts B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN3501"}
+{"code": "RELN6000", "name": "Methodology of Studies in Religion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN6000"}
+{"code": "RELN6001", "name": "Individual Honours Study Unit 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN6001"}
+{"code": "RELN6002", "name": "Individual Honours Study Unit 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN6002"}
+{"code": "RELN6003", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN6003"}
+{"code": "RELN6004", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN6004"}
+{"code": "RELN7011", "name": "Religion in Media, Film and Music", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN7011"}
+{"code": "RELN7300", "name": "Rituals, Priests & Kings: A History of Hinduism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN7300"}
+{"code": "RELN7601", "name": "Masters Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN7601"}
+{"code": "RELN9000", "name": "Doctoral Colloquium A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN9000"}
+{"code": "RELN9001", "name": "Doctoral Colloquium B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN9001"}
+{"code": "RELN9002", "name": "Doctoral Colloquium C", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN9002"}
+{"code": "RELN9003", "name": "Personal Spirituality & Pastoral Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RELN9003"}
+{"code": "RESC1001E", "name": "Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RESC1001E"}
+{"code": "RESC1021E", "name": "Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RESC1021E"}
+{"code": "RESC1031E", "name": "Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RESC1031E"}
+{"code": "RSCH8000", "name": "Thesis (Full-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8000"}
+{"code": "RSCH8001", "name": "Thesis (Part-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8001"}
+{"code": "RSCH8003", "name": "Thesis (Full-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8003"}
+{"code": "RSCH8004", "name": "Thesis (Part-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8004"}
+{"code": "RSCH8101", "name": "Introduction to Specialist Veterinary Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8101"}
+{"code": "RSCH8102", "name": "Veterinary Specialist Practicum 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8102"}
+{"code": "RSCH8103", "name": "Veterinary Specialist Practicum 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8103"}
+{"code": "RSCH8900", "name": "Thesis Under Examination", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8900"}
+{"code": "RSCH8901", "name": "Interruption to Candidature", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH8901"}
+{"code": "RSCH9000", "name": "Research Studies (Full-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9000"}
+{"code": "RSCH9001", "name": "Research Studies (Part-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9001"}
+{"code": "RSCH9002", "name": "Study Abroad Research Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9002"}
+{"code": "RSCH9003", "name": "Joint Research Studies (Full-time - No Fees)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9003"}
+{"code": "RSCH9004", "name": "Joint Research Studies (Part-time - No Fees)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9004"}
+{"code": "RSCH9005", "name": "Study Abroad Research Studies Visiting PhD", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9005"}
+{"code": "RSCH9006", "name": "Research Studies (Part-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9006"}
+{"code": "RSCH9007", "name": "Research Studies (Part-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9007"}
+{"code": "RSCH9008", "name": "Research Studies (Full-time)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9008"}
+{"code": "RSCH9800", "name": "Thesis Under Examination", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9800"}
+{"code": "RSCH9900", "name": "Thesis Under Examination", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9900"}
+{"code": "RSCH9901", "name": "Interruption to Candidature", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSCH9901"}
+{"code": "RSSN1110", "name": "Introductory Russian I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN1110"}
+{"code": "RSSN1120", "name": "Introductory Russian II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN1120"}
+{"code": "RSSN2110", "name": "Russian Language III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN2110"}
+{"code": "RSSN2120", "name": "Russian Language IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN2120"}
+{"code": "RSSN3130", "name": "Russian V", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN3130"}
+{"code": "RSSN3140", "name": "Russian VI", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN3140"}
+{"code": "RSSN6340", "name": "Advanced Russian Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN6340"}
+{"code": "RSSN6350", "name": "Special Topics in Russian Language Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN6350"}
+{"code": "RSSN6364", "name": "Special Topic in Russian Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN6364"}
+{"code": "RSSN6920", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN6920"}
+{"code": "RSSN6930", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN6930"}
+{"code": "RSSN6940", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=RSSN6940"}
+{"code": "SCIE1000", "name": "Theory & Practice in Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE1000"}
+{"code": "SCIE1010", "name": "Introduction to Research Practices - The Big Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE1010"}
+{"code": "SCIE1100", "name": "Advanced Theory and Practice in Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE1100"}
+{"code": "SCIE1200", "name": "Introduction to Science Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE1200"}
+{"code": "SCIE2011", "name": "Perspectives in Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE2011"}
+{"code": "SCIE2020", "name": "CSI UQ: Introduction to Forensic Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE2020"}
+{"code": "SCIE2100", "name": "Introduction to Bioinformatics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE2100"}
+{"code": "SCIE3011", "name": "Perspectives in Science Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3011"}
+{"code": "SCIE3040", "name": "STEM Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3040"}
+{"code": "SCIE3044", "name": "Vacation Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3044"}
+{"code": "SCIE3050", "name": "Science Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3050"}
+{"code": "SCIE3210", "name": "Research Topic in Geographical Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3210"}
+{"code": "SCIE3220", "name": "Biomedical Science Research Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3220"}
+{"code": "SCIE3221", "name": "Biomedical Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3221"}
+{"code": "SCIE3222", "name": "Advanced Biomedical Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3222"}
+{"code": "SCIE3223", "name": "Advanced Biomedical Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3223"}
+{"code": "SCIE3224", "name": "Advanced Biomedical Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3224"}
+{"code": "SCIE3225", "name": "Advanced Biomedical Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3225"}
+{"code": "SCIE3226", "name": "Advanced Biomedical Science Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3226"}
+{"code": "SCIE3230", "name": "Introduction to Research in Geological Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3230"}
+{"code": "SCIE3231", "name": "Research Project II in Geological Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3231"}
+{"code": "SCIE3240", "name": "Introduction to Research in Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3240"}
+{"code": "SCIE3241", "name": "Special Project in Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3241"}
+{"code": "SCIE3250", "name": "Introduction to Research in Mathematics/Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3250"}
+{"code": "SCIE3251", "name": "Introduction to Research in Mathematics/Physics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3251"}
+{"code": "SCIE3255", "name": "Mathematics & Physics Industry Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3255"}
+{"code": "SCIE3260", "name": "Introduction to Research in Chemistry, Biochemistry & Microbiology (A)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3260"}
+{"code": "SCIE3261", "name": "Introduction to Research in Chemistry, Biochemistry & Microbiology (B)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3261"}
+{"code": "SCIE3270", "name": "Introduction to Research in Agriculture and Food Science (A)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3270"}
+{"code": "SCIE3271", "name": "Introduction to Research in Agriculture and Food Science (B)", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE3271"}
+{"code": "SCIE7004", "name": "Preparation for Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SCIE7004"}
+{"code": "SLAT2001", "name": "Second Language Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT2001"}
+{"code": "SLAT2002", "name": "Language in the Digital World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT2002"}
+{"code": "SLAT3001", "name": "Cognitive and Social Aspects of Bilingualism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT3001"}
+{"code": "SLAT7001", "name": "Introduction to Second Language Learning and Teaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7001"}
+{"code": "SLAT7705", "name": "Structure of Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7705"}
+{"code": "SLAT7706", "name": "Concepts in Applied Linguistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7706"}
+{"code": "SLAT7805", "name": "Second Language Acquisition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7805"}
+{"code": "SLAT7806", "name": "Research Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7806"}
+{"code": "SLAT7807", "name": "Classroom Second Language Processes: Theory, Research, Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7807"}
+{"code": "SLAT7809", "name": "Sociocultural Approaches to Second Language Learning and Teaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7809"}
+{"code": "SLAT7826", "name": "Teaching Languages in a Global Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7826"}
+{"code": "SLAT7827", "name": "Second Language Writing: Teaching and Researching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7827"}
+{"code": "SLAT7830", "name": "Second Language Reading: Teaching and Researching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7830"}
+{"code": "SLAT7835", "name": "Language Testing & Assessment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7835"}
+{"code": "SLAT7852", "name": "Portfolio & Synthesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7852"}
+{"code": "SLAT7853", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7853"}
+{"code": "SLAT7854", "name": "Qualitative Research Methods in Applied Linguistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7854"}
+{"code": "SLAT7855", "name": "Quantitative Research Methods in Applied Linguistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7855"}
+{"code": "SLAT7860", "name": "Language and Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7860"}
+{"code": "SLAT7897", "name": "Independent Reading Course A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7897"}
+{"code": "SLAT7898", "name": "Independent Reading Course B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7898"}
+{"code": "SLAT7899", "name": "Language and Intercultural communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SLAT7899"}
+{"code": "SOCY1030", "name": "Introduction to Health, Illness and Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY1030"}
+{"code": "SOCY1050", "name": "Introduction to Sociology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY1050"}
+{"code": "SOCY1060", "name": "Gender, Sexuality and Society: An Introduction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY1060"}
+{"code": "SOCY2019", "name": "Introduction to social research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2019"}
+{"code": "SOCY2020", "name": "Sociology of the Environment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2020"}
+{"code": "SOCY2040", "name": "Families, Households and the Life Course", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2040"}
+{"code": "SOCY2170", "name": "Emotions in Social Life", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2170"}
+{"code": "SOCY2220", "name": "Globalisation & Development in Post-Colonial Societies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2220"}
+{"code": "SOCY2280", "name": "Sociology of Sport", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2280"}
+{"code": "SOCY2339", "name": "Introducing Quantitative Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2339"}
+{"code": "SOCY2340", "name": "Sociology of the City", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY2340"}
+{"code": "SOCY3020", "name": "Medicine, Markets and Health: Sociological Perspectives on Health and Illness", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY3020"}
+{"code": "SOCY3039", "name": "Applied Quantitative Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY3039"}
+{"code": "SOCY3050", "name": "Independent Study in Sociology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY3050"}
+{"code": "SOCY3200", "name": "Current Issues & Debates in Sociology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY3200"}
+{"code": "SOCY3329", "name": "Qualitative Social Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY3329"}
+{"code": "SOCY3345", "name": "Conceptual Challenges in Sociology: Classical and Contemporary Debates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY3345"}
+{"code": "SOCY6008", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY6008"}
+{"code": "SOCY6009", "name": "Honours Research Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY6009"}
+{"code": "SOCY7000", "name": "Independent Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7000"}
+{"code": "SOCY7109", "name": "Medicine, Markets and Health: Sociological Perspectives on Health and Illness", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7109"}
+{"code": "SOCY7120", "name": "History and Theories of Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7120"}
+{"code": "SOCY7130", "name": "Social Impact Assessment: applied social research and development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7130"}
+{"code": "SOCY7190", "name": "Evaluating Social Programs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7190"}
+{"code": "SOCY7221", "name": "Globalisation and Development in Post Colonial Societies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7221"}
+{"code": "SOCY7329", "name": "Advanced Issues in Qualitative Inquiry", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7329"}
+{"code": "SOCY7339", "name": "Introducing Quantitative Research", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7339"}
+{"code": "SOCY7341", "name": "Sociology of the City", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOCY7341"}
+{"code": "SOSC1000", "name": "Society, Challenges and Solutions: Introduction to the Social Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC1000"}
+{"code": "SOSC1001", "name": "Social Being: Personal & Social Identities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC1001"}
+{"code": "SOSC1002", "name": "Ethnicity and Diversity in Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC1002"}
+{"code": "SOSC1011", "name": "Social Being: Power, Structures & Agency", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC1011"}
+{"code": "SOSC2190", "name": "Human Bodies, Culture & Society", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC2190"}
+{"code": "SOSC2288", "name": "Community Development: Local and International Practices", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC2288"}
+{"code": "SOSC3201", "name": "Research, Planning and Design", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC3201"}
+{"code": "SOSC3202", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC3202"}
+{"code": "SOSC3211", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC3211"}
+{"code": "SOSC3300", "name": "Field Experience in the Social Sciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC3300"}
+{"code": "SOSC6030", "name": "Social Science Honours Research Seminar 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC6030"}
+{"code": "SOSC6040", "name": "Social Science Honours Research Seminar 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC6040"}
+{"code": "SOSC6100", "name": "Social Science Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC6100"}
+{"code": "SOSC6101", "name": "Social Science Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC6101"}
+{"code": "SOSC7093", "name": "Participatory Development Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC7093"}
+{"code": "SOSC7100", "name": "Development Practice Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC7100"}
+{"code": "SOSC7101", "name": "Development Practice Thesis Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC7101"}
+{"code": "SOSC7288", "name": "Community Development: Local and International Practices", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC7288"}
+{"code": "SOSC7433", "name": "Transformative Economics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SOSC7433"}
+{"code": "SPAN1010", "name": "Introductory Spanish A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN1010"}
+{"code": "SPAN1020", "name": "Introductory Spanish B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN1020"}
+{"code": "SPAN2010", "name": "Continuing Spanish A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN2010"}
+{"code": "SPAN2020", "name": "Continuing Spanish B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN2020"}
+{"code": "SPAN2310", "name": "Reading & Writing in Spanish", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN2310"}
+{"code": "SPAN3110", "name": "Advanced Spanish A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3110"}
+{"code": "SPAN3120", "name": "Advanced Spanish B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3120"}
+{"code": "SPAN3310", "name": "Text analysis and translation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3310"}
+{"code": "SPAN3330", "name": "Generos de composicion", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3330"}
+{"code": "SPAN3340", "name": "Cine de Autor en Espanol", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3340"}
+{"code": "SPAN3390", "name": "America Latina: el deseo y la realidad", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3390"}
+{"code": "SPAN3460", "name": "Literatura en Espanol", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3460"}
+{"code": "SPAN3910", "name": "Spanish Special Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN3910"}
+{"code": "SPAN6340", "name": "Advanced Spanish Language Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN6340"}
+{"code": "SPAN6350", "name": "Special Topics in Spanish Language Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN6350"}
+{"code": "SPAN6364", "name": "Special Topics in Spanish Cultural Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN6364"}
+{"code": "SPAN6910", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN6910"}
+{"code": "SPAN6911", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN6911"}
+{"code": "SPAN6912", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN6912"}
+{"code": "SPAN6920", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPAN6920"}
+{"code": "SPCG1000", "name": "Sport Coaching: Learning, Talent and Performance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG1000"}
+{"code": "SPCG1101", "name": "Strength and Conditioning Theory and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG1101"}
+{"code": "SPCG1102", "name": "Rugby Skills: Theory and Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG1102"}
+{"code": "SPCG3343", "name": "Developing the Elite Athlete", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG3343"}
+{"code": "SPCG4000", "name": "Sports Leadership in Diverse Communities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG4000"}
+{"code": "SPCG6000", "name": "Contemporary Issues in Coaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG6000"}
+{"code": "SPCG6001", "name": "Movement and Performance Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG6001"}
+{"code": "SPCG6002", "name": "Applied Sport Psychology for Coaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG6002"}
+{"code": "SPCG6027", "name": "Quality Coaching: Understanding, Informing and Advancing Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG6027"}
+{"code": "SPCG7000", "name": "Contemporary Issues in Coaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7000"}
+{"code": "SPCG7001", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7001"}
+{"code": "SPCG7002", "name": "Skill Acquisition & Movement Analysis for Coaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7002"}
+{"code": "SPCG7005", "name": "Sports Medicine for Coaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7005"}
+{"code": "SPCG7008", "name": "Sport Psychology & the Coaching Process", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7008"}
+{"code": "SPCG7010", "name": "Training Programs for Elite Athletes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7010"}
+{"code": "SPCG7012", "name": "Management for Coaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7012"}
+{"code": "SPCG7013", "name": "Business & the Law for Coaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7013"}
+{"code": "SPCG7015", "name": "Identification & Development of Talent", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7015"}
+{"code": "SPCG7016", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7016"}
+{"code": "SPCG7017", "name": "Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7017"}
+{"code": "SPCG7018", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7018"}
+{"code": "SPCG7019", "name": "Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7019"}
+{"code": "SPCG7020", "name": "Developing the Elite Athlete", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7020"}
+{"code": "SPCG7022", "name": "High Performance Program Management for Coaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7022"}
+{"code": "SPCG7023", "name": "Performance Psychology for Coaches", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7023"}
+{"code": "SPCG7024", "name": "Sport Communication and Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7024"}
+{"code": "SPCG7025", "name": "Skill Acquisition & Performance Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7025"}
+{"code": "SPCG7026", "name": "Strength and Conditioning for Elite Athletes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7026"}
+{"code": "SPCG7027", "name": "Quality Coaching: Action Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7027"}
+{"code": "SPCG7028", "name": "Advanced Training Programs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7028"}
+{"code": "SPCG7029", "name": "Case Studies in Sports Coaching", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7029"}
+{"code": "SPCG7030", "name": "Directed Study", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCG7030"}
+{"code": "SPCH1100", "name": "Introduction to Communication and Swallowing Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH1100"}
+{"code": "SPCH1101", "name": "Introduction to Speech Pathology Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH1101"}
+{"code": "SPCH1201", "name": "Communication Across the Lifespan", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH1201"}
+{"code": "SPCH2104", "name": "Assessment and Management of Voice Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH2104"}
+{"code": "SPCH2105", "name": "Disorders of Early Language Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH2105"}
+{"code": "SPCH2106", "name": "Phonological Disorders & Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH2106"}
+{"code": "SPCH2203", "name": "Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH2203"}
+{"code": "SPCH2204", "name": "Paediatric & Adult Motor Speech Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH2204"}
+{"code": "SPCH2205", "name": "Acquired Adult Neurogenic Language Disorders: Differential Diagnosis & Clinical Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH2205"}
+{"code": "SPCH3102", "name": "The School-Aged Child", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH3102"}
+{"code": "SPCH3106", "name": "Language: Representation, Processing & Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH3106"}
+{"code": "SPCH3107", "name": "Fluency Disorders & Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH3107"}
+{"code": "SPCH3200", "name": "Children with Special Needs in Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH3200"}
+{"code": "SPCH3205", "name": "Clinical Education IIIB", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH3205"}
+{"code": "SPCH3206", "name": "Adult & Paediatric Dysphagia & Laryngectomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH3206"}
+{"code": "SPCH4105", "name": "Clinical Education IV", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH4105"}
+{"code": "SPCH4106", "name": "Planning, Providing & Managing Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH4106"}
+{"code": "SPCH4107", "name": "Disability Issues & Alternate & Augmentative Communication", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH4107"}
+{"code": "SPCH4108", "name": "Case Integration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH4108"}
+{"code": "SPCH4201", "name": "Professional Issues in Speech Pathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH4201"}
+{"code": "SPCH4202", "name": "Transition to Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH4202"}
+{"code": "SPCH4206", "name": "Clinical Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH4206"}
+{"code": "SPCH7201", "name": "Human Communication & its Disorders: A Guide for the Rural Health Practitioner", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7201"}
+{"code": "SPCH7801", "name": "Introduction to Speech Pathology Practice for Graduates", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7801"}
+{"code": "SPCH7803", "name": "Voice, Hearing & Fluency Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7803"}
+{"code": "SPCH7809", "name": "Intensive Clinic Block", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7809"}
+{"code": "SPCH7811", "name": "Integrated Case Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7811"}
+{"code": "SPCH7812", "name": "Adult Language Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7812"}
+{"code": "SPCH7813", "name": "Clinical Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7813"}
+{"code": "SPCH7814", "name": "Professional Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7814"}
+{"code": "SPCH7815", "name": "Children with Special Needs", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7815"}
+{"code": "SPCH7816", "name": "Practice Education II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7816"}
+{"code": "SPCH7818", "name": "Clinical Management of Dysphagia & Laryngectomy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7818"}
+{"code": "SPCH7819", "name": "Practice Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7819"}
+{"code": "SPCH7820", "name": "Articulation and Phonological Disorders and Clinical Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7820"}
+{"code": "SPCH7821", "name": "Early Childhood Language", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7821"}
+{"code": "SPCH7823", "name": "Language and Literacy in Education", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7823"}
+{"code": "SPCH7824", "name": "Best Practices in Case Integration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7824"}
+{"code": "SPCH7825", "name": "Acquired Adult Neurological Language Disorders", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7825"}
+{"code": "SPCH7826", "name": "Motor Speech Disorders in Children & Adults", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7826"}
+{"code": "SPCH7827", "name": "Integrated Case Management in Speech Pathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPCH7827"}
+{"code": "SPMD3052", "name": "Sports Medicine of Physical Activity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD3052"}
+{"code": "SPMD7001", "name": "Principles of Sports Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7001"}
+{"code": "SPMD7002", "name": "Special Groups in Sports Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7002"}
+{"code": "SPMD7003", "name": "Upper Limb, Head, Neck and Trunk Sport Injuries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7003"}
+{"code": "SPMD7004", "name": "Lower Limb and Lumbar Region Injuries in Sport Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7004"}
+{"code": "SPMD7005", "name": "Clinical Exercise Science for Sports Medicine 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7005"}
+{"code": "SPMD7006", "name": "Exercise Physiology for Sports Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7006"}
+{"code": "SPMD7007", "name": "Clinical Exercise Science for Sports Medicine 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7007"}
+{"code": "SPMD7009", "name": "Research Project in Sports Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7009"}
+{"code": "SPMD7052", "name": "Sports Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SPMD7052"}
+{"code": "STAT1201", "name": "Analysis of Scientific Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT1201"}
+{"code": "STAT1301", "name": "Advanced Analysis of Scientific Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT1301"}
+{"code": "STAT2003", "name": "Mathematical Probability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT2003"}
+{"code": "STAT2004", "name": "Statistical Modelling & Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT2004"}
+{"code": "STAT2201", "name": "Analysis of Engineering & Scientific Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT2201"}
+{"code": "STAT2202", "name": "Probability Models for Engineering & Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT2202"}
+{"code": "STAT2203", "name": "Probability Models and Data Analysis for Engineering", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT2203"}
+{"code": "STAT3001", "name": "Mathematical Statistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT3001"}
+{"code": "STAT3004", "name": "Probability Models & Stochastic Processes", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT3004"}
+{"code": "STAT3006", "name": "Statistical Learning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT3006"}
+{"code": "STAT3306", "name": "Statistical Analysis of Genetic Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT3306"}
+{"code": "STAT3500", "name": "Problems & Applications in Modern Statistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT3500"}
+{"code": "STAT4401", "name": "Advanced Statistics I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT4401"}
+{"code": "STAT4402", "name": "Advanced Statistics II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT4402"}
+{"code": "STAT4403", "name": "Advanced Probability & Stochastic Processes I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT4403"}
+{"code": "STAT4404", "name": "Advanced Probability & Stochastic Processes II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT4404"}
+{"code": "STAT6003", "name": "Special Topics A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT6003"}
+{"code": "STAT6004", "name": "Special Topics B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT6004"}
+{"code": "STAT6010", "name": "Statistics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT6010"}
+{"code": "STAT6020", "name": "Statistics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT6020"}
+{"code": "STAT6030", "name": "Statistics Honours Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT6030"}
+{"code": "STAT7003", "name": "Mathematical Probability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7003"}
+{"code": "STAT7010", "name": "Project or Thesis I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7010"}
+{"code": "STAT7011", "name": "Project or Thesis I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7011"}
+{"code": "STAT7013", "name": "Project or Thesis I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7013"}
+{"code": "STAT7014", "name": "Minor Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7014"}
+{"code": "STAT7015", "name": "Minor Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7015"}
+{"code": "STAT7016", "name": "Mini Project A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7016"}
+{"code": "STAT7017", "name": "Mini Project B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7017"}
+{"code": "STAT7120", "name": "Analysis of Scientific Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7120"}
+{"code": "STAT7174", "name": "Applications of Computational Statistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7174"}
+{"code": "STAT7203", "name": "Applied Probability & Statistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7203"}
+{"code": "STAT7301", "name": "Mathematical Statistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7301"}
+{"code": "STAT7304", "name": "Probability Models & Stochastic Processes I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7304"}
+{"code": "STAT7306", "name": "Statistical Analysis of Genetic Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7306"}
+{"code": "STAT7500", "name": "Problems and Applications in Modern Statistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7500"}
+{"code": "STAT7502", "name": "Advanced Statistics I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7502"}
+{"code": "STAT7503", "name": "Advanced Statistics II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7503"}
+{"code": "STAT7504", "name": "Advanced Probability & Stochastic Processes I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7504"}
+{"code": "STAT7505", "name": "Advanced Probability & Stochastic Processes II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7505"}
+{"code": "STAT7601", "name": "Mathematical Background for Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7601"}
+{"code": "STAT7602", "name": "Health Indicators & Health Surveys", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7602"}
+{"code": "STAT7603", "name": "Data Management & Statistical Computing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7603"}
+{"code": "STAT7604", "name": "Principles of Statistical Inference", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7604"}
+{"code": "STAT7605", "name": "Clinical Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7605"}
+{"code": "STAT7606", "name": "Design of Randomised Controlled Trials", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7606"}
+{"code": "STAT7607", "name": "Linear Models", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7607"}
+{"code": "STAT7608", "name": "Categorical Data & Generalised Linear Models", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7608"}
+{"code": "STAT7609", "name": "Survival Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7609"}
+{"code": "STAT7610", "name": "Longitudinal & Correlated Data", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7610"}
+{"code": "STAT7611", "name": "Statistical Genomics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7611"}
+{"code": "STAT7612", "name": "Advanced Clinical Trials", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7612"}
+{"code": "STAT7613", "name": "Bayesian Statistical Methods", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7613"}
+{"code": "STAT7614", "name": "Probability & Distributional Theory", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7614"}
+{"code": "STAT7615", "name": "Causal Inference", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7615"}
+{"code": "STAT7616", "name": "Machine Learning for Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7616"}
+{"code": "STAT7620", "name": "Thesis in Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7620"}
+{"code": "STAT7622", "name": "Project in Biostatistics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7622"}
+{"code": "STAT7701", "name": "Special Topics I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7701"}
+{"code": "STAT7702", "name": "Special Topics II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7702"}
+{"code": "STAT7703", "name": "Special Topics III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=STAT7703"}
+{"code": "SURG8000", "name": "Doctoral Disseration", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SURG8000"}
+{"code": "SURG8011", "name": "Molecular Biology for Clinicians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SURG8011"}
+{"code": "SURG8012", "name": "Advanced Principles of Immunology and Vaccine Strategies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SURG8012"}
+{"code": "SURG8016", "name": "Special Topic in Surgery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SURG8016"}
+{"code": "SWSP1011", "name": "The Welfare of Australians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP1011"}
+{"code": "SWSP1033", "name": "Introduction to Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP1033"}
+{"code": "SWSP1044", "name": "Human Development and Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP1044"}
+{"code": "SWSP2001", "name": "Identity and Difference in Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2001"}
+{"code": "SWSP2044", "name": "Human Development and Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2044"}
+{"code": "SWSP2066", "name": "Social Work & the Legal Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2066"}
+{"code": "SWSP2077", "name": "Direct Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2077"}
+{"code": "SWSP2088", "name": "Direct Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2088"}
+{"code": "SWSP2211", "name": "Individual Development & Health Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2211"}
+{"code": "SWSP2221", "name": "International Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2221"}
+{"code": "SWSP2288", "name": "Community Development: Local and International Practices", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP2288"}
+{"code": "SWSP3011", "name": "Working in Human Service Organisations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3011"}
+{"code": "SWSP3022", "name": "Moral and Ethical Foundations of Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3022"}
+{"code": "SWSP3027", "name": "Foundational Social Work Field Practice Course in Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3027"}
+{"code": "SWSP3028", "name": "Foundational Social Work Field Practice Course in Child, Youth and Family", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3028"}
+{"code": "SWSP3029", "name": "Foundational Social Work Field Practice Course in Health and Ageing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3029"}
+{"code": "SWSP3076", "name": "Foundations for Social Work Practice in Disability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3076"}
+{"code": "SWSP3077", "name": "Supervised Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3077"}
+{"code": "SWSP3155", "name": "Field Placement 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3155"}
+{"code": "SWSP3160", "name": "Field Placement 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3160"}
+{"code": "SWSP3302", "name": "Research in Social Work and Human Services Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3302"}
+{"code": "SWSP3303", "name": "Advanced Research in Social Work and Human Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP3303"}
+{"code": "SWSP4033", "name": "Research & Evaluation for Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4033"}
+{"code": "SWSP4034", "name": "Advanced Research and Evaluation for Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4034"}
+{"code": "SWSP4088", "name": "Supervised Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4088"}
+{"code": "SWSP4100", "name": "Contemporary Social Work: Frameworks for Advanced Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4100"}
+{"code": "SWSP4176", "name": "Advanced Social Work Field Practice Course in Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4176"}
+{"code": "SWSP4178", "name": "Advanced Social Work Field Practice Course in Child, Youth and Family", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4178"}
+{"code": "SWSP4179", "name": "Advanced Social Work Field Practice Course in Health and Ageing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4179"}
+{"code": "SWSP4181", "name": "Advanced Social Work Field Practice in Health and Ageing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4181"}
+{"code": "SWSP4182", "name": "Advanced Social Work Field Practice in Child, Youth and Family", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4182"}
+{"code": "SWSP4183", "name": "Advanced Social Work Field Practice in Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4183"}
+{"code": "SWSP4211", "name": "Group Work: individual change and social action", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4211"}
+{"code": "SWSP4213", "name": "Community Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4213"}
+{"code": "SWSP4215", "name": "Interpersonal Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4215"}
+{"code": "SWSP4217", "name": "Child and Family Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4217"}
+{"code": "SWSP4266", "name": "Field Placement 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4266"}
+{"code": "SWSP4281", "name": "Advanced Research and Evaluation in Health and Ageing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4281"}
+{"code": "SWSP4282", "name": "Advanced Research and Evaluation in Child, Youth and Family", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4282"}
+{"code": "SWSP4283", "name": "Advanced Research and Evaluation in Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP4283"}
+{"code": "SWSP7022", "name": "Moral & Ethical Foundations of Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7022"}
+{"code": "SWSP7025", "name": "Social Work Practice With People Who Have Mental Health Problems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7025"}
+{"code": "SWSP7026", "name": "Social Work Practice in Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7026"}
+{"code": "SWSP7027", "name": "Social Context and Consequences of Mental Illness in Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7027"}
+{"code": "SWSP7028", "name": "Foundational Social Work Field Practice Course in Child, Youth and Family", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7028"}
+{"code": "SWSP7033", "name": "Research & Evaluation for Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7033"}
+{"code": "SWSP7044", "name": "Lifespan, Culture and Disability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7044"}
+{"code": "SWSP7046", "name": "Human Services Practice with Indigenous Australians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7046"}
+{"code": "SWSP7066", "name": "Social Work and the Legal Context", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7066"}
+{"code": "SWSP7082", "name": "Program Development and Management for the Human Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7082"}
+{"code": "SWSP7088", "name": "Supervised Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7088"}
+{"code": "SWSP7093", "name": "Community Development Method & Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7093"}
+{"code": "SWSP7103", "name": "Frameworking for Community Development Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7103"}
+{"code": "SWSP7111", "name": "Introduction to Key Elements of Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7111"}
+{"code": "SWSP7113", "name": "Training Frameworks for Community Development Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7113"}
+{"code": "SWSP7123", "name": "Community Planning, Engagement and Governance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7123"}
+{"code": "SWSP7133", "name": "Community Development Practice in International Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7133"}
+{"code": "SWSP7144", "name": "Social Research in the Human Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7144"}
+{"code": "SWSP7155", "name": "Field Placement 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7155"}
+{"code": "SWSP7160", "name": "Field Placement 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7160"}
+{"code": "SWSP7164", "name": "Program and Service Evaluation in the Human Services", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7164"}
+{"code": "SWSP7165", "name": "Field Placement 1: Extended Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7165"}
+{"code": "SWSP7175", "name": "Practice Leadership in Complex Environments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7175"}
+{"code": "SWSP7177", "name": "Direct Practice 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7177"}
+{"code": "SWSP7181", "name": "Advanced Social Work Field Practice Course in Health and Ageing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7181"}
+{"code": "SWSP7182", "name": "Advanced Social Work Field Practice Course in Child, Youth and Family", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7182"}
+{"code": "SWSP7183", "name": "Advanced Social Work Field Practice Course in Mental Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7183"}
+{"code": "SWSP7188", "name": "Direct Practice 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7188"}
+{"code": "SWSP7195", "name": "Applied Ethics in Human Service Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7195"}
+{"code": "SWSP7199", "name": "The Legal and Policy Context for Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7199"}
+{"code": "SWSP7205", "name": "Professional Leadership and Supervision in Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7205"}
+{"code": "SWSP7222", "name": "The Social Policy Context of Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7222"}
+{"code": "SWSP7254", "name": "Communication Skills for Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7254"}
+{"code": "SWSP7255", "name": "Theorising Social Work Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7255"}
+{"code": "SWSP7266", "name": "Field Placement 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7266"}
+{"code": "SWSP7267", "name": "Family Therapy Traditions: Basic Concepts and Skills", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7267"}
+{"code": "SWSP7277", "name": "Key Skills and Competencies of Family Therapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7277"}
+{"code": "SWSP7287", "name": "Theoretical Foundations of Family Therapy Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7287"}
+{"code": "SWSP7297", "name": "Family Therapy: Life Stages and Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7297"}
+{"code": "SWSP7302", "name": "Research in Social Work and Human Services Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7302"}
+{"code": "SWSP7360", "name": "Research Project Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7360"}
+{"code": "SWSP7361", "name": "Research Project Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7361"}
+{"code": "SWSP7362", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7362"}
+{"code": "SWSP7366", "name": "Field Placement 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7366"}
+{"code": "SWSP7367", "name": "Advanced Practicum 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7367"}
+{"code": "SWSP7368", "name": "Advanced Practicum 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7368"}
+{"code": "SWSP7394", "name": "Research Project Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7394"}
+{"code": "SWSP7404", "name": "Research Project Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7404"}
+{"code": "SWSP7414", "name": "Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7414"}
+{"code": "SWSP7433", "name": "Community Economic Development: Local & International", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7433"}
+{"code": "SWSP7500", "name": "Key Theoretical Perspectives in Contemporary Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7500"}
+{"code": "SWSP7501", "name": "The Organisational Context of Child Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7501"}
+{"code": "SWSP7502", "name": "Working with Children, Family and Caregivers", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7502"}
+{"code": "SWSP7503", "name": "Practising in Child Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7503"}
+{"code": "SWSP7504", "name": "Advanced Assessment Skills in Child Protection", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7504"}
+{"code": "SWSP7505", "name": "Advanced Practice in Out of Home Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7505"}
+{"code": "SWSP7600", "name": "Professional Practice Portfolio for Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7600"}
+{"code": "SWSP7700", "name": "Professional Practice Portfolio for Social Work", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=SWSP7700"}
+{"code": "TIMS1301", "name": "Foundations of Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS1301"}
+{"code": "TIMS2301", "name": "Theory of Entrepreneurship and Innovation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS2301"}
+{"code": "TIMS3302", "name": "Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS3302"}
+{"code": "TIMS3304", "name": "Social Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS3304"}
+{"code": "TIMS3309", "name": "Fundamentals of Technology and Innovation Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS3309"}
+{"code": "TIMS3310", "name": "Entrepreneurial Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS3310"}
+{"code": "TIMS4301", "name": "Entrepreneurship and Innovation Incubator", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS4301"}
+{"code": "TIMS4302", "name": "Business Model Innovation and Growth", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS4302"}
+{"code": "TIMS7301", "name": "Principles of Entrepreneurship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7301"}
+{"code": "TIMS7302", "name": "The Business of Complex Projects", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7302"}
+{"code": "TIMS7317", "name": "Corporate Sustainability", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7317"}
+{"code": "TIMS7319", "name": "Management of Research & Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7319"}
+{"code": "TIMS7321", "name": "Developing Business from Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7321"}
+{"code": "TIMS7323", "name": "Bio-Entrepreneurship and Innovation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7323"}
+{"code": "TIMS7324", "name": "Biotechnology Venture Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7324"}
+{"code": "TIMS7326", "name": "Management of Intellectual Property", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7326"}
+{"code": "TIMS7327", "name": "Managing Creativity and Innovation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7327"}
+{"code": "TIMS7328", "name": "Strategies for Business Sustainability and Innovation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7328"}
+{"code": "TIMS7329", "name": "Social Entrepreneurship in Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7329"}
+{"code": "TIMS7330", "name": "Startup Entrepreneurship In Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7330"}
+{"code": "TIMS7331", "name": "Entrepreneurship Incubator", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7331"}
+{"code": "TIMS7811", "name": "Innovation Leadership", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7811"}
+{"code": "TIMS7900", "name": "Innovation Management in Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TIMS7900"}
+{"code": "TOUR1000", "name": "Principles of Tourism, Hospitality & Events", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR1000"}
+{"code": "TOUR1001", "name": "Global Cultures & Tourism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR1001"}
+{"code": "TOUR2001", "name": "Tourist and Visitor Behaviour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR2001"}
+{"code": "TOUR2002", "name": "Tourism and Leisure Operations Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR2002"}
+{"code": "TOUR2007", "name": "Sustainable Tourism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR2007"}
+{"code": "TOUR2008", "name": "Tourism and Leisure Futures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR2008"}
+{"code": "TOUR2009", "name": "Destination and Experience Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR2009"}
+{"code": "TOUR2010", "name": "Applied Economics for Tourism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR2010"}
+{"code": "TOUR2011", "name": "Tourism Sales and Distribution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR2011"}
+{"code": "TOUR3001", "name": "Tourism Policy and Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3001"}
+{"code": "TOUR3003", "name": "Tourism Field Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3003"}
+{"code": "TOUR3004", "name": "International Study Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3004"}
+{"code": "TOUR3005", "name": "Tourism and Hospitality Issues", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3005"}
+{"code": "TOUR3006", "name": "Responsible Tourism and Ethics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3006"}
+{"code": "TOUR3007", "name": "Strategic Tourism Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3007"}
+{"code": "TOUR3008", "name": "Service Management in Tourism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3008"}
+{"code": "TOUR3009", "name": "Professional Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR3009"}
+{"code": "TOUR6000", "name": "Tourism & Leisure Seminars", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR6000"}
+{"code": "TOUR6005", "name": "Industry Research and Consultancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR6005"}
+{"code": "TOUR6007", "name": "Honours Thesis A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR6007"}
+{"code": "TOUR6008", "name": "Honours Thesis B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR6008"}
+{"code": "TOUR6033", "name": "Critical Issues in Tourism, Hospitality & Events", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR6033"}
+{"code": "TOUR6034", "name": "Change & Innovation in Tourism, Hospitality & Events", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR6034"}
+{"code": "TOUR6035", "name": "Advanced Research Methods and Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR6035"}
+{"code": "TOUR7000", "name": "Industry Research and Consultancy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7000"}
+{"code": "TOUR7009", "name": "Tourism Thesis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7009"}
+{"code": "TOUR7011", "name": "Destination Study Tour", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7011"}
+{"code": "TOUR7012", "name": "Research Tourism Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7012"}
+{"code": "TOUR7020", "name": "Tourism, Hospitality & Event Industries", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7020"}
+{"code": "TOUR7021", "name": "Tourism, Hospitality & Event Service", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7021"}
+{"code": "TOUR7022", "name": "Disciplinary Foundations of Tourism, Hospitality & Events", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7022"}
+{"code": "TOUR7023", "name": "Managing Resources in Tourism, Hospitality & Events", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7023"}
+{"code": "TOUR7031", "name": "Visitor Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7031"}
+{"code": "TOUR7032", "name": "Marketing & Distribution Research Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7032"}
+{"code": "TOUR7033", "name": "Critical Issues in Tourism, Hospitality & Events", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7033"}
+{"code": "TOUR7034", "name": "Change & Innovation in Tourism, Hospitality & Events", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7034"}
+{"code": "TOUR7035", "name": "Advanced Research Methods and Analysis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7035"}
+{"code": "TOUR7040", "name": "Professional Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7040"}
+{"code": "TOUR7050", "name": "Special Interest Tourism", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7050"}
+{"code": "TOUR7051", "name": "Destination Management & Marketing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7051"}
+{"code": "TOUR7052", "name": "Travel Distribution and Transport Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7052"}
+{"code": "TOUR7053", "name": "Tourism in Developing Economies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7053"}
+{"code": "TOUR7060", "name": "Research Thesis I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7060"}
+{"code": "TOUR7061", "name": "Research Thesis II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7061"}
+{"code": "TOUR7071", "name": "Professional Consultancy Project II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7071"}
+{"code": "TOUR7999", "name": "Tourism Industry Placement", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOUR7999"}
+{"code": "TOXY6005", "name": "Drug Metabolism, Transport and Toxicology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TOXY6005"}
+{"code": "TRFCR1000", "name": "Transfer Credit - Block", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1000"}
+{"code": "TRFCR1001", "name": "Transfer Credit-Elective Intro", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1001"}
+{"code": "TRFCR1002", "name": "Transfer Credit-Directed Intro", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1002"}
+{"code": "TRFCR1003", "name": "Transfer Credit - Off List Elective Intro", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1003"}
+{"code": "TRFCR1004", "name": "Transfer Credit - Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1004"}
+{"code": "TRFCR1005", "name": "Unspec Engineering Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1005"}
+{"code": "TRFCR1006", "name": "Unspec Lvl 1 Non Eng Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1006"}
+{"code": "TRFCR1007", "name": "Unspecified Part B Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1007"}
+{"code": "TRFCR1008", "name": "Unspecified Part B1 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1008"}
+{"code": "TRFCR1009", "name": "Unspecified Part B2 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1009"}
+{"code": "TRFCR1010", "name": "Unspecified Lvl 1 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1010"}
+{"code": "TRFCR1011", "name": "Unspecified Part B3 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1011"}
+{"code": "TRFCR1012", "name": "Unspecified Part B4 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1012"}
+{"code": "TRFCR1013", "name": "Unspecified Part C Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1013"}
+{"code": "TRFCR1014", "name": "Unspecified Part D Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1014"}
+{"code": "TRFCR1015", "name": "Unspecified Part E Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1015"}
+{"code": "TRFCR1016", "name": "Unspecified Part F Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1016"}
+{"code": "TRFCR1017", "name": "Unspecified Part N Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1017"}
+{"code": "TRFCR1018", "name": "Unspec Part A Compulsory Course", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1018"}
+{"code": "TRFCR1019", "name": "Unspecified Part B Level 3 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1019"}
+{"code": "TRFCR1020", "name": "Unspecified Part B Level 4 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR1020"}
+{"code": "TRFCR2001", "name": "Transfer Credit-Elective Adv 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR2001"}
+{"code": "TRFCR2002", "name": "Transfer Credit-Directed Adv 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR2002"}
+{"code": "TRFCR2003", "name": "Transfer Credit-Off List Elective Advanced", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR2003"}
+{"code": "TRFCR2004", "name": "Transfer Credit - Part B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR2004"}
+{"code": "TRFCR2005", "name": "Unspec Lvl 2 Non Eng Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR2005"}
+{"code": "TRFCR2006", "name": "Unspecified Lvl 2 Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR2006"}
+{"code": "TRFCR3000", "name": "Transfer Credit-Field Placemnt", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR3000"}
+{"code": "TRFCR3001", "name": "Transfer Credit-Elective Adv 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR3001"}
+{"code": "TRFCR3002", "name": "Transfer Credit-Directed Adv 3", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR3002"}
+{"code": "TRFCR3004", "name": "Transfer Credit - Part B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR3004"}
+{"code": "TRFCR4001", "name": "Transfer Credit-Elective Adv 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR4001"}
+{"code": "TRFCR4002", "name": "Transfer Credit-Directed Adv 4", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR4002"}
+{"code": "TRFCR5001", "name": "Transfer Credit-Elective Adv 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR5001"}
+{"code": "TRFCR5002", "name": "Transfer Credit-Directed Adv 5", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR5002"}
+{"code": "TRFCR6001", "name": "Transfer Credit-Elective Adv 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR6001"}
+{"code": "TRFCR6002", "name": "Transfer Credit-Directed Adv 6", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR6002"}
+{"code": "TRFCR7000", "name": "Transfer Credit-Field Placemnt", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR7000"}
+{"code": "TRFCR7001", "name": "Transfer Credit-Elective Adv 7", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR7001"}
+{"code": "TRFCR7002", "name": "Transfer Credit-Directed Adv 7", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR7002"}
+{"code": "TRFCR8001", "name": "Transfer Credit-Elective Adv 8", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR8001"}
+{"code": "TRFCR8002", "name": "Transfer Credit-Directed Adv 8", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=TRFCR8002"}
+{"code": "UNITS2000", "name": "Transfer Credit Points to Units", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=UNITS2000"}
+{"code": "VETS1003", "name": "Digestion, Metabolism & Nutrition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1003"}
+{"code": "VETS1005", "name": "Professional Studies for Veterinary Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1005"}
+{"code": "VETS1018", "name": "Veterinary Professional Foundations", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1018"}
+{"code": "VETS1021", "name": "Functional Anatomy of Locomotion and the Integument", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1021"}
+{"code": "VETS1023", "name": "Animal Handling, Behaviour and Welfare for Veterinary Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1023"}
+{"code": "VETS1025", "name": "Animal Management for Veterinarians", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1025"}
+{"code": "VETS1030", "name": "One Health: Animals, the Environment and Human Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1030"}
+{"code": "VETS1060", "name": "Animal and Veterinary Biology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS1060"}
+{"code": "VETS2001", "name": "Animal Health Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2001"}
+{"code": "VETS2006", "name": "Principles of Disease I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2006"}
+{"code": "VETS2007", "name": "Principles of Disease II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2007"}
+{"code": "VETS2008", "name": "Veterinary Reproduction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2008"}
+{"code": "VETS2011", "name": "Structure and Function I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2011"}
+{"code": "VETS2012", "name": "Structure and Function II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2012"}
+{"code": "VETS2031", "name": "Comparative Structure and Function for Animal Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2031"}
+{"code": "VETS2032", "name": "Animal Pathogens and Immunity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2032"}
+{"code": "VETS2033", "name": "Laboratory Animal Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS2033"}
+{"code": "VETS3009", "name": "Small Animal Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3009"}
+{"code": "VETS3010", "name": "Infectious Diseases", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3010"}
+{"code": "VETS3011", "name": "Pathophysiology, Pharmacological & Clinical Principles Used in Diagnosis of Diseases in Body Syst", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3011"}
+{"code": "VETS3012", "name": "Animal Production Systems and Welfare", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3012"}
+{"code": "VETS3017", "name": "Animal Therapeutics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3017"}
+{"code": "VETS3018", "name": "Large Animal Health & Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3018"}
+{"code": "VETS3022", "name": "Veterinary and Animal Enterprise Business Fundamentals", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3022"}
+{"code": "VETS3023", "name": "Veterinary Laboratory Diagnostics for Veterinary Technologists", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3023"}
+{"code": "VETS3024", "name": "Veterinary Professional Contexts", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3024"}
+{"code": "VETS3040", "name": "Mechanisms of Animal Disease", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3040"}
+{"code": "VETS3041", "name": "Stem Cells, Clones & Genetically Modified Organisms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3041"}
+{"code": "VETS3042", "name": "Ecological and Disease Genetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3042"}
+{"code": "VETS3043", "name": "Surgical Principles and Practices", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3043"}
+{"code": "VETS3044", "name": "Preparation for Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3044"}
+{"code": "VETS3050", "name": "Veterinary Pharmacology, Therapeutics and Toxicology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3050"}
+{"code": "VETS3060", "name": "Veterinary Systems Pathology and Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3060"}
+{"code": "VETS3070", "name": "Veterinary Clinical Principles", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3070"}
+{"code": "VETS3071", "name": "Veterinary Clinical Transition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS3071"}
+{"code": "VETS4010", "name": "Companion Animal Clinical Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS4010"}
+{"code": "VETS4022", "name": "Equine Clinical Studies", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS4022"}
+{"code": "VETS4034", "name": "Theriogenology: Clinical Reproduction, Obstetrics and Neonatology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS4034"}
+{"code": "VETS4035", "name": "Ruminant Medicine and Surgery", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS4035"}
+{"code": "VETS4040", "name": "Veterinary Population Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS4040"}
+{"code": "VETS5012", "name": "Veterinary Public Health and Pathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5012"}
+{"code": "VETS5015", "name": "Equine Clinics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5015"}
+{"code": "VETS5016", "name": "Clinical Veterinary Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5016"}
+{"code": "VETS5017", "name": "Research Veterinary Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5017"}
+{"code": "VETS5020", "name": "Veterinary Diagnostic Pathology and State Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5020"}
+{"code": "VETS5024", "name": "Rural Veterinary Practice - Livestock Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5024"}
+{"code": "VETS5028", "name": "Veterinary Anaesthesia, Diagnostic Imaging and Emergency and Critical Care", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5028"}
+{"code": "VETS5029", "name": "Veterinary Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5029"}
+{"code": "VETS5030", "name": "Small Animal Clinics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5030"}
+{"code": "VETS5050", "name": "Veterinary Diagnostic Pathology and State Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5050"}
+{"code": "VETS5116", "name": "Clinical Veterinary Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5116"}
+{"code": "VETS5117", "name": "Research Veterinary Elective", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5117"}
+{"code": "VETS5120", "name": "Veterinary Diagnostic Pathology and State Medicine", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5120"}
+{"code": "VETS5128", "name": "Veterinary Anaesthesia and Radiology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5128"}
+{"code": "VETS5130", "name": "Small Animal Clinics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS5130"}
+{"code": "VETS6001", "name": "Epidemiological and Research Methods for Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6001"}
+{"code": "VETS6616", "name": "Honours Research Project in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6616"}
+{"code": "VETS6617", "name": "Honours Research Project in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6617"}
+{"code": "VETS6619", "name": "Honours Research Project in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6619"}
+{"code": "VETS6621", "name": "Veterinary Technology Honours Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6621"}
+{"code": "VETS6622", "name": "Veterinary Technology Honours Practicum", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6622"}
+{"code": "VETS6626", "name": "Honours Research Project in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6626"}
+{"code": "VETS6627", "name": "Honours Research Project in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6627"}
+{"code": "VETS6628", "name": "Honours Research Project in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6628"}
+{"code": "VETS6629", "name": "Honours Research Project in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6629"}
+{"code": "VETS6631", "name": "Honours Research Project in Veterinary Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6631"}
+{"code": "VETS6632", "name": "Honours Research Project in Veterinary Technology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6632"}
+{"code": "VETS6640", "name": "Critical Thinking and Scientific Writing in Animal and Veterinary Biosciences", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS6640"}
+{"code": "VETS7601", "name": "Graduate Research Project I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7601"}
+{"code": "VETS7605", "name": "Advanced Veterinary Topic III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7605"}
+{"code": "VETS7608", "name": "Advanced Veterinary Topic I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7608"}
+{"code": "VETS7609", "name": "Advanced Veterinary Topic II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7609"}
+{"code": "VETS7611", "name": "Graduate Research Project I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7611"}
+{"code": "VETS7617", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7617"}
+{"code": "VETS7618", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7618"}
+{"code": "VETS7619", "name": "Graduate Research Project III", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7619"}
+{"code": "VETS7703", "name": "Tropical Veterinary Medicine I", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7703"}
+{"code": "VETS7704", "name": "Veterinary Diagnostic Laboratory Techniques", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7704"}
+{"code": "VETS7706", "name": "Infectious Disease Diagnosis", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7706"}
+{"code": "VETS7708", "name": "Tropical Veterinary Medicine II", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7708"}
+{"code": "VETS7709", "name": "Diagnostic Pathology", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7709"}
+{"code": "VETS7711", "name": "Pathology of Diseases of Australian Wildlife", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS7711"}
+{"code": "VETS8000", "name": "Clinical Research Methods in Veterinary Science", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VETS8000"}
+{"code": "VREX1011", "name": "Virtual Exchange - Semester 1", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VREX1011"}
+{"code": "VREX1021", "name": "Virtual Exchange - Semester 2", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VREX1021"}
+{"code": "VREX1031", "name": "Virtual Exchange - Summer Semester", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VREX1031"}
+{"code": "VREX1035", "name": "Virtual Exchange - Summer Semester", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=VREX1035"}
+{"code": "WATR7000", "name": "New Perspectives on Project Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7000"}
+{"code": "WATR7001", "name": "Science of Water", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7001"}
+{"code": "WATR7002", "name": "Water, Sustainability and Development", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7002"}
+{"code": "WATR7003", "name": "Water Governance and Policy", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7003"}
+{"code": "WATR7100", "name": "Catchment & Aquatic Ecosystem Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7100"}
+{"code": "WATR7103", "name": "Advanced Wastewater and Biosolids Treatment", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7103"}
+{"code": "WATR7104", "name": "Sewer Networks - Design, Operation and Maintenance", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7104"}
+{"code": "WATR7105", "name": "Integrated Urban Water Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7105"}
+{"code": "WATR7106", "name": "Emerging Issues in the Urban Water Cycle and Public Health", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7106"}
+{"code": "WATR7107", "name": "Wastewater Modelling and Control", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7107"}
+{"code": "WATR7108", "name": "Advanced Unit Operations in Water Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7108"}
+{"code": "WATR7109", "name": "Drinking Water Supply: Source, Treatment and Distribution", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7109"}
+{"code": "WATR7200", "name": "Community, Livelihoods, Development & Water", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7200"}
+{"code": "WATR7300", "name": "Economics for Water Resource Management", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7300"}
+{"code": "WATR7400", "name": "WASH: water supply, sanitation and hygiene", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7400"}
+{"code": "WATR7500", "name": "Integrated Water Management Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7500"}
+{"code": "WATR7501", "name": "Integrated Water Management Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7501"}
+{"code": "WATR7502", "name": "Integrated Water Management Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7502"}
+{"code": "WATR7503", "name": "Integrated Water Management Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7503"}
+{"code": "WATR7600", "name": "Urban Futures: Delivering Water Sensitive Cities", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7600"}
+{"code": "WATR7700", "name": "Urban Metabolism - Resource and Energy Recovery Systems", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7700"}
+{"code": "WATR7800", "name": "Water, Agricultural Landscapes and Food Security", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7800"}
+{"code": "WATR7900", "name": "Collaborative Planning", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WATR7900"}
+{"code": "WCIV1000", "name": "The Classical World", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV1000"}
+{"code": "WCIV1100", "name": "Jewish and Christian Works", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV1100"}
+{"code": "WCIV2000", "name": "European Enlightenments", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2000"}
+{"code": "WCIV2100", "name": "Empire and its Critics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2100"}
+{"code": "WCIV2200", "name": "American Epic: Form and Experience", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2200"}
+{"code": "WCIV2300", "name": "Shakespeare, Art and the Modern", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2300"}
+{"code": "WCIV2400", "name": "The Critical Tradition", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2400"}
+{"code": "WCIV2500", "name": "Sounding the West: Music and Cultures", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2500"}
+{"code": "WCIV2600", "name": "Icons of Western Art", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2600"}
+{"code": "WCIV2700", "name": "Western Political Thought", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2700"}
+{"code": "WCIV2800", "name": "The Rule of Law", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2800"}
+{"code": "WCIV2900", "name": "Rights and Freedoms", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV2900"}
+{"code": "WCIV3000", "name": "Women and Gender: Historical and Contemporary Writings", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV3000"}
+{"code": "WCIV3100", "name": "Situating Australia", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV3100"}
+{"code": "WCIV3200", "name": "Constructing the West", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV3200"}
+{"code": "WCIV6000", "name": "Western Civilisation Honours Seminar A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV6000"}
+{"code": "WCIV6100", "name": "Western Civilisation Honours Seminar B", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WCIV6100"}
+{"code": "WRIT1001", "name": "Writing for International Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1001"}
+{"code": "WRIT1005", "name": "Fundamentals of Academic Writing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1005"}
+{"code": "WRIT1101X", "name": "English Grammar and Style", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1101X"}
+{"code": "WRIT1110", "name": "Creative Writing: Narrative Fiction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1110"}
+{"code": "WRIT1200", "name": "Writing Creatively", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1200"}
+{"code": "WRIT1250", "name": "English Grammar and Style", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1250"}
+{"code": "WRIT1901D", "name": "Language for Business", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1901D"}
+{"code": "WRIT1999", "name": "Effective Thinking and Writing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT1999"}
+{"code": "WRIT2000", "name": "Writing & Editing for the Professions", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT2000"}
+{"code": "WRIT2050", "name": "Creative Writing: Genre Fiction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT2050"}
+{"code": "WRIT2100", "name": "Creative Writing: Poetics", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT2100"}
+{"code": "WRIT2120", "name": "Creative Writing: Screenwriting", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT2120"}
+{"code": "WRIT2250", "name": "Writing: Grammar, Syntax, and Style", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT2250"}
+{"code": "WRIT3000", "name": "Writing: Advanced Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT3000"}
+{"code": "WRIT3050", "name": "Creative Writing: Non-Fiction", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT3050"}
+{"code": "WRIT3100", "name": "Writing Ancient History", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT3100"}
+{"code": "WRIT3613", "name": "History in Action", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT3613"}
+{"code": "WRIT3700", "name": "Publishing, Editing, and Authorship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT3700"}
+{"code": "WRIT6001", "name": "Academic English & Thesis Writing for International Students", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT6001"}
+{"code": "WRIT6055", "name": "Writing Creative Non-Fiction and Memoir", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT6055"}
+{"code": "WRIT6110", "name": "Writing the Novel", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT6110"}
+{"code": "WRIT7000", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7000"}
+{"code": "WRIT7005", "name": "Research Techniques", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7005"}
+{"code": "WRIT7010", "name": "Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7010"}
+{"code": "WRIT7015", "name": "Publishing and Professional Practice", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7015"}
+{"code": "WRIT7020", "name": "Dissertation Part A", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7020"}
+{"code": "WRIT7035", "name": "Workplace Writing and Editing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7035"}
+{"code": "WRIT7040", "name": "Industry Internship", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7040"}
+{"code": "WRIT7045", "name": "Individual Project", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7045"}
+{"code": "WRIT7050", "name": "Fiction, Ideas, Creativity", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7050"}
+{"code": "WRIT7070", "name": "Editing the Manuscript", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7070"}
+{"code": "WRIT7080", "name": "Special Research Topic in Writing, Editing & Publishing", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7080"}
+{"code": "WRIT7090", "name": "Writing and Publishing for Children and Young Adults", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7090"}
+{"code": "WRIT7100", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7100"}
+{"code": "WRIT7110", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7110"}
+{"code": "WRIT7120", "name": "Dissertation", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7120"}
+{"code": "WRIT7250", "name": "Advanced Writing: Grammar, Syntax and Style", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT7250"}
+{"code": "WRIT9500", "name": "Creative Writing Seminar", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT9500"}
+{"code": "WRIT9510", "name": "Creative Writing Workshop", "href": "https://my.uq.edu.au/programs-courses/course.html?course_code=WRIT9510"}
@@ -0,0 +1,31 @@
+"""The cases of python -m uq_data.bench, as pytest-benchmark tests.
+
+    pytest tests/test_bench.py --benchmark-json=bench.json
+    pytest tests/test_bench.py --benchmark-compare
+
+Each case runs at BENCH_SIZES items (default 100), and the suite checks
+each still runs. The bench runner times the same cases at up to 50k items.
+"""
+import os
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from uq_data.bench.__main__ import CASES
+
+_sizes = [int(n) for n in os.environ.get('BENCH_SIZES', '100').split(',')]
+
+@pytest.mark.parametrize('size', _sizes)
+@pytest.mark.parametrize('name', list(CASES))
+def test_case(benchmark, name, size):
+    try:
+        case = CASES[name]()
+    except ImportError as e:
+        pytest.skip(str(e))
+    if size > case.limit:
+        pytest.skip(f'{name} is limited to {case.limit} items')
+    data = case.setup(size)
+    benchmark.group = name
+    benchmark.extra_info['items'] = size
+    benchmark.pedantic(case.run, args=(data, ), rounds=3 if size < 10000 else 1)
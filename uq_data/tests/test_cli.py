@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from uq_data.__main__ import main
+
+def test_triage_runs_verify_html(tmp_path, capsys):
+    html = tmp_path / 'html'
+    html.mkdir()
+    (html / 'MATH1051.html').write_text('<html></html>')
+    (html / 'MATH1052.html').write_text('')
+    report = str(tmp_path / 'report.json')
+
+    main(['triage', str(html), '--report', report, '--threads', '1'])
+    with open(report) as f:
+        assert json.load(f)['counts']['empty'] == 1
+    assert '1 empty' in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        main(['triage', '--help'])
+    assert capsys.readouterr().out.startswith('usage: python -m uq_data triage')
+
+def test_other_commands_reject_unknown_arguments(tmp_path):
+    with pytest.raises(SystemExit) as e:
+        main(['query', str(tmp_path / 'courses.idx'), '--bad'])
+    assert e.value.code == 2
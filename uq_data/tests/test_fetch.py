@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from uq_data.course_codes.listing import ListingParser
+from uq_data.course_codes.scrape import fetch_listing
+from uq_data.fetch import FetchError, feed_to, fetch, save_to
+
+CODES = ['ENGG%d' % (1100 + i) for i in range(12)]
+
+def _listing_chunks():
+    # Split part way through, so a parser fed as bytes arrive sees the
+    # first half of the courses before the rest is sent.
+    items = [f'<li><a class="code" href="/programs-courses/course.html?course_code={code}">'
+        f'{code}</a> <span class="title">Course {code}</span></li>\n' for code in CODES]
+    half = len(items) // 2
+    yield ('<html><body><div id="courses-container"><ul class="listing">\n'
+        + ''.join(items[:half])).encode()
+    yield (''.join(items[half:]) + '</ul></div></body></html>').encode()
+
+class _Handler(BaseHTTPRequestHandler):
+    pause = 0.3 # between listing chunks
+    requests = None # path of each request
+    fail_first = () # course codes answered 503 on their first request
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        url = urlparse(self.path)
+        if url.path == '/programs-courses/search.html':
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.end_headers()
+            for i, chunk in enumerate(_listing_chunks()):
+                if i:
+                    time.sleep(self.pause)
+                self.wfile.write(chunk)
+                self.wfile.flush()
+            return
+
+        code = parse_qs(url.query).get('course_code', [''])[0]
+        if code not in CODES:
+            status, body = 404, b''
+        elif code in self.fail_first and self.requests.count(self.path) == 1:
+            status, body = 503, b''
+        else:
+            status, body = 200, f'<html><h1>{code}</h1></html>'.encode() * 1000
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def server():
+    handler = type('Handler', (_Handler, ), {'requests': [], 'fail_first': {'ENGG1100', 'ENGG1105'}})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f'http://127.0.0.1:{server.server_port}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _course_url(server, code):
+    return f'{server.url}/programs-courses/course.html?course_code={code}'
+
+def test_fetch_listing(server):
+    courses = fetch_listing(server.url + '/programs-courses/search.html')
+    assert [c['code'] for c in courses] == CODES
+    assert courses[0] == {'code': 'ENGG1100', 'name': 'Course ENGG1100',
+        'href': _course_url(server, 'ENGG1100')}
+
+def test_parser_is_fed_as_bytes_arrive(server):
+    first_course = []
+    closed = []
+
+    class Parser(ListingParser):
+        def feed(self, data):
+            if super().feed(data) and not first_course:
+                first_course.append(time.perf_counter())
+
+        def close(self):
+            super().close()
+            closed.append(time.perf_counter())
+
+    failures = fetch([server.url + '/programs-courses/search.html'], feed_to(Parser))
+    assert failures == []
+    assert closed[0] - first_course[0] >= _Handler.pause * 0.8
+
+def test_save_to_retries_and_fails(server, tmp_path):
+    folder = str(tmp_path / 'html')
+    urls = [_course_url(server, code) for code in CODES + ['MISSING1000']]
+    failures = fetch(urls, save_to(folder), backoff=0.01, rate=100, burst=100)
+
+    assert [(url, type(e), e.status) for url, e in failures] == \
+        [(urls[-1], FetchError, 404)]
+    assert sorted(os.listdir(folder)) == [code + '.html' for code in CODES]
+    with open(os.path.join(folder, 'ENGG1105.html'), 'rb') as f:
+        assert f.read() == b'<html><h1>ENGG1105</h1></html>' * 1000
+    # Retried once each, and the 404 not at all.
+    assert len(server.RequestHandlerClass.requests) == len(urls) + 2
+
+def test_rate_limit(server, tmp_path):
+    urls = [_course_url(server, code) for code in CODES]
+    start = time.perf_counter()
+    fetch(urls, save_to(str(tmp_path)), rate=20, burst=1, backoff=0.01)
+    # 12 courses and 2 retries, one every 50ms after the first.
+    assert time.perf_counter() - start >= 13 / 20 * 0.9
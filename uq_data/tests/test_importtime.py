@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from uq_data.bench import importtime
+
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+@pytest.fixture(scope='module')
+def results():
+    # A generous budget, as CI machines are slower and noisier than the
+    # 100ms bench/importtime.py checks by default.
+    return importtime.run(budget_ms=1000)
+
+@pytest.mark.parametrize('case', ['help', 'query', 'search', 'triage',
+    'import courses.parse', 'import lookup', 'import snapshot'])
+def test_light_commands_import_no_heavy_dependencies(results, case):
+    result = results[case]
+    assert result['heavy'] == []
+    assert result['ok'], result
+
+@pytest.mark.parametrize('script', ['uq_data/prereqs.py', 'uq_data/courses/parse.py'])
+def test_modules_run_as_scripts(tmp_path, script):
+    # As editors run the current file, without -m, from within uq_data.
+    os.mkdir(str(tmp_path / 'html'))
+    os.mkdir(str(tmp_path / 'course'))
+    with open(str(tmp_path / '_prereqs.txt'), 'w') as f:
+        f.write('MATH1051 and (MATH1052 or MATH1072)\n')
+    subprocess.run([sys.executable, os.path.join(_root, script)],
+        cwd=str(tmp_path), check=True, stdout=subprocess.DEVNULL)
@@ -0,0 +1,32 @@
+import pytest
+
+from uq_data.lookup import CourseIndex, build_index
+
+CODES = ['COMP3506', 'ENGG1100', 'ENGG1100A', 'ENGG1200', 'MATH1051']
+
+@pytest.fixture
+def index(tmp_path):
+    path = str(tmp_path / 'courses.idx')
+    build_index(path, [{'code': code, 'name': code.lower()} for code in reversed(CODES)])
+    with CourseIndex(path) as index:
+        yield index
+
+def test_get(index):
+    assert len(index) == len(CODES)
+    assert index.get('ENGG1100A')['name'] == 'engg1100a'
+    assert 'ENGG1100' in index
+    assert 'ENGG110' not in index
+    assert index.get('ENGG1100AB') is None
+
+@pytest.mark.parametrize('prefix, codes', [
+    ('', CODES),
+    ('ENGG', ['ENGG1100', 'ENGG1100A', 'ENGG1200']),
+    ('ENGG1100', ['ENGG1100', 'ENGG1100A']),
+    ('ENGG1100A', ['ENGG1100A']),
+    ('MATH1051', ['MATH1051']),
+    ('ENGG1100AB', []),
+    ('PHYS', []),
+])
+def test_prefix(index, prefix, codes):
+    assert index.codes(prefix) == codes
+    assert [c['code'] for c in index.prefix(prefix)] == codes
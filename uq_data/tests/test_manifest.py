@@ -0,0 +1,101 @@
+import json
+import os
+import sqlite3
+
+from uq_data.bench.corpus import write_course_html
+from uq_data.courses import parse
+from uq_data.courses.manifest import Manifest
+
+def _recorded(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return sorted(path for path, in conn.execute('SELECT path FROM html_manifest'))
+
+def test_keys_are_relative_to_root(tmp_path, monkeypatch):
+    html = tmp_path / 'html'
+    html.mkdir()
+    (html / 'MATH1051.html').write_text('<html></html>')
+    db = str(tmp_path / 'manifest.sqlite')
+
+    monkeypatch.chdir(tmp_path)
+    with Manifest(db, 'html') as manifest:
+        assert manifest.changed('html/MATH1051.html')
+        manifest.record('html/./MATH1051.html')
+    assert _recorded(db) == ['MATH1051.html']
+
+    # From another directory, the file is the same one.
+    monkeypatch.chdir(html)
+    with Manifest(db, '.') as manifest:
+        assert not manifest.changed('MATH1051.html')
+    with Manifest(db, str(html)) as manifest:
+        assert not manifest.changed(str(html / 'MATH1051.html'))
+
+def test_touched_files_are_not_changed(tmp_path):
+    path = tmp_path / 'MATH1051.html'
+    path.write_text('<html></html>')
+    db = str(tmp_path / 'manifest.sqlite')
+    with Manifest(db, str(tmp_path)) as manifest:
+        assert manifest.changed(str(path))
+        manifest.record(str(path))
+
+    os.utime(str(path), ns=(0, 0))
+    with Manifest(db, str(tmp_path)) as manifest:
+        assert not manifest.changed(str(path))
+        assert manifest.touched == 1
+    path.write_text('<html>changed</html>')
+    with Manifest(db, str(tmp_path)) as manifest:
+        assert manifest.changed(str(path))
+
+def test_json_run_commits_each_batch(tmp_path, monkeypatch):
+    html = str(tmp_path / 'html')
+    out = str(tmp_path / 'course')
+    os.mkdir(html)
+    os.mkdir(out)
+    names = sorted(os.path.basename(p) for p in write_course_html(html, 7))
+    manifest_path = str(tmp_path / 'manifest.sqlite')
+
+    # What another process would see, e.g. after this one was killed,
+    # just before each course is written.
+    seen = []
+    dump = json.dump
+    def dump_and_look(obj, f):
+        seen.append(_recorded(manifest_path))
+        dump(obj, f)
+    monkeypatch.setattr(parse.json, 'dump', dump_and_look)
+
+    parse.parse_and_write_json(out, html, manifest_path=manifest_path, batch_size=2)
+    assert seen == [[], [], names[:2], names[:2], names[:4], names[:4], names[:6]]
+    assert _recorded(manifest_path) == names
+
+def test_sqlite_run_commits_each_batch(tmp_path, monkeypatch):
+    html = str(tmp_path / 'html')
+    os.mkdir(html)
+    names = sorted(os.path.basename(p) for p in write_course_html(html, 5))
+    db = str(tmp_path / 'courses.sqlite')
+
+    seen = []
+    upsert = parse.upsert_courses
+    def upsert_and_look(conn, courses):
+        seen.append(_recorded(db))
+        upsert(conn, courses)
+    monkeypatch.setattr(parse, 'upsert_courses', upsert_and_look)
+
+    parse.parse_and_write_sqlite(html, db_path=db, batch_size=2)
+    assert seen == [[], names[:2], names[:4]]
+    assert _recorded(db) == names
+
+def test_json_run_rewrites_deleted_outputs(tmp_path, capsys):
+    html = str(tmp_path / 'html')
+    out = str(tmp_path / 'course')
+    os.mkdir(html)
+    os.mkdir(out)
+    write_course_html(html, 3)
+
+    parse.parse_and_write_json(out, html)
+    outputs = sorted(n for n in os.listdir(out) if n.endswith('.json'))
+    assert len(outputs) == 3
+    os.remove(os.path.join(out, outputs[0]))
+    capsys.readouterr()
+
+    parse.parse_and_write_json(out, html)
+    assert sorted(n for n in os.listdir(out) if n.endswith('.json')) == outputs
+    assert '1 changed, 0 touched, 2 unchanged' in capsys.readouterr().out
@@ -0,0 +1,50 @@
+import datetime as dt
+import io
+import re
+
+import pytest
+
+from uq_data.bench.corpus import course_dicts, course_html
+from uq_data.courses.parse import parse_course_html
+
+_time = dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+
+def _parse(html, backend):
+    try:
+        return parse_course_html(io.StringIO(html), _time, backend)
+    except Exception as e:
+        # Both backends should fail on the same malformed pages.
+        return type(e).__name__
+
+_page = course_html(course_dicts(1, seed=3)[0])
+
+def _in_summary(html):
+    return _page.replace('<!-- summary end -->', html + '<!-- summary end -->')
+
+_edited = {
+    'script': _in_summary('Hello &amp; <script>var a = "<b>1</b>";</script>world'),
+    'style': _in_summary('A<style>p { color: red }</style>B'),
+    'template': _in_summary('A<template>T<b>u</b></template>B'),
+    'ruby': _in_summary('A<ruby>r<rp>(</rp><rt>t</rt><rp>)</rp></ruby>B'),
+    'nested': _in_summary('<b>bold <i>italic</i></b> &lt;tail&gt; <noscript>N</noscript>'),
+    'comment': _in_summary('A<!-- B -->C<?pi D?>'),
+    'missing href': re.sub(r'class="course-offering-year" href="[^"]*"',
+        'class="course-offering-year"', _page, count=1),
+    'missing title': _page.replace('id="course-title"', ''),
+    'missing description': _page.replace('id="description"', ''),
+    'missing section': _page.replace('id="course-units"', ''),
+}
+
+@pytest.mark.parametrize('html', list(_edited.values()), ids=list(_edited))
+def test_lxml_matches_bs4_on_edge_cases(html):
+    assert _parse(html, 'lxml') == _parse(html, 'bs4')
+
+def test_lxml_matches_bs4_on_corpus():
+    for i, course in enumerate(course_dicts(50, seed=4)):
+        html = course_html(course, seed=i)
+        assert _parse(html, 'lxml') == _parse(html, 'bs4'), course['course_code']
+
+def test_errors():
+    assert _parse(_edited['missing href'], 'lxml') == 'KeyError'
+    assert _parse(_edited['missing title'], 'lxml') == 'AttributeError'
+    assert _parse(_edited['script'], 'lxml')['description'].endswith('Hello & world')
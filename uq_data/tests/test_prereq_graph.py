@@ -0,0 +1,16 @@
+import logging
+
+from uq_data.prereq_graph import PrereqGraph
+
+def test_unparsed_strings_keep_their_course_codes(caplog):
+    with caplog.at_level(logging.INFO, 'uq_data.prereq_graph'):
+        graph = PrereqGraph.from_prereq_strings({
+            'MATH1052': 'MATH1051',
+            'MATH2001': 'MATH1052 or equivalent, and a grade of 5 in MATH1051',
+            'MATH2000': 'Admission to MATH2000 needs MATH1052 or MATH1072.',
+            'MATH1051': None,
+        })
+    assert graph.prerequisites('MATH2001', transitive=False) == ['MATH1051', 'MATH1052']
+    assert graph.prerequisites('MATH2000', transitive=False) == ['MATH1052', 'MATH1072']
+    assert graph.unlocks('MATH1051') == ['MATH1052', 'MATH2000', 'MATH2001']
+    assert '2 of 4 prerequisite strings did not parse' in caplog.text
@@ -0,0 +1,44 @@
+import pytest
+
+from parsimonious.exceptions import ParseError
+
+from uq_data.bench import corpus
+from uq_data.bench.prereq_parser import fuzz_strings
+from uq_data.bench.prereqs import load_prereqs_txt
+from uq_data.prereqs import (And, CourseNode, Or, PrereqSyntaxError, build_prereq,
+    build_prereq_peg)
+
+def _outcome(build, s):
+    try:
+        return build(s)
+    except ParseError:
+        return ParseError
+
+@pytest.mark.parametrize('strings', [
+    load_prereqs_txt(),
+    corpus.prereq_strings(2000, seed=1),
+    fuzz_strings(5000, seed=2),
+], ids=['_prereqs.txt', 'corpus', 'fuzz'])
+def test_agrees_with_grammar(strings):
+    different = [s for s in strings if _outcome(build_prereq, s) != _outcome(build_prereq_peg, s)]
+    assert different == []
+
+def test_trees():
+    a, b, c = (CourseNode(code, None, None) for code in ('MATH1051', 'MATH1052', 'CSSE2002'))
+    assert build_prereq('MATH1051') == a
+    assert build_prereq('MATH1051, MATH1052 or CSSE2002') == Or([a, b, c])
+    assert build_prereq('MATH1051; MATH1052; CSSE2002') == And([a, b, c])
+    assert build_prereq('(MATH1051 | MATH1052) + CSSE2002') == And([Or([a, b]), c])
+
+@pytest.mark.parametrize('text, pos, expected', [
+    ('Permission of head of school', 0, 'a course code or "("'),
+    ('ACCT1110 or 2101 or 2111', 12, 'a course code or "("'),
+    ('MATH1051 and MATH1052 or CSSE2002', 21, 'end'),
+    ('(MATH1051 and MATH1052', 22, '")"'),
+    ('(MATH1051), MATH1052', 10, 'end'),
+])
+def test_error_positions(text, pos, expected):
+    with pytest.raises(PrereqSyntaxError) as e:
+        build_prereq(text)
+    assert (e.value.pos, e.value.expected) == (pos, expected)
+    assert isinstance(e.value, ParseError)
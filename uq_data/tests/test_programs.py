@@ -0,0 +1,29 @@
+import pytest
+
+bs4 = pytest.importorskip('bs4')
+pytest.importorskip('lxml')
+
+from uq_data.bench.corpus import program_html
+from uq_data.prereqs import pretty_string
+from uq_data.programs.layout import BMATH, parse_program
+from uq_data.programs.scrape import BMathParser
+
+def _lists(course_list):
+    # Name, depth and course tree of course_list and every list below it.
+    lists = []
+    stack = [course_list]
+    while stack:
+        cl = stack.pop()
+        lists.append((cl.name, cl.depth, pretty_string(cl.node)))
+        stack.extend(reversed(cl.sublists))
+    return lists
+
+@pytest.mark.parametrize('n, seed', [(10, 0), (60, 1), (200, 2), (500, 3)])
+def test_bmath_layout_matches_bmath_parser(n, seed):
+    html = program_html(n, seed)
+    parser = BMathParser()
+    parser.parse_program(bs4.BeautifulSoup(html, features='lxml'))
+
+    expected = _lists(parser.root_course_list)
+    assert len(expected) > 4
+    assert _lists(parse_program(html, BMATH)) == expected
@@ -0,0 +1,25 @@
+import pytest
+
+from uq_data.snapshot import Snapshot, write_snapshot
+
+def _course(code, faculty, offerings=()):
+    return {'code': code, 'name': 'Course ' + code, 'current': True, 'faculty': faculty,
+        'prerequisite': None, 'offerings': [{'offer_code': o, 'year': 2020, 'archived': False,
+            'semester': 'Semester 1'} for o in offerings]}
+
+def test_round_trip(tmp_path):
+    courses = [_course('MATH1051', 'Science', ['A', 'B']), _course('MATH1052', None)]
+    path = str(tmp_path / 'course_details.uqs')
+
+    write_snapshot(path, courses)
+    with Snapshot(path) as s:
+        assert s.column('faculty') == ['Science', None]
+        assert s.column('offerings') == [(0, 2), (2, 2)]
+        assert [r['code'] for r in s.records()] == ['MATH1051', 'MATH1052']
+        assert s.records()[0]['offerings'][1]['offer_code'] == 'B'
+
+def test_too_many_values_for_uint16_codes(tmp_path):
+    courses = [{'code': 'C', 'offerings': []}]
+    courses += [{'code': 'C%d' % i, 'level': str(i), 'offerings': []} for i in range(0x10000)]
+    with pytest.raises(ValueError, match='courses.level has 65536 distinct values'):
+        write_snapshot(str(tmp_path / 'course_details.uqs'), courses)
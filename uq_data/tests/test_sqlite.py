@@ -0,0 +1,54 @@
+import sqlite3
+
+import pytest
+
+from uq_data.bench.corpus import course_dicts
+from uq_data.courses import sql
+from uq_data.courses.parse import connect_for_load, create_sqlite_schema, upsert_courses
+
+def _course(updated, *offerings):
+    course = dict(course_dicts(1)[0], last_updated=updated)
+    course['semesters'] = [{'code': code, 'year': year, 'teaching_period': None}
+        for code, year in offerings]
+    return course
+
+def _offered(conn):
+    return conn.execute('SELECT id, code, year FROM offerings ORDER BY id').fetchall()
+
+def test_offerings_follow_the_newest_page(tmp_path):
+    db = str(tmp_path / 'courses.sqlite')
+    create_sqlite_schema(db)
+    conn = connect_for_load(db)
+
+    upsert_courses(conn, [_course('2020-01-01T10:00:00+10:00', ('A', 2020), ('B', 2020))])
+    # B dropped and C added, so A keeps its row.
+    upsert_courses(conn, [_course('2020-02-01T10:00:00+10:00', ('A', 2020), ('C', 2020))])
+    offered = _offered(conn)
+    assert [row[1:] for row in offered] == [('A', 2020), ('C', 2020)]
+    assert offered[0][0] == 1
+
+    # An older page changes nothing, offerings included.
+    upsert_courses(conn, [_course('2020-01-15T10:00:00+10:00', ('D', 2020))])
+    assert _offered(conn) == offered
+    conn.close()
+
+def _tables(db):
+    with sqlite3.connect(db) as conn:
+        return {name: (conn.execute(f'PRAGMA table_info({name})').fetchall(),
+                sorted(conn.execute(f'PRAGMA index_list({name})').fetchall()))
+            for name in ('courses', 'offerings')}
+
+def test_schema_matches_models(tmp_path):
+    sqlalchemy = pytest.importorskip('sqlalchemy')
+    from uq_data.courses.models import Base, Course
+
+    models_db = str(tmp_path / 'models.sqlite')
+    engine = sqlalchemy.create_engine('sqlite:///' + models_db)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    sql_db = str(tmp_path / 'sql.sqlite')
+    with sqlite3.connect(sql_db) as conn:
+        sql.create_schema(conn)
+
+    assert _tables(sql_db) == _tables(models_db)
+    assert sql.COURSE_COLUMNS == [c.name for c in Course.__table__.columns]
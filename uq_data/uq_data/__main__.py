@@ -0,0 +1,159 @@
+"""Command line interface to the course data tools.
+
+    python -m uq_data parse [html_folder] [--json course | --sqlite DB]
+        [--processes N] [--backend bs4|lxml]
+    python -m uq_data export course_details.jl OUT [--format index|snapshot|graph]
+    python -m uq_data query INDEX [CODE...] [--prefix PREFIX]
+    python -m uq_data search DB WORDS... [--limit 20] [--raw]
+    python -m uq_data triage [html_folder] [--report analysis.json]
+        [--quarantine FOLDER] [--threads N]
+    python -m uq_data serve DATA [--host 127.0.0.1] [--port 8080]
+        [--cache 4096] [--reload 2]
+
+Each command imports only the modules it needs, so query, search and
+triage, which need none of bs4, lxml, SQLAlchemy or NumPy, start in tens
+of milliseconds. bench/importtime.py checks this stays true.
+
+parse honours UQ_INSTRUMENT, UQ_PROFILE and UQ_TRACE, as running
+uq_data.courses.parse does.
+"""
+import typing as T
+
+import argparse
+import json
+import os
+import sys
+
+_formats = {'.idx': 'index', '.uqs': 'snapshot', '.uqpg': 'graph'}
+
+def parse(args: argparse.Namespace):
+    from . import instrument
+    from .courses.parse import parse_and_write_json, parse_and_write_sqlite
+
+    processes = args.processes or None
+    with instrument.session('UQ_INSTRUMENT' in os.environ,
+            os.environ.get('UQ_PROFILE'), os.environ.get('UQ_TRACE')):
+        if args.sqlite:
+            parse_and_write_sqlite(args.html_folder, processes, args.sqlite, backend=args.backend)
+        else:
+            os.makedirs(args.json, exist_ok=True)
+            parse_and_write_json(args.json, args.html_folder, processes, backend=args.backend)
+
+def export(args: argparse.Namespace):
+    from .lookup import iter_course_details
+
+    fmt = args.format or _formats.get(os.path.splitext(args.output)[1])
+    if fmt is None:
+        raise SystemExit(f'cannot tell the format of {args.output}, give --format')
+    if fmt == 'index':
+        from .lookup import build_index
+        n = build_index(args.output, iter_course_details(args.details))
+    elif fmt == 'snapshot':
+        from .snapshot import write_snapshot
+        courses = list(iter_course_details(args.details))
+        write_snapshot(args.output, courses)
+        n = len(courses)
+    else:
+        from .prereq_graph import PrereqGraph
+        graph = PrereqGraph.from_prereq_strings(
+            {c['code']: c['prerequisite'] for c in iter_course_details(args.details)})
+        graph.save(args.output)
+        n = len(graph)
+    print(f'wrote {n} courses to {args.output}')
+
+def query(args: argparse.Namespace):
+    from .lookup import CourseIndex
+
+    missing = []
+    with CourseIndex(args.index) as index:
+        if args.prefix is not None:
+            for course in index.prefix(args.prefix.upper()):
+                print(json.dumps(course, ensure_ascii=False))
+        for code in args.codes:
+            course = index.get(code.upper())
+            if course is None:
+                missing.append(code)
+            else:
+                print(json.dumps(course, ensure_ascii=False))
+    if missing:
+        sys.exit('not found: ' + ' '.join(missing))
+
+def search(args: argparse.Namespace):
+    import sqlite3
+    from .courses.search import search
+
+    conn = sqlite3.connect(f'file:{args.db}?mode=ro', uri=True)
+    try:
+        for result in search(conn, ' '.join(args.words), args.limit, raw=args.raw):
+            print(f'{result.course_code:10} {result.course_name}')
+            print(f'{"":10} {result.snippet}')
+    finally:
+        conn.close()
+
+def triage(args: argparse.Namespace):
+    from .courses.verify_html import main
+    main(args.argv, prog='python -m uq_data triage')
+
+def serve(args: argparse.Namespace):
+    import logging
+    from .serve import serve
+
+    logging.basicConfig(level=logging.INFO)
+    serve(args.data, args.host, args.port, args.cache, args.reload)
+
+def main(argv: T.List[str] = None):
+    parser = argparse.ArgumentParser(prog='python -m uq_data',
+        description='Parses, exports, queries and serves UQ course data.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    p = commands.add_parser('parse', help='parse downloaded course pages')
+    p.add_argument('html_folder', nargs='?', default='./html')
+    output = p.add_mutually_exclusive_group()
+    output.add_argument('--json', default='./course', help='folder of JSON files, one per course')
+    output.add_argument('--sqlite', help='database to upsert courses into instead')
+    p.add_argument('--processes', type=int, default=0, help='worker processes, 0 for every CPU')
+    p.add_argument('--backend', choices=('bs4', 'lxml'), default='bs4')
+    p.set_defaults(run=parse)
+
+    p = commands.add_parser('export', help='convert course_details to another format')
+    p.add_argument('details', help='course_details .jl or .json')
+    p.add_argument('output')
+    p.add_argument('--format', choices=sorted(set(_formats.values())),
+        help='lookup index, columnar snapshot or prerequisite graph. By default, '
+            'from the extension of output: ' + ', '.join(sorted(_formats)))
+    p.set_defaults(run=export)
+
+    p = commands.add_parser('query', help='look up courses in an index from export')
+    p.add_argument('index')
+    p.add_argument('codes', nargs='*', metavar='CODE')
+    p.add_argument('--prefix', help='every course whose code starts with this')
+    p.set_defaults(run=query)
+
+    p = commands.add_parser('search', help='full-text search of a database from parse --sqlite')
+    p.add_argument('db')
+    p.add_argument('words', nargs='+', metavar='WORD')
+    p.add_argument('--limit', type=int, default=20)
+    p.add_argument('--raw', action='store_true', help='WORDS are an FTS5 query')
+    p.set_defaults(run=search)
+
+    # Its arguments, and --help, are parsed by courses/verify_html.py.
+    p = commands.add_parser('triage', help='classify downloaded course pages', add_help=False)
+    p.set_defaults(run=triage)
+
+    p = commands.add_parser('serve', help='serve the data over HTTP, see serve.py')
+    p.add_argument('data', help='SQLite database, folder of course JSON or course_details')
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8080)
+    p.add_argument('--cache', type=int, default=4096, help='responses kept in the LRU')
+    p.add_argument('--reload', type=float, default=2.0,
+        help='seconds between checks for changed data, 0 to never reload')
+    p.set_defaults(run=serve)
+
+    args, args.argv = parser.parse_known_args(argv)
+    if args.argv and args.run is not triage:
+        parser.error('unrecognized arguments: ' + ' '.join(args.argv))
+    args.run(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Benchmarks every parsing hot path at several input sizes and saves the
+results as JSON, so runs on different commits can be compared.
+
+    python -m uq_data.bench run [--sizes 100,1000,10000,50000]
+        [--only parse_prereq,...] [--repeat 3] [--out results.json]
+    python -m uq_data.bench compare old.json new.json [--threshold 0.1]
+
+Inputs are generated by bench.corpus from fixed seeds, so every run sees
+the same data. Course pages and prerequisite strings are mixed with real
+ones from data/course_details.7z (if py7zr is installed) and _prereqs.txt.
+Sizes above a case's limit are skipped unless given with --sizes.
+CourseDetailsSpider.parse is skipped if scrapy is not installed.
+
+tests/test_bench.py runs the same cases under pytest-benchmark, at 100
+items unless BENCH_SIZES says otherwise, for its JSON output and
+--benchmark-compare.
+"""
+import typing as T
+
+import argparse
+import datetime as dt
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import corpus
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_repo = os.path.join(_here, '..', '..', '..')
+_fixed_time = dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+_pool_size = 1000 # distinct generated pages, cycled for larger sizes
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+
+class Case(T.NamedTuple):
+    setup: T.Callable[[int], T.Any] # size -> input, not timed
+    run: T.Callable[[T.Any], T.Any]
+    limit: int # largest default size
+
+def _cycle(pool: T.List, n: int) -> T.List:
+    return [pool[i % len(pool)] for i in range(n)]
+
+_real_courses = None
+
+def _real_course_dicts() -> T.List[T.Dict]:
+    global _real_courses
+    if _real_courses is None:
+        try:
+            records = corpus.load_course_details(os.path.join(_repo, 'data', 'course_details.7z'))
+            _real_courses = [corpus.details_course_dict(r) for r in records]
+        except (ImportError, OSError):
+            _real_courses = []
+    return _real_courses
+
+def course_pages(n: int) -> T.List[str]:
+    """n course pages, a quarter rendered from real course records."""
+    count = min(n, _pool_size)
+    synthetic = corpus.course_dicts(count, seed=1)
+    real = _real_course_dicts()[::7][:count // 4]
+    data = real + synthetic[:count - len(real)]
+    return _cycle([corpus.course_html(d, seed=i) for i, d in enumerate(data)], n)
+
+def prereq_strings(n: int) -> T.List[str]:
+    """n prerequisite strings, half from _prereqs.txt."""
+    from .prereqs import load_prereqs_txt
+    real = load_prereqs_txt()
+    synthetic = corpus.prereq_strings(min(n, 10000), seed=1)
+    mixed = [x for pair in zip(real * (n // len(real) + 1), synthetic) for x in pair]
+    return _cycle(mixed, n)
+
+def _parse_pages(backend: str) -> Case:
+    from ..courses.parse import parse_course_html
+
+    def run(pages):
+        for html in pages:
+            parse_course_html(io.StringIO(html), _fixed_time, backend)
+    return Case(course_pages, run, 50000 if backend == 'lxml' else 10000)
+
+def _parse_prereq() -> Case:
+    from parsimonious.exceptions import ParseError
+    from ..prereqs import parse_prereq
+
+    def run(strings):
+        for s in strings:
+            try:
+                parse_prereq(s)
+            except ParseError:
+                pass
+    return Case(prereq_strings, run, 50000)
+
+def _build_prereq(build: str) -> Case:
+    from parsimonious.exceptions import ParseError
+    from .. import prereqs
+
+    def run(strings):
+        for s in strings:
+            try:
+                getattr(prereqs, build)(s)
+            except ParseError:
+                pass
+    return Case(prereq_strings, run, 50000)
+
+def _parse_prereqs_batch() -> Case:
+    from ..prereqs import parse_prereqs_batch, PrereqCache
+    return Case(prereq_strings, lambda strings: parse_prereqs_batch(strings, PrereqCache()), 50000)
+
+def _parse_program() -> Case:
+    import bs4
+    from ..programs.scrape import BMathParser
+
+    def run(html):
+        BMathParser().parse_program(bs4.BeautifulSoup(html, features='lxml'))
+    return Case(lambda n: corpus.program_html(n, seed=1), run, 50000)
+
+def _parse_program_layout() -> Case:
+    from ..programs.layout import parse_program, BMATH
+    return Case(lambda n: corpus.program_html(n, seed=1),
+        lambda html: parse_program(html, BMATH), 50000)
+
+def _spider_parse() -> Case:
+    scraper = os.path.join(_repo, 'uq_scraper')
+    if scraper not in sys.path:
+        sys.path.append(scraper)
+    from scrapy.http import HtmlResponse
+    from uq_scraper.spiders.course_details import CourseDetailsSpider
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spider = CourseDetailsSpider(details=os.path.join(tmp, 'none.jl'))
+    url = 'https://my.uq.edu.au/programs-courses/course.html?course_code='
+
+    def setup(n):
+        pages = course_pages(min(n, _pool_size))
+        responses = [HtmlResponse(url + str(i), body=html, encoding='utf-8')
+            for i, html in enumerate(pages)]
+        return _cycle(responses, n)
+
+    def run(responses):
+        for response in responses:
+            for _ in spider.parse(response):
+                pass
+    return Case(setup, run, 50000)
+
+def _sqlite(writer: str) -> Case:
+    from .sqlite_writers import writers
+
+    def run(courses):
+        with tempfile.TemporaryDirectory() as tmp:
+            writers[writer](os.path.join(tmp, 'bench.sqlite'), courses)
+    return Case(lambda n: corpus.course_dicts(n, seed=1), run,
+        1000 if writer == 'orm_loop' else 50000)
+
+CASES = {
+    'parse_course_html/bs4': lambda: _parse_pages('bs4'),
+    'parse_course_html/lxml': lambda: _parse_pages('lxml'),
+    'parse_prereq': _parse_prereq,
+    'build_prereq': lambda: _build_prereq('build_prereq'),
+    'build_prereq_peg': lambda: _build_prereq('build_prereq_peg'),
+    'parse_prereqs_batch': _parse_prereqs_batch,
+    'BMathParser.parse_program': _parse_program,
+    'programs.layout.parse_program': _parse_program_layout,
+    'CourseDetailsSpider.parse': _spider_parse,
+    'sqlite/orm_loop': lambda: _sqlite('orm_loop'),
+    'sqlite/bulk_upsert': lambda: _sqlite('bulk_upsert'),
+}
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(['git', *args], cwd=_repo, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, check=True).stdout.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+def run(names: T.Iterable[str], sizes: T.List[int] = None, repeat: int = 3) -> T.Dict:
+    """Runs the named cases at each size, keeping the best of repeat runs
+    (one run from 10000 up). sizes=None uses DEFAULT_SIZES up to each case's
+    limit."""
+    results = {}
+    for name in names:
+        try:
+            case = CASES[name]()
+        except ImportError as e:
+            print(f'{name}: skipped, {e}', file=sys.stderr)
+            continue
+        results[name] = {}
+        for n in sizes or [n for n in DEFAULT_SIZES if n <= case.limit]:
+            data = case.setup(n)
+            best = float('inf')
+            for _ in range(repeat if n < 10000 else 1):
+                start = time.perf_counter()
+                case.run(data)
+                best = min(best, time.perf_counter() - start)
+            results[name][str(n)] = {'seconds': best, 'per_item_us': best / n * 1e6}
+            print(f'{name:28} {n:>6} {best:9.3f}s {best / n * 1e6:10.1f}us/item', file=sys.stderr)
+    return {
+        'commit': _git('rev-parse', 'HEAD') or 'unknown',
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': dt.datetime.now(dt.timezone.utc).isoformat(),
+        'results': results,
+    }
+
+def compare(old: T.Dict, new: T.Dict, threshold: float = 0.1) -> T.List[str]:
+    """Prints the change in time of every case and size in both results.
+    Returns those which got slower by more than threshold."""
+    print(f'{old["commit"][:10]} -> {new["commit"][:10]}')
+    regressions = []
+    for name, sizes in new['results'].items():
+        for n, result in sizes.items():
+            before = old['results'].get(name, {}).get(n)
+            if before is None:
+                continue
+            change = result['seconds'] / before['seconds'] - 1
+            flag = ''
+            if change > threshold:
+                flag = '  slower'
+                regressions.append(f'{name} {n}')
+            print(f'{name:28} {n:>6} {before["seconds"]:9.3f}s {result["seconds"]:9.3f}s {change:+8.1%}{flag}')
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog='python -m uq_data.bench')
+    commands = parser.add_subparsers(dest='command')
+    run_parser = commands.add_parser('run')
+    run_parser.add_argument('--sizes', help='comma separated, default %s' % DEFAULT_SIZES)
+    run_parser.add_argument('--only', help='comma separated case names')
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--out', help='default bench-COMMIT.json')
+    compare_parser = commands.add_parser('compare')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        names = args.only.split(',') if args.only else list(CASES)
+        sizes = [int(n) for n in args.sizes.split(',')] if args.sizes else None
+        results = run(names, sizes, args.repeat)
+        out = args.out or f'bench-{results["commit"][:10]}.json'
+        with open(out, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f'saved {out}', file=sys.stderr)
+    elif args.command == 'compare':
+        with open(args.old) as f, open(args.new) as g:
+            regressions = compare(json.load(f), json.load(g), args.threshold)
+        sys.exit(1 if regressions else 0)
+    else:
+        parser.print_help()
@@ -0,0 +1,74 @@
+"""Times auditing a cohort against generated programs with AuditPlan,
+against walking each student's transcript through the tree, and checks
+they agree.
+
+    python -m uq_data.bench.audit [students] [programs] [rows per program]
+"""
+import typing as T
+
+import random
+import sys
+import time
+
+from . import corpus
+from ..course_list import CourseList
+from ..eligibility import completion_matrix
+from ..prereqs import And, Or, CourseNode
+from ..programs.audit import AuditPlan
+from ..programs.layout import parse_program, BMATH
+
+def walk(program: CourseList, courses: T.Set[str]) -> T.Tuple[bool, T.List[float]]:
+    """Completion and units towards each requirement of one student, with
+    the trees' own verify() and units_completed()."""
+    units = []
+
+    def complete(cl: CourseList, root: bool) -> bool:
+        ok = True
+        if cl.node is not None:
+            for child in (cl.node.children if isinstance(cl.node, And) else [cl.node]):
+                parts = [child] if isinstance(child, (Or, CourseNode)) else child.children
+                units.append(sum(part.units_completed(courses) for part in parts))
+                ok = child.verify(courses) and ok
+        subs = [complete(x, False) for x in cl.sublists]
+        if subs:
+            ok = ok and (any(subs) if cl.node is None and not root else all(subs))
+        return ok
+    return complete(program, True), units
+
+def run(students: int = 20000, programs: int = 20, rows: int = 150, sample: int = 200) -> T.Dict[str, float]:
+    """Returns seconds taken by each stage for all programs, with walk
+    extrapolated from a sample of students."""
+    trees = [parse_program(corpus.program_html(rows, seed=i), BMATH) for i in range(programs)]
+    results = {'compile': 0.0, 'completion_matrix': 0.0, 'evaluate': 0.0, 'walk': 0.0}
+
+    for i, program in enumerate(trees):
+        start = time.perf_counter()
+        plan = AuditPlan(program)
+        results['compile'] += time.perf_counter() - start
+
+        # Most of the program's courses and a few others.
+        rng = random.Random(i)
+        others = corpus.course_codes(50, seed=1000 + i)
+        records = [[c for c in plan.codes if rng.random() < 0.9] + rng.sample(others, 5)
+            for _ in range(students)]
+
+        start = time.perf_counter()
+        completed = completion_matrix(records, plan.codes)
+        results['completion_matrix'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        audit = plan.evaluate(completed)
+        results['evaluate'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for s, record in enumerate(records[:sample]):
+            complete, units = walk(program, set(record))
+            if complete != audit.complete[s] or units != list(audit.units[s]):
+                raise AssertionError(f'program {i} student {s} differs from walk()')
+        results['walk'] += (time.perf_counter() - start) * students / sample
+    return results
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:4]]
+    for stage, seconds in run(*args).items():
+        print(f'{stage:18} {seconds:8.2f}s')
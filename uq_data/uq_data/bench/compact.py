@@ -0,0 +1,89 @@
+"""Measures the memory of every program's course list and every course's
+prerequisites loaded at once, as the original classes, as compact nodes and
+as a FlatForest.
+
+    python -m uq_data.bench.compact [programs] [rows per program]
+
+Prerequisites are those of data/course_details.7z (needs py7zr), or
+_prereqs.txt without it. Programs are generated by bench.corpus. Each form
+is measured with tracemalloc while loading it from serialised bytes, so
+none shares strings with another.
+"""
+import typing as T
+
+import gc
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
+from . import corpus
+from .. import compact
+from ..prereqs import parse_prereqs_batch, PrereqCache, pretty_string
+from ..programs.layout import parse_program, BMATH
+
+data_7z = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data', 'course_details.7z')
+
+def _prereq_strings() -> T.List[str]:
+    try:
+        return [r.get('prerequisite') or '' for r in corpus.load_course_details(data_7z)]
+    except (ImportError, OSError):
+        from .prereqs import load_prereqs_txt
+        return load_prereqs_txt()
+
+def _allocated(f: T.Callable[[], T.Any]) -> T.Tuple[T.Any, int]:
+    # Bytes still allocated by f once its garbage is collected.
+    gc.collect()
+    tracemalloc.start()
+    result = f()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+def _render_seconds(trees: T.List) -> float:
+    start = time.perf_counter()
+    for tree in trees:
+        if hasattr(tree, 'sublists'):
+            str(tree)
+        else:
+            pretty_string(tree)
+    return time.perf_counter() - start
+
+def run(programs: int = 400, rows: int = 150) -> T.Dict[str, float]:
+    trees = [t for t in parse_prereqs_batch(_prereq_strings(), PrereqCache())
+        if t is not None]
+    trees += [parse_program(corpus.program_html(rows, seed=i), BMATH) for i in range(programs)]
+
+    forest = compact.FlatForest()
+    for tree in trees:
+        forest.add(tree)
+    full_bytes = pickle.dumps(trees, pickle.HIGHEST_PROTOCOL)
+    flat_bytes = forest.to_bytes()
+    del trees, forest
+
+    full, full_size = _allocated(lambda: pickle.loads(full_bytes))
+    nodes, compact_size = _allocated(lambda: list(compact.FlatForest.from_bytes(flat_bytes)))
+    forest, flat_size = _allocated(lambda: compact.FlatForest.from_bytes(flat_bytes))
+    n = len(forest.kinds)
+
+    return {
+        'trees': len(forest),
+        'nodes': n,
+        'original MiB': full_size / 2**20,
+        'compact MiB': compact_size / 2**20,
+        'flat MiB': flat_size / 2**20,
+        'original B/node': full_size / n,
+        'compact B/node': compact_size / n,
+        'flat B/node': flat_size / n,
+        'flat serialised MiB': len(flat_bytes) / 2**20,
+        'render original s': _render_seconds(full),
+        'render compact s': _render_seconds(nodes),
+    }
+
+if __name__ == "__main__":
+    programs = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    for name, value in run(programs, rows).items():
+        print(f'{name:20} {value:12.4g}')
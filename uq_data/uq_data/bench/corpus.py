@@ -0,0 +1,291 @@
+"""Synthetic but realistic-looking inputs for the benchmarks in this package.
+
+Everything is generated from a seeded random.Random so runs are
+reproducible."""
+import typing as T
+
+import os
+import random
+
+_prefixes = ['MATH', 'COMP', 'CSSE', 'STAT', 'PHYS', 'CHEM', 'BIOL', 'ECON',
+    'ACCT', 'LAWS', 'ENGG', 'ELEC', 'MECH', 'PSYC', 'HIST', 'ENGL']
+_faculties = ['Science', 'Engineering, Architecture & Information Technology',
+    'Business, Economics & Law', 'Humanities and Social Sciences',
+    'Health and Behavioural Sciences', 'Medicine']
+_words = ('introduction advanced topics theory practice analysis design '
+    'systems methods applied foundations principles modelling data research '
+    'professional communication computation structures environment').split()
+
+def course_codes(n: int, seed: int = 0) -> T.List[str]:
+    rng = random.Random(seed)
+    codes = set()
+    while len(codes) < n:
+        codes.add(rng.choice(_prefixes) + str(rng.randint(1000, 7999)))
+    return sorted(codes)
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return ' '.join(rng.choice(_words) for _ in range(n)).capitalize() + '.'
+
+def course_dicts(n: int, seed: int = 0) -> T.List[T.Dict]:
+    """Course dicts shaped like the output of parse_course_html."""
+    rng = random.Random(seed)
+    courses = []
+    for code in course_codes(n, seed):
+        semesters = [
+            {'code': format(rng.getrandbits(64), '016x'), 'year': year,
+                'teaching_period': None if rng.random() < 0.9 else 'Non-standard'}
+            for year in range(2020 - rng.randint(0, 5), 2021)
+            for _ in range(rng.randint(1, 2))
+        ]
+        courses.append({
+            'course_code': code,
+            'course_name': _sentence(rng, rng.randint(2, 6))[:-1],
+            'semesters': semesters,
+            'level': rng.choice(['Undergraduate', 'Postgraduate Coursework']),
+            'faculty': rng.choice(_faculties),
+            'school': rng.choice(_faculties),
+            'units': rng.choice(['2', '4', '8']),
+            'duration': 'One Semester',
+            'contact': f'{rng.randint(1, 3)}L{rng.randint(1, 2)}T',
+            'restricted': '',
+            'incompatible': '',
+            'prerequisites': '',
+            'assessment_methods': _sentence(rng, 8),
+            'coordinator': 'Dr ' + rng.choice(_words).capitalize(),
+            'study_abroad': '',
+            'description': ' '.join(_sentence(rng, 12) for _ in range(4)),
+            'last_updated': f'2020-0{rng.randint(1, 9)}-01T00:00:00+10:00',
+        })
+    return courses
+
+_course_page = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{name} ({code}) - Programs and Courses - The University of Queensland</title>
+<link rel="stylesheet" href="/programs-courses/css/main.css">
+<script type="text/javascript">var _gaq = _gaq || []; _gaq.push(['_setAccount', 'UA-0000000-0']);</script>
+</head>
+<body>
+<div id="header"><ul class="nav">{nav}</ul></div>
+<div class="breadcrumb-wrapper"><ul><li><a href="/programs-courses/">Programs &amp; Courses</a></li><li>{name}</li></ul></div>
+<div id="content">
+<div id="description">
+<h1 id="course-title">{name} ({code})</h1>
+<div id="summary-content">
+<h2>Course level</h2><p id="course-level">{level}</p>
+<h2>Faculty</h2><p id="course-faculty">{faculty}</p>
+<h2>School</h2><p id="course-school">{school}</p>
+<h2>Units</h2><p id="course-units">{units}</p>
+<h2>Duration</h2><p id="course-duration">{duration}</p>
+<h2>Attendance mode</h2><p id="course-mode">Internal</p>
+<h2>Class hours</h2><p id="course-contact">{contact}</p>
+{optional}
+<h2>Assessment methods</h2><p id="course-assessment-methods">
+  {assessment_methods}
+</p>
+<h2>Course coordinator</h2><p id="course-coordinator">{coordinator}</p>
+</div>
+<h2>Course description</h2>
+<p id="course-summary">{description}<!-- summary end --></p>
+<h2>Current course offerings</h2>
+<table id="course-current-offerings" class="offerings">
+<thead><tr><th>Course offerings</th><th>Location</th><th>Mode</th><th>Course Profile</th></tr></thead>
+<tbody>
+{offerings}
+</tbody>
+</table>
+</div>
+</div>
+<div id="footer"><p>&copy; The University of Queensland &nbsp; ABN: 63 942 912 684</p>{footer}</div>
+</body>
+</html>
+'''
+
+_offering_row = '''<tr>
+<td><a class="course-offering-year" href="/programs-courses/course.html?course_code={code}&amp;offer={offer}&amp;year={year}">{semester}, {year}{period}</a></td>
+<td>St Lucia</td>
+<td>Internal</td>
+<td><a class="profile-available" href="https://course-profiles.uq.edu.au/student_section_loader/section_1/{profile}">Course Profile</a></td>
+</tr>'''
+
+def course_html(data: T.Dict, seed: int = 0) -> str:
+    """Renders a course dict from course_dicts() as a course page in the
+    layout parse_course_html and CourseDetailsSpider expect."""
+    rng = random.Random(seed)
+    optional = ''.join(
+        f'<h2>{key}</h2><p id="course-{key}">{data[field]}</p>\n'
+        for key, field in (('restricted', 'restricted'),
+            ('incompatible', 'incompatible'), ('prerequisite', 'prerequisites'),
+            ('studyabroard', 'study_abroad'))
+        if data[field]
+    )
+    offerings = '\n'.join(
+        _offering_row.format(code=data['course_code'], offer=sem['code'],
+            year=sem['year'],
+            semester=rng.choice(['Semester 1', 'Semester 2', 'Summer Semester']),
+            period=f" ({sem['teaching_period'] or 'Standard'})",
+            profile=rng.randint(10000, 99999))
+        for sem in data['semesters']
+    )
+    filler = ''.join(f'<li><a href="/{w}">{w.capitalize()}</a></li>' for w in _words)
+    return _course_page.format(
+        optional=optional, offerings=offerings, nav=filler, footer=filler,
+        code=data['course_code'], name=data['course_name'],
+        **{k: v for k, v in data.items() if k not in ('course_code', 'course_name')})
+
+def write_course_html(folder: str, n: int, seed: int = 0) -> T.List[str]:
+    """Writes n synthetic course pages named CODE.html into folder."""
+    paths = []
+    for i, data in enumerate(course_dicts(n, seed)):
+        path = os.path.join(folder, data['course_code'] + '.html')
+        with open(path, 'w') as f:
+            f.write(course_html(data, seed + i))
+        paths.append(path)
+    return paths
+
+def prereq_string(rng: random.Random, codes: T.Sequence[str], depth: int = 0) -> str:
+    """A random prerequisite string in the language of prereqs._grammar,
+    mixing and/or lists, comma lists and parentheses."""
+    def operand():
+        if depth < 2 and rng.random() < 0.25:
+            return '(' + prereq_string(rng, codes, depth + 1) + ')'
+        return rng.choice(codes)
+
+    n = rng.choice([1, 1, 2, 2, 2, 3, 4])
+    first = rng.choice(codes)
+    if n == 1:
+        return first
+    items = [first] + [operand() for _ in range(n - 1)]
+    kind = rng.random()
+    if kind < 0.35:
+        return rng.choice([' and ', ' & ', ' + ']).join(items)
+    elif kind < 0.7:
+        return rng.choice([' or ', ' or ', ' OR ', ' | ']).join(items)
+    else:
+        sep = rng.choice([', ', '; '])
+        if rng.random() < 0.5:
+            return sep.join(items[:-1]) + ' or ' + items[-1]
+        return sep.join(items)
+
+def prereq_strings(n: int, seed: int = 0, codes: T.Sequence[str] = None) -> T.List[str]:
+    rng = random.Random(seed)
+    if codes is None:
+        codes = course_codes(max(n // 4, 10), seed)
+    return [prereq_string(rng, codes) for _ in range(n)]
+
+def transcripts(n: int, codes: T.Sequence[str], per_student: int = 24,
+        seed: int = 0) -> T.List[T.List[str]]:
+    rng = random.Random(seed)
+    per_student = min(per_student, len(codes))
+    return [rng.sample(codes, rng.randint(per_student // 2, per_student))
+        for _ in range(n)]
+
+def details_course_dict(record: T.Dict) -> T.Dict:
+    """Converts a record scraped by CourseDetailsSpider, as in
+    data/course_details.7z, into the shape of course_dicts(), so real
+    course text can be rendered with course_html()."""
+    return {
+        'course_code': record['code'],
+        'course_name': record['name'],
+        'semesters': [
+            {'code': o['offer_code'], 'year': o['year'],
+                'teaching_period': None if o['teaching_period'] == 'Standard'
+                    else o['teaching_period']}
+            for o in record['offerings']
+        ],
+        'level': record['level'] or '',
+        'faculty': record['faculty'] or '',
+        'school': record['school'] or '',
+        'units': record['units'] or '',
+        'duration': record['duration'] or '',
+        'contact': record['contact'] or '',
+        'restricted': record['restricted'] or '',
+        'incompatible': record['incompatible'] or '',
+        'prerequisites': record['prerequisite'] or '',
+        'assessment_methods': record['assessment'] or '',
+        'coordinator': record['coordinator'] or '',
+        'study_abroad': record['study_abroad'] or '',
+        'description': record['description'] or '',
+        'last_updated': record['_updated'],
+    }
+
+def load_course_details(path: str) -> T.List[T.Dict]:
+    """Records from a course_details .json, .jl or .7z file. Reading .7z
+    needs py7zr."""
+    import json
+    if path.endswith('.7z'):
+        import py7zr
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            with py7zr.SevenZipFile(path) as z:
+                name, = z.getnames()
+                z.extractall(tmp)
+            return load_course_details(os.path.join(tmp, name))
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.json'):
+            return json.load(f)
+        return [json.loads(line) for line in f if line.strip()]
+
+_program_page = '''<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title} - Programs and Courses</title></head>
+<body>
+<div id="header"><ul class="nav">{nav}</ul></div>
+<div id="program-course-list">
+<h1>{title}</h1>
+{plans}
+<div id="endnotes"><p>Endnotes apply to this program.</p></div>
+</div>
+</body>
+</html>
+'''
+
+_course_row = '<tr{cls}><td>{bracket}{code}</td><td>{units}</td><td>{name}</td></tr>'
+
+def _course_table(rng: random.Random, codes: T.Iterator[str], n: int) -> str:
+    rows = []
+    while len(rows) < n:
+        if rng.random() < 0.15:
+            # An "option" group of alternatives, separated by "or" rows.
+            for i in range(rng.randint(2, 3)):
+                if i:
+                    rows.append('<tr class="option"><td>or</td><td></td><td></td></tr>')
+                rows.append(_course_row.format(
+                    cls=' class="option first"' if i == 0 else ' class="option"',
+                    bracket='[' if i == 0 else '', code=next(codes), units=2,
+                    name=_sentence(rng, 3)[:-1]))
+        else:
+            rows.append(_course_row.format(cls='', bracket='', code=next(codes),
+                units=rng.choice([2, 2, 4]), name=_sentence(rng, 3)[:-1]))
+    return '<table class="courses"><tbody>\n' + '\n'.join(rows) + '\n</tbody></table>'
+
+def _course_lists(rng: random.Random, codes: T.Iterator[str], n: int) -> str:
+    lists = []
+    per_list = max(n // rng.randint(1, 3), 1)
+    for start in range(0, n, per_list):
+        count = min(per_list, n - start)
+        lists.append(f'<div class="courselist"><p>Courses totalling {2 * count} units from:</p>\n'
+            + _course_table(rng, codes, count) + '</div>')
+    return '\n'.join(lists)
+
+def program_html(n: int, seed: int = 0) -> str:
+    """A program course list page with about n course rows, in the layout
+    BMathParser reads: Parts A and C of compulsory lists, and Part B split
+    into majors."""
+    rng = random.Random(seed)
+    codes = iter(course_codes(2 * n + 16, seed))
+    sizes = [max(n // 4, 1), max(n // 2, 1), max(n - n // 4 - n // 2, 1)]
+    majors = max(sizes[1] // 40, 1)
+
+    plans = [f'<div class="planlist"><h1>Part A</h1>\n{_course_lists(rng, codes, sizes[0])}</div>',
+        '<div class="planlist"><h1>Part B</h1></div>']
+    for i in range(majors):
+        count = sizes[1] // majors + (i < sizes[1] % majors)
+        plans.append(f'<div class="planlist"><h1>Major in {_sentence(rng, 2)[:-1]}</h1>\n'
+            f'{_course_lists(rng, codes, max(count, 1))}</div>')
+    plans.append(f'<div class="planlist"><h1>Part C</h1>\n{_course_lists(rng, codes, sizes[2])}</div>')
+
+    nav = ''.join(f'<li><a href="/{w}">{w.capitalize()}</a></li>' for w in _words)
+    return _program_page.format(title='Bachelor of Mathematics (2393)',
+        plans='\n'.join(plans), nav=nav)
@@ -0,0 +1,66 @@
+"""Checks the lxml extraction backend of parse_course_html against bs4 and
+compares their throughput.
+
+    python -m uq_data.bench.course_html [html_folder]
+
+With no folder, a synthetic corpus is generated in a temporary directory.
+"""
+import typing as T
+
+import datetime as dt
+import io
+import os
+import sys
+import tempfile
+import time
+
+from ..courses.parse import parse_course_html, _backends, _list_course_html
+from .corpus import write_course_html
+
+_fixed_time = dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+
+def _read_pages(html_folder: str) -> T.Dict[str, str]:
+    pages = {}
+    for html_path in _list_course_html(html_folder):
+        with open(os.path.join(html_folder, html_path)) as f:
+            pages[html_path] = f.read()
+    return pages
+
+def _parse(html: str, backend: str):
+    try:
+        return parse_course_html(io.StringIO(html), _fixed_time, backend)
+    except Exception as e:
+        # Both backends should fail on the same malformed pages.
+        return type(e).__name__
+
+def diff_backends(pages: T.Dict[str, str], backend: str = 'lxml') -> T.List[str]:
+    """Returns the names of pages where backend's output differs from bs4."""
+    return [name for name, html in pages.items()
+        if _parse(html, 'bs4') != _parse(html, backend)]
+
+def throughput(pages: T.Dict[str, str], backend: str) -> float:
+    """Returns pages parsed per second."""
+    start = time.perf_counter()
+    for html in pages.values():
+        _parse(html, backend)
+    return len(pages) / (time.perf_counter() - start)
+
+def run(html_folder: str) -> T.Dict[str, float]:
+    pages = _read_pages(html_folder)
+    mismatches = diff_backends(pages)
+    for name in mismatches:
+        print('MISMATCH', name)
+    print(f'{len(pages) - len(mismatches)}/{len(pages)} pages identical')
+    return {backend: throughput(pages, backend) for backend in _backends}
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        if len(sys.argv) > 1:
+            html_folder = sys.argv[1]
+        else:
+            html_folder = tmp
+            write_course_html(tmp, 1000)
+        results = run(html_folder)
+    for backend, rate in results.items():
+        print(f'{backend:6} {rate:10,.0f} pages/s')
+    print(f'speedup {results["lxml"] / results["bs4"]:.1f}x')
@@ -0,0 +1,45 @@
+"""Times batched eligibility evaluation against calling verify() per
+student, and checks they agree.
+
+    python -m uq_data.bench.eligibility [students] [courses]
+"""
+import typing as T
+
+import sys
+import time
+
+from ..eligibility import completion_matrix, eligibility
+from ..prereqs import parse_prereqs_batch
+from .corpus import course_codes, prereq_strings, transcripts
+
+def run(students: int = 10000, courses: int = 5000, sample: int = 50) -> T.Dict[str, float]:
+    """Returns seconds taken by each stage, with verify_loop extrapolated
+    from a sample of students."""
+    codes = course_codes(courses)
+    trees = parse_prereqs_batch(prereq_strings(courses, codes=codes))
+    prereqs = dict(zip(codes, trees))
+    records = transcripts(students, codes)
+    results = {}
+
+    start = time.perf_counter()
+    completed = completion_matrix(records, codes)
+    results['completion_matrix'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    eligible = eligibility(prereqs, completed, codes)
+    results['eligibility'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i, record in enumerate(records[:sample]):
+        record = set(record)
+        expected = [node is None or node.verify(record) for node in prereqs.values()]
+        if list(eligible[i]) != expected:
+            raise AssertionError(f'student {i} differs from verify()')
+    results['verify_loop'] = (time.perf_counter() - start) * students / sample
+
+    return results
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:3]]
+    for stage, seconds in run(*args).items():
+        print(f'{stage:18} {seconds:8.2f}s')
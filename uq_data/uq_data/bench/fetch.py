@@ -0,0 +1,110 @@
+"""Downloads course pages from a local stand-in server with uq_data.fetch and
+checks that every page arrives intact, that failures are retried and that
+the per-host rate limit holds.
+
+    python -m uq_data.bench.fetch [n] [rate]
+
+The server answers every fifth course's first request with 503, and
+delays each response slightly to imitate a remote host.
+"""
+import typing as T
+
+import collections
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from ..fetch import fetch, save_to
+
+def _body(code: str) -> bytes:
+    # Deterministic pages of a realistic size, about 40KB.
+    seed = hashlib.sha1(code.encode()).hexdigest().encode()
+    return b'<html><body><h1>' + code.encode() + b'</h1>' + seed * 1000 + b'</body></html>'
+
+class _Handler(BaseHTTPRequestHandler):
+    latency = 0.02
+    requests = None # (time, code) of each request
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        code = parse_qs(urlparse(self.path).query)['course_code'][0]
+        with self.lock:
+            attempt = sum(1 for _, c in self.requests if c == code)
+            self.requests.append((time.perf_counter(), code))
+        time.sleep(self.latency)
+        if attempt == 0 and int(code[4:]) % 5 == 0:
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = _body(code)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def _max_per_second(times: T.List[float]) -> int:
+    # Most requests started in any one second long window.
+    times = sorted(times)
+    best = start = 0
+    for end in range(len(times)):
+        while times[end] - times[start] >= 1:
+            start += 1
+        best = max(best, end - start + 1)
+    return best
+
+def run(n: int = 200, rate: float = 50.0) -> T.Dict[str, float]:
+    _Handler.requests = []
+    server = ThreadingHTTPServer(('localhost', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f'http://localhost:{server.server_address[1]}'
+    codes = [f'TEST{i:04}' for i in range(n)]
+    urls = (f'{host}/programs-courses/course.html?course_code={c}' for c in codes)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            failures = fetch(urls, save_to(tmp), concurrency=16, rate=rate,
+                burst=int(rate), backoff=0.1)
+            elapsed = time.perf_counter() - start
+
+            intact = 0
+            for code in codes:
+                path = os.path.join(tmp, code + '.html')
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        intact += f.read() == _body(code)
+            leftover = [p for p in os.listdir(tmp) if p.endswith('.part')]
+    finally:
+        server.shutdown()
+
+    attempts = collections.Counter(code for _, code in _Handler.requests)
+    return {
+        'pages': n,
+        'intact': intact,
+        'failures': len(failures),
+        'partial files': len(leftover),
+        'retried': sum(1 for c in attempts.values() if c > 1),
+        'seconds': elapsed,
+        'pages/s': n / elapsed,
+        'max requests in 1s': _max_per_second([t for t, _ in _Handler.requests]),
+    }
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 50.0
+    results = run(n, rate)
+    for name, value in results.items():
+        print(f'{name:20} {value:10.4g}')
+    assert results['intact'] == n and results['partial files'] == 0
+    assert results['max requests in 1s'] <= 2 * rate
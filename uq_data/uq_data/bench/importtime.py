@@ -0,0 +1,100 @@
+"""Checks the light CLI commands and modules start quickly, with
+python -X importtime.
+
+    python -m uq_data.bench.importtime [budget ms]
+
+Each case runs in a fresh interpreter. Its import time is the cumulative
+time of every top-level import after site, so interpreter startup and
+.pth files of the environment are not counted. A case fails if it takes
+longer than the budget (100 ms by default) or imports any of the heavy
+dependencies, and the script then exits with status 1.
+
+tests/test_importtime.py runs the same cases with a looser budget, as
+the regression test.
+"""
+import typing as T
+
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+
+HEAVY = ('bs4', 'lxml', 'sqlalchemy', 'numpy', 'parsimonious', 'aiohttp')
+
+_line = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+def import_times(args: T.List[str]) -> T.Tuple[T.Dict[str, int], float]:
+    """Cumulative microseconds of each top-level import after site when
+    running python with args, and the wall seconds it took."""
+    env = dict(os.environ, PYTHONPATH=_root)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f'{args} failed:\n{result.stderr}')
+
+    times = {}
+    after_site = False
+    for line in result.stderr.splitlines():
+        match = _line.match(line)
+        if match is None:
+            continue
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        if indent:
+            times[name] = 0 # nested, already counted in its parent
+        elif after_site:
+            times[name] = cumulative
+        else:
+            after_site = name == 'site'
+    return times, wall
+
+def _cases(folder: str) -> T.Dict[str, T.List[str]]:
+    from ..lookup import build_index
+    from ..courses.search import create_search_index
+
+    index = os.path.join(folder, 'courses.idx')
+    build_index(index, [{'code': 'MATH1051', 'name': 'Calculus & Linear Algebra I'}])
+    db = os.path.join(folder, 'courses.sqlite')
+    with sqlite3.connect(db) as conn:
+        conn.execute('CREATE TABLE courses (course_code, course_name, description, assessment_methods)')
+        conn.execute("INSERT INTO courses VALUES ('MATH1051', 'Calculus & Linear Algebra I', '', '')")
+        create_search_index(conn)
+    conn.close()
+    html = os.path.join(folder, 'html')
+    os.mkdir(html)
+    with open(os.path.join(html, 'MATH1051.html'), 'w') as f:
+        f.write('<html></html>')
+    return {
+        'help': ['-m', 'uq_data', '--help'],
+        'query': ['-m', 'uq_data', 'query', index, 'MATH1051'],
+        'search': ['-m', 'uq_data', 'search', db, 'calculus'],
+        'triage': ['-m', 'uq_data', 'triage', html, '--report', os.path.join(folder, 'report.json')],
+        'import courses.parse': ['-c', 'import uq_data.courses.parse'],
+        'import lookup': ['-c', 'import uq_data.lookup'],
+        'import snapshot': ['-c', 'import uq_data.snapshot'],
+    }
+
+def run(budget_ms: float = 100) -> T.Dict[str, T.Dict[str, T.Any]]:
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for name, args in _cases(folder).items():
+            times, wall = import_times(args)
+            heavy = sorted(m for m in times if m.split('.')[0] in HEAVY)
+            imports_ms = sum(times.values()) / 1000
+            results[name] = {'imports_ms': imports_ms, 'wall_ms': wall * 1000,
+                'heavy': sorted({m.split('.')[0] for m in heavy}),
+                'ok': imports_ms <= budget_ms and not heavy}
+    return results
+
+if __name__ == "__main__":
+    results = run(float(sys.argv[1]) if len(sys.argv) > 1 else 100)
+    for name, r in results.items():
+        print(f'{name:22} {r["imports_ms"]:7.1f}ms imports {r["wall_ms"]:7.1f}ms wall '
+            f'{"ok" if r["ok"] else "FAIL"} {" ".join(r["heavy"])}')
+    sys.exit(0 if all(r['ok'] for r in results.values()) else 1)
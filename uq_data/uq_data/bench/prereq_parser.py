@@ -0,0 +1,116 @@
+"""Checks the hand-written prerequisite parser against the parsimonious
+grammar, and compares their speed.
+
+    python -m uq_data.bench.prereq_parser [fuzz cases]
+
+Every string of _prereqs.txt, the prerequisites of data/course_details.7z
+(if py7zr is installed), bench.corpus and random near-miss strings is given
+to both build_prereq() and build_prereq_peg(), which must return equal
+trees or both raise ParseError. Exits with status 1 on any difference.
+tests/test_prereqs.py checks the same without the catalogue.
+
+Speedups are of the best of 5 runs over each set of strings, over all of
+them and over those which parse. The catalogue is the one to go by: most
+of it is prose, rejected at the first character, and the rest short flat
+lists, while the corpus and fuzz strings are far more deeply nested.
+"""
+import typing as T
+
+import random
+import os
+import sys
+import time
+
+from parsimonious.exceptions import ParseError
+
+from . import corpus
+from .prereqs import load_prereqs_txt
+from ..prereqs import build_prereq, build_prereq_peg, normalise_prereq
+
+data_7z = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data', 'course_details.7z')
+
+_codes = ['MATH1051', 'CSSE2002', 'ORTH1000', 'ENGG1100A', 'ABC123', 'ABCDEF1234',
+    'MATH10512', 'math1051', 'CSSE200']
+_operators = [' and ', ' or ', ' & ', ' + ', ' | ', ' OR ', ' AND ', 'and', ' and  ',
+    '\tor ', ', ', '; ', ',', ' , ', ' ']
+
+def fuzz_strings(n: int, seed: int = 0) -> T.List[str]:
+    """Random strings over the grammar's tokens, mostly close to valid."""
+    rng = random.Random(seed)
+
+    def expr(depth: int) -> str:
+        parts = []
+        for i in range(rng.randint(1, 4)):
+            if i:
+                parts.append(rng.choice(_operators))
+            if depth < 3 and rng.random() < 0.25:
+                parts.append('(' + expr(depth + 1) + ')')
+            else:
+                parts.append(rng.choice(_codes[:3]) if rng.random() < 0.9 else rng.choice(_codes))
+        s = ''.join(parts)
+        if rng.random() < 0.05:
+            i = rng.randrange(len(s) + 1)
+            s = s[:i] + rng.choice('() ,x\n') + s[i:]
+        return s
+    return [expr(0) for _ in range(n)]
+
+def _outcome(build: T.Callable, s: str):
+    try:
+        return build(s)
+    except ParseError:
+        return ParseError
+
+def differences(strings: T.Iterable[str]) -> T.List[str]:
+    """Strings the two parsers disagree on."""
+    return [s for s in strings if _outcome(build_prereq, s) != _outcome(build_prereq_peg, s)]
+
+def _catalogue() -> T.List[str]:
+    try:
+        records = corpus.load_course_details(data_7z)
+    except (ImportError, OSError):
+        return []
+    return [r['prerequisite'] for r in records if r.get('prerequisite')]
+
+def _seconds(build: T.Callable, strings: T.List[str], repeat: int = 5) -> float:
+    # Not through _outcome(), whose call would be a large share of the time
+    # of the hand-written parser.
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for s in strings:
+            try:
+                build(s)
+            except ParseError:
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(fuzz: int = 20000, repeat: int = 5) -> T.Dict[str, T.Dict[str, T.Any]]:
+    corpora = {
+        '_prereqs.txt': load_prereqs_txt(),
+        'catalogue': [normalise_prereq(s) for s in _catalogue()],
+        'corpus': corpus.prereq_strings(5000, seed=1),
+        'fuzz': fuzz_strings(fuzz),
+    }
+    results = {}
+    for name, strings in corpora.items():
+        parseable = [s for s in strings if _outcome(build_prereq, s) is not ParseError]
+        results[name] = {'strings': len(strings), 'parsed': len(parseable),
+            'differences': differences(strings)}
+        for key, timed in (('speedup', strings), ('parseable_speedup', parseable)):
+            if timed:
+                results[name][key] = (_seconds(build_prereq_peg, timed, repeat)
+                    / _seconds(build_prereq, timed, repeat))
+    return results
+
+if __name__ == "__main__":
+    results = run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+    failed = False
+    for name, r in results.items():
+        print(f'{name:14} {r["strings"]:7} strings {r["parsed"]:7} parsed '
+            f'{len(r["differences"]):5} differences '
+            f'{r.get("speedup", 0):5.1f}x faster {r.get("parseable_speedup", 0):5.1f}x on those which parse')
+        for s in r['differences'][:10]:
+            print(f'    {s!r}')
+        failed = failed or bool(r['differences'])
+    sys.exit(1 if failed else 0)
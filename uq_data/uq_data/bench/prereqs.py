@@ -0,0 +1,59 @@
+"""Compares parsing prerequisite strings one at a time with
+parse_prereqs_batch, cold and with a warm cache.
+
+    python -m uq_data.bench.prereqs [course_details.jl]
+
+Uses _prereqs.txt and, if given, the prerequisite column of the scraped
+course details.
+"""
+import typing as T
+
+import os
+import sys
+import time
+
+from parsimonious.exceptions import ParseError
+
+from ..lookup import iter_course_details
+from ..prereqs import build_prereq, parse_prereqs_batch, PrereqCache
+
+prereqs_txt = os.path.join(os.path.dirname(__file__), '..', '..', '_prereqs.txt')
+
+def load_prereqs_txt(path: str = prereqs_txt) -> T.List[str]:
+    with open(path) as f:
+        return [l.strip() for l in f]
+
+def load_course_details(path: str) -> T.List[str]:
+    return [x['prerequisite'] for x in iter_course_details(path) if x.get('prerequisite')]
+
+def one_at_a_time(strings: T.List[str]):
+    for s in strings:
+        try:
+            build_prereq(s)
+        except ParseError:
+            pass
+
+def _rate(f, strings: T.List[str]) -> float:
+    start = time.perf_counter()
+    f(strings)
+    return len(strings) / (time.perf_counter() - start)
+
+def run(strings: T.List[str]) -> T.Dict[str, float]:
+    """Returns strings parsed per second for each approach."""
+    cache = PrereqCache(maxsize=len(strings) + 1)
+    batch = lambda strings: parse_prereqs_batch(strings, cache)
+    return {
+        'one_at_a_time': _rate(one_at_a_time, strings),
+        'batch_cold': _rate(batch, strings),
+        'batch_warm': _rate(batch, strings),
+    }
+
+if __name__ == "__main__":
+    corpora = {'_prereqs.txt': load_prereqs_txt()}
+    if len(sys.argv) > 1:
+        corpora['course_details'] = load_course_details(sys.argv[1])
+
+    for name, strings in corpora.items():
+        print(f'{name}: {len(strings)} strings, {len(set(strings))} distinct')
+        for approach, rate in run(strings).items():
+            print(f'  {approach:14} {rate:12,.0f} strings/s')
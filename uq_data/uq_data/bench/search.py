@@ -0,0 +1,112 @@
+"""Times full-text search against scanning every course for the words,
+in Python and with SQL LIKE, and checks the index is kept up to date.
+
+    python -m uq_data.bench.search [repeat]
+
+Courses are those of data/course_details.7z (needs py7zr), or generated
+by bench.corpus without it.
+"""
+import typing as T
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from . import corpus
+from ..courses.parse import create_sqlite_schema, connect_for_load, upsert_courses
+from ..courses.search import search, fts_query
+
+data_7z = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data', 'course_details.7z')
+
+QUERIES = ['quantum', 'machine learning', 'linear algebra', 'climate change',
+    'history of art', 'statistic', 'software eng', 'the', 'c++', 'marine biology',
+    'public health policy', 'thermodynamics']
+
+_fields = ('course_name', 'description', 'assessment_methods')
+
+def _courses() -> T.List[T.Dict]:
+    try:
+        return [corpus.details_course_dict(r) for r in corpus.load_course_details(data_7z)]
+    except (ImportError, OSError):
+        return corpus.course_dicts(5000)
+
+def python_scan(rows: T.List[T.Tuple[str, ...]], text: str) -> T.List[str]:
+    """Codes of courses containing every word of text in some field, the
+    linear scan search replaces."""
+    words = text.lower().split()
+    return [row[0] for row in rows
+        if all(any(w in field.lower() for field in row[1:]) for w in words)]
+
+def like_scan(conn: sqlite3.Connection, text: str) -> T.List[str]:
+    words = text.split()
+    where = ' AND '.join(['(course_name LIKE ? OR description LIKE ? OR assessment_methods LIKE ?)']
+        * len(words))
+    params = [f'%{w}%' for w in words for _ in _fields]
+    return [code for code, in conn.execute(f'SELECT course_code FROM courses WHERE {where}', params)]
+
+def _best_ms(f: T.Callable[[], T.Any], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def _load_seconds(db_path: str, courses: T.List[T.Dict], index: bool) -> float:
+    create_sqlite_schema(db_path)
+    conn = connect_for_load(db_path)
+    if not index:
+        conn.executescript('DROP TABLE courses_fts; DROP TRIGGER courses_fts_insert; '
+            'DROP TRIGGER courses_fts_delete; DROP TRIGGER courses_fts_update;')
+    start = time.perf_counter()
+    for i in range(0, len(courses), 500):
+        upsert_courses(conn, courses[i:i + 500])
+    seconds = time.perf_counter() - start
+    conn.close()
+    return seconds
+
+def run(repeat: int = 5) -> T.Dict[str, T.Any]:
+    courses = _courses()
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = _load_seconds(os.path.join(tmp, 'plain.sqlite'), courses, index=False)
+        db_path = os.path.join(tmp, 'courses.sqlite')
+        indexed = _load_seconds(db_path, courses, index=True)
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute('SELECT course_code, ' + ', '.join(_fields) + ' FROM courses').fetchall()
+        queries = {}
+        for text in QUERIES:
+            queries[text] = {
+                'fts_query': fts_query(text),
+                'hits': len(search(conn, text, limit=10**6)),
+                'scan_hits': len(python_scan(rows, text)),
+                'search_ms': _best_ms(lambda: search(conn, text), repeat),
+                'python_scan_ms': _best_ms(lambda: python_scan(rows, text), repeat),
+                'like_scan_ms': _best_ms(lambda: like_scan(conn, text), repeat),
+            }
+
+        # Upserting newer text re-indexes the course; unchanged text does not.
+        course = dict(courses[0], description='Zyzzogeton taxonomy',
+            last_updated='9999-01-01T00:00:00+00:00')
+        with conn:
+            upsert_courses(conn, [course])
+        updated = [r.course_code for r in search(conn, 'zyzzogeton')] == [course['course_code']]
+        conn.execute("INSERT INTO courses_fts (courses_fts) VALUES ('integrity-check')")
+        conn.close()
+
+    return {'courses': len(courses), 'load_s': plain, 'load_indexed_s': indexed,
+        'updated': updated, 'queries': queries}
+
+if __name__ == "__main__":
+    results = run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
+    print(f'{results["courses"]} courses, loaded in {results["load_s"]:.2f}s, '
+        f'{results["load_indexed_s"]:.2f}s with the search index')
+    print(f'{"query":22} {"hits":>6} {"scan":>6} {"search ms":>10} {"python ms":>10} {"LIKE ms":>10}')
+    for text, q in results['queries'].items():
+        print(f'{text:22} {q["hits"]:6} {q["scan_hits"]:6} {q["search_ms"]:10.2f} '
+            f'{q["python_scan_ms"]:10.2f} {q["like_scan_ms"]:10.2f}')
+    if not results['updated']:
+        print('an upserted course was not re-indexed')
+        sys.exit(1)
@@ -0,0 +1,141 @@
+"""Load tests the HTTP service of serve.py, reporting latency percentiles
+and requests per second.
+
+    python -m uq_data.bench.serve DATA [--url http://127.0.0.1:8080]
+        [--requests 20000] [--concurrency 32] [--revalidate 0.3]
+
+Without --url, the service is started on DATA in a subprocess on a free
+port and stopped afterwards. Requests are a fixed mix of course lookups,
+prerequisites and offerings of courses in DATA, chosen from a fixed seed.
+A --revalidate fraction of requests repeat an earlier URL with its ETag,
+so are answered 304. Client and server share the machine, so numbers are
+a lower bound on what the service alone could do.
+"""
+import typing as T
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+from collections import Counter
+
+import aiohttp
+
+from ..serve import read_courses, semester_of
+
+_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+
+def request_paths(data: str, n: int, seed: int = 0) -> T.List[str]:
+    """n paths: 70% courses, 20% prerequisites, 10% offerings."""
+    rng = random.Random(seed)
+    courses = list(read_courses(data))
+    codes = [c.code for c in courses]
+    semesters = sorted({(year, semester_of(offer_code)) for c in courses
+        for offer_code, year, _ in c.offerings if semester_of(offer_code)})
+    paths = []
+    for _ in range(n):
+        x = rng.random()
+        if x < 0.7 or not semesters:
+            paths.append(f'/courses/{rng.choice(codes)}')
+        elif x < 0.9:
+            paths.append(f'/courses/{rng.choice(codes)}/prerequisites')
+        else:
+            paths.append('/offerings/%d/%s' % rng.choice(semesters))
+    return paths
+
+def _percentile(sorted_values: T.List[float], p: float) -> float:
+    return sorted_values[min(int(len(sorted_values) * p), len(sorted_values) - 1)]
+
+async def load_test(url: str, paths: T.List[str], concurrency: int = 32,
+        revalidate: float = 0.3, seed: int = 0) -> T.Dict[str, T.Any]:
+    rng = random.Random(seed)
+    etags = {} # path -> ETag of its last 200
+    latencies = []
+    statuses = Counter()
+    todo = iter(paths)
+
+    async def worker(session: aiohttp.ClientSession):
+        for path in todo:
+            headers = {}
+            if path in etags and rng.random() < revalidate:
+                headers['If-None-Match'] = etags[path]
+            start = time.perf_counter()
+            async with session.get(url + path, headers=headers) as response:
+                await response.read()
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status] += 1
+            if response.status == 200:
+                etags[path] = response.headers['ETag']
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'statuses': dict(sorted(statuses.items())),
+        'p50_ms': _percentile(latencies, 0.5) * 1000,
+        'p90_ms': _percentile(latencies, 0.9) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000,
+        'rps': len(latencies) / wall,
+    }
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def _wait_until_up(url: str, process: subprocess.Popen, timeout: float = 120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('the service exited while starting')
+        try:
+            urllib.request.urlopen(url + '/offerings/0/1', timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'the service did not start within {timeout}s')
+
+def run(data: str, url: str = None, requests: int = 20000, concurrency: int = 32,
+        revalidate: float = 0.3) -> T.Dict[str, T.Any]:
+    paths = request_paths(data, requests)
+    process = None
+    if url is None:
+        port = _free_port()
+        url = f'http://127.0.0.1:{port}'
+        process = subprocess.Popen([sys.executable, '-m', 'uq_data', 'serve', data,
+                '--port', str(port), '--reload', '0'],
+            env=dict(os.environ, PYTHONPATH=_root),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if process is not None:
+            _wait_until_up(url, process)
+        return asyncio.run(load_test(url.rstrip('/'), paths, concurrency, revalidate))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Load tests the course HTTP service.')
+    parser.add_argument('data')
+    parser.add_argument('--url', help='a running service, instead of starting one')
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--revalidate', type=float, default=0.3)
+    args = parser.parse_args()
+
+    for name, value in run(args.data, args.url, args.requests, args.concurrency,
+            args.revalidate).items():
+        print(f'{name:10} {value:.1f}' if isinstance(value, float) else f'{name:10} {value}')
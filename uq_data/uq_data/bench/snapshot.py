@@ -0,0 +1,97 @@
+"""Compares the columnar snapshot with the published course_details.7z route,
+unpacking the archive and loading the whole JSON Lines file, by size on
+disk and load time.
+
+    python -m uq_data.bench.snapshot [course_details.7z, .jl or .json]
+
+Reading .7z archives needs py7zr.
+"""
+import typing as T
+
+import os
+import sys
+import tempfile
+import time
+
+from ..lookup import iter_course_details
+from ..snapshot import Snapshot, write_snapshot
+
+data_7z = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data', 'course_details.7z')
+
+def _extract(archive: str, folder: str) -> str:
+    import py7zr
+    with py7zr.SevenZipFile(archive) as z:
+        name, = z.getnames()
+        z.extractall(folder)
+    return os.path.join(folder, name)
+
+def _compress(path: str) -> str:
+    import py7zr
+    out = path + '.7z'
+    with py7zr.SevenZipFile(out, 'w') as z:
+        z.write(path, os.path.basename(path))
+    return out
+
+def _best(f: T.Callable, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def run(source: str = data_7z) -> T.Tuple[T.Dict[str, int], T.Dict[str, float]]:
+    """Returns file sizes in bytes and load times in seconds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        if source.endswith('.7z'):
+            archive = source
+            json_path = _extract(source, tmp)
+        else:
+            json_path = source
+            archive = _compress(json_path)
+        courses = list(iter_course_details(json_path))
+
+        snapshot_path = os.path.join(tmp, 'course_details.uqs')
+        write_snapshot(snapshot_path, courses)
+        with Snapshot(snapshot_path) as snapshot:
+            assert snapshot.records() == courses
+
+        sizes = {
+            'json': os.path.getsize(json_path),
+            'json.7z': os.path.getsize(archive),
+            'snapshot': os.path.getsize(snapshot_path),
+        }
+        try:
+            sizes['snapshot.7z'] = os.path.getsize(_compress(snapshot_path))
+        except ImportError:
+            pass
+
+        def load_json(path=json_path):
+            return list(iter_course_details(path))
+
+        def unpack_and_load_json():
+            return load_json(_extract(archive, os.path.join(tmp, 'unpacked')))
+
+        def snapshot_column(field):
+            with Snapshot(snapshot_path) as snapshot:
+                return snapshot.column(field)
+
+        def snapshot_records():
+            with Snapshot(snapshot_path) as snapshot:
+                return snapshot.records()
+
+        times = {
+            '7z + json, all': _best(unpack_and_load_json, 1),
+            'json, all': _best(load_json),
+            'snapshot, all': _best(snapshot_records),
+            'snapshot, prerequisite': _best(lambda: snapshot_column('prerequisite')),
+            'snapshot, faculty': _best(lambda: snapshot_column('faculty')),
+        }
+    return sizes, times
+
+if __name__ == "__main__":
+    sizes, times = run(*sys.argv[1:2])
+    for name, size in sizes.items():
+        print(f'{name:24} {size / 2**20:8.1f} MiB')
+    for name, seconds in times.items():
+        print(f'{name:24} {seconds * 1000:8.1f} ms')
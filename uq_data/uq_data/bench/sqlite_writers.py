@@ -0,0 +1,64 @@
+"""Compares rows per second of the bulk upsert writer against the previous
+one-query-per-course ORM loop.
+
+    python -m uq_data.bench.sqlite_writers [n]
+"""
+import typing as T
+
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from ..courses.parse import Base, Course, Offering, \
+    create_sqlite_schema, connect_for_load, upsert_courses
+from .corpus import course_dicts
+
+def orm_loop(db_path: str, courses: T.List[T.Dict]):
+    # The writer parse_and_write_sqlite used before the bulk path, extended
+    # to write offerings so both sides store the same rows.
+    engine = create_engine('sqlite:///' + db_path)
+    Base.metadata.create_all(engine)
+    s = sessionmaker(bind=engine)()
+    for data in courses:
+        d = {k: v for k, v in data.items() if k != 'semesters'}
+        if s.query(Course).get(d['course_code']) is None:
+            s.add(Course(**d))
+            s.add_all(Offering(course_code=d['course_code'], **sem)
+                for sem in data['semesters'])
+    s.commit()
+    engine.dispose()
+
+def bulk_upsert(db_path: str, courses: T.List[T.Dict], batch_size: int = 500):
+    create_sqlite_schema(db_path)
+    conn = connect_for_load(db_path)
+    for i in range(0, len(courses), batch_size):
+        upsert_courses(conn, courses[i:i+batch_size])
+    conn.close()
+
+writers = {
+    'orm_loop': orm_loop,
+    'bulk_upsert': bulk_upsert,
+}
+
+def run(n: int = 5000) -> T.Dict[str, float]:
+    """Returns rows (courses + offerings) per second for each writer."""
+    courses = course_dicts(n)
+    rows = len(courses) + sum(len(c['semesters']) for c in courses)
+
+    results = {}
+    for name, writer in writers.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, 'bench.sqlite')
+            start = time.perf_counter()
+            writer(db_path, courses)
+            results[name] = rows / (time.perf_counter() - start)
+    return results
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for name, rate in run(n).items():
+        print(f'{name:12} {rate:12,.0f} rows/s')
@@ -0,0 +1,345 @@
+"""Compact, read-only forms of PrereqNode and CourseList trees, for holding
+many programs and courses in memory at once.
+
+Classes have the same names as the originals. Nodes have __slots__ and no
+type_ field, children are tuples and course codes and names are interned.
+Identical course leaves are shared between trees converted with one memo:
+
+    memo = {}
+    trees = [compact.from_node(tree, memo) for tree in trees]
+
+FlatForest stores many trees in a few flat arrays instead, 17 bytes per
+node plus a table of distinct strings, and serialises to bytes for bulk
+storage. See bench/compact.py for the memory of each form.
+
+to_node() and to_course_list() convert back to the prereqs and course_list
+classes, which compare equal to the originals.
+"""
+import typing as T
+
+import array
+import json
+import math
+import struct
+import sys
+
+from . import prereqs
+from . import course_list
+
+class Node:
+    __slots__ = ()
+
+    def verify(self, courses) -> bool:
+        raise NotImplementedError
+
+    def units_completed(self, courses) -> float:
+        raise NotImplementedError
+
+class CourseNode(Node):
+    __slots__ = ('course_code', 'units', 'name')
+
+    def __init__(self, course_code: str, units: T.Optional[float], name: T.Optional[str]):
+        self.course_code = course_code
+        self.units = units
+        self.name = name
+
+    def verify(self, courses):
+        return self.course_code in courses
+
+    def units_completed(self, courses):
+        return (self.units or 0) if self.course_code in courses else 0
+
+    def _key(self):
+        return self.course_code, self.units, self.name
+
+    def __repr__(self):
+        return f'CourseNode(course_code={self.course_code!r}, units={self.units!r}, name={self.name!r})'
+
+class Relation(Node):
+    __slots__ = ('children',)
+
+    def __init__(self, children: T.Iterable[Node] = ()):
+        self.children = tuple(children)
+
+    def units_completed(self, courses):
+        if not self.verify(courses):
+            return 0
+        return sum(child.units_completed(courses) for child in self.children)
+
+    def _key(self):
+        return self.children
+
+    def __repr__(self):
+        return f'{type(self).__name__}()'
+
+class And(Relation):
+    __slots__ = ()
+
+    def verify(self, courses):
+        return all(child.verify(courses) for child in self.children)
+
+class Or(Relation):
+    __slots__ = ()
+
+    def verify(self, courses):
+        return any(child.verify(courses) for child in self.children)
+
+    def units_completed(self, courses):
+        return max((child.units_completed(courses) for child in self.children), default=0)
+
+class UnitsOf(Relation):
+    __slots__ = ('units',)
+
+    def __init__(self, children: T.Iterable[Node] = (), units: int = 0):
+        super().__init__(children)
+        self.units = units
+
+    def verify(self, courses):
+        return sum(child.units_completed(courses) for child in self.children) >= self.units
+
+    def _key(self):
+        return self.children, self.units
+
+    def __repr__(self):
+        return f'UnitsOf(units={self.units!r})'
+
+def _eq(self, other):
+    return type(self) is type(other) and self._key() == other._key()
+
+def _hash(self):
+    return hash((type(self), self._key()))
+
+for _cls in (CourseNode, Relation):
+    _cls.__eq__ = _eq
+    _cls.__hash__ = _hash
+
+class CourseList:
+    __slots__ = ('name', 'node', 'sublists')
+
+    def __init__(self, name: str, node: T.Optional[Node] = None,
+            sublists: T.Iterable['CourseList'] = ()):
+        self.name = name
+        self.node = node
+        self.sublists = tuple(sublists)
+
+    def __eq__(self, other):
+        return (type(other) is CourseList and self.name == other.name
+            and self.node == other.node and self.sublists == other.sublists)
+
+    def __hash__(self):
+        return hash((self.name, self.node, self.sublists))
+
+    def __repr__(self):
+        return f'CourseList(name={self.name!r}, node={self.node})'
+
+    def __str__(self):
+        # Same text as course_list.CourseList, which also shows depths.
+        lines = []
+        stack = [(self, 0)]
+        while stack:
+            cl, depth = stack.pop()
+            indent = '  ' * depth
+            text = f'CourseList(name={cl.name!r}, depth={depth}, node={cl.node})'
+            lines.append(indent + text.replace('\n', '\n' + indent))
+            stack.extend((x, depth + 1) for x in reversed(cl.sublists))
+        return '\n'.join(lines)
+
+def _intern(s: T.Optional[str]) -> T.Optional[str]:
+    return None if s is None else sys.intern(s)
+
+_relations = {
+    prereqs.And: And,
+    prereqs.Or: Or,
+    prereqs.UnitsOf: UnitsOf,
+}
+_full_relations = {v: k for k, v in _relations.items()}
+
+def from_node(node: prereqs.PrereqNode, memo: T.Dict = None) -> Node:
+    """Compact copy of a PrereqNode tree. Course leaves equal to one
+    already in memo are shared rather than copied."""
+    if memo is None:
+        memo = {}
+    if isinstance(node, prereqs.CourseNode):
+        key = (node.course_code, node.units, node.name)
+        course = memo.get(key)
+        if course is None:
+            course = memo[key] = CourseNode(_intern(node.course_code), node.units, _intern(node.name))
+        return course
+    children = (from_node(child, memo) for child in node.children)
+    cls = _relations[type(node)]
+    if cls is UnitsOf:
+        return UnitsOf(children, node.units)
+    return cls(children)
+
+def to_node(node: Node) -> prereqs.PrereqNode:
+    """A new PrereqNode tree equal to the one node was made from."""
+    if isinstance(node, CourseNode):
+        return prereqs.CourseNode(node.course_code, node.units, node.name)
+    children = [to_node(child) for child in node.children]
+    if isinstance(node, UnitsOf):
+        return prereqs.UnitsOf(children, node.units)
+    return _full_relations[type(node)](children)
+
+def from_course_list(cl: course_list.CourseList, memo: T.Dict = None) -> CourseList:
+    if memo is None:
+        memo = {}
+    node = None if cl.node is None else from_node(cl.node, memo)
+    return CourseList(cl.name, node, (from_course_list(x, memo) for x in cl.sublists))
+
+def to_course_list(cl: CourseList, parent: course_list.CourseList = None) -> course_list.CourseList:
+    """A new course_list.CourseList tree. Parents and depths are rebuilt
+    from the nesting, as set_parent() gives them."""
+    full = course_list.CourseList(cl.name, None if cl.node is None else to_node(cl.node))
+    if parent is not None:
+        full.set_parent(parent)
+    for sublist in cl.sublists:
+        to_course_list(sublist, full)
+    return full
+
+# FlatForest node kinds.
+_NONE, _COURSE, _AND, _OR, _UNITS, _LIST = range(6)
+_kinds = {And: _AND, Or: _OR, UnitsOf: _UNITS}
+_kind_classes = {v: k for k, v in _kinds.items()}
+
+_header = struct.Struct('<4sIII') # magic, nodes, trees, string table bytes
+_magic = b'UQF\x01'
+
+def _little_endian(arr: array.array) -> bytes:
+    if sys.byteorder == 'big':
+        arr = array.array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+class FlatForest:
+    """Many compact trees stored as parallel arrays in preorder.
+
+    Each node has a kind and two integers a and b, and courses a float of
+    units (NaN for None):
+
+        course    a = code, b = name (string table indices, 0 is None)
+        and, or   a = number of children
+        units     a = number of children, b = units
+        list      a = name, b = number of sublists, then its node (or a
+                  none entry) and sublists follow
+        none      an absent CourseList node
+
+    add() appends a tree and returns its number, and forest[i] rebuilds it
+    as compact nodes.
+    """
+
+    def __init__(self):
+        self.kinds = array.array('B')
+        self.a = array.array('I')
+        self.b = array.array('I')
+        self.units = array.array('d')
+        self.roots = array.array('I') # offset of each tree
+        self.strings = [None] # type: T.List[T.Optional[str]]
+        self._string_ids = {None: 0}
+
+    def __len__(self):
+        return len(self.roots)
+
+    def _string(self, s: T.Optional[str]) -> int:
+        i = self._string_ids.get(s)
+        if i is None:
+            i = self._string_ids[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+    def _append(self, kind: int, a: int = 0, b: int = 0, units: float = math.nan):
+        self.kinds.append(kind)
+        self.a.append(a)
+        self.b.append(b)
+        self.units.append(units)
+
+    def add(self, tree: T.Union[Node, CourseList, prereqs.PrereqNode, course_list.CourseList]) -> int:
+        """Appends a tree of either form. Returns its index."""
+        self.roots.append(len(self.kinds))
+        stack = [tree]
+        while stack:
+            x = stack.pop()
+            if x is None:
+                self._append(_NONE)
+            elif isinstance(x, (CourseList, course_list.CourseList)):
+                self._append(_LIST, self._string(x.name), len(x.sublists))
+                stack.extend(reversed(x.sublists))
+                stack.append(x.node)
+            elif isinstance(x, (CourseNode, prereqs.CourseNode)):
+                self._append(_COURSE, self._string(x.course_code), self._string(x.name),
+                    math.nan if x.units is None else x.units)
+            else:
+                cls = type(x) if isinstance(x, Node) else _relations[type(x)]
+                kind = _kinds[cls]
+                self._append(kind, len(x.children), x.units if kind == _UNITS else 0)
+                stack.extend(reversed(x.children))
+        return len(self.roots) - 1
+
+    def __getitem__(self, i: int) -> T.Union[Node, CourseList]:
+        return self._build(self.roots[i], {})[0]
+
+    def __iter__(self) -> T.Iterator[T.Union[Node, CourseList]]:
+        memo = {}
+        for root in self.roots:
+            yield self._build(root, memo)[0]
+
+    def _build(self, i: int, memo: T.Dict) -> T.Tuple[T.Any, int]:
+        # The tree at offset i and the offset after it.
+        kind = self.kinds[i]
+        a, b = self.a[i], self.b[i]
+        if kind == _NONE:
+            return None, i + 1
+        if kind == _COURSE:
+            units = self.units[i]
+            key = (a, b, units)
+            course = memo.get(key)
+            if course is None:
+                course = memo[key] = CourseNode(self.strings[a],
+                    None if math.isnan(units) else units, self.strings[b])
+            return course, i + 1
+        if kind == _LIST:
+            node, i = self._build(i + 1, memo)
+            sublists = []
+            for _ in range(b):
+                sublist, i = self._build(i, memo)
+                sublists.append(sublist)
+            return CourseList(self.strings[a], node, sublists), i
+        children = []
+        i += 1
+        for _ in range(a):
+            child, i = self._build(i, memo)
+            children.append(child)
+        if kind == _UNITS:
+            return UnitsOf(children, b), i
+        return _kind_classes[kind](children), i
+
+    def nbytes(self) -> int:
+        """Size of the arrays, not counting the string table."""
+        return sum(x.itemsize * len(x) for x in (self.kinds, self.a, self.b, self.units, self.roots))
+
+    def to_bytes(self) -> bytes:
+        """Header, the arrays little-endian, then the strings as JSON."""
+        strings = json.dumps(self.strings[1:]).encode('utf-8')
+        return b''.join([
+            _header.pack(_magic, len(self.kinds), len(self.roots), len(strings)),
+            *(_little_endian(x) for x in (self.kinds, self.a, self.b, self.units, self.roots)),
+            strings,
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'FlatForest':
+        magic, nodes, trees, strings_size = _header.unpack_from(data)
+        if magic != _magic:
+            raise ValueError('not a FlatForest')
+        forest = cls()
+        offset = _header.size
+        for name, count in (('kinds', nodes), ('a', nodes), ('b', nodes),
+                ('units', nodes), ('roots', trees)):
+            arr = getattr(forest, name)
+            size = arr.itemsize * count
+            arr.frombytes(data[offset:offset + size])
+            offset += size
+            if sys.byteorder == 'big':
+                arr.byteswap()
+        for s in json.loads(data[offset:offset + strings_size].decode('utf-8')):
+            forest._string(_intern(s))
+        return forest
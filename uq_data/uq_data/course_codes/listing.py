@@ -0,0 +1,130 @@
+"""Incremental extractor for the course search results page, which lists
+every course.
+
+Bytes are fed to the standard library's event-based HTMLParser as they
+arrive and each course is emitted as soon as its list item closes. No tree
+is built, so memory stays bounded however long the page is. (lxml's HTML
+push parser keeps all of its input, so is not used here.)
+
+Stdlib only, as uq_scraper's course_codes spider imports it too, see
+uq_scraper/uq_scraper/shared.py.
+"""
+import typing as T
+
+import codecs
+
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+SEARCH_URL = 'https://my.uq.edu.au/programs-courses/search.html?keywords=course&searchType=all&archived=false'
+
+_fields = {'code': 'code', 'title': 'name'} # class -> output key
+
+class ListingParser(HTMLParser):
+    """Extracts {code, name, href} of each course in #courses-container
+    .listing > li. code and name are the stripped text of .code and
+    .title, including the text of any tags within them.
+
+        parser = ListingParser()
+        for chunk in chunks:
+            for course in parser.feed(chunk):
+                ...
+        courses = parser.close()
+    """
+
+    def __init__(self, base_url: str = SEARCH_URL, encoding: str = 'utf-8'):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+        self._divs = 0 # open divs, counting #courses-container, else 0
+        self._lists = [] # whether each open ul/ol in the container is .listing
+        self._item = None # course being read
+        self._text = None # (key, tag, nesting, parts) of a field being read
+        self._done = []
+
+    def feed(self, data: bytes) -> T.List[T.Dict[str, str]]:
+        """Parses more of the page, returning the courses it completed."""
+        super().feed(self._decoder.decode(data))
+        return self._take()
+
+    def close(self) -> T.List[T.Dict[str, str]]:
+        """Finishes the page, returning any remaining courses."""
+        super().feed(self._decoder.decode(b'', final=True))
+        super().close()
+        self._end_item()
+        return self._take()
+
+    def _take(self) -> T.List[T.Dict[str, str]]:
+        done, self._done = self._done, []
+        return done
+
+    def _end_item(self):
+        if self._item is not None:
+            self._done.append(self._item)
+            self._item = None
+            self._text = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if not self._divs:
+            if tag == 'div' and attrs.get('id') == 'courses-container':
+                self._divs = 1
+            return
+        if tag == 'div':
+            self._divs += 1
+        elif tag in ('ul', 'ol'):
+            self._lists.append('listing' in (attrs.get('class') or '').split())
+        elif tag == 'li' and self._lists and self._lists[-1]:
+            # An unclosed <li> is closed by the next one.
+            self._end_item()
+            self._item = {'code': None, 'name': None, 'href': None}
+        if self._item is None:
+            return
+
+        if self._text is not None:
+            key, open_tag, nesting, parts = self._text
+            if tag == open_tag:
+                self._text = (key, open_tag, nesting + 1, parts)
+            return
+        for cls in (attrs.get('class') or '').split():
+            key = _fields.get(cls)
+            if key is not None and self._item[key] is None:
+                self._text = (key, tag, 0, [])
+                break
+        href = attrs.get('href') or ''
+        if tag == 'a' and self._item['href'] is None and href.startswith('/programs-courses/'):
+            self._item['href'] = urljoin(self.base_url, href.split('&offer=', 1)[0])
+
+    def handle_endtag(self, tag):
+        if not self._divs:
+            return
+        if self._text is not None and tag == self._text[1]:
+            key, open_tag, nesting, parts = self._text
+            if nesting:
+                self._text = (key, open_tag, nesting - 1, parts)
+            else:
+                self._item[key] = ''.join(parts).strip()
+                self._text = None
+        if tag == 'li' and self._lists and self._lists[-1]:
+            self._end_item()
+        elif tag in ('ul', 'ol') and self._lists:
+            if self._lists.pop():
+                self._end_item()
+        elif tag == 'div':
+            self._divs -= 1
+            if not self._divs:
+                self._end_item()
+
+    def handle_data(self, data):
+        if self._text is not None:
+            self._text[3].append(data)
+
+def iter_listing(chunks: T.Iterable[bytes], base_url: str = SEARCH_URL,
+        encoding: str = 'utf-8') -> T.Iterator[T.Dict[str, str]]:
+    """Yields each course on a search results page given as an iterable of
+    byte chunks, such as a response read a block at a time. Courses are
+    yielded while later chunks are still to come."""
+    parser = ListingParser(base_url, encoding)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
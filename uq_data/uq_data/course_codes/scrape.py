@@ -1,25 +1,55 @@
-import urllib.request
+import typing as T
+
 import json.encoder
 
+from ..fetch import fetch, feed_to, save_to
+from .listing import SEARCH_URL, ListingParser, iter_listing
+
 def parse_courses_html(html) -> list:
-    courses = []
-    for line in html:
-        if line.startswith(b' <a href="#" class="code">'):
-            courses.append(line.replace(b'<a href="#" class="code">', b'').replace(b'</a>', b'').strip().decode('utf-8'))
-    return courses
+    """Course codes on the search results page, given as an iterable of
+    byte chunks such as a file or response."""
+    return [course['code'] for course in iter_listing(html)]
+
+class _ListingCollector(ListingParser):
+    # Keeps the courses ListingParser completes, so it can be fed by
+    # fetch.feed_to(), which ignores what feed() returns.
+    def __init__(self, base_url: str = SEARCH_URL):
+        super().__init__(base_url)
+        self.courses = []
+
+    def feed(self, data: bytes):
+        self.courses.extend(super().feed(data))
+
+    def close(self):
+        self.courses.extend(super().close())
+
+def fetch_listing(url: str = SEARCH_URL, **kwargs) -> T.List[T.Dict[str, str]]:
+    """Every course on the search results page at url, parsed as the page
+    downloads. kwargs are passed to fetch.fetch_all(), which retries
+    failed attempts; the courses are those of the last attempt.
+
+    Raises:
+        FetchError or aiohttp.ClientError -- if every attempt failed.
+    """
+    attempts = []
+
+    def make_parser(url: str) -> _ListingCollector:
+        attempts.append(_ListingCollector(url))
+        return attempts[-1]
+
+    failures = fetch([url], feed_to(make_parser), **kwargs)
+    if failures:
+        raise failures[0][1]
+    return attempts[-1].courses
 
 if __name__ == "__main__":
-    url = 'https://my.uq.edu.au/programs-courses/search.html?keywords=course&searchType=all&archived=false'
-    with urllib.request.urlopen(url) as f:
-        courses = parse_courses_html(f)
+    courses = fetch_listing()
+    codes = [course['code'] for course in courses]
     with open('data/course_codes.json', 'w') as j:
-        json.dump(courses, j)
+        json.dump(codes, j)
     with open('data/course_codes.txt', 'w', newline='\n') as f:
-        f.write('\n'.join(courses))
-    course_url = 'https://my.uq.edu.au/programs-courses/course.html?course_code='
-    with open('data/_aria_list.txt', 'w', newline='\n') as f:
-        for c in courses:
-            f.write(course_url + c + '\n out=' + c + '.html\n' )
-    with open('data/_url_list.txt', 'w', newline='\n') as f:
-        for c in courses:
-            f.write(course_url + c + '\n')
\ No newline at end of file
+        f.write('\n'.join(codes))
+
+    # Downloads every course page to html/CODE.html, for courses.parse.
+    failures = fetch((course['href'] for course in courses), save_to('html'))
+    print(f'downloaded {len(courses) - len(failures)} of {len(courses)} courses')
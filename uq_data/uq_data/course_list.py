@@ -21,8 +21,13 @@ class CourseList:
         return f'CourseList(name={repr(self.name)}, depth={self.depth}, node={self.node})'
 
     def __str__(self):
-        if not self.sublists:
-            return repr(self)
-        else:
-            return repr(self) + '\n  ' + '\n'.join(str(x) for x in self.sublists) \
-                .replace('\n', '\n  ')
\ No newline at end of file
+        # Each list's repr, indented two spaces per level below this one.
+        # Built in one pass, as joining and re-indenting each level's
+        # string is quadratic in the depth.
+        lines = []
+        stack = [(self, '')]
+        while stack:
+            course_list, indent = stack.pop()
+            lines.append(indent + repr(course_list).replace('\n', '\n' + indent))
+            stack.extend((x, indent + '  ') for x in reversed(course_list.sublists))
+        return '\n'.join(lines)
\ No newline at end of file
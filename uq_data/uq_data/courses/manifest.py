@@ -0,0 +1,119 @@
+import typing as T
+
+import hashlib
+import os
+import sqlite3
+
+from collections import namedtuple
+
+FileState = namedtuple('FileState', 'path size mtime digest')
+
+_schema = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        path VARCHAR PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime INTEGER NOT NULL,
+        digest VARCHAR NOT NULL
+    )
+'''
+
+def file_digest(path: str, block_size: int = 1 << 16) -> str:
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+class Manifest:
+    """Persistent record of the size, mtime and content hash of every input
+    file which has been successfully processed, stored in a SQLite table.
+
+    changed() is cheap for untouched files (one stat and one indexed lookup)
+    and only hashes a file when its size or mtime differ from the record.
+    Nothing is written until commit(), so the manifest can share a database
+    file with another connection which is mid-transaction. Commit after
+    each batch of outputs is written, so an interrupted run only redoes
+    the files of its last batch.
+
+    Files are recorded by their path relative to root, the input folder, so
+    the manifest stays valid when run from another working directory. Paths
+    passed in are relative to the working directory, as for open().
+
+    Delete the table (or file) to force a full rebuild.
+    """
+
+    def __init__(self, db_path: str, root: str = '.', table: str = 'html_manifest'):
+        self.table = table
+        self.root = os.path.abspath(root)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(_schema.format(table=table))
+        self.conn.commit()
+
+        self._pending = {} # type: T.Dict[str, FileState]
+        self._updates = [] # type: T.List[FileState]
+
+        self.unchanged = 0
+        self.touched = 0
+        self.changed_count = 0
+
+    def _lookup(self, path: str) -> T.Optional[FileState]:
+        row = self.conn.execute(
+            f'SELECT path, size, mtime, digest FROM {self.table} WHERE path = ?',
+            (path, )).fetchone()
+        return FileState(*row) if row else None
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, '/')
+
+    def changed(self, path: str, output: str = None) -> bool:
+        """Returns True if path is new or its contents differ from the last
+        recorded version, or if output, the file written from it, is given
+        and missing. A file whose mtime changed but whose contents did not
+        is treated as unchanged and its new mtime is recorded."""
+        key = self._key(path)
+        stat = os.stat(path)
+        old = self._lookup(key)
+        if output is not None and not os.path.exists(output):
+            old = None
+
+        if old and old.size == stat.st_size and old.mtime == stat.st_mtime_ns:
+            self.unchanged += 1
+            return False
+
+        state = FileState(key, stat.st_size, stat.st_mtime_ns, file_digest(path))
+        if old and old.digest == state.digest:
+            self.touched += 1
+            self._updates.append(state)
+            return False
+
+        self.changed_count += 1
+        self._pending[key] = state
+        return True
+
+    def record(self, path: str):
+        """Marks a changed file as processed. Call this only once its output
+        has been written."""
+        state = self._pending.pop(self._key(path), None)
+        if state is not None:
+            self._updates.append(state)
+
+    def commit(self):
+        self.conn.executemany(
+            f'INSERT OR REPLACE INTO {self.table} (path, size, mtime, digest) '
+            'VALUES (?, ?, ?, ?)', self._updates)
+        self.conn.commit()
+        self._updates.clear()
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return (f'{self.changed_count} changed, {self.touched} touched, '
+            f'{self.unchanged} unchanged')
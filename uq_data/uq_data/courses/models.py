@@ -0,0 +1,47 @@
+"""SQLAlchemy models of the course database, whose tables sql.py creates
+without SQLAlchemy. Loaded by parse.py only on first access to Course,
+Offering or Base, as building them loads all of SQLAlchemy."""
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+class Course(Base):
+    __tablename__ = 'courses'
+    course_code = Column(String(16), primary_key=True, unique=True, index=True)
+
+    course_name = Column(String)
+    level = Column(String)
+    faculty = Column(String)
+    school = Column(String)
+    units = Column(String)
+    duration = Column(String)
+    contact = Column(String)
+    restricted = Column(String)
+    incompatible = Column(String)
+    prerequisites = Column(String)
+    assessment_methods = Column(String)
+    coordinator = Column(String)
+    study_abroad = Column(String)
+    description = Column(String)
+
+    last_updated = Column(String)
+
+    offerings = relationship('Offering', back_populates='course')
+
+class Offering(Base):
+    __tablename__ = 'offerings'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    course_code = Column(String(16), ForeignKey('courses.course_code'))
+    code = Column(String)
+    year = Column(Integer)
+    teaching_period = Column(String, nullable=True)
+
+    course = relationship('Course', back_populates='offerings')
+
+    # Conflict target for upserting offerings.
+    __table_args__ = (
+        Index('ix_offerings_course_offer', 'course_code', 'code', 'year', unique=True),
+    )
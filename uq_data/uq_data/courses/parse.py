@@ -1,60 +1,46 @@
 import typing as T 
 
 import datetime as dt
-import bs4
+import functools
 import os
 import json
+import multiprocessing
+import sqlite3
 
 from collections import namedtuple
 
-import logging
+if not __package__:
+    # Run as a script, python uq_data/courses/parse.py, rather than with
+    # -m, so make the relative imports resolve within the package (PEP 366).
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    __package__ = 'uq_data.courses'
+
+from . import sql
+from .manifest import Manifest
+from .. import instrument
 
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship, sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+import logging
 
 CourseData = namedtuple('CourseData', 'data file')
 
 logger = logging.getLogger(__name__)
 
-Base = declarative_base()
-
-class Course(Base):
-    __tablename__ = 'courses'
-    course_code = Column(String(16), primary_key=True, unique=True, index=True)
-
-    course_name = Column(String)
-    level = Column(String)
-    faculty = Column(String)
-    school = Column(String)
-    units = Column(String)
-    duration = Column(String)
-    contact = Column(String)
-    restricted = Column(String)
-    incompatible = Column(String)
-    prerequisites = Column(String)
-    assessment_methods = Column(String)
-    coordinator = Column(String)
-    study_abroad = Column(String)
-    description = Column(String)
-
-    last_updated = Column(String)
+# bs4, lxml and SQLAlchemy are imported where they are first used, so the
+# module loads quickly for callers needing none of them, e.g. the CLI's
+# lighter commands. Course, Offering and Base are loaded from models.py
+# on first access.
+_models = ('Base', 'Course', 'Offering')
 
-    offerings = relationship('Offering', back_populates='course')
+def __getattr__(name: str):
+    if name in _models:
+        from . import models
+        return getattr(models, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-class Offering(Base):
-    __tablename__ = 'offerings'
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    course_code = Column(String(16), ForeignKey('courses.course_code'))
-    code = Column(String)
-    year = Column(Integer)
-    teaching_period = Column(String, nullable=True)
-
-    course = relationship('Course', back_populates='offerings')
-
-
-_local_tz = dt.datetime.now(dt.timezone.utc).astimezone().tzinfo
+@functools.lru_cache(maxsize=None)
+def _local_tz() -> dt.tzinfo:
+    return dt.datetime.now(dt.timezone.utc).astimezone().tzinfo
 
 _id_mapping = {
     'course-level': 'level',
@@ -72,33 +58,122 @@ _id_mapping = {
     'course-summary': 'description',
 }
 
-def parse_course_html(html_file: T.IO[T.Any], updated_time: dt.datetime=None) -> T.Dict:
-    soup = bs4.BeautifulSoup(html_file.read(), features='lxml')
+# An extraction backend takes the page's HTML and returns the text of the
+# course title, (href, text) of each offering link and the text of each
+# _id_mapping section (None if missing). parse_course_html turns these into
+# the course dict, so every backend produces identical output.
+_Extracted = T.Tuple[str, T.List[T.Tuple[str, str]], T.Dict[str, T.Optional[str]]]
+
+def _extract_bs4(html: str) -> _Extracted:
+    import bs4
+
+    with instrument.stage('soup'):
+        soup = bs4.BeautifulSoup(html, features='lxml')
+
+    with instrument.stage('extract'):
+        title = soup.find('h1', {'id': 'course-title'}).text
+        offerings = [
+            (a['href'], a.text) for a in soup.find('div', {'id': 'description'})
+                .find_all('a', {'class': 'course-offering-year'})
+        ]
+
+        sections = {}
+        for html_id in _id_mapping:
+            element = soup.find('p', {'id': html_id})
+            sections[html_id] = None if element is None else element.text
+
+    return title, offerings, sections
+
+def _extract_lxml(html: str) -> _Extracted:
+    # Feeds the same libxml2 parser BeautifulSoup uses with features='lxml',
+    # but finds every element of interest in a single walk over the tree.
+    from lxml import etree
+
+    with instrument.stage('soup'):
+        parser = etree.HTMLParser()
+        parser.feed(html)
+        root = parser.close()
+
+    with instrument.stage('extract'):
+        return _find_lxml(root)
+
+def _find_lxml(root) -> _Extracted:
+    from lxml import etree
+
+    wanted = {html_id: 'p' for html_id in _id_mapping}
+    wanted['course-title'] = 'h1'
+    wanted['description'] = 'div'
+    found = {}
+    for element in root.iter(etree.Element):
+        html_id = element.get('id')
+        if html_id in wanted and html_id not in found and element.tag == wanted[html_id]:
+            found[html_id] = element
+            if len(found) == len(wanted):
+                break
+
+    # .get() so a missing title or description raises AttributeError, and
+    # attrib[] so a missing href raises KeyError, as the bs4 backend does.
+    title = _text_lxml(found.get('course-title'))
+    offerings = [
+        (a.attrib['href'], _text_lxml(a)) for a in found.get('description').iter('a')
+            if 'course-offering-year' in a.get('class', '').split()
+    ]
+    sections = {
+        html_id: _text_lxml(found[html_id]) if html_id in found else None
+        for html_id in _id_mapping
+    }
+
+    return title, offerings, sections
+
+# Elements whose text bs4's .text leaves out, as it gives the strings in
+# them their own types, e.g. Script and Stylesheet.
+_no_text = ('script', 'style', 'template', 'rt', 'rp')
+
+def _text_lxml(element) -> str:
+    # The text of element and its descendants, as bs4's .text gives it:
+    # without comments or anything inside a _no_text element.
+    if next(element.iter(*_no_text), None) is None:
+        return ''.join(element.itertext())
+    parts = [element.text or '']
+    for child in element:
+        # Comments and processing instructions have no str tag.
+        if isinstance(child.tag, str) and child.tag not in _no_text:
+            parts.append(_text_lxml(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+_backends = {
+    'bs4': _extract_bs4,
+    'lxml': _extract_lxml,
+}
+
+def parse_course_html(html_file: T.IO[T.Any], updated_time: dt.datetime=None,
+        backend: str = 'bs4') -> T.Dict:
+    with instrument.stage('read'):
+        html = html_file.read()
+    title, offerings, sections = _backends[backend](html)
+
+    with instrument.stage('fields'):
+        return _course_dict(title, offerings, sections, updated_time)
 
+def _course_dict(title: str, offerings: T.List[T.Tuple[str, str]],
+        sections: T.Dict[str, T.Optional[str]], updated_time: dt.datetime) -> T.Dict:
     data = {}
-    def _find_section(element_id, output_key):
-        try:
-            return soup.find('p', {'id': element_id}).text.strip()
-        except AttributeError:
-            return ''
 
     # Get the course title by deleting " (ABCD1234)" from the heading.
-    title = soup.find('h1', {'id': 'course-title'}).text
-    
     data['course_code'] = course_code = title.split('(')[-1].replace(')', '')
     data['course_name'] = course_name = title.replace(' ('+course_code+')', '', 1)
 
     semesters = []
-    semester_elements = soup.find('div', {'id': 'description'}).find_all('a', {'class': 'course-offering-year'})
-    for sem_elem in semester_elements:
-        semester_code = sem_elem['href'].split('&offer=')[1].split('&')[0]
-        if '&year=' in sem_elem['href']:
-            year = int(sem_elem['href'].split('&year=')[1].split('+')[0])
+    for href, text in offerings:
+        semester_code = href.split('&offer=')[1].split('&')[0]
+        if '&year=' in href:
+            year = int(href.split('&year=')[1].split('+')[0])
         else:
             year = dt.datetime.today().year
-        teaching_period = None 
-        if '(' in sem_elem.text: # possibly non-standard teaching period
-            teaching_period = sem_elem.text.split('(')[1].split(')')[0]
+        teaching_period = None
+        if '(' in text: # possibly non-standard teaching period
+            teaching_period = text.split('(')[1].split(')')[0]
             if teaching_period == 'Standard':
                 teaching_period = None
         semesters.append({'code': semester_code, 'year': year, 'teaching_period': teaching_period})
@@ -107,7 +182,8 @@ def parse_course_html(html_file: T.IO[T.Any], updated_time: dt.datetime=None) ->
     data['semesters'] = semesters
 
     for html_id, data_key in _id_mapping.items():
-        data[data_key] = _find_section(html_id, data_key)
+        text = sections[html_id]
+        data[data_key] = '' if text is None else text.strip()
     # gets everything else
 
     if updated_time is None:
@@ -117,70 +193,182 @@ def parse_course_html(html_file: T.IO[T.Any], updated_time: dt.datetime=None) ->
     return data
 
 
-def parse_all_courses_from_html(html_folder: str):
-
-    for html_path in os.listdir(html_folder):
-        html_path_full = os.path.join(html_folder, html_path)
-
-        if not (os.path.isfile(html_path_full) and html_path.lower().endswith('.html')):
-            continue 
-        
-        modified = dt.datetime.fromtimestamp(os.path.getmtime(html_path_full))
-        modified = modified.replace(tzinfo=_local_tz)
-        
-        with open(html_path_full) as html_file:
-            parsed_data = parse_course_html(html_file, modified)
-
-        yield CourseData(parsed_data, html_path)
-
-def parse_and_write_sqlite(html_folder):
-    engine = create_engine('sqlite:///data/course_data.sqlite')
-    Base.metadata.create_all(engine)
-
-    Session = sessionmaker(bind=engine)
-    s = Session()
-
-    for data, path in parse_all_courses_from_html(html_folder):
-        print(path)
-        d = {k: v for k, v in data.items() if k != 'semesters'}
-        q = s.query(Course).get(d['course_code'])
-        if q:
-            if q.last_updated < d['last_updated']:
-                print('time to update') 
-            else:
-                print('not updating')
+def _parse_course_file(html_folder: str, html_path: str, backend: str = 'bs4') -> CourseData:
+    html_path_full = os.path.join(html_folder, html_path)
+
+    modified = dt.datetime.fromtimestamp(os.path.getmtime(html_path_full))
+    modified = modified.replace(tzinfo=_local_tz())
+
+    with open(html_path_full) as html_file:
+        parsed_data = parse_course_html(html_file, modified, backend)
+
+    return CourseData(parsed_data, html_path)
+
+def _parse_course_file_safe(args) -> T.Tuple[T.Optional[CourseData], str, T.Optional[str]]:
+    # Worker entry point. Exceptions are returned rather than raised so one
+    # bad file cannot take down the whole pool.
+    html_folder, html_path, backend = args
+    try:
+        return _parse_course_file(html_folder, html_path, backend), html_path, None
+    except Exception as e:
+        return None, html_path, f'{type(e).__name__}: {e}'
+
+def _parse_in_worker(args):
+    # Pool workers send the stats of each file back with its result.
+    return _parse_course_file_safe(args) + (instrument.snapshot(),)
+
+def _report_failure(html_path: str, error: str):
+    logger.error('failed to parse %s: %s', html_path, error)
+
+def _list_course_html(html_folder: str) -> T.List[str]:
+    # Sorted so sequential and parallel runs yield courses in the same order.
+    return sorted(
+        html_path for html_path in os.listdir(html_folder)
+        if html_path.lower().endswith('.html')
+            and os.path.isfile(os.path.join(html_folder, html_path))
+    )
+
+def parse_all_courses_from_html(html_folder: str, processes: int = 1,
+        batch_size: int = 64, manifest: Manifest = None, backend: str = 'bs4',
+        on_error: T.Callable[[str, str], None] = _report_failure,
+        output_of: T.Callable[[str], str] = None) \
+        -> T.Iterator[CourseData]:
+    """Parses every .html file in html_folder, yielding CourseData in sorted
+    filename order.
+
+    Arguments:
+        html_folder {str} -- folder of course HTML pages.
+        processes {int} -- number of worker processes. 1 parses in this
+            process, None uses every CPU.
+        batch_size {int} -- files handed to a worker at a time. At most
+            processes * batch_size results are held in memory at once.
+        manifest {Manifest} -- if given, files the manifest reports as
+            unchanged are skipped without being parsed. The caller should
+            record() each yielded file once its output is written.
+        backend {str} -- extraction backend for parse_course_html, 'bs4' or
+            the faster 'lxml'.
+        on_error {callable} -- called with (filename, error message) for
+            each file which could not be parsed. Such files are skipped.
+        output_of {callable} -- path of the file written from each .html
+            filename. Files whose output is missing are parsed even if the
+            manifest reports them unchanged.
+    """
+    html_paths = _list_course_html(html_folder)
+    if manifest is not None:
+        total = len(html_paths)
+        html_paths = [p for p in html_paths
+            if manifest.changed(os.path.join(html_folder, p), output_of and output_of(p))]
+        instrument.count('manifest.changed', len(html_paths))
+        instrument.count('manifest.unchanged', total - len(html_paths))
+    args = [(html_folder, html_path, backend) for html_path in html_paths]
+
+    if processes == 1:
+        results = (r + (None,) for r in map(_parse_course_file_safe, args))
+        yield from _handle_results(results, on_error)
+        return
+
+    window = batch_size * (processes or os.cpu_count() or 1)
+    initializer = instrument.enable if instrument.enabled() else None
+    with multiprocessing.Pool(processes, initializer, (instrument.tracing(),)) as pool:
+        for start in range(0, len(args), window):
+            # imap preserves input order. Submitting one window at a time
+            # stops finished results piling up if the consumer is slow.
+            results = pool.imap(_parse_in_worker,
+                args[start:start+window], chunksize=batch_size)
+            yield from _handle_results(results, on_error)
+
+def _handle_results(results, on_error) -> T.Iterator[CourseData]:
+    for course_data, html_path, error, stats in results:
+        instrument.merge(stats)
+        if error is not None:
+            on_error(html_path, error)
         else:
-            s.add(Course(**d))
-
-    s.commit()
-
-def parse_and_write_json(output_folder: str, html_folder: str):
+            yield course_data
+
+def create_sqlite_schema(db_path: str):
+    with sqlite3.connect(db_path) as conn:
+        sql.create_schema(conn)
+
+def connect_for_load(db_path: str) -> sqlite3.Connection:
+    """Opens a connection tuned for bulk loading. synchronous=OFF risks
+    corruption on power loss, which is acceptable for a database that can
+    be rebuilt from HTML."""
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    return conn
+
+def upsert_courses(conn: sqlite3.Connection, courses: T.List[T.Dict]):
+    """Inserts or updates the given parsed courses and their offerings in a
+    single transaction. A course already stored from a page at least as new
+    is left as it was, offerings included. Otherwise its offerings become
+    those parsed, and any no longer listed are deleted."""
+    with instrument.stage('db_write'), conn:
+        for data in courses:
+            sql.upsert_course(conn, data, [
+                dict(semester, course_code=data['course_code'])
+                for semester in data['semesters']])
+
+def parse_and_write_sqlite(html_folder, processes: int = 1,
+        db_path: str = 'data/course_data.sqlite', batch_size: int = 500,
+        backend: str = 'bs4'):
+    create_sqlite_schema(db_path)
+    conn = connect_for_load(db_path)
+    manifest = Manifest(db_path, html_folder)
+
+    def _flush(batch: T.List[CourseData]):
+        upsert_courses(conn, [data for data, path in batch])
+        for data, path in batch:
+            manifest.record(os.path.join(html_folder, path))
+        manifest.commit()
+
+    batch = []
+    for course_data in parse_all_courses_from_html(html_folder, processes,
+            manifest=manifest, backend=backend):
+        print(course_data.file)
+        batch.append(course_data)
+        if len(batch) >= batch_size:
+            _flush(batch)
+            batch = []
+    _flush(batch)
+
+    conn.close()
+    manifest.close()
+    print(manifest)
+
+def parse_and_write_json(output_folder: str, html_folder: str, processes: int = 1,
+        manifest_path: str = None, backend: str = 'bs4', batch_size: int = 500):
     # https://stackoverflow.com/a/39079819
 
-    for data, path in parse_all_courses_from_html(html_folder):
-        out_path_full = os.path.join(output_folder, path.upper().replace('.HTML', '.json'))
-        modified = dt.datetime.fromisoformat(data['last_updated'])
+    # Only HTML files which changed since the last run, or whose JSON is
+    # missing, are parsed at all.
+    if manifest_path is None:
+        manifest_path = os.path.join(output_folder, '_manifest.sqlite')
 
-        try:
-            with open(out_path_full) as out_file:
-                last_modified = dt.datetime.fromisoformat(json.load(out_file)['last_updated'])
-        except OSError:
-            last_modified = dt.datetime.min.replace(tzinfo=_local_tz)
+    def output_of(path: str) -> str:
+        return os.path.join(output_folder, path.upper().replace('.HTML', '.json'))
 
-        print('json', last_modified,   'HTML', modified )
+    with Manifest(manifest_path, html_folder) as manifest:
+        for i, (data, path) in enumerate(parse_all_courses_from_html(html_folder, processes,
+                manifest=manifest, backend=backend, output_of=output_of), 1):
+            out_path_full = output_of(path)
+            print(f'{path} changed, writing JSON...')
 
-        if last_modified > modified:
-            print(f'{path}\'s JSON file is newer than the HTML file!')
-            continue
-        elif last_modified == modified:
-            print(f'{path}\'s JSON file matches the HTML file.')
-            continue
-        else:
-            print(f'{path}\'s JSON file is older than the HTML, parsing...')
+            with instrument.stage('serialize'), open(out_path_full, 'w') as out_file:
+                json.dump(data, out_file)
+            manifest.record(os.path.join(html_folder, path))
+            if i % batch_size == 0:
+                manifest.commit()
 
-        with open(out_path_full, 'w') as out_file:
-            json.dump(data, out_file)
+        print(manifest)
 
 if __name__ == "__main__":
-    parse_and_write_json('./course', './html')
+    # UQ_INSTRUMENT=1 prints time per stage, UQ_PROFILE and UQ_TRACE
+    # name cProfile and Chrome trace outputs.
+    with instrument.session('UQ_INSTRUMENT' in os.environ,
+            os.environ.get('UQ_PROFILE'), os.environ.get('UQ_TRACE')):
+        # A worker process per CPU, where this used to parse in one. The
+        # output is the same, written in the same order.
+        parse_and_write_json('./course', './html', processes=None)
     # parse_and_write_sqlite('./html')
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""Full-text search over course names, descriptions and assessment.
+
+courses_fts is an FTS5 index whose content is the courses table itself, so
+the text is stored once. Triggers on courses keep it up to date with every
+insert, upsert and delete, whichever writer made them, and only re-index
+a course when one of its searched columns changed. Results are ranked by
+BM25, with names weighted above descriptions above assessment.
+
+    with sqlite3.connect('data/course_data.sqlite') as conn:
+        for result in search(conn, 'quantum comput'):
+            print(result.course_code, result.snippet)
+
+The index refers to courses by rowid, which VACUUM may renumber, as
+course_code is not an INTEGER PRIMARY KEY. Run rebuild_search_index()
+after vacuuming.
+"""
+import typing as T
+
+import logging
+import re
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+_schema = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5(
+    course_name, description, assessment_methods,
+    content='courses', content_rowid='rowid',
+    tokenize='porter unicode61', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS courses_fts_insert AFTER INSERT ON courses BEGIN
+    INSERT INTO courses_fts (rowid, course_name, description, assessment_methods)
+    VALUES (new.rowid, new.course_name, new.description, new.assessment_methods);
+END;
+CREATE TRIGGER IF NOT EXISTS courses_fts_delete AFTER DELETE ON courses BEGIN
+    INSERT INTO courses_fts (courses_fts, rowid, course_name, description, assessment_methods)
+    VALUES ('delete', old.rowid, old.course_name, old.description, old.assessment_methods);
+END;
+CREATE TRIGGER IF NOT EXISTS courses_fts_update AFTER UPDATE ON courses
+WHEN old.course_name IS NOT new.course_name
+    OR old.description IS NOT new.description
+    OR old.assessment_methods IS NOT new.assessment_methods
+BEGIN
+    INSERT INTO courses_fts (courses_fts, rowid, course_name, description, assessment_methods)
+    VALUES ('delete', old.rowid, old.course_name, old.description, old.assessment_methods);
+    INSERT INTO courses_fts (rowid, course_name, description, assessment_methods)
+    VALUES (new.rowid, new.course_name, new.description, new.assessment_methods);
+END;
+'''
+
+# BM25 weights of course_name, description and assessment_methods. Only
+# the best rows are joined for snippets, as snippet() is far slower than
+# bm25().
+_search_sql = '''
+    SELECT c.course_code, c.course_name, hit.rank,
+        snippet(courses_fts, -1, :start, :end, :ellipsis, :tokens)
+    FROM (SELECT rowid, bm25(courses_fts, 10.0, 1.0, 0.5) AS rank FROM courses_fts
+        WHERE courses_fts MATCH :query ORDER BY rank LIMIT :limit) AS hit
+    JOIN courses_fts ON courses_fts.rowid = hit.rowid AND courses_fts MATCH :query
+    JOIN courses AS c ON c.rowid = hit.rowid
+    ORDER BY hit.rank
+'''
+
+_word = re.compile(r'\w+')
+
+# In most courses, so they barely affect ranking but make every course a
+# match which must be scored.
+_stop_words = frozenset('a an and are as at be by for from in into is it of on or '
+    'the to with'.split())
+
+# Shortest prefix of the prefix index. Shorter prefixes scan every term.
+_min_prefix = 2
+
+class SearchResult(T.NamedTuple):
+    course_code: str
+    course_name: str
+    rank: float # BM25, lower is better
+    snippet: str
+
+def create_search_index(conn: sqlite3.Connection) -> bool:
+    """Creates courses_fts and its triggers if missing, indexing any
+    courses already in the database. Returns False, and leaves the
+    database unchanged, if SQLite was built without FTS5."""
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'courses_fts'").fetchone()
+    try:
+        with conn:
+            conn.executescript(_schema)
+    except sqlite3.OperationalError as e:
+        if 'fts5' not in str(e):
+            raise
+        logger.warning('SQLite has no FTS5, so courses will not be searchable: %s', e)
+        return False
+    if not exists:
+        rebuild_search_index(conn)
+    return True
+
+def rebuild_search_index(conn: sqlite3.Connection):
+    """Re-indexes every course, e.g. after VACUUM renumbered rowids."""
+    with conn:
+        conn.execute("INSERT INTO courses_fts (courses_fts) VALUES ('rebuild')")
+
+def fts_query(text: str, prefix: bool = True) -> str:
+    """An FTS5 query matching courses containing every word of text, with
+    the last as a prefix if prefix is set, so partly typed words match.
+    Punctuation is dropped, so any text is a valid query. Common words are
+    dropped too, unless text has no others, when only names are searched."""
+    words = _word.findall(text)
+    if not words:
+        return ''
+    last = words.pop()
+    kept = [w for w in words if w.lower() not in _stop_words]
+    # The last word is kept as typed, or else the query would be empty.
+    if kept or prefix or last.lower() not in _stop_words:
+        words = kept
+    terms = [f'"{w}"' for w in words] + [f'"{last}"']
+    if prefix and len(last) >= _min_prefix:
+        terms[-1] += '*'
+    query = ' '.join(terms)
+    if not kept and last.lower() in _stop_words:
+        # Nearly every course matches, so only look in names.
+        query = f'course_name : ({query})'
+    return query
+
+def search(conn: sqlite3.Connection, text: str, limit: int = 20, prefix: bool = True,
+        raw: bool = False, highlight: T.Tuple[str, str] = ('[', ']'),
+        snippet_tokens: int = 12) -> T.List[SearchResult]:
+    """Best matching courses for text, best first.
+
+    Arguments:
+        text {str} -- words to search for, see fts_query().
+        raw {bool} -- text is already an FTS5 query, e.g. to use OR, NEAR
+            or column filters such as 'course_name: algebra'.
+        highlight {tuple} -- strings put around matches in snippets.
+        snippet_tokens {int} -- most words in each snippet, taken from
+            whichever column matched best.
+    """
+    query = text if raw else fts_query(text, prefix)
+    if not query:
+        return []
+    rows = conn.execute(_search_sql, {'query': query, 'limit': limit,
+        'start': highlight[0], 'end': highlight[1], 'ellipsis': '…', 'tokens': snippet_tokens})
+    return [SearchResult(*row) for row in rows]
@@ -0,0 +1,106 @@
+"""Tables of the course database and the statements writing them.
+
+Needs only the standard library, so the scraper's SQLite pipeline imports
+it too and either can write the database the other reads. The tables are
+those of Course and Offering in models.py, which SQLAlchemy users map
+onto them.
+
+    with sqlite3.connect('data/course_data.sqlite') as conn:
+        create_schema(conn)
+        upsert_course(conn, course, offerings)
+"""
+import typing as T
+
+import sqlite3
+
+from .search import create_search_index
+
+COURSE_COLUMNS = [
+    'course_code', 'course_name', 'level', 'faculty', 'school', 'units',
+    'duration', 'contact', 'restricted', 'incompatible', 'prerequisites',
+    'assessment_methods', 'coordinator', 'study_abroad', 'description',
+    'last_updated',
+]
+
+# As SQLAlchemy creates Course and Offering, plus the unique index on
+# offerings which upserts conflict on.
+_schema = '''
+CREATE TABLE IF NOT EXISTS courses (
+    course_code VARCHAR(16) NOT NULL,
+    course_name VARCHAR,
+    level VARCHAR,
+    faculty VARCHAR,
+    school VARCHAR,
+    units VARCHAR,
+    duration VARCHAR,
+    contact VARCHAR,
+    restricted VARCHAR,
+    incompatible VARCHAR,
+    prerequisites VARCHAR,
+    assessment_methods VARCHAR,
+    coordinator VARCHAR,
+    study_abroad VARCHAR,
+    description VARCHAR,
+    last_updated VARCHAR,
+    PRIMARY KEY (course_code)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_courses_course_code ON courses (course_code);
+CREATE TABLE IF NOT EXISTS offerings (
+    id INTEGER NOT NULL,
+    course_code VARCHAR(16),
+    code VARCHAR,
+    year INTEGER,
+    teaching_period VARCHAR,
+    PRIMARY KEY (id),
+    FOREIGN KEY(course_code) REFERENCES courses (course_code)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_offerings_course_offer
+    ON offerings (course_code, code, year);
+'''
+
+# Existing rows are only overwritten by data from a newer page. Times are
+# compared with julianday(), which applies their UTC offsets, as the
+# offline parser writes local times and the scraper's pipeline UTC.
+_upsert_course_sql = '''
+    INSERT INTO courses ({columns}) VALUES ({params})
+    ON CONFLICT (course_code) DO UPDATE SET {updates}
+    WHERE julianday(excluded.last_updated) > julianday(courses.last_updated)
+'''.format(
+    columns=', '.join(COURSE_COLUMNS),
+    params=', '.join(':' + c for c in COURSE_COLUMNS),
+    updates=', '.join(f'{c} = excluded.{c}' for c in COURSE_COLUMNS if c != 'course_code'),
+)
+
+_upsert_offering_sql = '''
+    INSERT INTO offerings (course_code, code, year, teaching_period)
+    VALUES (:course_code, :code, :year, :teaching_period)
+    ON CONFLICT (course_code, code, year) DO UPDATE SET
+        teaching_period = excluded.teaching_period
+'''
+
+def create_schema(conn: sqlite3.Connection):
+    """Creates any missing tables and indexes, including the search index."""
+    conn.executescript(_schema)
+    create_search_index(conn)
+
+def replace_offerings(conn: sqlite3.Connection, course_code: str,
+        offerings: T.List[T.Dict]):
+    """Makes offerings those of course_code. Offerings no longer listed are
+    deleted, and those still listed updated in place, keeping their ids."""
+    current = {(o['code'], o['year']) for o in offerings}
+    stale = [(id, ) for id, code, year in conn.execute(
+            'SELECT id, code, year FROM offerings WHERE course_code = ?', (course_code, ))
+        if (code, year) not in current]
+    conn.executemany('DELETE FROM offerings WHERE id = ?', stale)
+    conn.executemany(_upsert_offering_sql, offerings)
+
+def upsert_course(conn: sqlite3.Connection, course: T.Dict,
+        offerings: T.List[T.Dict]) -> bool:
+    """Inserts or updates course, a row with every column in COURSE_COLUMNS,
+    and its offerings. Returns False, changing nothing, if the course is
+    already stored from a page at least as new. Does not commit."""
+    # rowcount is 0 when the WHERE of the upsert skipped the update.
+    if not conn.execute(_upsert_course_sql, {c: course[c] for c in COURSE_COLUMNS}).rowcount:
+        return False
+    replace_offerings(conn, course['course_code'], offerings)
+    return True
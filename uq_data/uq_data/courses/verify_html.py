@@ -1,34 +1,142 @@
-import glob
+"""Triage of downloaded course pages before parsing.
+
+Files are searched with bytes-level find, which runs at memchr speed, by a
+thread pool working through batches of files, so a full corpus is checked
+as fast as it can be read. Large files are memory mapped; course pages are
+small enough that reading one in a single call is cheaper than mapping it.
+Files are classified as
+
+    empty       zero bytes.
+    not_found   UQ's "course could not be found" page.
+    truncated   no closing </html>, e.g. an interrupted download.
+    normal      anything else.
+
+    python -m uq_data.courses.verify_html html [--report analysis.json]
+        [--quarantine quarantine] [--threads N]
+"""
+import typing as T
+
+import argparse
+import json
+import logging
+import mmap
 import os
 
-def analyse_html(html_folder):
-    html = {
-        'empty': [],
-        'not_found': [],
-        'normal': [],
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ('empty', 'not_found', 'truncated', 'normal')
+
+_not_found = b'<h1 id="course-notfound">The course you requested could not be found.</h1>'
+_end = b'</html>'
+_tail = 4096 # bytes from the end searched for _end
+_mmap_size = 64 * 1024 # files at least this big are memory mapped
+_batch_size = 256
+
+def _classify_bytes(data, size: int) -> str:
+    # data is bytes or an mmap, which have the same find methods.
+    if data.find(_not_found) != -1:
+        return 'not_found'
+    if data.rfind(_end, max(0, size - _tail)) == -1:
+        return 'truncated'
+    return 'normal'
+
+def classify(path: str) -> str:
+    """The category of one HTML file, one of CATEGORIES."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 'empty'
+        if size < _mmap_size:
+            data = f.read()
+            return _classify_bytes(data, len(data))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return _classify_bytes(m, size)
+
+def _classify_batch(paths: T.List[str]) -> T.List[T.Tuple[str, T.Optional[str], T.Optional[str]]]:
+    # One task per batch, as a future per file costs more than the check.
+    results = []
+    for path in paths:
+        try:
+            results.append((path, classify(path), None))
+        except OSError as e:
+            results.append((path, None, f'{type(e).__name__}: {e}'))
+    return results
+
+def triage(html_folder: str, threads: int = None) -> T.Dict:
+    """Classifies every file in html_folder.
+
+    Returns:
+        dict -- {'folder', 'counts': {category: n}, 'files': {category:
+            [filename]}, 'errors': {filename: message}}, filenames sorted.
+            Files which could not be read are only in errors.
+    """
+    if threads is None:
+        threads = min(32, 4 * (os.cpu_count() or 1))
+    names = sorted(name for name in os.listdir(html_folder)
+        if os.path.isfile(os.path.join(html_folder, name)))
+    paths = [os.path.join(html_folder, name) for name in names]
+
+    files = {category: [] for category in CATEGORIES}
+    errors = {}
+    batches = [paths[i:i+_batch_size] for i in range(0, len(paths), _batch_size)]
+    with ThreadPoolExecutor(threads) as pool:
+        # map preserves order, so each list stays sorted.
+        results = (r for batch in pool.map(_classify_batch, batches) for r in batch)
+        for path, category, error in results:
+            name = os.path.basename(path)
+            if error is None:
+                files[category].append(name)
+            else:
+                logger.error('could not read %s: %s', path, error)
+                errors[name] = error
+
+    return {
+        'folder': html_folder,
+        'counts': {category: len(files[category]) for category in CATEGORIES},
+        'files': files,
+        'errors': errors,
     }
-    for f in glob.glob(os.path.join(html_folder, '*')):
-        if os.path.getsize(f) == 0:
-            html['empty'].append(f)
-            continue
-        else:
-            print(f)
-            with open(f) as f_:
-                if '<h1 id="course-notfound">The course you requested could not be found.</h1>' in f_.read():
-                    html['not_found'].append(f)
-                    continue
-        html['normal'].append(f)
-    return html
 
+def quarantine(report: T.Dict, quarantine_folder: str,
+        categories: T.Iterable[str] = ('empty', 'not_found', 'truncated')) -> int:
+    """Moves the files of the given categories in a triage() report to
+    quarantine_folder/category/, where they can be inspected or restored.
+    Returns the number of files moved."""
+    moved = 0
+    for category in categories:
+        target = os.path.join(quarantine_folder, category)
+        os.makedirs(target, exist_ok=True)
+        for name in report['files'][category]:
+            os.replace(os.path.join(report['folder'], name), os.path.join(target, name))
+            moved += 1
+    return moved
+
+def analyse_html(html_folder: str) -> T.Dict[str, T.List[str]]:
+    """Paths of the files in html_folder, by category. See triage()."""
+    report = triage(html_folder)
+    return {category: [os.path.join(html_folder, name) for name in names]
+        for category, names in report['files'].items()}
+
+def main(argv: T.List[str] = None, prog: str = None):
+    """Command line entry point, also run by python -m uq_data triage."""
+    logging.basicConfig()
+    parser = argparse.ArgumentParser(prog=prog, description='Classifies downloaded course pages.')
+    parser.add_argument('html_folder', nargs='?', default='./html')
+    parser.add_argument('--report', default='analysis.json', help='JSON report path')
+    parser.add_argument('--quarantine', help='move bad files into this folder')
+    parser.add_argument('--threads', type=int)
+    args = parser.parse_args(argv)
+
+    report = triage(args.html_folder, args.threads)
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(', '.join(f'{n} {category}' for category, n in report['counts'].items()))
+
+    if args.quarantine:
+        moved = quarantine(report, args.quarantine)
+        print(f'moved {moved} files to {args.quarantine}')
 
 if __name__ == "__main__":
-    import json
-    with open('analysis.json', 'w') as f:
-        d = analyse_html('./html')
-        json.dump(d, f, indent=2)
-    
-    for x in d['empty']:
-        os.remove(os.path.normpath(x))
-    for x in d['not_found']:
-        os.remove(x)
-    
\ No newline at end of file
+    main()
@@ -0,0 +1,145 @@
+"""Evaluates prerequisites for many students at once.
+
+Transcripts are held as a boolean completion matrix with one row per
+student and one column per course code. Each PrereqNode tree is compiled
+once into a function of that matrix which returns a boolean column, so
+checking every student against a course is a handful of NumPy operations
+rather than one recursive walk per student.
+
+The results match PrereqNode.verify().
+"""
+import typing as T
+
+import numpy as np
+
+from .prereqs import PrereqNode, And, Or, UnitsOf, CourseNode
+
+Columns = T.Mapping[str, int]
+_Vector = T.Callable[[np.ndarray], np.ndarray]
+
+def completion_matrix(transcripts: T.Sequence[T.Iterable[str]],
+        codes: T.Sequence[str]) -> np.ndarray:
+    """Returns a students x courses boolean matrix where [i, j] is whether
+    student i has completed codes[j]. Course codes not in codes are ignored.
+
+    The matrix is column-major so each course's column is contiguous.
+    """
+    columns = {code: j for j, code in enumerate(codes)}
+    completed = np.zeros((len(transcripts), len(codes)), dtype=bool, order='F')
+    # One scatter of every (student, course) pair, rather than one per student.
+    js = []
+    lengths = []
+    get = columns.get
+    for transcript in transcripts:
+        n = len(js)
+        js.extend(j for j in map(get, transcript) if j is not None)
+        lengths.append(len(js) - n)
+    rows = np.repeat(np.arange(len(transcripts)), lengths)
+    completed[rows, np.array(js, dtype=np.intp)] = True
+    return completed
+
+def _course_columns(nodes: T.List[PrereqNode], columns: Columns) -> T.Optional[T.List[int]]:
+    # Column of each child if every child is a known course, else None.
+    if all(isinstance(n, CourseNode) and n.course_code in columns for n in nodes):
+        return [columns[n.course_code] for n in nodes]
+    return None
+
+def _compile(node: PrereqNode, columns: Columns) -> T.Tuple[_Vector, _Vector]:
+    """Returns functions computing verify() and units_completed() of node
+    for every row of a completion matrix."""
+    if isinstance(node, CourseNode):
+        units = node.units or 0
+        if node.course_code not in columns:
+            none = lambda m: np.zeros(m.shape[0], dtype=bool)
+            return none, lambda m: np.zeros(m.shape[0])
+        j = columns[node.course_code]
+        return (lambda m: m[:, j]), (lambda m: m[:, j] * units)
+
+    children = [_compile(child, columns) for child in node.children]
+    oks = [ok for ok, _ in children]
+    unitses = [units for _, units in children]
+    js = _course_columns(node.children, columns)
+
+    def _all(m):
+        result = np.ones(m.shape[0], dtype=bool)
+        for ok in oks:
+            result &= ok(m)
+        return result
+
+    def _any(m):
+        result = np.zeros(m.shape[0], dtype=bool)
+        for ok in oks:
+            result |= ok(m)
+        return result
+
+    def _sum(m):
+        result = np.zeros(m.shape[0])
+        for units in unitses:
+            result += units(m)
+        return result
+
+    if isinstance(node, And):
+        if js is not None:
+            _all = lambda m: m[:, js].all(axis=1)
+        return _all, lambda m: np.where(_all(m), _sum(m), 0)
+
+    if isinstance(node, Or):
+        if js is not None:
+            _any = lambda m: m[:, js].any(axis=1)
+        def _max(m):
+            result = np.zeros(m.shape[0])
+            for units in unitses:
+                np.maximum(result, units(m), out=result)
+            return result
+        return _any, _max
+
+    if isinstance(node, UnitsOf):
+        if js is not None:
+            weights = np.array([child.units or 0 for child in node.children], dtype=float)
+            _sum = lambda m: m[:, js] @ weights
+        ok = lambda m: _sum(m) >= node.units
+        return ok, lambda m: np.where(ok(m), _sum(m), 0)
+
+    raise TypeError(f'cannot compile {type(node).__name__}')
+
+def compile_node(node: PrereqNode, columns: Columns) -> T.Tuple[_Vector, _Vector]:
+    """Compiles a tree into a pair of functions taking a completion matrix
+    and returning, for every student, verify() and units_completed()."""
+    return _compile(node, columns)
+
+def compile_prereq(node: T.Optional[PrereqNode], columns: Columns) -> _Vector:
+    """Compiles a prerequisite tree into a function taking a completion
+    matrix and returning which students meet it. None, for a course with no
+    prerequisites, is met by everyone."""
+    if node is None:
+        return lambda m: np.ones(m.shape[0], dtype=bool)
+    return _compile(node, columns)[0]
+
+def eligibility(prereqs: T.Mapping[str, T.Optional[PrereqNode]],
+        completed: np.ndarray, codes: T.Sequence[str]) -> np.ndarray:
+    """Evaluates every course's prerequisites for every student.
+
+    Arguments:
+        prereqs {Mapping} -- course code to parsed prerequisites.
+        completed {np.ndarray} -- completion matrix over codes, see
+            completion_matrix().
+        codes {Sequence} -- course code of each column of completed.
+
+    Returns:
+        np.ndarray -- students x len(prereqs) boolean matrix, columns in
+            the order of prereqs.
+    """
+    columns = {code: j for j, code in enumerate(codes)}
+    result = np.empty((completed.shape[0], len(prereqs)), dtype=bool, order='F')
+
+    # Identical prerequisite strings share one tree when parsed with
+    # parse_prereqs_batch, so evaluate each distinct tree once.
+    done = {}
+    for j, node in enumerate(prereqs.values()):
+        key = id(node)
+        if key in done:
+            result[:, j] = result[:, done[key]]
+            continue
+        result[:, j] = compile_prereq(node, columns)(completed)
+        done[key] = j
+    return result
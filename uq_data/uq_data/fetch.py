@@ -0,0 +1,159 @@
+"""Concurrent downloader for lists of UQ pages.
+
+A fixed number of workers share one aiohttp session, so connections are
+pooled, and pull URLs lazily from the given iterable. Requests to each host
+are rate limited by a token bucket. Failed requests are retried with
+exponential backoff. Each response body is streamed to a sink as it
+arrives, rather than read into memory first.
+
+    fetch(urls, save_to('html'))
+"""
+import typing as T
+
+import asyncio
+import logging
+import os
+import random
+
+from urllib.parse import urlparse, parse_qs
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Called with the URL and the response, whose body is still unread. Called
+# again with a new response if the request is retried.
+Sink = T.Callable[[str, aiohttp.ClientResponse], T.Awaitable[None]]
+
+# Worth trying again; other error statuses fail immediately.
+_retry_statuses = {408, 429, 500, 502, 503, 504}
+
+_chunk_size = 64 * 1024
+
+class TokenBucket:
+    """Allows rate acquisitions per second on average, and up to burst at
+    once after being idle."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = None
+
+    async def acquire(self):
+        now = asyncio.get_running_loop().time()
+        if self.last is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        # Take the token now, possibly going negative, then wait until it
+        # would have been available. Later callers queue behind it.
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+class FetchError(Exception):
+    def __init__(self, url: str, status: int):
+        super().__init__(f'{url} returned {status}')
+        self.url = url
+        self.status = status
+
+def course_code_of(url: str) -> str:
+    """The course_code or acad_prog query parameter of a UQ page's URL."""
+    query = parse_qs(urlparse(url).query)
+    for key in ('course_code', 'acad_prog'):
+        if key in query:
+            return query[key][0]
+    raise ValueError(f'{url} has no course_code or acad_prog')
+
+def save_to(folder: str, filename: T.Callable[[str], str] = None) -> Sink:
+    """A sink writing each body to folder/filename(url), by default
+    CODE.html. Files are written under a temporary name and renamed once
+    complete, so an interrupted download never leaves a partial page."""
+    if filename is None:
+        filename = lambda url: course_code_of(url) + '.html'
+    os.makedirs(folder, exist_ok=True)
+
+    async def sink(url: str, response: aiohttp.ClientResponse):
+        path = os.path.join(folder, filename(url))
+        part = path + '.part'
+        with open(part, 'wb') as f:
+            async for chunk in response.content.iter_chunked(_chunk_size):
+                f.write(chunk)
+        os.replace(part, path)
+    return sink
+
+def feed_to(make_parser: T.Callable[[str], T.Any]) -> Sink:
+    """A sink feeding each body to a parser as it arrives. make_parser(url)
+    returns an object with feed(bytes) and close() methods, such as an
+    lxml.etree.HTMLParser; a new one is made for each attempt."""
+    async def sink(url: str, response: aiohttp.ClientResponse):
+        parser = make_parser(url)
+        async for chunk in response.content.iter_chunked(_chunk_size):
+            parser.feed(chunk)
+        parser.close()
+    return sink
+
+async def fetch_all(urls: T.Iterable[str], sink: Sink, concurrency: int = 8,
+        rate: float = 4.0, burst: int = 4, retries: int = 4,
+        backoff: float = 1.0, timeout: float = 60,
+        headers: T.Dict[str, str] = None) -> T.List[T.Tuple[str, Exception]]:
+    """Downloads every URL, passing each response to sink.
+
+    Arguments:
+        urls {Iterable} -- URLs, consumed lazily.
+        sink {Sink} -- see save_to() and feed_to().
+        concurrency {int} -- requests in flight at once, over all hosts.
+        rate {float} -- requests per second to each host.
+        burst {int} -- requests allowed at once to an idle host.
+        retries {int} -- further attempts after a failed request.
+        backoff {float} -- seconds before the first retry, doubling each
+            time, with jitter.
+        timeout {float} -- seconds allowed for each attempt.
+        headers {dict} -- extra request headers.
+
+    Returns:
+        list -- (url, exception) for each URL which failed every attempt.
+    """
+    urls = iter(urls)
+    buckets = {}
+    failures = []
+
+    async def fetch_one(session: aiohttp.ClientSession, url: str):
+        host = urlparse(url).netloc
+        if host not in buckets:
+            buckets[host] = TokenBucket(rate, burst)
+        for attempt in range(retries + 1):
+            await buckets[host].acquire()
+            try:
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        raise FetchError(url, response.status)
+                    await sink(url, response)
+                return
+            except (aiohttp.ClientError, asyncio.TimeoutError, FetchError) as e:
+                if isinstance(e, FetchError) and e.status not in _retry_statuses:
+                    raise
+                if attempt == retries:
+                    raise
+                delay = backoff * 2**attempt * random.uniform(0.5, 1.5)
+                logger.info('%s: %r, retrying in %.1fs', url, e, delay)
+                await asyncio.sleep(delay)
+
+    async def worker(session: aiohttp.ClientSession):
+        # Workers share the one iterator, so URLs are read as needed.
+        for url in urls:
+            try:
+                await fetch_one(session, url)
+            except Exception as e:
+                logger.error('failed to fetch %s: %r', url, e)
+                failures.append((url, e))
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+    return failures
+
+def fetch(urls: T.Iterable[str], sink: Sink, **kwargs) -> T.List[T.Tuple[str, Exception]]:
+    """Runs fetch_all() to completion. See fetch_all() for arguments."""
+    return asyncio.run(fetch_all(urls, sink, **kwargs))
@@ -0,0 +1,179 @@
+"""Opt-in timers and counters for the parsing pipelines.
+
+Code marks its stages and events, which cost a flag check when
+instrumentation is off:
+
+    with instrument.stage('soup'):
+        soup = bs4.BeautifulSoup(html)
+    instrument.count('prereq_cache.hits')
+
+and a caller turns it on around a run:
+
+    with instrument.session(profile='parse.prof', trace='trace.json'):
+        parse_and_write_json('course', 'html', processes=None)
+
+which prints a table of time per stage and counter values at the end, and
+optionally writes a cProfile dump (read with pstats or snakeviz) and a
+Chrome trace (open in chrome://tracing or Perfetto). Worker processes
+return their stats with their results, see snapshot() and merge().
+"""
+import typing as T
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+_enabled = False
+_tracing = False
+
+class _Stats:
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.calls = Counter()
+        self.counts = Counter()
+        self.events = [] # Chrome trace events, if tracing
+        self.start = time.perf_counter()
+
+_stats = _Stats()
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+_null_stage = _NullStage()
+
+class _Stage:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        end = time.perf_counter()
+        _stats.seconds[self.name] += end - self.start
+        _stats.calls[self.name] += 1
+        if _tracing:
+            _stats.events.append({'name': self.name, 'ph': 'X',
+                'ts': self.start * 1e6, 'dur': (end - self.start) * 1e6,
+                'pid': os.getpid(), 'tid': threading.get_ident()})
+        return False
+
+def enabled() -> bool:
+    return _enabled
+
+def tracing() -> bool:
+    return _tracing
+
+def enable(trace: bool = False):
+    """Starts recording, from empty stats."""
+    global _enabled, _tracing, _stats
+    _stats = _Stats()
+    _enabled = True
+    _tracing = trace
+
+def disable():
+    global _enabled, _tracing
+    _enabled = _tracing = False
+
+def stage(name: str):
+    """Context manager timing one occurrence of the named stage."""
+    if not _enabled:
+        return _null_stage
+    return _Stage(name)
+
+def count(name: str, n: int = 1):
+    """Adds n to the named counter."""
+    if _enabled:
+        _stats.counts[name] += n
+
+def snapshot(reset: bool = True) -> T.Optional[T.Dict]:
+    """The stats recorded so far as a picklable dict, or None if disabled.
+    With reset, recording starts again from empty, so a worker can send
+    each batch's stats back to be merged exactly once."""
+    global _stats
+    if not _enabled:
+        return None
+    stats = {'seconds': dict(_stats.seconds), 'calls': dict(_stats.calls),
+        'counts': dict(_stats.counts), 'events': _stats.events}
+    if reset:
+        _stats = _Stats()
+    return stats
+
+def merge(stats: T.Optional[T.Dict]):
+    """Adds stats from snapshot(), e.g. from a worker process."""
+    if stats is None or not _enabled:
+        return
+    for name, seconds in stats['seconds'].items():
+        _stats.seconds[name] += seconds
+    _stats.calls.update(stats['calls'])
+    _stats.counts.update(stats['counts'])
+    _stats.events.extend(stats['events'])
+
+def summary() -> str:
+    """A table of each stage's calls and time, and each counter. Stage
+    times from worker processes overlap, so can add up to more than the
+    wall time."""
+    wall = time.perf_counter() - _stats.start
+    lines = [f'{"stage":24} {"calls":>9} {"total s":>9} {"mean ms":>9} {"% wall":>7}']
+    for name, seconds in sorted(_stats.seconds.items(), key=lambda x: -x[1]):
+        calls = _stats.calls[name]
+        lines.append(f'{name:24} {calls:9} {seconds:9.3f} '
+            f'{seconds / calls * 1000:9.3f} {seconds / wall:7.1%}')
+    lines.append(f'{"wall":24} {"":9} {wall:9.3f}')
+    if _stats.counts:
+        lines.append('')
+        lines.append(f'{"counter":24} {"value":>9}')
+        for name, value in sorted(_stats.counts.items()):
+            lines.append(f'{name:24} {value:9}')
+    return '\n'.join(lines)
+
+def write_trace(path: str):
+    """Writes recorded stages as a Chrome trace event file."""
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': _stats.events, 'displayTimeUnit': 'ms'}, f)
+
+@contextmanager
+def session(on: bool = True, profile: str = None, trace: str = None,
+        out: T.TextIO = sys.stderr):
+    """Records stats for the duration of the with block, then prints
+    summary() to out.
+
+    Arguments:
+        on {bool} -- if false, does nothing, for callers with an option to
+            turn instrumentation on.
+        profile {str} -- also profiles this process with cProfile and
+            writes the pstats dump to this path.
+        trace {str} -- writes a Chrome trace of every stage to this path.
+    """
+    if not on:
+        yield
+        return
+    enable(trace=trace is not None)
+    profiler = cProfile.Profile() if profile else None
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile)
+        if trace:
+            write_trace(trace)
+        print(summary(), file=out)
+        disable()
@@ -0,0 +1,186 @@
+"""Read-only lookup of course details by course code.
+
+The index is a single file, memory mapped when opened, so opening it reads
+only the header and lookups touch only the pages they need. Processes
+forked after opening share those pages.
+
+File layout, all integers little-endian:
+
+    magic       b'UQLK\\x01' padded with zeros to 8 bytes
+    uint32      number of courses n
+    uint32      key width w
+    index       n entries sorted by code, each
+                    w bytes   course code, ASCII, padded with zeros
+                    uint64    offset of the record from the start of the file
+                    uint32    length of the record
+    records     each course as UTF-8 JSON
+
+    python -m uq_data.lookup course_details.jl course_details.idx [CODE...]
+"""
+import typing as T
+
+import json
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+
+_magic = b'UQLK\x01\x00\x00\x00'
+_header = struct.Struct('<8sII')
+
+def _entry(width: int) -> struct.Struct:
+    return struct.Struct(f'<{width}sQI')
+
+def iter_course_details(path: str) -> T.Iterator[dict]:
+    """Yields the courses in a course_details .jl file, or a legacy .json
+    file, which is loaded in full."""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.json'):
+            yield from json.load(f)
+            return
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def build_index(path: str, courses: T.Iterable[dict]) -> int:
+    """Writes an index of course records to path. If a code appears more
+    than once, the last record is kept. Records are spooled to a temporary
+    file, so only the codes are held in memory. Returns the number of
+    courses."""
+    positions = {}
+    with tempfile.TemporaryFile() as spool:
+        for course in courses:
+            data = json.dumps(course, separators=(',', ':')).encode('utf-8')
+            positions[course['code']] = (spool.tell(), len(data))
+            spool.write(data)
+
+        codes = sorted(positions)
+        width = max((len(c) for c in codes), default=0)
+        entry = _entry(width)
+        base = _header.size + entry.size * len(codes)
+
+        with open(path, 'wb') as f:
+            f.write(_header.pack(_magic, len(codes), width))
+            for code in codes:
+                offset, length = positions[code]
+                f.write(entry.pack(code.encode('ascii'), base + offset, length))
+            spool.seek(0)
+            shutil.copyfileobj(spool, f)
+    return len(codes)
+
+class CourseIndex:
+    """Course details by code, from a file written by build_index().
+
+        index = CourseIndex('course_details.idx')
+        index.get('COMP3506')['name']
+        [c['code'] for c in index.prefix('COMP')]
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._n, width = _header.unpack_from(self._map)
+        if magic != _magic:
+            self._map.close()
+            raise ValueError(f'{path} is not a course index')
+        self._width = width
+        self._entry = _entry(width)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._n
+
+    def _key(self, i: int) -> bytes:
+        pos = _header.size + i * self._entry.size
+        return self._map[pos:pos+self._width]
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _upper_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _record(self, i: int) -> dict:
+        _, offset, length = self._entry.unpack_from(
+            self._map, _header.size + i * self._entry.size)
+        return json.loads(self._map[offset:offset+length].decode('utf-8'))
+
+    def _find(self, code: str) -> T.Optional[int]:
+        if len(code) > self._width:
+            return None
+        key = code.encode('ascii').ljust(self._width, b'\0')
+        i = self._lower_bound(key)
+        if i < self._n and self._key(i) == key:
+            return i
+        return None
+
+    def __contains__(self, code: str) -> bool:
+        return self._find(code) is not None
+
+    def get(self, code: str, default=None) -> T.Optional[dict]:
+        """The course with the given code, or default if there is none."""
+        i = self._find(code)
+        return default if i is None else self._record(i)
+
+    def _prefix_range(self, prefix: str) -> range:
+        # Codes are ASCII, so every code with the prefix sorts at or below
+        # it padded with 0xff, which is the code itself if it is full width.
+        key = prefix.encode('ascii')
+        if len(key) > self._width:
+            return range(0)
+        start = self._lower_bound(key)
+        stop = self._upper_bound(key.ljust(self._width, b'\xff'))
+        return range(start, stop)
+
+    def codes(self, prefix: str = '') -> T.List[str]:
+        """Sorted codes starting with prefix, without reading any records."""
+        return [self._key(i).rstrip(b'\0').decode('ascii')
+            for i in self._prefix_range(prefix)]
+
+    def prefix(self, prefix: str) -> T.Iterator[dict]:
+        """Yields courses whose codes start with prefix, e.g. 'COMP', in
+        order of code."""
+        for i in self._prefix_range(prefix):
+            yield self._record(i)
+
+if __name__ == "__main__":
+    import time
+    details_path, index_path = sys.argv[1:3]
+    n = build_index(index_path, iter_course_details(details_path))
+    print(f'indexed {n} courses')
+
+    start = time.perf_counter()
+    index = CourseIndex(index_path)
+    print(f'opened in {(time.perf_counter() - start) * 1e6:.0f}us')
+    for code in sys.argv[3:]:
+        start = time.perf_counter()
+        course = index.get(code)
+        elapsed = (time.perf_counter() - start) * 1e6
+        if course is None:
+            found = index.codes(code)
+            print(f'{code} ({elapsed:.0f}us): {len(found)} courses with this prefix')
+        else:
+            print(f'{code} ({elapsed:.0f}us): {course["name"]}')
@@ -0,0 +1,280 @@
+"""Whole-catalogue prerequisite graph.
+
+Course codes are interned to integer ids by their position in a sorted
+list. Direct edges and precomputed transitive closures, in both directions,
+are stored as CSR arrays: for course id i, its neighbours are
+targets[offsets[i]:offsets[i+1]].
+
+An edge A -> B means B is mentioned in A's prerequisites, regardless of
+whether it is part of an And or an Or.
+"""
+import typing as T
+
+import bisect
+import logging
+import re
+import struct
+import sys
+import time
+
+from array import array
+
+from .prereqs import PrereqNode, Relation, CourseNode, parse_prereqs_batch, _code_pattern
+
+logger = logging.getLogger(__name__)
+
+_magic = b'UQPG\x01'
+_header = struct.Struct('<5sII')
+
+_CSR = T.Tuple[array, array]
+
+_course_code = re.compile(_code_pattern)
+
+def course_codes_in(node: T.Optional[PrereqNode]) -> T.Iterator[str]:
+    """Yields the code of every CourseNode in the tree."""
+    if isinstance(node, CourseNode):
+        yield node.course_code
+    elif isinstance(node, Relation):
+        for child in node.children:
+            yield from course_codes_in(child)
+
+def _csr(n: int, adjacency: T.List[T.Iterable[int]]) -> _CSR:
+    offsets = array('I', [0])
+    targets = array('I')
+    for i in range(n):
+        targets.extend(sorted(set(adjacency[i])))
+        offsets.append(len(targets))
+    return offsets, targets
+
+def _reverse(n: int, offsets: array, targets: array) -> _CSR:
+    reverse = [[] for _ in range(n)]
+    for v in range(n):
+        for i in range(offsets[v], offsets[v+1]):
+            reverse[targets[i]].append(v)
+    return _csr(n, reverse)
+
+def _bits(x: int) -> T.Iterator[int]:
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+def _closure(n: int, offsets: array, targets: array) -> _CSR:
+    """Transitive closure of a CSR graph, which may contain cycles.
+
+    Uses an iterative Tarjan's algorithm, which finishes strongly connected
+    components in reverse topological order, so each component's reachable
+    set is the union of its already-final successors' sets. Sets are Python
+    ints used as bitsets.
+    """
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    reach = [0] * n
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, offsets[root])]
+
+        while work:
+            v, i = work[-1]
+            if i < offsets[v+1]:
+                work[-1] = (v, i+1)
+                w = targets[i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, offsets[w]))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+
+            work.pop()
+            if work:
+                u = work[-1][0]
+                low[u] = min(low[u], low[v])
+            if low[v] != index[v]:
+                continue
+
+            component = []
+            while True:
+                w = stack.pop()
+                on_stack[w] = False
+                component.append(w)
+                if w == v:
+                    break
+            bits = 0
+            for m in component:
+                for j in range(offsets[m], offsets[m+1]):
+                    w = targets[j]
+                    bits |= (1 << w) | reach[w]
+            for m in component:
+                reach[m] = bits
+
+    return _csr(n, [_bits(x) for x in reach])
+
+class PrereqGraph:
+    """Compact prerequisite graph answering transitive queries by slicing
+    precomputed closure arrays."""
+
+    _arrays = ('prereq_offsets', 'prereq_targets', 'unlock_offsets',
+        'unlock_targets', 'prereq_closure_offsets', 'prereq_closure_targets',
+        'unlock_closure_offsets', 'unlock_closure_targets')
+
+    def __init__(self, codes: T.List[str], **arrays: array):
+        self.codes = codes
+        for name in self._arrays:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def from_prereqs(cls, prereqs: T.Mapping[str, T.Optional[PrereqNode]]) -> 'PrereqGraph':
+        """Builds the graph from a mapping of course code to parsed
+        prerequisites."""
+        return cls._from_edges({code: set(course_codes_in(node)) for code, node in prereqs.items()})
+
+    @classmethod
+    def _from_edges(cls, edges: T.Mapping[str, T.Set[str]]) -> 'PrereqGraph':
+        codes = sorted(set(edges).union(*edges.values()))
+        ids = {code: i for i, code in enumerate(codes)}
+        n = len(codes)
+
+        adjacency = [[] for _ in range(n)]
+        for code, targets in edges.items():
+            adjacency[ids[code]] = [ids[t] for t in targets]
+
+        prereq = _csr(n, adjacency)
+        unlock = _reverse(n, *prereq)
+        prereq_closure = _closure(n, *prereq)
+        unlock_closure = _closure(n, *unlock)
+        return cls(codes,
+            prereq_offsets=prereq[0], prereq_targets=prereq[1],
+            unlock_offsets=unlock[0], unlock_targets=unlock[1],
+            prereq_closure_offsets=prereq_closure[0],
+            prereq_closure_targets=prereq_closure[1],
+            unlock_closure_offsets=unlock_closure[0],
+            unlock_closure_targets=unlock_closure[1])
+
+    @classmethod
+    def from_prereq_strings(cls, prereqs: T.Mapping[str, T.Optional[str]]) -> 'PrereqGraph':
+        """Builds the graph from unparsed prerequisite strings.
+
+        Over half of the catalogue's strings are outside the prerequisite
+        grammar, e.g. "MATH1051 or equivalent". The edges of such a string
+        are every course code it mentions, other than its own, so they may
+        include courses a parse would leave out. Bare numbers continuing a
+        code, as in "ACCT1110 or 2101", are not found. The number of such
+        strings is logged."""
+        codes = list(prereqs)
+        trees = parse_prereqs_batch(prereqs[c] for c in codes)
+        edges = {}
+        unparsed = 0
+        for code, tree in zip(codes, trees):
+            if tree is None and prereqs[code]:
+                unparsed += 1
+                edges[code] = set(_course_code.findall(prereqs[code])) - {code}
+            else:
+                edges[code] = set(course_codes_in(tree))
+        if unparsed:
+            logger.info('%d of %d prerequisite strings did not parse, '
+                'using the course codes in them', unparsed, len(codes))
+        return cls._from_edges(edges)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code: str):
+        return self.id(code) is not None
+
+    def id(self, code: str) -> T.Optional[int]:
+        i = bisect.bisect_left(self.codes, code)
+        if i < len(self.codes) and self.codes[i] == code:
+            return i
+        return None
+
+    def _lookup(self, code: str, offsets: array, targets: array) -> T.List[str]:
+        i = self.id(code)
+        if i is None:
+            return []
+        codes = self.codes
+        return [codes[t] for t in targets[offsets[i]:offsets[i+1]]]
+
+    def prerequisites(self, code: str, transitive: bool = True) -> T.List[str]:
+        """Courses mentioned in code's prerequisites, and if transitive, in
+        theirs and so on. Sorted."""
+        if transitive:
+            return self._lookup(code, self.prereq_closure_offsets, self.prereq_closure_targets)
+        return self._lookup(code, self.prereq_offsets, self.prereq_targets)
+
+    def unlocks(self, code: str, transitive: bool = True) -> T.List[str]:
+        """Courses which have code as a (transitive) prerequisite. Sorted."""
+        if transitive:
+            return self._lookup(code, self.unlock_closure_offsets, self.unlock_closure_targets)
+        return self._lookup(code, self.unlock_offsets, self.unlock_targets)
+
+    def save(self, path: str):
+        """Writes the graph to a single file: a header, the newline separated
+        codes, then each array as little-endian uint32 prefixed by its
+        length."""
+        codes = '\n'.join(self.codes).encode('ascii')
+        with open(path, 'wb') as f:
+            f.write(_header.pack(_magic, len(self.codes), len(codes)))
+            f.write(codes)
+            for name in self._arrays:
+                a = getattr(self, name)
+                if sys.byteorder == 'big':
+                    a = array('I', a)
+                    a.byteswap()
+                f.write(struct.pack('<I', len(a)))
+                f.write(a.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'PrereqGraph':
+        with open(path, 'rb') as f:
+            buf = f.read()
+        magic, n, codes_len = _header.unpack_from(buf)
+        if magic != _magic:
+            raise ValueError(f'{path} is not a prerequisite graph file')
+        pos = _header.size
+        codes = buf[pos:pos+codes_len].decode('ascii').split('\n') if n else []
+        pos += codes_len
+
+        arrays = {}
+        for name in cls._arrays:
+            length, = struct.unpack_from('<I', buf, pos)
+            pos += 4
+            a = array('I')
+            a.frombytes(buf[pos:pos+4*length])
+            if sys.byteorder == 'big':
+                a.byteswap()
+            arrays[name] = a
+            pos += 4*length
+        return cls(codes, **arrays)
+
+if __name__ == "__main__":
+    from .lookup import iter_course_details
+    details_path, graph_path = sys.argv[1:3]
+
+    prereqs = {x['code']: x['prerequisite'] for x in iter_course_details(details_path)}
+    start = time.perf_counter()
+    graph = PrereqGraph.from_prereq_strings(prereqs)
+    print(f'built {len(graph)} courses in {time.perf_counter() - start:.2f}s')
+    graph.save(graph_path)
+
+    start = time.perf_counter()
+    graph = PrereqGraph.load(graph_path)
+    print(f'loaded in {(time.perf_counter() - start) * 1000:.1f}ms')
+
+    for code in sys.argv[3:]:
+        start = time.perf_counter()
+        prereqs, unlocks = graph.prerequisites(code), graph.unlocks(code)
+        elapsed = (time.perf_counter() - start) * 1e6
+        print(f'{code} ({elapsed:.0f}us): needs {prereqs}, unlocks {len(unlocks)} courses')
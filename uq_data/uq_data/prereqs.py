@@ -1,15 +1,39 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Iterable, List, Optional, Tuple
+
+import pickle
+import re
+
+from collections import OrderedDict
 
 from parsimonious.grammar import Grammar
 from parsimonious.exceptions import ParseError
+from parsimonious.nodes import NodeVisitor
+
+if not __package__:
+    # Run as a script, python uq_data/prereqs.py, rather than with -m, so
+    # make the relative imports resolve within the package (PEP 366).
+    import os, sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'uq_data'
+
+from . import instrument
 
 static_field = lambda name: field(default=name, init=False, repr=False, compare=False)
 
 @dataclass
 class PrereqNode:
     type_: str = static_field('node')
-    pass
+
+    def verify(self, courses) -> bool:
+        """Returns whether this requirement is met by the given collection of
+        completed course codes."""
+        raise NotImplementedError
+
+    def units_completed(self, courses) -> float:
+        """Returns the units this requirement contributes towards a UnitsOf
+        given the completed course codes."""
+        raise NotImplementedError
 
 @dataclass 
 class Relation(PrereqNode):
@@ -19,19 +43,37 @@ class Relation(PrereqNode):
     def verify(self, courses):
         raise NotImplementedError
 
+    def units_completed(self, courses):
+        if not self.verify(courses):
+            return 0
+        return sum(child.units_completed(courses) for child in self.children)
+
 @dataclass 
 class And(Relation):
     type_: str = static_field('and')
 
+    def verify(self, courses):
+        return all(child.verify(courses) for child in self.children)
+
 @dataclass 
 class Or(Relation):
     type_: str = static_field('or')
 
+    def verify(self, courses):
+        return any(child.verify(courses) for child in self.children)
+
+    def units_completed(self, courses):
+        # Only one option counts, so take the best completed one.
+        return max((child.units_completed(courses) for child in self.children), default=0)
+
 @dataclass
 class UnitsOf(Relation):
     type_: str = static_field('units')
     units: int = 0
 
+    def verify(self, courses):
+        return sum(child.units_completed(courses) for child in self.children) >= self.units
+
 @dataclass
 class CourseNode(PrereqNode): 
     type_: str = static_field('course')
@@ -39,19 +81,30 @@ class CourseNode(PrereqNode):
     units: float
     name: str
 
+    def verify(self, courses):
+        return self.course_code in courses
+
+    def units_completed(self, courses):
+        # Courses parsed from prerequisite strings have no units.
+        return (self.units or 0) if self.course_code in courses else 0
+
 def pretty_string(node):
     return '\n'.join(_pretty_list(node))
 
 def _pretty_list(node, depth=0):
-    indent = '  '*depth
-    if isinstance(node, Relation):
-        s = []
-        s.append(indent+str(node) + ':')
-        for child in node.children:
-            s.extend(x for x in _pretty_list(child, depth+1))
-        return s
-    else:
-        return (indent+str(node), )
+    # Lines of node and its descendants, indented two spaces per level.
+    # Iterative so each line is only built once, however deep the tree.
+    lines = []
+    stack = [(node, '  '*depth)]
+    while stack:
+        node, indent = stack.pop()
+        # Duck typed, so compact trees print the same.
+        if hasattr(node, 'children'):
+            lines.append(indent+str(node) + ':')
+            stack.extend((child, indent + '  ') for child in reversed(node.children))
+        else:
+            lines.append(indent+str(node))
+    return lines
 
 # https://math.stackexchange.com/questions/140036/why-is-this-parsing-expression-grammar-left-recursive
 _grammar = Grammar('''
@@ -83,6 +136,311 @@ _grammar = Grammar('''
 def parse_prereq(prereq_string: str):     
     return _grammar.parse(prereq_string)
 
+# Markers left in the flattened children by the and/or rules, so list rules
+# can tell which operators joined their courses.
+_AND = 'and'
+_OR = 'or'
+
+class PrereqVisitor(NodeVisitor):
+    """Builds PrereqNode trees from parse trees of _grammar.
+
+    Comma or semicolon separated lists are an And, unless the last course is
+    joined by "or" ("A, B or C"), in which case the whole list is an Or.
+    Courses are CourseNodes with no units or name.
+    """
+
+    def generic_visit(self, node, visited_children):
+        # Flattens children down to just PrereqNodes and operator markers.
+        flat = []
+        for child in visited_children:
+            if isinstance(child, list):
+                flat.extend(child)
+            elif child is not None:
+                flat.append(child)
+        return flat
+
+    def visit_code(self, node, visited_children):
+        return CourseNode(node.text, None, None)
+
+    def visit_and(self, node, visited_children):
+        return _AND
+
+    def visit_or(self, node, visited_children):
+        return _OR
+
+    def visit_space(self, node, visited_children):
+        return None
+
+    def _relation(self, items, relation):
+        children = [x for x in items if isinstance(x, PrereqNode)]
+        return children[0] if len(children) == 1 else relation(children)
+
+    def visit_basic_comma_list(self, node, visited_children):
+        items = self.generic_visit(node, visited_children)
+        return [self._relation(items, Or if _OR in items else And)]
+
+    def visit_basic_and_list(self, node, visited_children):
+        return [self._relation(self.generic_visit(node, visited_children), And)]
+
+    def visit_basic_or_list(self, node, visited_children):
+        return [self._relation(self.generic_visit(node, visited_children), Or)]
+
+    def visit_prereq(self, node, visited_children):
+        nodes = self.generic_visit(node, visited_children)
+        return nodes[0]
+
+_visitor = PrereqVisitor()
+
+def normalise_prereq(prereq_string: str) -> str:
+    return ' '.join(prereq_string.split())
+
+def build_prereq_peg(prereq_string: str) -> PrereqNode:
+    """build_prereq() through _grammar and PrereqVisitor. Slower, but the
+    reference the hand-written parser is checked against."""
+    return _visitor.visit(parse_prereq(prereq_string))
+
+class PrereqSyntaxError(ParseError):
+    """A string outside the prerequisite grammar. pos is the index in text
+    where parsing stopped and expected what was wanted there."""
+
+    # Not ParseError.__init__, which also takes the grammar rule. Attributes
+    # are read from args, as most strings of the catalogue are prose which
+    # is rejected at once, so raising is most of what parsing them costs.
+    # Raised with text alone, pos and expected are found when first read,
+    # by parsing text again.
+    __init__ = Exception.__init__
+    text = property(lambda self: self.args[0])
+    pos = property(lambda self: self._where()[0])
+    expected = property(lambda self: self._where()[1])
+    expr = None
+
+    def _where(self) -> Tuple[int, str]:
+        if len(self.args) == 1:
+            try:
+                _parse(self.text)
+            except PrereqSyntaxError as e:
+                self.args = e.args
+        return self.args[1:]
+
+    def __str__(self):
+        found = repr(self.text[self.pos:self.pos + 20]) if self.pos < len(self.text) else 'end'
+        return f'expected {self.expected} at column {self.column()}, found {found}: {self.text!r}'
+
+# Tokens of the same language as _grammar. Operators are one token with
+# the whitespace _grammar requires around them, as are commas with the
+# whitespace after them, so one token of lookahead decides every rule.
+# Anything else is a one character 'other' token, where parsing fails, and
+# every string ends with an empty 'end' token.
+_code_pattern = r'[A-Z]{3,5}[0-9]{3,4}[A-Z]?' # as in _grammar
+_token_regex = re.compile(r'''
+    (?P<code>{code})
+    |(?P<and>\s+(?:and|&|\+)\s+)
+    |(?P<or>\s+(?:or|\||OR)\s+)
+    |(?P<comma>[,;]\s+)
+    |(?P<open>\()
+    |(?P<close>\))
+    |(?P<other>.)
+    |(?P<end>\Z)
+'''.format(code=_code_pattern), re.VERBOSE | re.DOTALL)
+
+_expected_course = 'a course code or "("'
+
+def _parse(text: str) -> PrereqNode:
+    # Follows _grammar rule for rule, in one pass over the tokens with a
+    # stack of open parentheses. _grammar's ordered choices never need to
+    # backtrack far: once the first course of an expression is read, the
+    # token after it decides which list rule applies, and wherever a list
+    # stops early the whole parse fails, so the first mismatch is reported.
+    # Tokens are read lazily, so prose after a course is never tokenized.
+    tokens = _token_regex.finditer(text)
+
+    def error(token, expected: str):
+        raise PrereqSyntaxError(text, token.start(), expected)
+
+    stack = [] # enclosing expressions, as (children, rule)
+    children = []
+    rule = None # list rule, decided by the token after the first course
+    while True:
+        # A course.
+        token = next(tokens)
+        kind = token.lastgroup
+        if kind == 'open':
+            stack.append((children, rule))
+            children = []
+            rule = None
+            continue
+        if kind != 'code':
+            error(token, _expected_course)
+        node = CourseNode(token.group(), None, None)
+        parens = False
+
+        while True:
+            # node is a complete course. Add it to the expression and either
+            # continue to the next course or finish the expression.
+            children.append(node)
+            token = next(tokens)
+            kind = token.lastgroup
+            if rule is None:
+                if kind == 'and' or kind == 'or':
+                    rule = kind
+                    break
+                if kind == 'comma' and not parens:
+                    rule = 'comma'
+                    break
+                # parens!(and/or), or a single course comma list.
+            elif rule == 'comma':
+                if kind == 'comma':
+                    break
+                if kind == 'or':
+                    # "A, B or C" ends the list, and makes it an Or.
+                    rule = 'comma_or'
+                    break
+            elif rule != 'comma_or' and kind == rule:
+                break
+
+            if rule is None:
+                node = children[0]
+            else:
+                node = (Or if rule in ('or', 'comma_or') else And)(children)
+            if not stack:
+                if kind != 'end':
+                    error(token, 'end')
+                return node
+            if kind != 'close':
+                error(token, '")"')
+            children, rule = stack.pop()
+            parens = True
+
+# Most strings are a single list without parentheses, which one regex can
+# recognise whole, as _grammar's basic_and_list, basic_or_list or
+# basic_comma_list. Codes cannot match differently by backtracking, as a
+# code is always followed by whitespace, a separator or the end.
+_flat_list = re.compile(r'''
+    {code}(?:
+        (?P<and>(?:\s+(?:and|&|\+)\s+{code})+)
+        |(?P<or>(?:\s+(?:or|\||OR)\s+{code})+)
+        |(?P<comma>(?:[,;]\s+{code})+)(?P<comma_or>\s+(?:or|\||OR)\s+{code})?
+    )?
+'''.format(code=_code_pattern), re.VERBOSE)
+_course_start = re.compile(_code_pattern + r'|\(')
+
+def build_prereq(prereq_string: str) -> PrereqNode:
+    """Parses a prerequisite string into a PrereqNode tree, in one pass over
+    its tokens. Accepts exactly the strings _grammar does and gives the same
+    trees as build_prereq_peg().
+
+    Raises:
+        PrereqSyntaxError -- a ParseError, if the string is not in the
+            prerequisite grammar.
+    """
+    flat = _flat_list.fullmatch(prereq_string)
+    if flat is not None:
+        # Codes are the words, or every other word if operators separate
+        # them, as nothing else in a flat list is whitespace.
+        rule = flat.lastgroup
+        if rule is None:
+            return CourseNode(prereq_string, None, None)
+        if rule == 'and' or rule == 'or':
+            codes = prereq_string.split()[::2]
+        else:
+            codes = prereq_string.split()
+            if rule == 'comma_or':
+                del codes[-2]
+            codes = [code.rstrip(',;') for code in codes]
+        return (And if rule == 'and' or rule == 'comma' else Or)(
+            [CourseNode(code, None, None) for code in codes])
+    if '(' not in prereq_string:
+        # Without parentheses, only flat lists are in the grammar. Such
+        # strings are mostly prose, which is rejected without tokenizing.
+        raise PrereqSyntaxError(prereq_string)
+    if _course_start.match(prereq_string) is None:
+        raise PrereqSyntaxError(prereq_string, 0, _expected_course)
+    return _parse(prereq_string)
+
+class PrereqCache:
+    """Bounded LRU cache of normalised prerequisite string to PrereqNode
+    tree, or None for strings which failed to parse.
+
+    Optionally persisted to disk with save() and load()."""
+
+    def __init__(self, maxsize: int = 8192):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default=KeyError):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            if default is KeyError:
+                raise
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Optional[PrereqNode]):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            pickle.dump(list(self._data.items()), f, pickle.HIGHEST_PROTOCOL)
+
+    def load(self, path: str):
+        try:
+            with open(path, 'rb') as f:
+                items = pickle.load(f)
+        except FileNotFoundError:
+            return
+        for key, value in items:
+            self.put(key, value)
+
+_default_cache = PrereqCache()
+
+_missing = object()
+
+def parse_prereqs_batch(prereq_strings: Iterable[Optional[str]],
+        cache: PrereqCache = None) -> List[Optional[PrereqNode]]:
+    """Parses many prerequisite strings into PrereqNode trees.
+
+    Strings are normalised and deduplicated so each distinct string is parsed
+    at most once, and results are kept in cache (a shared module-level cache
+    by default). Identical inputs share one tree so results must be treated
+    as read-only.
+
+    Returns:
+        list -- tree for each input, or None if it was empty or unparseable.
+    """
+    if cache is None:
+        cache = _default_cache
+
+    keys = [normalise_prereq(x) if x else '' for x in prereq_strings]
+    results = {'': None}
+    for key in keys:
+        if key in results:
+            continue
+        tree = cache.get(key, _missing)
+        if tree is _missing:
+            instrument.count('prereq_cache.misses')
+            try:
+                with instrument.stage('prereq_parse'):
+                    tree = build_prereq(key)
+            except ParseError:
+                tree = None
+            cache.put(key, tree)
+        else:
+            instrument.count('prereq_cache.hits')
+        results[key] = tree
+    return [results[key] for key in keys]
+
 if __name__ == "__main__":
     with open('_prereqs.txt') as f:
         failures = 0
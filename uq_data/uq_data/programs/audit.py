@@ -0,0 +1,164 @@
+"""Audits many students' transcripts against a program's course list.
+
+A program's CourseList tree is flattened once into an AuditPlan, a list
+of requirements whose completed units are one matrix product over the
+completion matrix of a batch of students (see eligibility.py), so a
+cohort of thousands is audited with a few NumPy operations per batch
+rather than one recursive walk per student:
+
+    plan = AuditPlan(parse_program(html, BMATH))
+    result = plan.audit(transcripts)
+    result.complete        # students
+    result.remaining       # students x requirements, units still to pass
+    result.unmet(i)        # requirements student i has not met
+
+A requirement is each child of a list's And node, i.e. each course list
+of a plan in the layout.py trees, or the list's node itself if it is not
+an And. A program is complete when every requirement of every part is
+met, where a part with no node of its own, such as "Part B" introducing
+the majors, needs any one of its sublists complete.
+"""
+import typing as T
+
+import numpy as np
+
+from ..course_list import CourseList
+from ..eligibility import completion_matrix, compile_node
+from ..prereqs import PrereqNode, And, Or, UnitsOf, CourseNode
+
+class Requirement(T.NamedTuple):
+    """One requirement of a plan.
+
+    path -- names of the CourseLists from the program down to its own.
+    index -- position within its list's node.
+    units -- units needed: those stated for a UnitsOf, the units of every
+        course for an And, the fewest of any option for an Or.
+    """
+    path: T.Tuple[str, ...]
+    index: int
+    node: PrereqNode
+    units: float
+
+    def __str__(self):
+        return f'{" / ".join(self.path)} #{self.index + 1} ({self.units:g} units)'
+
+class AuditResult(T.NamedTuple):
+    requirements: T.List[Requirement]
+    complete: np.ndarray # students, bool
+    met: np.ndarray # students x requirements, bool
+    units: np.ndarray # students x requirements, units completed towards each
+    remaining: np.ndarray # students x requirements, 0 where met
+
+    def unmet(self, student: int) -> T.List[Requirement]:
+        return [self.requirements[k] for k in np.flatnonzero(~self.met[student])]
+
+def _required_units(node: PrereqNode) -> float:
+    if isinstance(node, CourseNode):
+        return node.units or 0
+    if isinstance(node, UnitsOf):
+        return node.units
+    if isinstance(node, Or):
+        return min((_required_units(child) for child in node.children), default=0)
+    return sum(_required_units(child) for child in node.children)
+
+def _codes(node: PrereqNode, codes: T.Dict[str, None]):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, CourseNode):
+            codes.setdefault(node.course_code)
+        else:
+            stack.extend(node.children)
+
+class AuditPlan:
+    """A program's course list compiled for batches of transcripts.
+
+    codes are the course codes the program mentions, the columns of the
+    completion matrices evaluate() takes.
+    """
+
+    def __init__(self, program: CourseList):
+        self.program = program
+        self.requirements = [] # type: T.List[Requirement]
+        lists = [] # (path, node)
+        stack = [(program, (program.name,))]
+        while stack:
+            cl, path = stack.pop()
+            lists.append((path, cl.node))
+            stack.extend((x, path + (x.name,)) for x in reversed(cl.sublists))
+
+        codes = {}
+        for path, node in lists:
+            if node is None:
+                continue
+            _codes(node, codes)
+            children = node.children if isinstance(node, And) else [node]
+            for k, child in enumerate(children):
+                self.requirements.append(Requirement(path, k, child, _required_units(child)))
+        self.codes = list(codes)
+        columns = {code: j for j, code in enumerate(self.codes)}
+
+        # Units completed towards every requirement are completed @ weights,
+        # plus the compiled units of children which are not single courses.
+        self._weights = np.zeros((len(self.codes), len(self.requirements)))
+        self._extra = [] # (requirement, units function)
+        self._oks = [] # (requirement, verify function) for all but UnitsOf
+        for k, r in enumerate(self.requirements):
+            parts = [r.node] if isinstance(r.node, (Or, CourseNode)) else r.node.children
+            for part in parts:
+                if isinstance(part, CourseNode):
+                    self._weights[columns[part.course_code], k] += part.units or 0
+                else:
+                    self._extra.append((k, compile_node(part, columns)[1]))
+            if not isinstance(r.node, UnitsOf):
+                self._oks.append((k, compile_node(r.node, columns)[0]))
+        self._needed = np.array([r.units for r in self.requirements])
+        self._units_of = np.array([isinstance(r.node, UnitsOf) for r in self.requirements], dtype=bool)
+        self._complete = self._compile_list(program, 0, True)[0]
+
+    def _compile_list(self, cl: CourseList, first: int, root: bool) \
+            -> T.Tuple[T.Callable[[np.ndarray], np.ndarray], int]:
+        # Function of the met matrix giving which students complete cl, whose
+        # requirements start at index first, and the index after its last.
+        count = 0
+        if cl.node is not None:
+            count = len(cl.node.children) if isinstance(cl.node, And) else 1
+        own = slice(first, first + count)
+        first += count
+
+        subs = []
+        for sublist in cl.sublists:
+            f, first = self._compile_list(sublist, first, False)
+            subs.append(f)
+        choose_one = cl.node is None and not root
+
+        def complete(met):
+            result = met[:, own].all(axis=1)
+            if subs:
+                parts = np.array([f(met) for f in subs])
+                result &= parts.any(axis=0) if choose_one else parts.all(axis=0)
+            return result
+        return complete, first
+
+    def evaluate(self, completed: np.ndarray) -> AuditResult:
+        """Audits the rows of a completion matrix over self.codes."""
+        units = completed.astype(float) @ self._weights
+        for k, f in self._extra:
+            units[:, k] += f(completed)
+        met = units >= self._needed
+        met &= self._units_of
+        for k, ok in self._oks:
+            met[:, k] = ok(completed)
+        remaining = np.where(met, 0, np.maximum(self._needed - units, 0))
+        return AuditResult(self.requirements, self._complete(met), met, units, remaining)
+
+    def audit(self, transcripts: T.Sequence[T.Iterable[str]], batch_size: int = 4096) -> AuditResult:
+        """Audits every transcript, a batch_size of students at a time so
+        memory stays bounded for any cohort."""
+        results = [self.evaluate(completion_matrix(transcripts[i:i + batch_size], self.codes))
+            for i in range(0, len(transcripts), batch_size)]
+        if not results:
+            results = [self.evaluate(np.zeros((0, len(self.codes)), dtype=bool))]
+        return AuditResult(self.requirements,
+            *(np.concatenate([getattr(r, name) for r in results])
+                for name in ('complete', 'met', 'units', 'remaining')))
@@ -0,0 +1,252 @@
+"""Program course list parsing driven by declarative rules, instead of a
+ProgramParser subclass per program.
+
+A Layout says, for each div.planlist title, where its CourseList goes in
+the tree and what node holds its courses. Each div.courselist then adds a
+UnitsOf if its text states a number of units, or an And of its courses.
+Pages are walked once with lxml.
+
+parse_programs() parses many pages in worker processes and pickles each
+program's tree to a cache folder, named by a hash of the page and layout,
+so a re-run only parses pages which changed.
+
+    python -m uq_data.programs.layout html_folder [--cache .program_cache]
+        [--processes N] [--layout bmath]
+"""
+import typing as T
+
+import argparse
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+import re
+
+from lxml import etree
+
+from ..course_list import CourseList
+from ..prereqs import And, Or, UnitsOf, CourseNode, PrereqNode
+
+logger = logging.getLogger(__name__)
+
+_version = 1 # bump when parsing changes, to invalidate cached trees
+
+_nodes = {'and': And, 'or': Or, None: lambda: None}
+
+class PlanRule(T.NamedTuple):
+    """Where to put a div.planlist whose title matches pattern (re.match).
+
+    depth -- depth of its CourseList, attached to the nearest shallower one.
+    node -- 'and', 'or' or None, the node course lists are added to. With
+        None, the plan has no courses of its own, e.g. a "choose a major"
+        part whose majors follow as deeper plans.
+    """
+    pattern: str
+    depth: int
+    node: T.Optional[str] = 'and'
+
+class Layout(T.NamedTuple):
+    """Rules for one layout of program page. The first matching plan rule
+    is used. A course list whose text matches units_pattern becomes a
+    UnitsOf of the first group."""
+    name: str
+    plans: T.Tuple[PlanRule, ...]
+    units_pattern: str = r'(\d+)\s+units?'
+
+    def plan_rule(self, title: str) -> PlanRule:
+        for rule in self.plans:
+            if re.match(rule.pattern, title):
+                return rule
+        raise ValueError(f'no {self.name} plan rule matches {title!r}')
+
+# Parts A to C at depth 1. Part B only introduces the majors, which follow
+# as their own plans at depth 2. Same tree as BMathParser.
+BMATH = Layout('bmath', (
+    PlanRule(r'Part [AC]$', 1),
+    PlanRule(r'Part ', 1, None),
+    PlanRule(r'', 2),
+))
+
+# Parts at depth 1 and anything else (majors, minors, fields) below them.
+DEFAULT = Layout('default', (
+    PlanRule(r'Part ', 1),
+    PlanRule(r'', 2),
+))
+
+LAYOUTS = {layout.name: layout for layout in (DEFAULT, BMATH)}
+
+# acad_prog -> layout name, for programs which differ from DEFAULT.
+PROGRAM_LAYOUTS = {
+    '2393': 'bmath',
+}
+
+def layout_for(html_path: str) -> Layout:
+    """The layout of a page saved as ACAD_PROG.html."""
+    acad_prog = os.path.splitext(os.path.basename(html_path))[0]
+    return LAYOUTS[PROGRAM_LAYOUTS.get(acad_prog, 'default')]
+
+def _text(element) -> str:
+    return ''.join(element.itertext())
+
+def _inner_html(element) -> str:
+    # Equivalent of bs4's decode_contents(), which BMathParser uses for titles.
+    return (element.text or '') + ''.join(
+        etree.tostring(child, encoding='unicode', method='html') for child in element)
+
+def _classes(element) -> T.List[str]:
+    return (element.get('class') or '').split()
+
+def _with_class(tag: str, cls: str) -> etree.XPath:
+    return etree.XPath(f'.//{tag}[contains(concat(" ", normalize-space(@class), " "), " {cls} ")]')
+
+_planlists = _with_class('div', 'planlist')
+_courselists = _with_class('div', 'courselist')
+_course_tables = _with_class('table', 'courses')
+
+def _course_rows(table) -> T.List[PrereqNode]:
+    courses = []
+    for row in table.iterfind('tbody/tr'):
+        tds = row.findall('td')
+        code = _text(tds[0]).replace('[', '').strip()
+        if code == 'or':
+            continue
+        node = CourseNode(code, float(_text(tds[1])), _text(tds[2]).strip())
+        classes = _classes(row)
+        if 'option' in classes:
+            if 'first' in classes:
+                courses.append(Or([node]))
+            else:
+                courses[-1].children.append(node)
+        else:
+            courses.append(node)
+    return courses
+
+def parse_program(html: T.Union[str, bytes], layout: Layout = DEFAULT) -> CourseList:
+    """Parses a program's course list page into a CourseList tree rooted at
+    the program, with a sublist per plan."""
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', 'replace')
+    root = etree.HTML(html).find('.//div[@id="program-course-list"]')
+    units_regex = re.compile(layout.units_pattern)
+
+    program = CourseList(_inner_html(root.find('h1')))
+    current = program
+    for planlist in _planlists(root):
+        title = _inner_html(planlist.find('h1'))
+        rule = layout.plan_rule(title)
+        course_list = CourseList(title, _nodes[rule.node]())
+        course_list.set_depth(current, rule.depth)
+        current = course_list
+
+        node = None
+        for courselist in _courselists(planlist):
+            p = courselist.find('p')
+            text = '' if p is None else _text(p).strip()
+            if text or node is None:
+                match = units_regex.search(text)
+                node = UnitsOf(units=int(match.group(1))) if match else And()
+                if course_list.node is None:
+                    course_list.node = And()
+                course_list.node.children.append(node)
+            # Text-less lists continue the previous one.
+            for table in _course_tables(courselist):
+                node.children.extend(_course_rows(table))
+    return program
+
+def page_key(data: bytes, layout: Layout) -> str:
+    """Cache key of a page parsed with layout."""
+    h = hashlib.sha1(repr((_version, layout)).encode())
+    h.update(data)
+    return h.hexdigest()
+
+def _cache_path(cache_folder: str, key: str) -> str:
+    return os.path.join(cache_folder, key + '.pickle')
+
+def _load_cached(cache_folder: str, key: str) -> T.Optional[CourseList]:
+    try:
+        with open(_cache_path(cache_folder, key), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning('ignoring unreadable cached tree %s: %s', key, e)
+        return None
+
+def _parse_to_cache(args) -> T.Tuple[str, T.Optional[bytes], T.Optional[str]]:
+    # Worker entry point. Returns the pickled tree, which is also written
+    # to the cache, or the error.
+    html_path, layout, key, cache_folder = args
+    try:
+        with open(html_path, 'rb') as f:
+            data = pickle.dumps(parse_program(f.read(), layout), pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        return html_path, None, f'{type(e).__name__}: {e}'
+    if cache_folder is not None:
+        path = _cache_path(cache_folder, key)
+        with open(path + '.part', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.part', path)
+    return html_path, data, None
+
+def parse_programs(html_paths: T.Iterable[str], cache_folder: T.Optional[str] = '.program_cache',
+        processes: int = None, layout: T.Callable[[str], Layout] = layout_for) \
+        -> T.Dict[str, CourseList]:
+    """Parses many program pages, in parallel and through a cache.
+
+    Arguments:
+        html_paths -- program pages, each named ACAD_PROG.html.
+        cache_folder -- folder of pickled trees, created if missing. Only
+            pages whose hash is not in it are parsed. None disables caching.
+        processes -- worker processes. 1 parses in this process, None uses
+            every CPU.
+        layout -- function from page path to its Layout.
+
+    Returns:
+        dict -- path to CourseList for each page, in the order given. Pages
+            which failed to parse are logged and left out.
+    """
+    if cache_folder is not None:
+        os.makedirs(cache_folder, exist_ok=True)
+
+    results = {}
+    todo = []
+    for html_path in html_paths:
+        page_layout = layout(html_path)
+        with open(html_path, 'rb') as f:
+            key = page_key(f.read(), page_layout)
+        tree = None if cache_folder is None else _load_cached(cache_folder, key)
+        results[html_path] = tree
+        if tree is None:
+            todo.append((html_path, page_layout, key, cache_folder))
+    logger.info('%d of %d programs cached', len(results) - len(todo), len(results))
+
+    if processes == 1 or len(todo) <= 1:
+        _collect(map(_parse_to_cache, todo), results)
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            _collect(pool.imap_unordered(_parse_to_cache, todo), results)
+    return {path: tree for path, tree in results.items() if tree is not None}
+
+def _collect(parsed, results: T.Dict[str, T.Optional[CourseList]]):
+    for html_path, data, error in parsed:
+        if error is not None:
+            logger.error('failed to parse %s: %s', html_path, error)
+        else:
+            results[html_path] = pickle.loads(data)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description='Parses every program page in a folder.')
+    parser.add_argument('html_folder')
+    parser.add_argument('--cache', default='.program_cache')
+    parser.add_argument('--processes', type=int)
+    parser.add_argument('--layout', choices=sorted(LAYOUTS),
+        help='use this layout for every page, instead of PROGRAM_LAYOUTS')
+    args = parser.parse_args()
+
+    paths = sorted(os.path.join(args.html_folder, name)
+        for name in os.listdir(args.html_folder) if name.lower().endswith('.html'))
+    choose = (lambda path: LAYOUTS[args.layout]) if args.layout else layout_for
+    for path, program in parse_programs(paths, args.cache, args.processes, choose).items():
+        print(f'{path}: {program.name}, {len(program.sublists)} parts')
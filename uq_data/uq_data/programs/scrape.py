@@ -132,12 +132,21 @@ class BMathParser(ProgramParser):
             self.current_node = UnitsOf(units=units)
             self.current_course_list.node.children.append(self.current_node)
 
+PROGRAM_URL = 'https://my.uq.edu.au/programs-courses/program_list.html?acad_prog='
+
+def download_programs(acad_progs, folder: str = '.') -> list:
+    """Downloads each program's course list page to folder/ACAD_PROG.html.
+    Returns (url, exception) for each page which could not be fetched."""
+    from ..fetch import fetch, save_to
+    return fetch((PROGRAM_URL + str(p) for p in acad_progs), save_to(folder))
+
 def main():
-    from urllib.request import urlopen
+    import os
     
     print('Scraper test')
+    if not os.path.exists('2393.html'):
+        download_programs([2393])
     with open('2393.html') as f:
-    # with urlopen('https://my.uq.edu.au/programs-courses/program_list.html?acad_prog=2393') as f:
         soup = bs4.BeautifulSoup(f)
         parser = BMathParser()
         parser.parse_program(soup)
@@ -0,0 +1,261 @@
+"""Local read-only HTTP API over the course data.
+
+    python -m uq_data serve DATA [--host 127.0.0.1] [--port 8080]
+        [--cache 4096] [--reload 2]
+
+DATA is any output of this project: a SQLite database written by
+parse_and_write_sqlite() or the scraper's SQLitePipeline, a folder of
+course JSON written by parse_and_write_json(), or a course_details .jl or
+.json file. It is loaded once, and every course's JSON is serialised then.
+Responses built from many courses are serialised on first request and kept
+in an LRU. Every response has an ETag, and requests whose If-None-Match
+matches it get an empty 304.
+
+The data is reloaded in a background thread when its modification time
+changes, and replaces the old data atomically once loaded. If loading
+fails, the old data keeps being served.
+
+    GET /courses/{code}                 the course's record, as stored
+    GET /courses/{code}/prerequisites   courses in its prerequisites and
+                                        theirs, transitively
+    GET /offerings/{year}/{semester}    courses offered that semester
+
+semester is the semester character of the offer codes, which are the hex
+of e.g. STLUC1IN: 1 and 2 for semesters, 3 for summer, 5 to 7 for
+trimesters and D to G for research quarters.
+
+bench/serve.py load tests a running service.
+"""
+import typing as T
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+
+from collections import OrderedDict, defaultdict
+
+from aiohttp import web
+
+from .lookup import iter_course_details
+from .prereq_graph import PrereqGraph
+
+logger = logging.getLogger(__name__)
+
+class Course(T.NamedTuple):
+    code: str
+    record: dict
+    offerings: T.List[T.Tuple[str, int, T.Optional[str]]] # offer code, year, teaching period
+    prerequisite: T.Optional[str]
+
+class Payload(T.NamedTuple):
+    body: bytes
+    etag: str
+
+def payload(obj) -> Payload:
+    body = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return Payload(body, '"' + hashlib.sha1(body).hexdigest() + '"')
+
+def semester_of(offer_code: str) -> T.Optional[str]:
+    """The semester character of an offer code, or None if it is not the
+    hex of 8 letters and digits."""
+    try:
+        code = bytes.fromhex(offer_code).decode('ascii')
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return code[5] if len(code) == 8 and code.isalnum() else None
+
+def _parsed_course(record: dict) -> Course:
+    # As written by courses.parse, or read back from its database.
+    return Course(record['course_code'], record,
+        [(s['code'], s['year'], s['teaching_period']) for s in record['semesters']],
+        record.get('prerequisites') or None)
+
+def _details_course(record: dict) -> Course:
+    # As scraped by CourseDetailsSpider.
+    return Course(record['code'], record,
+        [(o['offer_code'], o['year'], o['teaching_period']) for o in record['offerings']],
+        record.get('prerequisite') or None)
+
+def _read_sqlite(path: str) -> T.Iterator[Course]:
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        semesters = defaultdict(list)
+        for row in conn.execute('SELECT course_code, code, year, teaching_period '
+                'FROM offerings ORDER BY id'):
+            semesters[row['course_code']].append(
+                {'code': row['code'], 'year': row['year'], 'teaching_period': row['teaching_period']})
+        for row in conn.execute('SELECT * FROM courses ORDER BY course_code'):
+            record = dict(row)
+            record['semesters'] = semesters.get(record['course_code'], [])
+            yield _parsed_course(record)
+    finally:
+        conn.close()
+
+def _read_json_folder(path: str) -> T.Iterator[Course]:
+    for name in sorted(os.listdir(path)):
+        if name.lower().endswith('.json'):
+            with open(os.path.join(path, name), encoding='utf-8') as f:
+                yield _parsed_course(json.load(f))
+
+def read_courses(path: str) -> T.Iterator[Course]:
+    if os.path.isdir(path):
+        return _read_json_folder(path)
+    if path.endswith(('.json', '.jl')):
+        return map(_details_course, iter_course_details(path))
+    return _read_sqlite(path)
+
+def fingerprint(path: str) -> T.Tuple:
+    """Changes whenever the data at path does, including writes to a
+    SQLite database's WAL and files rewritten in a JSON folder."""
+    if os.path.isdir(path):
+        return tuple(sorted((e.name, e.stat().st_mtime_ns, e.stat().st_size)
+            for e in os.scandir(path) if e.name.lower().endswith('.json')))
+    paths = [path, path + '-wal']
+    return tuple((os.stat(p).st_mtime_ns, os.stat(p).st_size)
+        for p in paths if os.path.exists(p))
+
+class _LRU:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, make: T.Callable[[], T.Optional[Payload]]) -> T.Optional[Payload]:
+        try:
+            self._data.move_to_end(key)
+            return self._data[key]
+        except KeyError:
+            pass
+        value = self._data[key] = make()
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+class Dataset:
+    """Every course of one load of the data, with its responses."""
+
+    def __init__(self, courses: T.Iterable[Course], cache_size: int = 4096):
+        self.courses = {c.code: c for c in courses}
+        self.payloads = {code: payload(c.record) for code, c in self.courses.items()}
+        self.offered = defaultdict(list) # (year, semester) -> course codes
+        for code, course in self.courses.items():
+            for offer_code, year, _ in course.offerings:
+                key = (year, semester_of(offer_code))
+                if not self.offered[key] or self.offered[key][-1] != code:
+                    self.offered[key].append(code)
+        self.graph = PrereqGraph.from_prereq_strings(
+            {code: c.prerequisite for code, c in self.courses.items()})
+        self._responses = _LRU(cache_size)
+
+    @classmethod
+    def load(cls, path: str, cache_size: int = 4096) -> 'Dataset':
+        start = time.perf_counter()
+        dataset = cls(read_courses(path), cache_size)
+        logger.info('loaded %d courses from %s in %.2fs', len(dataset.courses), path,
+            time.perf_counter() - start)
+        return dataset
+
+    def course(self, code: str) -> T.Optional[Payload]:
+        return self.payloads.get(code)
+
+    def prerequisites(self, code: str) -> T.Optional[Payload]:
+        course = self.courses.get(code)
+        if course is None:
+            return None
+        return self._responses.get(('prerequisites', code), lambda: payload({
+            'course_code': code,
+            'prerequisite': course.prerequisite,
+            'prerequisites': self.graph.prerequisites(code),
+        }))
+
+    def offerings(self, year: int, semester: str) -> Payload:
+        def make():
+            offerings = []
+            for code in self.offered.get((year, semester), ()):
+                course = self.courses[code]
+                offerings.extend({'course_code': code, 'offer_code': offer_code,
+                        'teaching_period': teaching_period}
+                    for offer_code, y, teaching_period in course.offerings
+                    if y == year and semester_of(offer_code) == semester)
+            return payload({'year': year, 'semester': semester, 'offerings': offerings})
+        return self._responses.get(('offerings', year, semester), make)
+
+class CourseService:
+    """The routes of the API over the data at path, which is watched for
+    changes every reload_interval seconds (0 to never reload)."""
+
+    def __init__(self, path: str, cache_size: int = 4096, reload_interval: float = 2.0):
+        self.path = path
+        self.cache_size = cache_size
+        self.reload_interval = reload_interval
+        self._fingerprint = fingerprint(path)
+        self.data = Dataset.load(path, cache_size)
+        self._watcher = None
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.add_routes([
+            web.get('/courses/{code}', self.get_course),
+            web.get('/courses/{code}/prerequisites', self.get_prerequisites),
+            web.get('/offerings/{year:\\d+}/{semester}', self.get_offerings),
+        ])
+        app.on_startup.append(self._start_watching)
+        app.on_cleanup.append(self._stop_watching)
+        return app
+
+    async def _start_watching(self, app: web.Application):
+        if self.reload_interval > 0:
+            self._watcher = asyncio.get_running_loop().create_task(self._watch())
+
+    async def _stop_watching(self, app: web.Application):
+        if self._watcher is not None:
+            self._watcher.cancel()
+
+    async def _watch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                current = fingerprint(self.path)
+            except OSError as e:
+                logger.warning('cannot check %s for changes: %s', self.path, e)
+                continue
+            if current == self._fingerprint:
+                continue
+            # Remembered before loading, so a file caught half written is
+            # loaded again once its writer finishes and changes it again.
+            self._fingerprint = current
+            try:
+                self.data = await loop.run_in_executor(None, Dataset.load, self.path, self.cache_size)
+            except Exception:
+                logger.exception('failed to reload %s, still serving the previous data', self.path)
+
+    def _respond(self, request: web.Request, body: T.Optional[Payload]) -> web.Response:
+        if body is None:
+            raise web.HTTPNotFound(text=json.dumps({'error': 'not found'}),
+                content_type='application/json')
+        headers = {'ETag': body.etag, 'Cache-Control': 'no-cache'}
+        match = request.headers.get('If-None-Match')
+        if match is not None and (match.strip() == '*'
+                or body.etag in (tag.strip() for tag in match.split(','))):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body.body, content_type='application/json', headers=headers)
+
+    async def get_course(self, request: web.Request) -> web.Response:
+        return self._respond(request, self.data.course(request.match_info['code'].upper()))
+
+    async def get_prerequisites(self, request: web.Request) -> web.Response:
+        return self._respond(request, self.data.prerequisites(request.match_info['code'].upper()))
+
+    async def get_offerings(self, request: web.Request) -> web.Response:
+        year = int(request.match_info['year'])
+        semester = request.match_info['semester'].upper()
+        return self._respond(request, self.data.offerings(year, semester))
+
+def serve(path: str, host: str = '127.0.0.1', port: int = 8080, cache_size: int = 4096,
+        reload_interval: float = 2.0):
+    web.run_app(CourseService(path, cache_size, reload_interval).app(), host=host, port=port)
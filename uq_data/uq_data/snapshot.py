@@ -0,0 +1,238 @@
+"""Columnar snapshot of course_details, an alternative to course_details.jl.
+
+Each field is stored as its own column, so one column, e.g. every course's
+prerequisite, can be read from a memory map without decoding the rest.
+Offerings are a second table, and each course holds the range of its rows.
+
+File layout, all integers little-endian:
+
+    magic       b'UQSS\\x01' padded with zeros to 8 bytes
+    uint32      length of the directory
+    directory   UTF-8 JSON, padded with spaces to an 8 byte boundary
+    buffers     each starting on an 8 byte boundary
+
+The directory is
+
+    {"tables": {table: {"rows": n, "columns": {field: column}}}}
+
+where each column is {"type": type, "buffers": {name: [offset, length]}}
+with offsets from the start of the file. By type:
+
+    bool    "values": n uint8, 0 or 1.
+    int     "values": n int32.
+    str     "valid": n uint8, 0 where the value is null.
+            "offsets": n+1 uint32, row i is data[offsets[i]:offsets[i+1]].
+            "data": UTF-8 bytes.
+    dict    "codes": n uint16, 0 for null, else 1 + index into the column's
+            "values", a list of at most 65535 strings stored in the
+            directory itself.
+    range   "offsets": n+1 uint32, row i owns rows offsets[i]:offsets[i+1]
+            of another table, named by the column's "table".
+
+    python -m uq_data.snapshot course_details.jl course_details.uqs
+"""
+import typing as T
+
+import json
+import mmap
+import struct
+import sys
+
+from array import array
+
+from .lookup import iter_course_details
+
+_magic = b'UQSS\x01\x00\x00\x00'
+_length = struct.Struct('<I')
+
+_max_dict_values = 0xffff # codes are uint16, with 0 for null
+
+COURSE_FIELDS = [
+    ('code', 'str'), ('name', 'str'), ('current', 'bool'), ('_updated', 'str'),
+    ('description', 'str'), ('level', 'dict'), ('faculty', 'dict'),
+    ('school', 'dict'), ('units', 'dict'), ('duration', 'dict'),
+    ('contact', 'str'), ('incompatible', 'str'), ('prerequisite', 'str'),
+    ('companion', 'str'), ('restricted', 'str'), ('assessment', 'str'),
+    ('coordinator', 'str'), ('study_abroad', 'str'),
+]
+
+OFFERING_FIELDS = [
+    ('offer_code', 'str'), ('link', 'str'), ('semester', 'dict'),
+    ('year', 'int'), ('teaching_period', 'dict'), ('archived', 'bool'),
+    ('location', 'dict'), ('mode', 'dict'), ('profile_id', 'str'),
+    ('ecp', 'str'),
+]
+
+def _typed(typecode: str, values: T.Iterable[int]) -> bytes:
+    a = array(typecode, values)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a.tobytes()
+
+def _encode(name: str, kind: str, values: T.List) -> T.Tuple[dict, T.Dict[str, bytes]]:
+    # Returns the column's directory entry, without offsets, and its buffers.
+    if kind == 'bool':
+        return {}, {'values': bytes(bool(v) for v in values)}
+    if kind == 'int':
+        return {}, {'values': _typed('i', values)}
+    if kind == 'str':
+        encoded = [b'' if v is None else v.encode('utf-8') for v in values]
+        offsets = [0]
+        for b in encoded:
+            offsets.append(offsets[-1] + len(b))
+        return {}, {
+            'valid': bytes(v is not None for v in values),
+            'offsets': _typed('I', offsets),
+            'data': b''.join(encoded),
+        }
+    if kind == 'dict':
+        distinct = sorted(set(v for v in values if v is not None))
+        if len(distinct) > _max_dict_values:
+            raise ValueError(f'{name} has {len(distinct)} distinct values, but a dict '
+                f'column holds at most {_max_dict_values}. Store it as str instead.')
+        index = {v: i + 1 for i, v in enumerate(distinct)}
+        index[None] = 0
+        return {'values': distinct}, {'codes': _typed('H', (index[v] for v in values))}
+    raise ValueError(f'unknown column type {kind}')
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+def write_snapshot(path: str, courses: T.Iterable[dict]):
+    """Writes course_details records, as scraped by the course_details
+    spider, to a snapshot file. Fields not in COURSE_FIELDS or
+    OFFERING_FIELDS are not stored."""
+    courses = list(courses)
+    offerings = [o for c in courses for o in c['offerings']]
+    ranges = [0]
+    for c in courses:
+        ranges.append(ranges[-1] + len(c['offerings']))
+
+    tables = {}
+    blobs = []
+    for table, rows, fields in (('courses', courses, COURSE_FIELDS),
+            ('offerings', offerings, OFFERING_FIELDS)):
+        columns = {}
+        for field, kind in fields:
+            entry, buffers = _encode(f'{table}.{field}', kind, [r.get(field) for r in rows])
+            columns[field] = dict(type=kind, **entry)
+            blobs.append((columns[field], buffers))
+        tables[table] = {'rows': len(rows), 'columns': columns}
+    offerings_column = {'type': 'range', 'table': 'offerings'}
+    tables['courses']['columns']['offerings'] = offerings_column
+    blobs.append((offerings_column, {'offsets': _typed('I', ranges)}))
+
+    # Buffer offsets depend on the directory's length, which depends on the
+    # offsets, so lay out again until the length settles.
+    directory = b''
+    while True:
+        pos = len(_magic) + _length.size + len(directory)
+        for column, buffers in blobs:
+            column['buffers'] = {}
+            for name, data in buffers.items():
+                column['buffers'][name] = [pos, len(data)]
+                pos += len(data) + _pad(len(data))
+        encoded = json.dumps({'tables': tables}, separators=(',', ':')).encode('utf-8')
+        encoded += b' ' * _pad(_length.size + len(encoded))
+        settled = len(encoded) == len(directory)
+        directory = encoded
+        if settled:
+            break
+
+    with open(path, 'wb') as f:
+        f.write(_magic)
+        f.write(_length.pack(len(directory)))
+        f.write(directory)
+        for column, buffers in blobs:
+            for name, data in buffers.items():
+                assert f.tell() == column['buffers'][name][0]
+                f.write(data)
+                f.write(b'\0' * _pad(len(data)))
+
+class Snapshot:
+    """Read-only view of a snapshot file. Columns are decoded on request
+    from a memory map of the file.
+
+        with Snapshot('course_details.uqs') as snapshot:
+            prereqs = dict(zip(snapshot.column('code'),
+                snapshot.column('prerequisite')))
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(_magic)] != _magic:
+            self._map.close()
+            raise ValueError(f'{path} is not a course snapshot')
+        pos = len(_magic)
+        length, = _length.unpack_from(self._map, pos)
+        pos += _length.size
+        self.tables = json.loads(self._map[pos:pos+length].decode('utf-8'))['tables']
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.tables['courses']['rows']
+
+    def _bytes(self, column: dict, name: str) -> bytes:
+        offset, length = column['buffers'][name]
+        return self._map[offset:offset+length]
+
+    def _ints(self, column: dict, name: str, typecode: str) -> array:
+        a = array(typecode)
+        a.frombytes(self._bytes(column, name))
+        if sys.byteorder == 'big':
+            a.byteswap()
+        return a
+
+    def column(self, field: str, table: str = 'courses') -> T.List:
+        """Decodes one column of a table, 'courses' or 'offerings', into a
+        list with one value per row. The 'offerings' column of courses is a
+        list of (start, stop) row ranges into the offerings table."""
+        column = self.tables[table]['columns'][field]
+        kind = column['type']
+        if kind == 'bool':
+            return [b == 1 for b in self._bytes(column, 'values')]
+        if kind == 'int':
+            return self._ints(column, 'values', 'i').tolist()
+        if kind == 'str':
+            valid = self._bytes(column, 'valid')
+            offsets = self._ints(column, 'offsets', 'I')
+            data = self._bytes(column, 'data')
+            return [data[offsets[i]:offsets[i+1]].decode('utf-8') if v else None
+                for i, v in enumerate(valid)]
+        if kind == 'dict':
+            values = [None] + column['values']
+            return [values[c] for c in self._ints(column, 'codes', 'H')]
+        if kind == 'range':
+            offsets = self._ints(column, 'offsets', 'I')
+            return list(zip(offsets, offsets[1:]))
+        raise ValueError(f'unknown column type {kind}')
+
+    def _rows(self, table: str, fields: T.List[T.Tuple[str, str]]) -> T.List[dict]:
+        names = [field for field, _ in fields]
+        columns = [self.column(field, table) for field in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def records(self) -> T.List[dict]:
+        """Every course as a dict, equal to its record in course_details."""
+        courses = self._rows('courses', COURSE_FIELDS)
+        offerings = self._rows('offerings', OFFERING_FIELDS)
+        for course, (start, stop) in zip(courses, self.column('offerings')):
+            course['offerings'] = offerings[start:stop]
+        return courses
+
+if __name__ == "__main__":
+    details_path, snapshot_path = sys.argv[1:3]
+    courses = list(iter_course_details(details_path))
+    write_snapshot(snapshot_path, courses)
+    with Snapshot(snapshot_path) as snapshot:
+        assert snapshot.records() == courses
+    print(f'wrote {len(courses)} courses to {snapshot_path}')
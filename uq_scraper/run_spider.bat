@@ -1,6 +1,6 @@
 @echo off
 
-scrapy crawl course_details -o ../data/course_details.json
+scrapy crawl course_details -o ../data/course_details.jl
 REM :start
 REM timeout 600
 REM goto start
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""A local copy of the site, served by uq_scraper.stub_server, and a way to
+crawl it with scrapy as it would be run from the command line."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from uq_scraper import stub_server
+
+PROJECT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+_page = '''<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{name} ({code})</title></head>
+<body>
+<div class="breadcrumb-wrapper"><ul><li><a href="/programs-courses/">Programs &amp; Courses</a></li><li>{name}</li></ul></div>
+<h1 id="course-title">{name} ({code})</h1>
+<div id="summary-content">
+<p id="course-level">Undergraduate</p>
+<p id="course-units">2</p>
+<p id="course-prerequisite">{prerequisite}</p>
+</div>
+<p id="course-summary">About {name}.</p>
+<table id="course-current-offerings">
+<tbody>
+<tr>
+<td><a href="/programs-courses/course.html?course_code={code}&amp;offer=53544c5543314e4e&amp;year=2020">Semester 1, 2020</a></td>
+<td>St Lucia</td>
+<td>Internal</td>
+<td><a href="https://course-profiles.uq.edu.au/student_section_loader/section_1/12345">Course Profile</a></td>
+</tr>
+</tbody>
+</table>
+</body>
+</html>
+'''
+
+CODES = ['ENGG%d' % (1100 + i) for i in range(10)]
+
+
+class Site:
+    """Course pages of CODES in a folder, served by a stub server, and
+    the course_codes output listing them."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.html = os.path.join(folder, 'html')
+        self.courses = os.path.join(folder, 'courses.jl')
+        os.makedirs(self.html)
+        with open(self.courses, 'w') as f:
+            for code in CODES:
+                self.write_page(code)
+                f.write(json.dumps({'code': code, 'name': 'Course ' + code,
+                    'href': 'https://my.uq.edu.au/programs-courses/course.html?course_code=' + code}) + '\n')
+        self.server = stub_server.serve(self.html)
+        self.url = f'http://localhost:{self.server.server_port}'
+
+    @property
+    def counts(self):
+        return self.server.RequestHandlerClass.counts
+
+    def write_page(self, code, prerequisite='ENGG1000'):
+        with open(os.path.join(self.html, code + '.html'), 'w') as f:
+            f.write(_page.format(code=code, name='Course ' + code, prerequisite=prerequisite))
+
+    def scrapy_args(self):
+        """Arguments of scrapy crawl course_details which crawl this site
+        quickly, caching under folder and writing no database."""
+        return [
+            '-a', 'host=' + self.url, '-a', 'courses=' + self.courses,
+            '-s', 'CONDITIONAL_CACHE_DIR=' + os.path.join(self.folder, 'cache'),
+            '-s', 'SQLITE_PIPELINE_DB=', '-s', 'ROBOTSTXT_OBEY=False',
+            '-s', 'DOWNLOAD_DELAY=0', '-s', 'AUTOTHROTTLE_ENABLED=False',
+            '-s', 'LOG_LEVEL=WARNING',
+        ]
+
+    def crawl(self, details):
+        """Crawls every course into details, as scrapy crawl course_details
+        -o details would."""
+        subprocess.run([sys.executable, '-m', 'scrapy', 'crawl', 'course_details',
+                '-a', 'details=' + details, '-o', details] + self.scrapy_args(),
+            cwd=PROJECT, check=True)
+
+
+def read_codes(path):
+    with open(path) as f:
+        return sorted(json.loads(line)['code'] for line in f if line.strip())
+
+
+@pytest.fixture
+def site(tmp_path):
+    site = Site(str(tmp_path))
+    yield site
+    site.server.shutdown()
@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from scrapy.http import HtmlResponse, Request
+from scrapy.utils.test import get_crawler
+
+from uq_scraper.spiders.course_codes import CourseCodesSpider
+
+from .conftest import CODES, PROJECT
+
+
+def _crawl(site, out, *settings):
+    result = subprocess.run([sys.executable, '-m', 'scrapy', 'crawl', 'course_codes',
+            '-a', 'host=' + site.url, '-O', out, '-s', 'ROBOTSTXT_OBEY=False',
+            '-s', 'SQLITE_PIPELINE_DB=', '-s', 'LOG_LEVEL=INFO'] + list(settings),
+        cwd=PROJECT, check=True, stderr=subprocess.PIPE, universal_newlines=True)
+    with open(out) as f:
+        return [json.loads(line) for line in f], result.stderr
+
+
+@pytest.mark.parametrize('compression', ['gzip', 'identity'])
+def test_listing_is_parsed_as_it_downloads(site, tmp_path, compression):
+    settings = [] if compression == 'gzip' else ['-s', 'COMPRESSION_ENABLED=False']
+    courses, log = _crawl(site, str(tmp_path / 'courses.jl'), *settings)
+
+    assert "'course_codes/streamed': 1" in log
+    assert [c['code'] for c in courses] == CODES
+    assert courses[0] == {'code': 'ENGG1100', 'name': 'Course ENGG1100',
+        'href': site.url + '/programs-courses/course.html?course_code=ENGG1100'}
+
+
+def test_responses_not_streamed_are_parsed_once_downloaded():
+    # Such as a page whose encoding is only declared within it.
+    crawler = get_crawler(CourseCodesSpider)
+    spider = CourseCodesSpider.from_crawler(crawler)
+    body = ('<html><head><meta charset="cp1252"></head><body><div id="courses-container">'
+        '<ul class="listing"><li><a href="/programs-courses/course.html?course_code=FREN1010">'
+        '<span class="code">FREN1010</span><span class="title">Fran\u00e7ais</span></a></li>'
+        '</ul></div></body></html>').encode('cp1252')
+    response = HtmlResponse(spider.start_urls[0], body=body,
+        request=Request(spider.start_urls[0]))
+
+    assert list(spider.parse(response)) == [{'code': 'FREN1010', 'name': 'Fran\u00e7ais',
+        'href': 'https://my.uq.edu.au/programs-courses/course.html?course_code=FREN1010'}]
+    assert crawler.stats.get_value('course_codes/buffered') == 1
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+from .conftest import CODES, PROJECT
+
+
+def test_stage_stats(site, tmp_path):
+    details = str(tmp_path / 'course_details.jl')
+    result = subprocess.run([sys.executable, '-m', 'scrapy', 'crawl', 'course_details',
+            '-a', 'details=' + details, '-o', details] + site.scrapy_args() + [
+            '-s', 'STAGE_STATS=True', '-s', 'LOG_LEVEL=INFO',
+            '-s', 'SQLITE_PIPELINE_DB=' + os.path.join(str(tmp_path), 'courses.sqlite')],
+        cwd=PROJECT, check=True, stderr=subprocess.PIPE, universal_newlines=True)
+
+    log = result.stderr
+    for stage in ('extract', 'offerings'):
+        assert f"'stage/{stage}/calls': {len(CODES)}," in log
+        assert f"'stage/{stage}/seconds': " in log
+    assert "'stage/db_write/calls': " in log
+    assert f"'count/offerings': {len(CODES)}," in log
+    assert "'count/missing_fields': " in log
+
+
+def test_no_stage_stats_by_default(site, tmp_path):
+    details = str(tmp_path / 'course_details.jl')
+    result = subprocess.run([sys.executable, '-m', 'scrapy', 'crawl', 'course_details',
+            '-a', 'details=' + details, '-o', details] + site.scrapy_args() + [
+            '-s', 'LOG_LEVEL=INFO'],
+        cwd=PROJECT, check=True, stderr=subprocess.PIPE, universal_newlines=True)
+    assert "'stage/" not in result.stderr
+    assert "'count/" not in result.stderr
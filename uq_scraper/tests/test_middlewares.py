@@ -0,0 +1,46 @@
+import logging
+import os
+
+from uq_scraper.middlewares import ConditionalCacheMiddleware
+
+from .conftest import CODES, read_codes
+
+
+def test_unchanged_pages_are_parsed_from_the_cache(site):
+    details = os.path.join(site.folder, 'course_details.jl')
+    site.crawl(details)
+    assert read_codes(details) == CODES
+
+    # A refresh: every page is revalidated, none has changed, and every
+    # course is still written.
+    os.remove(details)
+    site.crawl(details)
+    assert site.counts[304] == len(CODES)
+    assert read_codes(details) == CODES
+
+
+class _Spider:
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, name):
+        self.name = name
+
+
+def test_resume_logs_are_per_spider(tmp_path):
+    def open_middleware(spider):
+        middleware = ConditionalCacheMiddleware(str(tmp_path), stats=None)
+        middleware.spider_opened(spider)
+        return middleware
+
+    details, codes = _Spider('course_details'), _Spider('course_codes')
+    interrupted = open_middleware(details)
+    interrupted._mark_seen('https://my.uq.edu.au/programs-courses/course.html?course_code=ENGG1100')
+    interrupted.spider_closed(details, 'shutdown')
+
+    # Another spider sharing the cache neither resumes from nor removes
+    # the interrupted crawl's log.
+    other = open_middleware(codes)
+    assert other.seen == set()
+    other.spider_closed(codes, 'finished')
+
+    assert open_middleware(details).seen == interrupted.seen
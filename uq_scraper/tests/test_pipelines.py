@@ -0,0 +1,53 @@
+import sqlite3
+
+from uq_scraper.pipelines import SQLitePipeline, course_rows
+
+
+def _item(name, updated):
+    return {'code': 'ENGG1100', 'name': name, '_updated': updated, 'offerings': []}
+
+
+def test_newer_courses_win_whatever_their_utc_offset(tmp_path):
+    db = str(tmp_path / 'courses.sqlite')
+    pipeline = SQLitePipeline(db)
+    conn = pipeline._connect()
+
+    # As uq_data.courses.parse writes it: 23:00 UTC, in Brisbane time.
+    pipeline._flush(conn, [course_rows(_item('parsed', '2020-01-01T09:00:00+10:00'))])
+    # Scraped an hour later, though its UTC string sorts first.
+    pipeline._flush(conn, [course_rows(_item('scraped', '2020-01-01T00:00:00'))])
+    # Older than both.
+    pipeline._flush(conn, [course_rows(_item('stale', '2019-12-31T22:00:00+00:00'))])
+    conn.close()
+
+    with sqlite3.connect(db) as conn:
+        assert conn.execute('SELECT course_name FROM courses').fetchall() == [('scraped',)]
+
+
+def _offered(db):
+    with sqlite3.connect(db) as conn:
+        return conn.execute('SELECT id, code, year, teaching_period FROM offerings '
+            'ORDER BY id').fetchall()
+
+
+def test_offerings_follow_the_newest_page(tmp_path):
+    db = str(tmp_path / 'courses.sqlite')
+    pipeline = SQLitePipeline(db)
+    conn = pipeline._connect()
+
+    def flush(updated, *offerings):
+        item = _item('name', updated)
+        item['offerings'] = [{'offer_code': code, 'year': year, 'teaching_period': 'Standard'}
+            for code, year in offerings]
+        pipeline._flush(conn, [course_rows(item)])
+
+    flush('2020-01-01T00:00:00', ('A', 2020), ('B', 2020))
+    # B dropped and C added, so A keeps its row.
+    flush('2020-02-01T00:00:00', ('A', 2020), ('C', 2020))
+    # An older page changes nothing, offerings included.
+    flush('2020-01-15T00:00:00', ('D', 2020))
+    conn.close()
+
+    offered = _offered(db)
+    assert [row[1:] for row in offered] == [('A', 2020, None), ('C', 2020, None)]
+    assert offered[0][0] == 1
@@ -0,0 +1,31 @@
+import json
+import os
+
+from uq_scraper import shards
+
+from .conftest import CODES, PROJECT, read_codes
+
+
+def test_shards_skip_merged_courses_and_merge(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(PROJECT)
+    folder = str(tmp_path / 'shards')
+    details = str(tmp_path / 'course_details.jl')
+    # Merged by an earlier run, so no shard should fetch them again.
+    merged = CODES[:4]
+    with open(details, 'w') as f:
+        for code in merged:
+            f.write(json.dumps({'code': code, '_updated': '2020-01-01T00:00:00'}) + '\n')
+
+    assert shards.crawl(3, folder, site.scrapy_args(), details) == []
+
+    paths = shards.shard_paths(3, folder)
+    crawled = [read_codes(path) if os.path.exists(path) else [] for path in paths]
+    assert sorted(code for codes in crawled for code in codes) == CODES[4:]
+    assert site.counts == {200: len(CODES) - len(merged)}
+
+    assert shards.merge(details, paths) == len(CODES)
+    assert read_codes(details) == CODES
+    # The merged copies are kept, as no shard has a newer one.
+    with open(details) as f:
+        items = [json.loads(line) for line in f]
+    assert [i['code'] for i in items if 'name' not in i] == merged
@@ -0,0 +1,90 @@
+"""Incremental readers for the JSON Lines files the spiders read and write.
+
+One JSON object per line means a file can be read without holding it all
+in memory, and a file cut short by an interrupted crawl loses at most its
+last line rather than becoming unreadable.
+"""
+import bisect
+import json
+import logging
+import os
+import string
+
+from array import array
+
+logger = logging.getLogger(__name__)
+
+
+def iter_jsonlines(path):
+    """Yields each object in a JSON Lines file. Blank lines are skipped and
+    lines which are not valid JSON, such as a truncated final line, are
+    logged and skipped. A missing file yields nothing.
+
+    Legacy .json files holding a single array are loaded in full."""
+    try:
+        f = open(path, encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        if path.endswith('.json'):
+            logger.warning('%s is not JSON Lines, loading it in full', path)
+            yield from json.load(f)
+            return
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logger.warning('%s:%d is not valid JSON, skipping', path, number)
+
+
+def terminate_last_line(path):
+    """Appends a newline if the file ends part way through a line, so lines
+    appended later are not glued onto a truncated one."""
+    try:
+        with open(path, 'rb+') as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+    except FileNotFoundError:
+        pass
+
+
+_alphabet = string.digits + string.ascii_uppercase
+_digit = {c: i + 1 for i, c in enumerate(_alphabet)}
+_base = len(_alphabet) + 1
+_max_length = 12 # 37**12 < 2**64
+
+
+def encode_code(code):
+    """Packs a course code of up to 12 digits and uppercase letters into a
+    64-bit integer. Distinct codes give distinct integers."""
+    if len(code) > _max_length:
+        raise ValueError(f'{code!r} is too long to encode')
+    value = 0
+    for c in code:
+        value = value * _base + _digit[c]
+    return value
+
+
+class CodeSet:
+    """Immutable set of course codes stored as a sorted array of 64-bit
+    integers, 8 bytes per code instead of a str object per code."""
+
+    def __init__(self, codes=()):
+        self._values = array('Q', sorted(map(encode_code, codes)))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, code):
+        try:
+            value = encode_code(code)
+        except (ValueError, KeyError):
+            return False
+        i = bisect.bisect_left(self._values, value)
+        return i < len(self._values) and self._values[i] == value
@@ -0,0 +1,48 @@
+"""Crawl stats of the time spent in each stage of parsing and writing.
+
+Spiders and pipelines mark their stages and counters with uq_data's
+instrument module, as the offline parser does:
+
+    with instrument.stage('extract'):
+        ...
+    instrument.count('offerings', n)
+
+StageStats turns recording on for the crawl and adds what was recorded to
+the crawl stats when the spider closes, after the pipelines have finished,
+as stage/<name>/calls, stage/<name>/seconds and count/<name>.
+"""
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+from .shared import instrument
+
+
+class StageStats(object):
+    """Enabled by the STAGE_STATS setting. When it is off, each stage costs
+    instrument's flag check."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('STAGE_STATS'):
+            raise NotConfigured
+        extension = cls(crawler.stats)
+        crawler.signals.connect(extension.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(extension.spider_closed, signal=signals.spider_closed)
+        return extension
+
+    def spider_opened(self, spider):
+        instrument.enable()
+
+    def spider_closed(self, spider):
+        recorded = instrument.snapshot()
+        instrument.disable()
+        if recorded is None:
+            return
+        for name, calls in recorded['calls'].items():
+            self.stats.inc_value(f'stage/{name}/calls', calls)
+            self.stats.inc_value(f'stage/{name}/seconds', recorded['seconds'][name])
+        for name, n in recorded['counts'].items():
+            self.stats.inc_value(f'count/{name}', n)
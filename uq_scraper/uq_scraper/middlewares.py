@@ -5,7 +5,15 @@
 # See documentation in:
 # https://doc.scrapy.org/en/latest/topics/spider-middleware.html
 
+import gzip
+import hashlib
+import json
+import os
+
 from scrapy import signals
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.responsetypes import responsetypes
+from scrapy.utils.project import data_path
 
 
 class ScraperSpiderMiddleware(object):
@@ -101,3 +109,148 @@ class ScraperDownloaderMiddleware(object):
 
     def spider_opened(self, spider):
         spider.logger.info('Spider opened: %s' % spider.name)
+
+
+class ConditionalCacheMiddleware(object):
+    """Downloader middleware which keeps a gzip compressed copy of every
+    response on disk and revalidates it with If-None-Match and
+    If-Modified-Since. Pages which come back 304 Not Modified are answered
+    from the cached copy, so the spider still yields their items. If
+    CONDITIONAL_CACHE_PARSE_UNCHANGED is False they are dropped instead,
+    which only suits outputs that already hold every unchanged page.
+
+    A log of the URLs handled by the current crawl is kept next to the
+    cache, one per spider and shard, so an interrupted crawl resumes where
+    it left off without re-reading its output. The log is cleared when a
+    crawl finishes.
+
+    Only enabled for the spiders which list it in their custom_settings.
+
+    Settings:
+        CONDITIONAL_CACHE_ENABLED -- must be True to use the middleware.
+        CONDITIONAL_CACHE_DIR -- cache directory, relative to .scrapy.
+        CONDITIONAL_CACHE_PARSE_UNCHANGED -- parse cached copies of 304s
+            (default True), rather than dropping them.
+    """
+
+    def __init__(self, cache_dir, stats, parse_unchanged=True):
+        self.cache_dir = cache_dir
+        self.stats = stats
+        self.parse_unchanged = parse_unchanged
+        self.seen = set()
+        self._seen_file = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool('CONDITIONAL_CACHE_ENABLED'):
+            raise NotConfigured
+        s = cls(
+            data_path(settings.get('CONDITIONAL_CACHE_DIR', 'conditional_cache'), createdir=True),
+            crawler.stats,
+            settings.getbool('CONDITIONAL_CACHE_PARSE_UNCHANGED', True),
+        )
+        crawler.signals.connect(s.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(s.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(s.item_scraped, signal=signals.item_scraped)
+        return s
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        folder = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(folder, key + '.json'), os.path.join(folder, key + '.gz')
+
+    def _mark_seen(self, url):
+        key = self._key(url)
+        if key not in self.seen:
+            self.seen.add(key)
+            self._seen_file.write(key + '\n')
+            self._seen_file.flush()
+
+    def _load_meta(self, key):
+        meta_path, _ = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key, response):
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        with open(body_path, 'wb') as f:
+            f.write(gzip.compress(response.body))
+        meta = {
+            'url': response.url,
+            'status': response.status,
+            'headers': {k.decode('latin-1'): [v.decode('latin-1') for v in vs]
+                for k, vs in response.headers.items()},
+        }
+        # Written last so a partial write leaves no metadata to revalidate.
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+
+    def _retrieve(self, key, request, meta):
+        _, body_path = self._paths(key)
+        with open(body_path, 'rb') as f:
+            body = gzip.decompress(f.read())
+        respcls = responsetypes.from_args(headers=meta['headers'], url=meta['url'], body=body)
+        return respcls(url=meta['url'], status=200, headers=meta['headers'],
+            body=body, request=request, flags=['cached'])
+
+    def process_request(self, request, spider):
+        key = self._key(request.url)
+        if key in self.seen:
+            self.stats.inc_value('conditional_cache/resumed_skip')
+            raise IgnoreRequest('already handled by this crawl')
+
+        meta = self._load_meta(key)
+        if meta is None:
+            return None
+        headers = {k.lower(): v[0] for k, v in meta['headers'].items()}
+        if 'etag' in headers:
+            request.headers.setdefault('If-None-Match', headers['etag'])
+        if 'last-modified' in headers:
+            request.headers.setdefault('If-Modified-Since', headers['last-modified'])
+        return None
+
+    def process_response(self, request, response, spider):
+        key = self._key(request.url)
+        if response.status == 304:
+            meta = self._load_meta(key)
+            if meta is None:
+                return response
+            self.stats.inc_value('conditional_cache/not_modified')
+            if self.parse_unchanged:
+                return self._retrieve(key, request, meta)
+            self._mark_seen(request.url)
+            raise IgnoreRequest('not modified')
+
+        if response.status == 200 and 'cached' not in response.flags:
+            self.stats.inc_value('conditional_cache/store')
+            self._store(key, response)
+        return response
+
+    def item_scraped(self, item, response, spider):
+        self._mark_seen(response.request.url)
+
+    def spider_opened(self, spider):
+        # Spiders, and shards of one crawl, share the cache but each
+        # resumes on its own.
+        shard = getattr(spider, 'shard', None)
+        seen_name = f'seen.{spider.name}.log' if shard is None else f'seen.{spider.name}.{shard}.log'
+        seen_path = os.path.join(self.cache_dir, seen_name)
+        try:
+            with open(seen_path) as f:
+                self.seen.update(line.strip() for line in f)
+        except FileNotFoundError:
+            pass
+        self._seen_file = open(seen_path, 'a')
+        spider.logger.info('Conditional cache: %d requests already handled', len(self.seen))
+
+    def spider_closed(self, spider, reason):
+        self._seen_file.close()
+        if reason == 'finished':
+            os.remove(self._seen_file.name)
@@ -5,7 +5,164 @@
 # Don't forget to add your pipeline to the ITEM_PIPELINES setting
 # See: https://doc.scrapy.org/en/latest/topics/item-pipeline.html
 
+import datetime
+import logging
+import queue
+import sqlite3
+import threading
+
+from scrapy.exceptions import NotConfigured
+from twisted.internet import threads
+
+from .shared import instrument, sql
+
+logger = logging.getLogger(__name__)
+
 
 class ScraperPipeline(object):
     def process_item(self, item, spider):
         return item
+
+
+# course_details item field -> courses column, one for each of
+# sql.COURSE_COLUMNS.
+_course_fields = {
+    'code': 'course_code',
+    'name': 'course_name',
+    'level': 'level',
+    'faculty': 'faculty',
+    'school': 'school',
+    'units': 'units',
+    'duration': 'duration',
+    'contact': 'contact',
+    'restricted': 'restricted',
+    'incompatible': 'incompatible',
+    'prerequisite': 'prerequisites',
+    'assessment': 'assessment_methods',
+    'coordinator': 'coordinator',
+    'study_abroad': 'study_abroad',
+    'description': 'description',
+    '_updated': 'last_updated',
+}
+
+
+def _utc_isoformat(timestamp):
+    # The spider's timestamps are naive UTC, the offline parser's are aware.
+    updated = datetime.datetime.fromisoformat(timestamp)
+    if updated.tzinfo is None:
+        updated = updated.replace(tzinfo=datetime.timezone.utc)
+    return updated.isoformat()
+
+
+def course_rows(item):
+    """Converts a course_details item into a courses row and its offerings
+    rows, with values as uq_data.courses.parse would store them."""
+    course = {column: item.get(field) for field, column in _course_fields.items()}
+    for column, value in course.items():
+        if value is None:
+            course[column] = ''
+    course['last_updated'] = _utc_isoformat(item['_updated'])
+
+    offerings = []
+    for offer in item.get('offerings', ()):
+        teaching_period = offer.get('teaching_period')
+        offerings.append({
+            'course_code': course['course_code'],
+            'code': offer['offer_code'],
+            'year': offer['year'],
+            'teaching_period': None if teaching_period == 'Standard' else teaching_period,
+        })
+    return course, offerings
+
+
+class SQLitePipeline(object):
+    """Upserts course_details items into SQLite as they are scraped.
+
+    Items are handed to a writer thread, which owns the connection and
+    commits them in batches, so the reactor never waits on the database. A
+    partial batch is committed after SQLITE_PIPELINE_FLUSH_INTERVAL seconds
+    without items, so the database can be queried during the crawl.
+
+    Settings:
+        SQLITE_PIPELINE_DB -- database path. Empty disables the pipeline.
+        SQLITE_PIPELINE_BATCH_SIZE -- courses per transaction.
+        SQLITE_PIPELINE_FLUSH_INTERVAL -- seconds.
+    """
+
+    def __init__(self, db_path, batch_size=500, flush_interval=1.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._failed = False
+        self.written = 0
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        db_path = settings.get('SQLITE_PIPELINE_DB')
+        if not db_path:
+            raise NotConfigured
+        return cls(db_path,
+            settings.getint('SQLITE_PIPELINE_BATCH_SIZE', 500),
+            settings.getfloat('SQLITE_PIPELINE_FLUSH_INTERVAL', 1.0))
+
+    def open_spider(self, spider):
+        self._thread = threading.Thread(target=self._write_forever,
+            name='SQLitePipeline', daemon=True)
+        self._thread.start()
+
+    def process_item(self, item, spider):
+        if not self._failed and 'code' in item and '_updated' in item:
+            self._queue.put(course_rows(item))
+        return item
+
+    def close_spider(self, spider):
+        self._queue.put(None)
+        # Wait for the last batch without blocking the reactor.
+        return threads.deferToThread(self._thread.join)
+
+    def _connect(self):
+        # timeout so separate shard processes can share one database.
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        conn.execute('PRAGMA journal_mode = WAL')
+        sql.create_schema(conn)
+        return conn
+
+    def _flush(self, conn, batch):
+        if not batch:
+            return
+        with instrument.stage('db_write'), conn:
+            for course, offerings in batch:
+                sql.upsert_course(conn, course, offerings)
+        self.written += len(batch)
+        logger.debug('Wrote %d courses to %s', len(batch), self.db_path)
+
+    def _write_forever(self):
+        conn = None
+        batch = []
+        try:
+            conn = self._connect()
+            while True:
+                try:
+                    rows = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    self._flush(conn, batch)
+                    batch = []
+                    continue
+                if rows is None:
+                    break
+                batch.append(rows)
+                if len(batch) >= self.batch_size:
+                    self._flush(conn, batch)
+                    batch = []
+            self._flush(conn, batch)
+        except Exception:
+            self._failed = True
+            logger.exception('SQLite pipeline failed, courses since the '
+                'last commit were not written to %s', self.db_path)
+        finally:
+            if conn is not None:
+                conn.close()
+        logger.info('Wrote %d courses to %s', self.written, self.db_path)
@@ -64,9 +64,24 @@ ROBOTSTXT_OBEY = True
 
 # Configure item pipelines
 # See https://doc.scrapy.org/en/latest/topics/item-pipeline.html
-#ITEM_PIPELINES = {
-#    'scraper.pipelines.ScraperPipeline': 300,
-#}
+ITEM_PIPELINES = {
+    'uq_scraper.pipelines.SQLitePipeline': 300,
+}
+
+# Written by SQLitePipeline while crawling, same schema as uq_data's
+# parse_and_write_sqlite. Set to '' to disable.
+SQLITE_PIPELINE_DB = '../data/course_data.sqlite'
+SQLITE_PIPELINE_BATCH_SIZE = 500
+SQLITE_PIPELINE_FLUSH_INTERVAL = 1.0
+
+# Adds the calls and seconds of each parsing stage (stage/<name>/...) and
+# counts of offerings and missing fields (count/...) to the crawl stats.
+STAGE_STATS = False
+
+EXTENSIONS = {
+    # Does nothing unless STAGE_STATS is on.
+    'uq_scraper.extensions.StageStats': 500,
+}
 
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://doc.scrapy.org/en/latest/topics/autothrottle.html
@@ -88,3 +103,10 @@ ROBOTSTXT_OBEY = True
 #HTTPCACHE_DIR = 'httpcache'
 #HTTPCACHE_IGNORE_HTTP_CODES = []
 #HTTPCACHE_STORAGE = 'scrapy.extensions.httpcache.FilesystemCacheStorage'
+
+# Compressed on-disk cache revalidated with ETag/Last-Modified, see
+# uq_scraper.middlewares.ConditionalCacheMiddleware. Installed by the
+# course_details spider only.
+CONDITIONAL_CACHE_ENABLED = True
+CONDITIONAL_CACHE_DIR = 'conditional_cache'
+CONDITIONAL_CACHE_PARSE_UNCHANGED = True
@@ -0,0 +1,139 @@
+"""Runs the course_details crawl as several independent shards and merges
+their outputs.
+
+Each shard is a separate scrapy process crawling the courses whose code
+hashes to it (see CourseDetailsSpider.in_shard), appending to its own JSON
+Lines file and keeping its own JOBDIR, so shards can be run on different
+machines and any of them stopped and resumed by running it again. Courses
+already in its own file or in the merged course_details.jl are skipped.
+
+    python3 -m uq_scraper.shards crawl 4 [scrapy crawl arguments]
+    python3 -m uq_scraper.shards merge ../data/course_details.jl shards/*.jl
+
+crawl runs every shard locally and then merges into course_details.jl.
+"""
+import json
+import logging
+import os
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+SHARD_FOLDER = '../data/shards'
+DETAILS = '../data/course_details.jl'
+
+
+def shard_paths(shards, folder=SHARD_FOLDER):
+    """Output file of each shard."""
+    return [os.path.join(folder, f'course_details.{i}.jl') for i in range(shards)]
+
+
+def crawl_command(shard, shards, folder=SHARD_FOLDER, extra=(), details=DETAILS):
+    """The scrapy command line which runs one shard, skipping courses
+    already merged into details."""
+    out = shard_paths(shards, folder)[shard]
+    return [
+        sys.executable, '-m', 'scrapy', 'crawl', 'course_details',
+        '-a', f'shard={shard}', '-a', f'shards={shards}',
+        '-a', f'details={out}', '-a', f'done={details}', '-o', out,
+        '-s', 'JOBDIR=' + os.path.join(folder, f'job.{shard}'),
+        *extra,
+    ]
+
+
+def crawl(shards, folder=SHARD_FOLDER, extra=(), details=DETAILS):
+    """Runs every shard as a subprocess and waits for them. Returns the
+    shards which failed."""
+    os.makedirs(folder, exist_ok=True)
+    processes = [subprocess.Popen(crawl_command(i, shards, folder, extra, details))
+        for i in range(shards)]
+    failed = []
+    for i, process in enumerate(processes):
+        if process.wait() != 0:
+            logger.error('shard %d exited with %d', i, process.returncode)
+            failed.append(i)
+    return failed
+
+
+def _latest_lines(paths):
+    # code -> (updated, file index, offset) of the newest line for it.
+    latest = {}
+    for index, path in enumerate(paths):
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            continue
+        with f:
+            offset = 0
+            for number, line in enumerate(f, 1):
+                start, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    logger.warning('%s:%d is not valid JSON, skipping', path, number)
+                    continue
+                key = (item.get('_updated') or '', index, start)
+                code = item['code']
+                if code not in latest or key > latest[code]:
+                    latest[code] = key
+    return latest
+
+
+def merge(out, paths, include_existing=True):
+    """Merges JSON Lines files of course details into out, keeping the most
+    recently updated line for each course code and sorting by code.
+
+    Lines are copied without being re-encoded. Only each code's position is
+    kept in memory, and out is replaced atomically once complete.
+
+    Arguments:
+        out {str} -- merged output file.
+        paths {list} -- shard outputs to merge.
+        include_existing {bool} -- whether courses already in out are kept
+            if no shard has a newer copy.
+
+    Returns:
+        int -- number of courses written.
+    """
+    paths = list(paths)
+    if include_existing and os.path.exists(out):
+        paths.append(out)
+    latest = _latest_lines(paths)
+
+    files = {}
+    tmp = out + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            for code in sorted(latest):
+                _, index, offset = latest[code]
+                if index not in files:
+                    files[index] = open(paths[index], 'rb')
+                source = files[index]
+                source.seek(offset)
+                line = source.readline()
+                f.write(line if line.endswith(b'\n') else line + b'\n')
+    finally:
+        for source in files.values():
+            source.close()
+    os.replace(tmp, out)
+    return len(latest)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    command, args = sys.argv[1], sys.argv[2:]
+    if command == 'crawl':
+        shards = int(args[0])
+        failed = crawl(shards, extra=args[1:])
+        if failed:
+            sys.exit(f'shards {failed} did not finish, run again to resume them')
+        n = merge(DETAILS, shard_paths(shards))
+        print(f'merged {n} courses into {DETAILS}')
+    elif command == 'merge':
+        n = merge(args[0], args[1:])
+        print(f'merged {n} courses into {args[0]}')
+    else:
+        sys.exit('usage: python -m uq_scraper.shards crawl N [args] | merge OUT IN...')
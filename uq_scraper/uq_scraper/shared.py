@@ -0,0 +1,19 @@
+"""Modules shared with uq_data, the offline half of this repository.
+
+uq_scraper installs only scrapy, so it does not depend on uq_data as a
+package. The few modules of uq_data which need nothing beyond the standard
+library are imported from the checkout instead, with its folder put on
+sys.path, so each exists once rather than as copies kept in sync.
+"""
+import os
+import sys
+
+UQ_DATA = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'uq_data'))
+
+if UQ_DATA not in sys.path:
+    sys.path.append(UQ_DATA)
+
+from uq_data import instrument # noqa: E402
+from uq_data.course_codes.listing import ListingParser, iter_listing # noqa: E402
+from uq_data.courses import sql # noqa: E402
@@ -1,17 +1,103 @@
 # -*- coding: utf-8 -*-
+import codecs
+import weakref
+import zlib
+
 import scrapy
 
+from scrapy import signals
+from urllib.parse import urlparse
+from w3lib.encoding import http_content_type_encoding
+
+from ..shared import ListingParser, iter_listing
+
+# zlib wbits undoing each Content-Encoding, as HttpCompressionMiddleware
+# only decompresses once the whole body has arrived.
+_wbits = {b'gzip': 16 + zlib.MAX_WBITS, b'x-gzip': 16 + zlib.MAX_WBITS,
+    b'deflate': zlib.MAX_WBITS}
+
+_block_size = 64 * 1024
+
+_search_path = '/programs-courses/search.html'
+
+
+class _Stream:
+    # The search page of one request, parsed as its bytes arrive.
+    __slots__ = ('parser', 'encoding', 'decompress', 'courses')
+
+    def __init__(self, url, encoding, wbits=None):
+        self.parser = ListingParser(url, encoding)
+        self.encoding = encoding
+        self.decompress = None if wbits is None else zlib.decompressobj(wbits).decompress
+        self.courses = []
+
+    def feed(self, data):
+        if self.decompress is not None:
+            data = self.decompress(data)
+        self.courses.extend(self.parser.feed(data))
+
 
 class CourseCodesSpider(scrapy.Spider):
+    """Lists every course from the search results page.
+
+    The page is several megabytes, so it is parsed while it downloads,
+    from the bytes_received signal, rather than after. Pages which cannot
+    be, such as those in an encoding only declared within the page, are
+    parsed from the response a block at a time instead. Either way no DOM
+    is built.
+    """
     name = 'course_codes'
     allowed_domains = ['my.uq.edu.au']
-    start_urls = ['https://my.uq.edu.au/programs-courses/search.html?keywords=course&searchType=all&archived=false/']
+
+    def __init__(self, host=None, *args, **kwargs):
+        """Arguments, given with -a:
+            host -- e.g. http://localhost:8000, fetches the page from
+                another server instead.
+        """
+        super().__init__(*args, **kwargs)
+        if host:
+            self.allowed_domains = [urlparse(host).hostname]
+        self.start_urls = [(host or 'https://my.uq.edu.au').rstrip('/') + _search_path
+            + '?keywords=course&searchType=all&archived=false/']
+        self._streams = weakref.WeakKeyDictionary() # request -> _Stream
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        crawler.signals.connect(spider._headers_received, signal=signals.headers_received)
+        crawler.signals.connect(spider._bytes_received, signal=signals.bytes_received)
+        return spider
+
+    def _headers_received(self, headers, body_length, request, spider):
+        # Also sent for robots.txt. Retries are new requests, each streamed
+        # separately.
+        if spider is not self or urlparse(request.url).path != _search_path:
+            return
+        encoding = headers.get(b'Content-Encoding', b'identity').strip().lower()
+        if encoding != b'identity' and encoding not in _wbits:
+            return
+        content_type = headers.get(b'Content-Type', b'').decode('latin-1')
+        self._streams[request] = _Stream(request.url,
+            http_content_type_encoding(content_type) or 'utf-8', _wbits.get(encoding))
+
+    def _bytes_received(self, data, request, spider):
+        stream = self._streams.get(request)
+        if stream is None:
+            return
+        try:
+            stream.feed(data)
+        except zlib.error as e:
+            self.logger.debug('Cannot stream %s, parsing it once downloaded: %s', request.url, e)
+            del self._streams[request]
 
     def parse(self, response):
-        for li in response.css('#courses-container .listing > li'):
-            yield {
-                'code': li.css('.code::text').get(),
-                'name': li.css('.title::text').get(),
-                'href': response.urljoin(
-                    li.css('a[href^="/programs-courses/"]::attr(href)').get().split('&offer=', 1)[0])
-            }
+        stream = self._streams.pop(response.request, None)
+        if stream is not None and codecs.lookup(stream.encoding).name == codecs.lookup(response.encoding).name:
+            self.crawler.stats.inc_value('course_codes/streamed')
+            yield from stream.courses
+            yield from stream.parser.close()
+            return
+        self.crawler.stats.inc_value('course_codes/buffered')
+        body = response.body
+        yield from iter_listing((body[i:i + _block_size] for i in range(0, len(body), _block_size)),
+            response.url, response.encoding)
@@ -1,30 +1,37 @@
 # -*- coding: utf-8 -*-
 import scrapy
-import json 
 import datetime
 import random
+import zlib
 
-seen = set()
-try:
-    with open('../data/course_details.json') as f:
-        seen.update(x['code'] for x in json.load(f))
-except FileNotFoundError: pass
-print(len(seen), 'items already done.')
-print()
+from urllib.parse import urlparse
 
-course_urls = []
-try:
-    with open('../data/courses.json') as f:
-        course_urls = [x['href'] for x in json.load(f) if x['code'] not in seen]
-except FileNotFoundError: pass
+from ..datafiles import iter_jsonlines, terminate_last_line, CodeSet
+from ..shared import instrument
+
+
+def _shuffled(iterable, buffer_size=1000):
+    # Randomises order using a bounded buffer rather than the whole list.
+    buffer = []
+    for x in iterable:
+        if len(buffer) < buffer_size:
+            buffer.append(x)
+            continue
+        i = random.randrange(buffer_size)
+        yield buffer[i]
+        buffer[i] = x
+    random.shuffle(buffer)
+    yield from buffer
+
+
+def shard_of(code, shards):
+    # crc32 rather than hash() so every process agrees.
+    return zlib.crc32(code.encode('utf-8')) % shards
 
-random.shuffle(course_urls)
-# course_urls = random.sample(course_urls, min(400, len(course_urls)))
 
 class CourseDetailsSpider(scrapy.Spider):
     name = 'course_details'
     allowed_domains = ['my.uq.edu.au']
-    start_urls = course_urls
 
     custom_settings = {
         'LOG_LEVEL': 'INFO',
@@ -39,9 +46,69 @@ class CourseDetailsSpider(scrapy.Spider):
 
         'AUTOTHROTTLE_ENABLED': True,
         'AUTOTHROTTLE_TARGET_CONCURRENCY': 4,
-        'AUTOTHROTTLE_DEBUG': True
+        'AUTOTHROTTLE_DEBUG': True,
+
+        'DOWNLOADER_MIDDLEWARES': {
+            # Before HttpCompressionMiddleware (590) so it sees decompressed bodies.
+            'uq_scraper.middlewares.ConditionalCacheMiddleware': 580,
+        },
     }
 
+    def __init__(self, host=None, courses='../data/courses.jl',
+            details='../data/course_details.jl', done=None, shard=None, shards=1,
+            *args, **kwargs):
+        """Arguments, given with -a:
+            host -- e.g. http://localhost:8000, fetches every page from
+                another server such as uq_scraper.stub_server instead.
+            courses -- JSON Lines output of the course_codes spider.
+            details -- this spider's JSON Lines output. Courses already in
+                it are skipped, so an interrupted crawl can be resumed.
+            done -- more JSON Lines files of course details, separated by
+                commas, whose courses are also skipped, e.g. the merged
+                course_details.jl when crawling one shard.
+            shard, shards -- crawl only shard number shard (from 0) of
+                shards. Courses are partitioned by a stable hash of their
+                code. See uq_scraper.shards to run and merge every shard.
+        """
+        super().__init__(*args, **kwargs)
+        self.host = host.rstrip('/') if host else None
+        if host:
+            self.allowed_domains = [urlparse(host).hostname]
+        self.shards = int(shards)
+        self.shard = None if shard is None else int(shard)
+        if self.shard is not None and not 0 <= self.shard < self.shards:
+            raise ValueError(f'shard must be between 0 and {self.shards - 1}')
+        self.courses_path = courses
+        self.details_path = details
+        self.done_paths = done.split(',') if done else []
+        # Before the feed exporter starts appending to an interrupted output.
+        terminate_last_line(details)
+
+    def start_requests(self):
+        # Read lazily here rather than at import, so only the compact set of
+        # finished codes is ever held in memory.
+        seen = CodeSet(x['code'] for path in [self.details_path] + self.done_paths
+            for x in iter_jsonlines(path))
+        self.logger.info('%d items already done.', len(seen))
+
+        courses = (x for x in iter_jsonlines(self.courses_path)
+            if x['code'] not in seen and self.in_shard(x['code']))
+        for course in _shuffled(courses):
+            url = course['href']
+            if self.host:
+                url = url.replace('https://my.uq.edu.au', self.host, 1)
+            yield scrapy.Request(url, dont_filter=True)
+
+    def in_shard(self, code):
+        if self.shard is None:
+            return True
+        return shard_of(code, self.shards) == self.shard
+
+    async def start(self):
+        # Scrapy 2.13+ entry point; older versions call start_requests().
+        for request in self.start_requests():
+            yield request
+
     _fields = {
         'course-level': 'level',
         'course-faculty': 'faculty',
@@ -59,6 +126,16 @@ class CourseDetailsSpider(scrapy.Spider):
     }
 
     def parse(self, response):
+        # Recorded in the crawl stats if STAGE_STATS is on, see extensions.py.
+        with instrument.stage('extract'):
+            out = self._extract(response)
+        with instrument.stage('offerings'):
+            out['offerings'] = self._offerings(response)
+        instrument.count('offerings', len(out['offerings']))
+        instrument.count('missing_fields', sum(1 for name in self._fields.values() if out[name] is None))
+        yield out
+
+    def _extract(self, response):
         out = {
             'code': response.css('#course-title::text').get().split('(')[-1][:-1],
             'name': response.css('.breadcrumb-wrapper>ul>li:nth-child(2)::text').get(),
@@ -75,10 +152,10 @@ class CourseDetailsSpider(scrapy.Spider):
             if value:
                 value = ' '.join(value).strip()
             out[name] = value
+        return out
 
-            
-        
-        out['offerings'] = offers = []
+    def _offerings(self, response):
+        offers = []
         for table, archived in (('#course-current-offerings', False), 
                 ('#course-archived-offerings', True)):
             for tr in response.css(f'{table} > tbody > tr'):
@@ -107,5 +184,4 @@ class CourseDetailsSpider(scrapy.Spider):
                     'profile_id': None if not ecp else ecp.split('=')[-1],
                     'ecp': ecp
                 })
-
-        yield out
+        return offers
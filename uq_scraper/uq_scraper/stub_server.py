@@ -0,0 +1,120 @@
+"""Local stand-in for my.uq.edu.au course pages, for testing the crawler
+offline.
+
+Serves /programs-courses/course.html?course_code=CODE from CODE.html in a
+folder, with ETag and Last-Modified headers, and answers conditional
+requests with 304 Not Modified. /programs-courses/search.html lists every
+course in the folder, gzipped if the client accepts it.
+
+    python -m uq_scraper.stub_server html_folder [port]
+    scrapy crawl course_codes -a host=http://localhost:8000
+    scrapy crawl course_details -a host=http://localhost:8000
+"""
+import gzip
+import hashlib
+import html
+import os
+import re
+import sys
+import threading
+
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+_title = re.compile(rb'<h1 id="course-title">(.*?) \(')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    html_folder = '.'
+    counts = None # status code -> number of responses, shared by the server
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b'', headers=()):
+        self.counts[status] = self.counts.get(status, 0) + 1
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _send_listing(self):
+        items = []
+        for name in sorted(os.listdir(self.html_folder)):
+            code, ext = os.path.splitext(name)
+            if ext != '.html':
+                continue
+            with open(os.path.join(self.html_folder, name), 'rb') as f:
+                title = _title.search(f.read())
+            title = html.unescape(title.group(1).decode('utf-8')) if title else code
+            items.append(f'<li><a href="/programs-courses/course.html?course_code={code}">'
+                f'<span class="code">{code}</span> <span class="title">{html.escape(title)}</span>'
+                '</a></li>\n')
+        body = ('<html><body><div id="courses-container"><ul class="listing">\n'
+            + ''.join(items) + '</ul></div></body></html>').encode('utf-8')
+        headers = [('Content-Type', 'text/html; charset=utf-8')]
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers.append(('Content-Encoding', 'gzip'))
+        self._send(200, body, headers)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/programs-courses/search.html':
+            return self._send_listing()
+        code = parse_qs(url.query).get('course_code', [''])[0]
+        path = os.path.join(self.html_folder, os.path.basename(code) + '.html')
+        if url.path != '/programs-courses/course.html' or not os.path.isfile(path):
+            return self._send(404)
+
+        with open(path, 'rb') as f:
+            body = f.read()
+        mtime = int(os.path.getmtime(path))
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers = [
+            ('Content-Type', 'text/html; charset=utf-8'),
+            ('ETag', etag),
+            ('Last-Modified', formatdate(mtime, usegmt=True)),
+        ]
+
+        if 'If-None-Match' in self.headers:
+            if self.headers['If-None-Match'] == etag:
+                return self._send(304, headers=headers)
+        elif 'If-Modified-Since' in self.headers:
+            try:
+                since = parsedate_to_datetime(self.headers['If-Modified-Since'])
+            except (TypeError, ValueError):
+                since = None
+            if since is not None and mtime <= since.timestamp():
+                return self._send(304, headers=headers)
+
+        self._send(200, body, headers)
+
+    do_HEAD = do_GET
+
+
+def serve(html_folder, port=0):
+    """Starts a stub server on a background thread. Returns the server;
+    its URL is f'http://localhost:{server.server_port}' and
+    server.RequestHandlerClass.counts tallies responses by status.
+    Stop it with server.shutdown()."""
+    handler = type('Handler', (StubHandler, ), {
+        'html_folder': html_folder,
+        'counts': {},
+    })
+    server = ThreadingHTTPServer(('localhost', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    server = serve(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 8000)
+    print(f'Serving {sys.argv[1]} on http://localhost:{server.server_port}')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()